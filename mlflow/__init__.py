@@ -59,6 +59,8 @@ set_experiment = mlflow.tracking.fluent.set_experiment
 log_params = mlflow.tracking.fluent.log_params
 log_metrics = mlflow.tracking.fluent.log_metrics
 set_tags = mlflow.tracking.fluent.set_tags
+enable_async_logging = mlflow.tracking.fluent.enable_async_logging
+flush_async_logging = mlflow.tracking.fluent.flush_async_logging
 
 
 run = projects.run
@@ -0,0 +1,57 @@
+"""create latest metrics table
+
+Revision ID: 45ed004d736b
+Revises: 451aebb31d03
+Create Date: 2019-06-03 11:20:41.623874
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '45ed004d736b'
+down_revision = '451aebb31d03'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    latest_metrics = op.create_table(
+        'latest_metrics',
+        sa.Column('key', sa.String(length=250), nullable=False),
+        sa.Column('value', sa.Float(), nullable=False),
+        sa.Column('timestamp', sa.BigInteger(), nullable=True),
+        sa.Column('step', sa.BigInteger(), nullable=False),
+        sa.Column('run_uuid', sa.String(length=32), nullable=False),
+        sa.ForeignKeyConstraint(['run_uuid'], ['runs.run_uuid'], ),
+        sa.PrimaryKeyConstraint('key', 'run_uuid', name='latest_metric_pk')
+    )
+    # Backfill the table with the latest value of each metric of each run, i.e. the metric row
+    # for which no other row with the same (run_uuid, key) has a larger (step, timestamp, value).
+    # Inline the metrics table schema rather than importing it from MLflow, since the model may
+    # change in future versions.
+    metrics = sa.table(
+        'metrics',
+        sa.column('key', sa.String(length=250)),
+        sa.column('value', sa.Float()),
+        sa.column('timestamp', sa.BigInteger()),
+        sa.column('step', sa.BigInteger()),
+        sa.column('run_uuid', sa.String(length=32)))
+    metric = metrics.alias('metric')
+    newer = metrics.alias('newer')
+    has_newer_value = sa.exists().where(sa.and_(
+        newer.c.run_uuid == metric.c.run_uuid,
+        newer.c.key == metric.c.key,
+        sa.or_(
+            newer.c.step > metric.c.step,
+            sa.and_(newer.c.step == metric.c.step, newer.c.timestamp > metric.c.timestamp),
+            sa.and_(newer.c.step == metric.c.step, newer.c.timestamp == metric.c.timestamp,
+                    newer.c.value > metric.c.value))))
+    columns = ['key', 'value', 'timestamp', 'step', 'run_uuid']
+    latest_values = sa.select([metric.c[name] for name in columns]).where(~has_newer_value)
+    op.execute(latest_metrics.insert().from_select(columns, latest_values))
+
+
+def downgrade():
+    op.drop_table('latest_metrics')
@@ -0,0 +1,32 @@
+"""add indexes for run and metric lookups
+
+Revision ID: 7ac759974ad8
+Revises: 45ed004d736b
+Create Date: 2019-06-04 15:02:11.413096
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7ac759974ad8'
+down_revision = '45ed004d736b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('index_runs_experiment_id_lifecycle_stage_start_time', 'runs',
+                    ['experiment_id', 'lifecycle_stage', 'start_time'], unique=False)
+    op.create_index('index_metrics_run_uuid_key', 'metrics', ['run_uuid', 'key'], unique=False)
+    op.create_index('index_latest_metrics_run_uuid', 'latest_metrics', ['run_uuid'], unique=False)
+    op.create_index('index_params_run_uuid', 'params', ['run_uuid'], unique=False)
+    op.create_index('index_tags_run_uuid', 'tags', ['run_uuid'], unique=False)
+
+
+def downgrade():
+    op.drop_index('index_tags_run_uuid', table_name='tags')
+    op.drop_index('index_params_run_uuid', table_name='params')
+    op.drop_index('index_latest_metrics_run_uuid', table_name='latest_metrics')
+    op.drop_index('index_metrics_run_uuid_key', table_name='metrics')
+    op.drop_index('index_runs_experiment_id_lifecycle_stage_start_time', table_name='runs')
@@ -0,0 +1,27 @@
+"""add run version
+
+Revision ID: a452acdb9245
+Revises: 7ac759974ad8
+Create Date: 2019-06-06 10:41:27.318550
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a452acdb9245'
+down_revision = '7ac759974ad8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('runs', sa.Column('version', sa.BigInteger(), nullable=False,
+                                    server_default='0'))
+
+
+def downgrade():
+    # Use batch mode so that we can run "ALTER TABLE" statements against SQLite databases
+    with op.batch_alter_table("runs") as batch_op:
+        batch_op.drop_column('version')
@@ -19,11 +19,12 @@ import mlflow.runs
 import mlflow.store.db.utils
 import mlflow.db
 
-from mlflow.tracking.utils import _is_local_uri
+from mlflow.tracking.utils import _is_local_uri, _is_database_uri
 from mlflow.utils.logging_utils import eprint
 from mlflow.utils.process import ShellCommandException
 from mlflow.utils import cli_args
 from mlflow.server import _run_server
+from mlflow.server.caching_store import DEFAULT_CACHE_TTL_SECONDS
 from mlflow.store import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 from mlflow import tracking
 import mlflow.store.cli
@@ -213,8 +214,28 @@ def _validate_static_prefix(ctx, param, value):  # pylint: disable=unused-argume
               help="A prefix which will be prepended to the path of all static paths.")
 @click.option("--gunicorn-opts", default=None,
               help="Additional command line options forwarded to gunicorn processes.")
+@click.option("--db-pool-size", type=int, default=None,
+              help="Number of connections each server worker keeps open to a database backend "
+                   "store. Only applies to SQLAlchemy-compatible backend store URIs.")
+@click.option("--db-max-overflow", type=int, default=None,
+              help="Number of connections each server worker may open to a database backend store "
+                   "beyond --db-pool-size under load.")
+@click.option("--db-pool-recycle", type=int, default=None,
+              help="Number of seconds after which connections to a database backend store are "
+                   "replaced, e.g. to stay below the database's idle connection timeout.")
+@click.option("--db-pool-pre-ping", is_flag=True,
+              help="If specified, test connections to a database backend store for liveness "
+                   "before using them.")
+@click.option("--cache-size", type=int, default=0,
+              help="Number of runs and experiments each server worker caches in memory after "
+                   "reading them from the backend store. Writes handled by a worker invalidate "
+                   "its cached entries. By default, nothing is cached.")
+@click.option("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL_SECONDS,
+              help="Number of seconds for which runs and experiments are cached with --cache-size. "
+                   "Writes handled by other workers or servers may take this long to be visible.")
 def server(backend_store_uri, default_artifact_root, host, port,
-           workers, static_prefix, gunicorn_opts):
+           workers, static_prefix, gunicorn_opts, db_pool_size, db_max_overflow, db_pool_recycle,
+           db_pool_pre_ping, cache_size, cache_ttl):
     """
     Run the MLflow tracking server.
 
@@ -227,6 +248,21 @@ def server(backend_store_uri, default_artifact_root, host, port,
     if not backend_store_uri:
         backend_store_uri = DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 
+    pool_options = {
+        "pool_size": db_pool_size,
+        "max_overflow": db_max_overflow,
+        "pool_recycle": db_pool_recycle,
+        "pool_pre_ping": True if db_pool_pre_ping else None,
+    }
+    if any(value is not None for value in pool_options.values()):
+        if not _is_database_uri(backend_store_uri):
+            eprint("Database connection pool options can only be specified with a database "
+                   "backend store.")
+            sys.exit(1)
+        # Pass the options to the server workers as part of the backend store URI
+        backend_store_uri = mlflow.store.db.utils._add_pool_options_to_db_uri(
+            backend_store_uri, pool_options)
+
     if not default_artifact_root:
         if _is_local_uri(backend_store_uri):
             default_artifact_root = backend_store_uri
@@ -235,9 +271,14 @@ def server(backend_store_uri, default_artifact_root, host, port,
                    "local file based.")
             sys.exit(1)
 
+    if cache_size < 0 or cache_ttl <= 0:
+        eprint("Option 'cache-size' must be non-negative and option 'cache-ttl' must be positive.")
+        sys.exit(1)
+
     try:
         _run_server(backend_store_uri, default_artifact_root, host, port, workers, static_prefix,
-                    gunicorn_opts)
+                    gunicorn_opts, cache_size=cache_size,
+                    cache_ttl=cache_ttl if cache_size else None)
     except ShellCommandException:
         eprint("Running the mlflow server failed. Please see the logs above for details.")
         sys.exit(1)
@@ -247,6 +288,7 @@ cli.add_command(mlflow.models.cli.commands)
 cli.add_command(mlflow.sagemaker.cli.commands)
 cli.add_command(mlflow.experiments.commands)
 cli.add_command(mlflow.store.cli.commands)
+cli.add_command(mlflow.store.cli.file_store_commands)
 cli.add_command(mlflow.azureml.cli.commands)
 cli.add_command(mlflow.runs.commands)
 cli.add_command(mlflow.db.commands)
@@ -12,6 +12,8 @@ from mlflow.utils.process import exec_cmd
 BACKEND_STORE_URI_ENV_VAR = "_MLFLOW_SERVER_FILE_STORE"
 ARTIFACT_ROOT_ENV_VAR = "_MLFLOW_SERVER_ARTIFACT_ROOT"
 STATIC_PREFIX_ENV_VAR = "_MLFLOW_STATIC_PREFIX"
+CACHE_SIZE_ENV_VAR = "_MLFLOW_SERVER_CACHE_SIZE"
+CACHE_TTL_ENV_VAR = "_MLFLOW_SERVER_CACHE_TTL"
 
 REL_STATIC_DIR = "js/build"
 
@@ -49,11 +51,14 @@ def serve():
 
 
 def _run_server(file_store_path, default_artifact_root, host, port, workers, static_prefix,
-                gunicorn_opts):
+                gunicorn_opts, cache_size=None, cache_ttl=None):
     """
     Run the MLflow server, wrapping it in gunicorn
     :param static_prefix: If set, the index.html asset will be served from the path static_prefix.
                           If left None, the index.html asset will be served from the root path.
+    :param cache_size: If set, each worker caches up to this many runs and experiments read from
+                       the backend store (see :py:class:`mlflow.server.caching_store.CachingStore`).
+    :param cache_ttl: Time to live of cached runs and experiments, in seconds.
     :return: None
     """
     env_map = {}
@@ -63,6 +68,10 @@ def _run_server(file_store_path, default_artifact_root, host, port, workers, sta
         env_map[ARTIFACT_ROOT_ENV_VAR] = default_artifact_root
     if static_prefix:
         env_map[STATIC_PREFIX_ENV_VAR] = static_prefix
+    if cache_size:
+        env_map[CACHE_SIZE_ENV_VAR] = str(cache_size)
+    if cache_ttl is not None:
+        env_map[CACHE_TTL_ENV_VAR] = str(cache_ttl)
     bind_address = "%s:%s" % (host, port)
     opts = shlex.split(gunicorn_opts) if gunicorn_opts else []
     exec_cmd(["gunicorn"] + opts + ["-b", bind_address, "-w", "%s" % workers, "mlflow.server:app"],
@@ -0,0 +1,329 @@
+"""
+Read cache in front of the backend store of the tracking server.
+
+The tracking UI repeatedly reads the same runs and experiments, each read hitting the file system
+or the database. :py:class:`CachingStore` keeps recently read runs and experiments in memory for a
+short time, and invalidates them when they are written through the same store. Each server worker
+process has its own cache, so writes handled by other workers (or other servers) only become
+visible once the cached entries expire: the time to live bounds how stale responses can be.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+DEFAULT_CACHE_TTL_SECONDS = 5
+
+# Maximum number of runs whose experiment IDs are remembered to invalidate their experiments
+_MAX_RUN_EXPERIMENT_IDS = 10000
+
+_VERSION = "version"
+_RUN = "run"
+_EXPERIMENT = "experiment"
+
+
+class ReadCache(object):
+    """
+    Thread-safe cache of at most ``max_size`` entries, evicted in least recently used order and
+    expired ``ttl_seconds`` after their creation. Each entry holds the values read about one
+    entity, e.g. a run and its version, so that they expire and are invalidated together.
+
+    Values are loaded outside of the cache's lock, and stored in the entry that was current when
+    the load started. An entry that is invalidated, expired or reset in the meantime is detached
+    from the cache, so a value read before a write can never be cached after the write
+    invalidated the entry.
+    """
+
+    def __init__(self, max_size, ttl_seconds=DEFAULT_CACHE_TTL_SECONDS):
+        if max_size < 1:
+            raise MlflowException("Invalid cache size %s. It must be at least 1." % max_size,
+                                  INVALID_PARAMETER_VALUE)
+        if ttl_seconds <= 0:
+            raise MlflowException("Invalid cache time to live %s. It must be positive."
+                                  % ttl_seconds, INVALID_PARAMETER_VALUE)
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # Maps key -> (expiration time, dictionary of values), in least recently used order
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _get_entry(self, key):
+        """Return the values of the entry for ``key``, creating the entry if needed."""
+        now = time.time()
+        expires_at, values = self._entries.pop(key, (None, None))
+        if expires_at is not None and expires_at <= now:
+            self.expirations += 1
+            values = None
+        if values is None:
+            expires_at, values = now + self.ttl_seconds, {}
+            if len(self._entries) >= self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        self._entries[key] = (expires_at, values)
+        return values
+
+    def get(self, key, name, load_fn, reset_entry=False):
+        """
+        Return the value ``name`` of the entry for ``key``, calling ``load_fn`` to load it on a
+        miss.
+
+        :param reset_entry: If True, a missing value is stored in a new entry, which replaces the
+                            current entry and its other values. This is used for the versions of
+                            entities, which must not be newer than the other cached values about
+                            the entity.
+        """
+        with self._lock:
+            values = self._get_entry(key)
+            if name in values:
+                self.hits += 1
+                return values[name]
+            self.misses += 1
+        value = load_fn()
+        with self._lock:
+            if reset_entry:
+                current_expires_at, current_values = self._entries.get(key, (None, None))
+                if current_values is values:
+                    self._entries[key] = (current_expires_at, {name: value})
+            else:
+                values[name] = value
+        return value
+
+    def peek(self, key, name):
+        """Return the cached value ``name`` of the entry for ``key``, or None if it is missing."""
+        with self._lock:
+            expires_at, values = self._entries.get(key, (None, {}))
+            if expires_at is not None and expires_at <= time.time():
+                return None
+            return values.get(name)
+
+    def invalidate(self, key):
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def invalidate_if(self, predicate):
+        """Invalidate the entries whose key satisfies ``predicate``."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def get_metrics(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": float(self.hits) / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+class _RunExperimentIds(object):
+    """
+    Thread-safe map of run IDs to the IDs of their experiments, holding at most ``max_size``
+    runs evicted in least recently used order. The experiment of a run never changes, so the
+    mappings neither expire nor are invalidated by writes.
+    """
+
+    def __init__(self, max_size=_MAX_RUN_EXPERIMENT_IDS):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._experiment_ids = OrderedDict()
+
+    def get(self, run_id):
+        with self._lock:
+            experiment_id = self._experiment_ids.pop(run_id, None)
+            if experiment_id is not None:
+                self._experiment_ids[run_id] = experiment_id
+            return experiment_id
+
+    def put(self, run_id, experiment_id):
+        with self._lock:
+            self._experiment_ids.pop(run_id, None)
+            if len(self._experiment_ids) >= self.max_size:
+                self._experiment_ids.popitem(last=False)
+            self._experiment_ids[run_id] = experiment_id
+
+
+class CachingStore(object):
+    """
+    Wrapper around a tracking store that serves ``get_run``, ``get_experiment``,
+    ``list_run_infos``, ``list_experiments`` and the versions of runs and experiments (see
+    :py:meth:`mlflow.store.abstract_store.AbstractStore.get_experiment_version`) from a
+    :py:class:`ReadCache`. Writes through the wrapper invalidate the affected cache entries. All
+    other methods are forwarded to the wrapped store.
+
+    :param store: The wrapped store.
+    :param max_size: Maximum number of runs and experiments to cache.
+    :param ttl_seconds: Time for which values are cached, which bounds the staleness of responses
+                        with respect to writes that do not go through this wrapper.
+    """
+
+    def __init__(self, store, max_size, ttl_seconds=DEFAULT_CACHE_TTL_SECONDS):
+        self.store = store
+        self.cache = ReadCache(max_size, ttl_seconds)
+        # Kept outside of the cache, so that it does not take the place of cached runs and
+        # experiments
+        self._run_experiment_ids = _RunExperimentIds()
+
+    def __getattr__(self, name):
+        return getattr(self.store, name)
+
+    def get_cache_metrics(self):
+        """
+        Get counters describing the usage of the cache, such as its numbers of hits and misses.
+
+        :return: A dictionary mapping metric names to values.
+        """
+        return self.cache.get_metrics()
+
+    @staticmethod
+    def _run_key(run_id):
+        return _RUN, run_id
+
+    @staticmethod
+    def _experiment_key(experiment_id):
+        # Stores accept experiment IDs as strings or integers
+        return _EXPERIMENT, None if experiment_id is None else str(experiment_id)
+
+    def _remember_experiment_id(self, run_id, experiment_id):
+        self._run_experiment_ids.put(run_id, experiment_id)
+
+    # Reads
+
+    def get_run(self, run_id):
+        run = self.cache.get(self._run_key(run_id), _RUN, lambda: self.store.get_run(run_id))
+        self._remember_experiment_id(run_id, run.info.experiment_id)
+        return run
+
+    def get_run_version(self, run_id):
+        return self.cache.get(self._run_key(run_id), _VERSION,
+                              lambda: self.store.get_run_version(run_id), reset_entry=True)
+
+    def get_experiment(self, experiment_id):
+        return self.cache.get(self._experiment_key(experiment_id), _EXPERIMENT,
+                              lambda: self.store.get_experiment(experiment_id))
+
+    def get_experiment_version(self, experiment_id):
+        return self.cache.get(self._experiment_key(experiment_id), _VERSION,
+                              lambda: self.store.get_experiment_version(experiment_id),
+                              reset_entry=True)
+
+    def list_run_infos(self, experiment_id, run_view_type):
+        run_infos = self.cache.get(self._experiment_key(experiment_id),
+                                   ("run_infos", run_view_type),
+                                   lambda: self.store.list_run_infos(experiment_id, run_view_type))
+        return list(run_infos)
+
+    def list_experiments(self, view_type):
+        experiments = self.cache.get(("experiments", ), view_type,
+                                     lambda: self.store.list_experiments(view_type))
+        return list(experiments)
+
+    # Writes to experiments
+
+    def _invalidate_experiment(self, experiment_id):
+        self.cache.invalidate(self._experiment_key(experiment_id))
+        self.cache.invalidate(("experiments", ))
+
+    def create_experiment(self, name, artifact_location=None):
+        try:
+            return self.store.create_experiment(name, artifact_location)
+        finally:
+            self.cache.invalidate(("experiments", ))
+
+    def delete_experiment(self, experiment_id):
+        try:
+            return self.store.delete_experiment(experiment_id)
+        finally:
+            self._invalidate_experiment(experiment_id)
+
+    def restore_experiment(self, experiment_id):
+        try:
+            return self.store.restore_experiment(experiment_id)
+        finally:
+            self._invalidate_experiment(experiment_id)
+
+    def rename_experiment(self, experiment_id, new_name):
+        try:
+            return self.store.rename_experiment(experiment_id, new_name)
+        finally:
+            self._invalidate_experiment(experiment_id)
+
+    # Writes to runs
+
+    def _invalidate_run(self, run_id):
+        """
+        Invalidate the cached run and the cached experiment of the run, whose version and run
+        infos depend on the run. If the experiment of the run is unknown, all cached experiments
+        are invalidated.
+        """
+        experiment_id = self._run_experiment_ids.get(run_id)
+        self.cache.invalidate(self._run_key(run_id))
+        if experiment_id is not None:
+            self.cache.invalidate(self._experiment_key(experiment_id))
+        else:
+            self.cache.invalidate_if(lambda key: key[0] == _EXPERIMENT)
+
+    def create_run(self, experiment_id, user_id, start_time, tags):
+        try:
+            run = self.store.create_run(experiment_id, user_id, start_time, tags)
+        finally:
+            self.cache.invalidate(self._experiment_key(experiment_id))
+        self._remember_experiment_id(run.info.run_id, run.info.experiment_id)
+        return run
+
+    def update_run_info(self, run_id, run_status, end_time):
+        try:
+            return self.store.update_run_info(run_id, run_status, end_time)
+        finally:
+            self._invalidate_run(run_id)
+
+    def delete_run(self, run_id):
+        try:
+            return self.store.delete_run(run_id)
+        finally:
+            self._invalidate_run(run_id)
+
+    def restore_run(self, run_id):
+        try:
+            return self.store.restore_run(run_id)
+        finally:
+            self._invalidate_run(run_id)
+
+    def log_metric(self, run_id, metric):
+        try:
+            return self.store.log_metric(run_id, metric)
+        finally:
+            self._invalidate_run(run_id)
+
+    def log_param(self, run_id, param):
+        try:
+            return self.store.log_param(run_id, param)
+        finally:
+            self._invalidate_run(run_id)
+
+    def set_tag(self, run_id, tag):
+        try:
+            return self.store.set_tag(run_id, tag)
+        finally:
+            self._invalidate_run(run_id)
+
+    def log_batch(self, run_id, metrics, params, tags):
+        try:
+            return self.store.log_batch(run_id, metrics, params, tags)
+        finally:
+            self._invalidate_run(run_id)
@@ -1,12 +1,19 @@
 # Define all the service endpoint handlers here.
+import hashlib
 import json
+import mimetypes
 import os
+import posixpath
 import re
 import six
+import unicodedata
 
+import zlib
 from functools import wraps
-from flask import Response, request, send_file
+from flask import Response, request, has_request_context
+from google.protobuf.message import DecodeError
 from querystring_parser import parser
+from six.moves.urllib.parse import quote as url_quote
 
 from mlflow.entities import Metric, Param, RunTag, ViewType
 from mlflow.exceptions import MlflowException
@@ -14,39 +21,105 @@ from mlflow.protos import databricks_pb2
 from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperiment, \
     GetRun, SearchRuns, ListArtifacts, GetMetricHistory, CreateRun, \
     UpdateRun, LogMetric, LogParam, SetTag, ListExperiments, \
-    DeleteExperiment, RestoreExperiment, RestoreRun, DeleteRun, UpdateExperiment, LogBatch
+    DeleteExperiment, RestoreExperiment, RestoreRun, DeleteRun, UpdateExperiment, LogBatch, \
+    GetRuns, GetMetricHistories, MetricHistory
 from mlflow.store.artifact_repository_registry import get_artifact_repository
 from mlflow.tracking.utils import _is_database_uri, _is_local_uri
 from mlflow.utils.proto_json_utils import message_to_json, parse_dict
+from mlflow.utils.rest_utils import gzip_compress, gzip_decompress, PROTOBUF_CONTENT_TYPE, \
+    JSON_CONTENT_TYPE, MIN_GZIP_BODY_SIZE
 from mlflow.utils.search_utils import SearchFilter
-from mlflow.utils.validation import _validate_batch_log_api_req
+from mlflow.utils.validation import _validate_batch_log_api_req, _validate_batch_get_limit, \
+    path_not_unique, MAX_RUNS_PER_BATCH_GET, MAX_METRIC_HISTORIES_PER_BATCH_GET
+
+MAX_DECOMPRESSED_REQUEST_SIZE_ENV_VAR = "MLFLOW_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE"
+DEFAULT_MAX_DECOMPRESSED_REQUEST_SIZE = 64 * 1024 * 1024
 
 _store = None
 
 
 def _get_store():
-    from mlflow.server import BACKEND_STORE_URI_ENV_VAR, ARTIFACT_ROOT_ENV_VAR
+    from mlflow.server import BACKEND_STORE_URI_ENV_VAR, ARTIFACT_ROOT_ENV_VAR, \
+        CACHE_SIZE_ENV_VAR, CACHE_TTL_ENV_VAR
     global _store
     if _store is None:
         store_dir = os.environ.get(BACKEND_STORE_URI_ENV_VAR, None)
         artifact_root = os.environ.get(ARTIFACT_ROOT_ENV_VAR, None)
         if _is_database_uri(store_dir):
             from mlflow.store.sqlalchemy_store import SqlAlchemyStore
-            _store = SqlAlchemyStore(store_dir, artifact_root)
+            store = SqlAlchemyStore(store_dir, artifact_root)
         elif _is_local_uri(store_dir):
             from mlflow.store.file_store import FileStore
-            _store = FileStore(store_dir, artifact_root)
+            store = FileStore(store_dir, artifact_root)
         else:
             raise MlflowException("Unexpected URI type '{}' for backend store. "
                                   "Expext local file or database type.".format(store_dir))
+        cache_size = int(os.environ.get(CACHE_SIZE_ENV_VAR, 0))
+        if cache_size > 0:
+            from mlflow.server.caching_store import CachingStore, DEFAULT_CACHE_TTL_SECONDS
+            cache_ttl = float(os.environ.get(CACHE_TTL_ENV_VAR, DEFAULT_CACHE_TTL_SECONDS))
+            store = CachingStore(store, cache_size, cache_ttl)
+        _store = store
     return _store
 
 
-def _get_request_json(flask_request=request):
-    return flask_request.get_json(force=True, silent=True)
+def _get_max_decompressed_request_size():
+    return int(os.environ.get(MAX_DECOMPRESSED_REQUEST_SIZE_ENV_VAR) or
+               DEFAULT_MAX_DECOMPRESSED_REQUEST_SIZE)
+
+
+def _get_request_body(flask_request=request):
+    """
+    Return the body of the request, decompressing it if it was sent with
+    ``Content-Encoding: gzip``. Bodies decompressing to more than
+    ``MLFLOW_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE`` bytes (64 MB by default) are rejected.
+    """
+    body = flask_request.get_data()
+    if flask_request.content_encoding == 'gzip':
+        try:
+            body = gzip_decompress(body, max_size=_get_max_decompressed_request_size())
+        except zlib.error as e:
+            raise MlflowException("Malformed gzip-encoded request body: %s" % e,
+                                  databricks_pb2.INVALID_PARAMETER_VALUE)
+        except ValueError as e:
+            raise MlflowException("Request body too large: %s" % e,
+                                  databricks_pb2.INVALID_PARAMETER_VALUE)
+    return body
+
+
+def _get_request_json(flask_request=request, body=None):
+    """
+    Parse the JSON body of the request, or ``body`` if it was already read with
+    :py:func:`_get_request_body`. Return None if the body is not valid JSON.
+    """
+    if body is None and flask_request.content_encoding != 'gzip':
+        return flask_request.get_json(force=True, silent=True)
+    if body is None:
+        body = _get_request_body(flask_request)
+    try:
+        return json.loads(body.decode("utf-8"))
+    except ValueError:
+        return None
 
 
-def _get_request_message(request_message, flask_request=request):
+def _convert_query_string_bools(request_dict, request_message):
+    """
+    Convert the "true" and "false" strings of query string parameters to booleans for the boolean
+    fields of ``request_message``, since parsing JSON into protobuf requires unquoted booleans.
+    """
+    for field in request_message.DESCRIPTOR.fields:
+        value = request_dict.get(field.name)
+        if field.type == field.TYPE_BOOL and isinstance(value, six.string_types) and \
+                value.lower() in ("true", "false"):
+            request_dict[field.name] = value.lower() == "true"
+
+
+def _get_request_message(request_message, flask_request=request, body=None):
+    """
+    Parse the request into ``request_message``, from its query string for GET requests or from
+    its body otherwise. ``body`` may be passed if it was already read with
+    :py:func:`_get_request_body`, so that compressed bodies are not decompressed again.
+    """
     if flask_request.method == 'GET' and len(flask_request.query_string) > 0:
         # This is a hack to make arrays of length 1 work with the parser.
         # for example experiment_ids%5B%5D=0 should be parsed to {experiment_ids: [0]}
@@ -55,10 +128,21 @@ def _get_request_message(request_message, flask_request=request):
         # result.
         query_string = re.sub('%5B%5D', '%5B0%5D', flask_request.query_string.decode("utf-8"))
         request_dict = parser.parse(query_string, normalized=True)
+        _convert_query_string_bools(request_dict, request_message)
         parse_dict(request_dict, request_message)
         return request_message
 
-    request_json = _get_request_json(flask_request)
+    if flask_request.mimetype == PROTOBUF_CONTENT_TYPE:
+        try:
+            if body is None:
+                body = _get_request_body(flask_request)
+            request_message.ParseFromString(body)
+        except DecodeError as e:
+            raise MlflowException("Malformed protobuf request body: %s" % e,
+                                  databricks_pb2.INVALID_PARAMETER_VALUE)
+        return request_message
+
+    request_json = _get_request_json(flask_request, body)
 
     # Older clients may post their JSON double-encoded as strings, so the get_json
     # above actually converts it to a string. Therefore, we check this condition
@@ -74,6 +158,75 @@ def _get_request_message(request_message, flask_request=request):
     return request_message
 
 
+def _accepts_protobuf(flask_request=request):
+    accept_mimetypes = flask_request.accept_mimetypes
+    return accept_mimetypes[PROTOBUF_CONTENT_TYPE] > accept_mimetypes[JSON_CONTENT_TYPE]
+
+
+def _get_etag(request_message, versions):
+    """
+    Return the entity tag of the response to a read request, derived from the request message,
+    the response format and the versions of the entities the response is computed from (see
+    ``AbstractStore.get_experiment_version``). Return None if there is no request context or any
+    of the versions is None, in which case the response is not cacheable.
+    """
+    if not has_request_context() or any(version is None for version in versions):
+        return None
+    digest = hashlib.sha1()
+    digest.update(request.path.encode("utf-8"))
+    digest.update(request_message.SerializeToString(deterministic=True))
+    digest.update(repr((_accepts_protobuf(), list(versions))).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _get_not_modified_response(etag):
+    """
+    Return a ``304 Not Modified`` response if the client already holds the response with the
+    given entity tag, as indicated by its ``If-None-Match`` header, or None otherwise. Read
+    endpoints served with POST, such as SearchRuns, are handled the same way as GET endpoints,
+    since they do not modify anything.
+    """
+    if etag is None or not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    _set_cache_headers(response, etag)
+    return response
+
+
+def _set_cache_headers(response, etag):
+    # Entity tags are weak since the response may be compressed. Clients must revalidate cached
+    # responses before using them, as they may be outdated at any time.
+    response.set_etag(etag, weak=True)
+    response.cache_control.no_cache = True
+    response.vary.update(('Accept', 'Accept-Encoding'))
+
+
+def _wrap_response(response_message, etag=None):
+    """
+    Serialize the response message in the format requested by the client: binary protobuf if
+    the client prefers ``application/x-protobuf`` in its ``Accept`` header, JSON otherwise.
+    Large responses are compressed if the client accepts gzip. Responses advertise that request
+    bodies may be compressed with gzip, by means of an ``Accept-Encoding`` header.
+
+    :param etag: Entity tag of the response (see ``_get_etag``), if it is cacheable.
+    """
+    if has_request_context() and _accepts_protobuf():
+        response = Response(mimetype=PROTOBUF_CONTENT_TYPE)
+        response.set_data(response_message.SerializeToString())
+    else:
+        response = Response(mimetype=JSON_CONTENT_TYPE)
+        response.set_data(message_to_json(response_message))
+    response.headers['Accept-Encoding'] = 'gzip'
+    response.vary.update(('Accept', 'Accept-Encoding'))
+    if has_request_context() and request.accept_encodings['gzip'] and \
+            response.content_length >= MIN_GZIP_BODY_SIZE:
+        response.set_data(gzip_compress(response.get_data()))
+        response.content_encoding = 'gzip'
+    if etag is not None:
+        _set_cache_headers(response, etag)
+    return response
+
+
 def catch_mlflow_exception(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
@@ -101,18 +254,72 @@ _TEXT_EXTENSIONS = ['txt', 'log', 'yaml', 'yml', 'json', 'js', 'py',
 
 @catch_mlflow_exception
 def get_artifact_handler():
+    """
+    Stream the file artifact at the ``path`` of the run ``run_id`` from its artifact repository,
+    without copying it to the server's file system. Supports requests for a single range of
+    bytes.
+    """
     query_string = request.query_string.decode('utf-8')
     request_dict = parser.parse(query_string, normalized=True)
     run_id = request_dict.get('run_id') or request_dict.get('run_uuid')
+    path = request_dict.get('path')
+    if not path or path_not_unique(path):
+        raise MlflowException("Invalid artifact path: '%s'." % path,
+                              databricks_pb2.INVALID_PARAMETER_VALUE)
     run = _get_store().get_run(run_id)
-    filename = os.path.abspath(_get_artifact_repo(run).download_artifacts(request_dict['path']))
+    artifact_repo = _get_artifact_repo(run)
+    size = artifact_repo.get_file_size(path)
+    if size is None:
+        raise MlflowException("No file artifact found at path '%s' of run '%s'." % (path, run_id),
+                              databricks_pb2.RESOURCE_DOES_NOT_EXIST)
+
+    start, end = 0, size
+    byte_range = _get_requested_range()
+    if byte_range is not None:
+        content_range = byte_range.make_content_range(size)
+        if content_range is None:
+            response = Response(status=416)
+            response.headers["Content-Range"] = "bytes */%s" % size
+            return response
+        start, end = content_range.start, content_range.stop
+
+    filename = posixpath.basename(path)
     extension = os.path.splitext(filename)[-1].replace(".", "")
     # Always send artifacts as attachments to prevent the browser from displaying them on our web
     # server's domain, which might enable XSS.
     if extension in _TEXT_EXTENSIONS:
-        return send_file(filename, mimetype='text/plain', as_attachment=True)
+        mimetype = 'text/plain'
     else:
-        return send_file(filename, as_attachment=True)
+        mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    body = artifact_repo.read_artifact(path, start, end) if end > start else []
+    response = Response(body, status=200 if byte_range is None else 206, mimetype=mimetype,
+                        direct_passthrough=True)
+    response.headers["Content-Length"] = str(end - start)
+    response.headers["Accept-Ranges"] = "bytes"
+    if byte_range is not None:
+        response.headers["Content-Range"] = "bytes %s-%s/%s" % (start, end - 1, size)
+    try:
+        filename.encode("ascii")
+        response.headers.set("Content-Disposition", "attachment", filename=filename)
+    except UnicodeError:
+        response.headers.set("Content-Disposition", "attachment",
+                             filename=unicodedata.normalize("NFKD", filename).encode(
+                                 "ascii", "ignore").decode("ascii"),
+                             **{"filename*": "UTF-8''%s" % url_quote(filename, safe="")})
+    return response
+
+
+def _get_requested_range():
+    """
+    Return the single byte range requested by the ``Range`` header of the current request, or
+    None if the whole file must be sent. Requests for several ranges are answered with the whole
+    file, as are conditional range requests, since artifacts have no validators.
+    """
+    byte_range = request.range
+    if byte_range is None or byte_range.units != "bytes" or len(byte_range.ranges) != 1 or \
+            "If-Range" in request.headers:
+        return None
+    return byte_range
 
 
 def _not_implemented():
@@ -128,23 +335,24 @@ def _create_experiment():
                                                    request_message.artifact_location)
     response_message = CreateExperiment.Response()
     response_message.experiment_id = experiment_id
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _get_experiment():
     request_message = _get_request_message(GetExperiment())
+    etag = _get_etag(request_message,
+                     [_get_store().get_experiment_version(request_message.experiment_id)])
+    not_modified_response = _get_not_modified_response(etag)
+    if not_modified_response is not None:
+        return not_modified_response
     response_message = GetExperiment.Response()
     experiment = _get_store().get_experiment(request_message.experiment_id).to_proto()
     response_message.experiment.MergeFrom(experiment)
     run_info_entities = _get_store().list_run_infos(request_message.experiment_id,
                                                     run_view_type=ViewType.ACTIVE_ONLY)
     response_message.runs.extend([r.to_proto() for r in run_info_entities])
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message, etag)
 
 
 @catch_mlflow_exception
@@ -152,9 +360,7 @@ def _delete_experiment():
     request_message = _get_request_message(DeleteExperiment())
     _get_store().delete_experiment(request_message.experiment_id)
     response_message = DeleteExperiment.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -162,9 +368,7 @@ def _restore_experiment():
     request_message = _get_request_message(RestoreExperiment())
     _get_store().restore_experiment(request_message.experiment_id)
     response_message = RestoreExperiment.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -173,9 +377,7 @@ def _update_experiment():
     if request_message.new_name:
         _get_store().rename_experiment(request_message.experiment_id, request_message.new_name)
     response_message = UpdateExperiment.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -191,9 +393,7 @@ def _create_run():
 
     response_message = CreateRun.Response()
     response_message.run.MergeFrom(run.to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -203,9 +403,7 @@ def _update_run():
     updated_info = _get_store().update_run_info(run_id, request_message.status,
                                                 request_message.end_time)
     response_message = UpdateRun.Response(run_info=updated_info.to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -213,9 +411,7 @@ def _delete_run():
     request_message = _get_request_message(DeleteRun())
     _get_store().delete_run(request_message.run_id)
     response_message = DeleteRun.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -223,9 +419,7 @@ def _restore_run():
     request_message = _get_request_message(RestoreRun())
     _get_store().restore_run(request_message.run_id)
     response_message = RestoreRun.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -236,9 +430,7 @@ def _log_metric():
     run_id = request_message.run_id or request_message.run_uuid
     _get_store().log_metric(run_id, metric)
     response_message = LogMetric.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -248,9 +440,7 @@ def _log_param():
     run_id = request_message.run_id or request_message.run_uuid
     _get_store().log_param(run_id, param)
     response_message = LogParam.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -260,25 +450,41 @@ def _set_tag():
     run_id = request_message.run_id or request_message.run_uuid
     _get_store().set_tag(run_id, tag)
     response_message = SetTag.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _get_run():
     request_message = _get_request_message(GetRun())
-    response_message = GetRun.Response()
     run_id = request_message.run_id or request_message.run_uuid
+    etag = _get_etag(request_message, [_get_store().get_run_version(run_id)])
+    not_modified_response = _get_not_modified_response(etag)
+    if not_modified_response is not None:
+        return not_modified_response
+    response_message = GetRun.Response()
     response_message.run.MergeFrom(_get_store().get_run(run_id).to_proto())
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message, etag)
+
+
+@catch_mlflow_exception
+def _get_runs():
+    request_message = _get_request_message(GetRuns())
+    run_ids = list(request_message.run_ids)
+    _validate_batch_get_limit(entity_name="runs", limit=MAX_RUNS_PER_BATCH_GET,
+                              length=len(run_ids))
+    response_message = GetRuns.Response()
+    response_message.runs.extend([run.to_proto() for run in _get_store().get_runs(run_ids)])
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
 def _search_runs():
     request_message = _get_request_message(SearchRuns())
+    etag = _get_etag(request_message, [_get_store().get_experiment_version(experiment_id)
+                                       for experiment_id in request_message.experiment_ids])
+    not_modified_response = _get_not_modified_response(etag)
+    if not_modified_response is not None:
+        return not_modified_response
     response_message = SearchRuns.Response()
     run_view_type = ViewType.ACTIVE_ONLY
     if request_message.HasField('run_view_type'):
@@ -286,11 +492,13 @@ def _search_runs():
     sf = SearchFilter(filter_string=request_message.filter)
     max_results = request_message.max_results
     experiment_ids = request_message.experiment_ids
-    run_entities = _get_store().search_runs(experiment_ids, sf, run_view_type, max_results)
+    page_token = request_message.page_token
+    run_entities = _get_store().search_runs(experiment_ids, sf, run_view_type, max_results,
+                                            page_token)
     response_message.runs.extend([r.to_proto() for r in run_entities])
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    if run_entities.token:
+        response_message.next_page_token = run_entities.token
+    return _wrap_response(response_message, etag)
 
 
 @catch_mlflow_exception
@@ -303,12 +511,13 @@ def _list_artifacts():
         path = None
     run_id = request_message.run_id or request_message.run_uuid
     run = _get_store().get_run(run_id)
-    artifact_entities = _get_artifact_repo(run).list_artifacts(path)
+    if request_message.recursive:
+        artifact_entities = _get_artifact_repo(run).list_artifacts_recursive(path)
+    else:
+        artifact_entities = _get_artifact_repo(run).list_artifacts(path)
     response_message.files.extend([a.to_proto() for a in artifact_entities])
     response_message.root_uri = _get_artifact_repo(run).artifact_uri
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -316,12 +525,30 @@ def _get_metric_history():
     request_message = _get_request_message(GetMetricHistory())
     response_message = GetMetricHistory.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    metric_entites = _get_store().get_metric_history(run_id,
-                                                     request_message.metric_key)
+    metric_entites = _get_store().get_metric_history(
+        run_id, request_message.metric_key,
+        max_points=request_message.max_points or None,
+        min_step=request_message.min_step if request_message.HasField("min_step") else None,
+        max_step=request_message.max_step if request_message.HasField("max_step") else None,
+        aggregation=request_message.aggregation or None)
     response_message.metrics.extend([m.to_proto() for m in metric_entites])
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
+
+
+@catch_mlflow_exception
+def _get_metric_histories():
+    request_message = _get_request_message(GetMetricHistories())
+    history_keys = [(history_key.run_id, history_key.metric_key)
+                    for history_key in request_message.history_keys]
+    _validate_batch_get_limit(entity_name="metric histories",
+                              limit=MAX_METRIC_HISTORIES_PER_BATCH_GET, length=len(history_keys))
+    histories = _get_store().get_metric_histories(history_keys)
+    response_message = GetMetricHistories.Response()
+    response_message.histories.extend([
+        MetricHistory(run_id=run_id, metric_key=metric_key,
+                      metrics=[metric.to_proto() for metric in metrics])
+        for (run_id, metric_key), metrics in zip(history_keys, histories)])
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -330,9 +557,7 @@ def _list_experiments():
     experiment_entities = _get_store().list_experiments(request_message.view_type)
     response_message = ListExperiments.Response()
     response_message.experiments.extend([e.to_proto() for e in experiment_entities])
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -342,16 +567,15 @@ def _get_artifact_repo(run):
 
 @catch_mlflow_exception
 def _log_batch():
-    _validate_batch_log_api_req(_get_request_json())
-    request_message = _get_request_message(LogBatch())
+    body = _get_request_body()
+    _validate_batch_log_api_req(body)
+    request_message = _get_request_message(LogBatch(), body=body)
     metrics = [Metric.from_proto(proto_metric) for proto_metric in request_message.metrics]
     params = [Param.from_proto(proto_param) for proto_param in request_message.params]
     tags = [RunTag.from_proto(proto_tag) for proto_tag in request_message.tags]
     _get_store().log_batch(run_id=request_message.run_id, metrics=metrics, params=params, tags=tags)
     response_message = LogBatch.Response()
-    response = Response(mimetype='application/json')
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 def _get_paths(base_path):
@@ -397,4 +621,6 @@ HANDLERS = {
     ListArtifacts: _list_artifacts,
     GetMetricHistory: _get_metric_history,
     ListExperiments: _list_experiments,
+    GetRuns: _get_runs,
+    GetMetricHistories: _get_metric_histories,
 }
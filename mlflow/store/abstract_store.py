@@ -70,6 +70,20 @@ class AbstractStore:
                 return experiment
         return None
 
+    def get_experiment_version(self, experiment_id):
+        """
+        Return an opaque version string for the experiment, which changes whenever the experiment
+        or any of its runs (including their metrics, params and tags) changes. Computing it must
+        be much cheaper than reading the experiment's runs, so that clients polling the experiment
+        can skip unchanged responses (see ``mlflow.server.handlers``).
+
+        :param experiment_id: String id for the experiment
+
+        :return: A version string, or None if the store does not track changes to the experiment
+                 or the experiment does not exist.
+        """
+        return None
+
     @abstractmethod
     def delete_experiment(self, experiment_id):
         """
@@ -116,6 +130,30 @@ class AbstractStore:
         """
         pass
 
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs. Stores should override this method to share work across the runs,
+        e.g. to fetch all of them with a single query; the default implementation calls
+        :py:meth:`get_run` for each run.
+
+        :param run_ids: List of run IDs. Each must be the ID of an existing run.
+
+        :return: A list of :py:class:`mlflow.entities.Run`, in the order of ``run_ids``.
+        """
+        return [self.get_run(run_id) for run_id in run_ids]
+
+    def get_run_version(self, run_id):
+        """
+        Return an opaque version string for the run, which changes whenever the run or its
+        metrics, params or tags change. See :py:meth:`get_experiment_version`.
+
+        :param run_id: Unique identifier for the run.
+
+        :return: A version string, or None if the store does not track changes to the run or the
+                 run does not exist.
+        """
+        return None
+
     @abstractmethod
     def update_run_info(self, run_id, run_status, end_time):
         """
@@ -184,32 +222,63 @@ class AbstractStore:
         self.log_batch(run_id, metrics=[], params=[], tags=[tag])
 
     @abstractmethod
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(self, run_id, metric_key, max_points=None, min_step=None,
+                           max_step=None, aggregation=None):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param metric_key: Metric name within the run
+        :param max_points: If specified, maximum number of values to return. Values beyond it are
+            downsampled as specified by ``aggregation`` and returned ordered by step, then by
+            timestamp.
+        :param min_step: If specified, only values logged at a step greater than or equal to
+            ``min_step`` are returned.
+        :param max_step: If specified, only values logged at a step less than or equal to
+            ``max_step`` are returned.
+        :param aggregation: How values are downsampled when there are more than ``max_points``:
+            one of ``"lttb"`` (the default), ``"min"``, ``"max"`` or ``"mean"``. See
+            :py:mod:`mlflow.store.metric_downsampling`.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
         pass
 
+    def get_metric_histories(self, history_keys):
+        """
+        Return the histories of multiple metrics, possibly logged under different runs. Stores
+        should override this method to share work across the histories; the default
+        implementation calls :py:meth:`get_metric_history` for each history.
+
+        :param history_keys: List of ``(run_id, metric_key)`` tuples.
+
+        :return: A list containing, for each of ``history_keys``, the list of
+                 :py:class:`mlflow.entities.Metric` entities logged for the metric, as returned
+                 by :py:meth:`get_metric_history`.
+        """
+        return [self.get_metric_history(run_id, metric_key)
+                for run_id, metric_key in history_keys]
+
     @abstractmethod
     def search_runs(self, experiment_ids, search_filter, run_view_type,
-                    max_results=SEARCH_MAX_RESULTS_DEFAULT):
+                    max_results=SEARCH_MAX_RESULTS_DEFAULT, page_token=None):
         """
         Return runs that match the given list of search expressions within the experiments.
         Given multiple search expressions, all these expressions are ANDed together for search.
+        Runs are ordered by descending start time, then by run ID.
 
         :param experiment_ids: List of experiment ids to scope the search
         :param search_filter: :py:class`mlflow.utils.search_utils.SearchFilter` object to encode
             search expression or filter string
         :param run_view_type: ACTIVE, DELETED, or ALL runs
         :param max_results: Maximum number of runs desired.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+            the ``token`` attribute of the list returned by a previous ``search_runs`` call with
+            the same experiment IDs, search filter and run view type.
 
-        :return: A list of :py:class:`mlflow.entities.Run` objects that satisfy the search
-            expressions
+        :return: A :py:class:`mlflow.store.entities.PagedList` of :py:class:`mlflow.entities.Run`
+            objects that satisfy the search expressions. Its ``token`` attribute holds the token
+            for the next page, or None if there are no more runs.
         """
         pass
 
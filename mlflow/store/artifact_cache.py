@@ -0,0 +1,188 @@
+"""
+Local cache of downloaded artifacts, shared by the processes of a machine.
+
+Loading a model from a remote artifact URI downloads the whole model directory into a new
+temporary directory, every time. When the ``MLFLOW_ARTIFACT_CACHE_DIR`` environment variable is
+set, :py:func:`mlflow.tracking.artifact_utils._download_artifact_from_uri` instead downloads
+artifacts once into an :py:class:`ArtifactCache` in that directory, and reuses the cached copy as
+long as the remote artifacts are unchanged.
+
+Entries are keyed by the artifact URI and a fingerprint of the remote artifacts: the relative
+paths, sizes and versions of their files, such as their ETags or modification times, so that an
+artifact overwritten with files of the same sizes is downloaded again. Artifacts of repositories
+that cannot tell the versions of files (see ``ArtifactRepository._list_file_versions``) are not
+cached.
+
+Entries are populated by downloading into a staging directory that is then renamed into place, so
+that they are only visible once complete, and under a lock file per entry, so that concurrent
+processes download each entry once. Once the total size of the entries exceeds the maximum size
+of the cache, the least recently used entries are evicted. Entries used during the last
+``EVICTION_GRACE_PERIOD_SECONDS`` are never evicted, since the processes that use them may still
+be reading them.
+"""
+import errno
+import hashlib
+import os
+import posixpath
+import shutil
+import time
+import uuid
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.env import get_env
+from mlflow.utils.file_utils import exclusive_lock
+
+CACHE_DIR_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_DIR"
+CACHE_MAX_SIZE_ENV_VAR = "MLFLOW_ARTIFACT_CACHE_MAX_SIZE"
+DEFAULT_CACHE_MAX_SIZE = 10 * 1024 * 1024 * 1024
+EVICTION_GRACE_PERIOD_SECONDS = 60
+
+_ENTRIES_DIR = "entries"
+_LOCKS_DIR = "locks"
+_STAGING_DIR = "staging"
+# Each entry holds the downloaded artifact in a subdirectory, so that the size file of the entry
+# cannot collide with the artifact
+_ENTRY_ARTIFACT_DIR = "artifact"
+_ENTRY_SIZE_FILE = "size"
+_EVICTION_LOCK = "eviction.lock"
+
+
+def get_artifact_cache():
+    """
+    Return the :py:class:`ArtifactCache` configured by the ``MLFLOW_ARTIFACT_CACHE_DIR`` and
+    ``MLFLOW_ARTIFACT_CACHE_MAX_SIZE`` environment variables, or None if the cache is disabled.
+    """
+    cache_dir = get_env(CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        return None
+    max_size = int(get_env(CACHE_MAX_SIZE_ENV_VAR) or DEFAULT_CACHE_MAX_SIZE)
+    return ArtifactCache(cache_dir, max_size)
+
+
+def _makedirs(path):
+    try:
+        os.makedirs(path)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+
+
+class ArtifactCache(object):
+    """
+    Cache of downloaded artifacts in the directory ``cache_dir``, holding at most about
+    ``max_size`` bytes of artifacts.
+    """
+
+    def __init__(self, cache_dir, max_size=DEFAULT_CACHE_MAX_SIZE):
+        if max_size < 1:
+            raise MlflowException("Invalid artifact cache size %s. It must be at least 1 byte."
+                                  % max_size, INVALID_PARAMETER_VALUE)
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size = max_size
+        for subdir in [_ENTRIES_DIR, _LOCKS_DIR, _STAGING_DIR]:
+            _makedirs(os.path.join(self.cache_dir, subdir))
+
+    def download_artifacts(self, artifact_uri, repo, artifact_path):
+        """
+        Return the local path of a cached copy of the artifact ``artifact_path`` of the artifact
+        repository ``repo``, downloading it if it is not cached yet. The returned files must not
+        be modified.
+
+        :param artifact_uri: Absolute URI of the artifact, which identifies it in the cache.
+        :return: The local path of the artifact, or None if the artifact cannot be cached because
+                 it does not exist or the versions of its files are unknown.
+        """
+        fingerprint = self._get_fingerprint(repo, artifact_path)
+        if fingerprint is None:
+            return None
+        key = hashlib.sha256((artifact_uri + "\n" + fingerprint).encode("utf-8")).hexdigest()
+        entry_dir = os.path.join(self.cache_dir, _ENTRIES_DIR, key)
+        local_path = os.path.join(entry_dir, _ENTRY_ARTIFACT_DIR, posixpath.basename(artifact_path))
+        if self._use_entry(entry_dir):
+            return local_path
+        with exclusive_lock(os.path.join(self.cache_dir, _LOCKS_DIR, key + ".lock")):
+            # Another process may have populated the entry while this one waited for the lock
+            if self._use_entry(entry_dir):
+                return local_path
+            staging_dir = self._get_staging_dir()
+            try:
+                artifact_dir = os.path.join(staging_dir, _ENTRY_ARTIFACT_DIR)
+                os.makedirs(artifact_dir)
+                repo.download_artifacts(artifact_path, artifact_dir)
+                with open(os.path.join(staging_dir, _ENTRY_SIZE_FILE), "w") as f:
+                    f.write(str(self._get_size(artifact_dir)))
+                os.rename(staging_dir, entry_dir)
+            finally:
+                if os.path.exists(staging_dir):
+                    shutil.rmtree(staging_dir, ignore_errors=True)
+        self.evict()
+        return local_path
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the total size of the cached artifacts is at
+        most ``max_size``, sparing the entries used during the last
+        ``EVICTION_GRACE_PERIOD_SECONDS``.
+        """
+        with exclusive_lock(os.path.join(self.cache_dir, _EVICTION_LOCK)):
+            entries = self._list_entries()
+            total_size = sum(size for _, size, _ in entries)
+            min_last_used = time.time() - EVICTION_GRACE_PERIOD_SECONDS
+            for last_used, size, entry_dir in sorted(entries):
+                if total_size <= self.max_size or last_used > min_last_used:
+                    break
+                # Renaming makes the removal atomic for the processes looking up the entry
+                removed_dir = self._get_staging_dir()
+                os.rename(entry_dir, removed_dir)
+                shutil.rmtree(removed_dir, ignore_errors=True)
+                total_size -= size
+
+    def get_size(self):
+        """Return the total size in bytes of the cached artifacts."""
+        return sum(size for _, size, _ in self._list_entries())
+
+    def _list_entries(self):
+        """Return a ``(last used time, size, directory)`` tuple for each entry."""
+        entries_dir = os.path.join(self.cache_dir, _ENTRIES_DIR)
+        entries = []
+        for key in os.listdir(entries_dir):
+            entry_dir = os.path.join(entries_dir, key)
+            try:
+                with open(os.path.join(entry_dir, _ENTRY_SIZE_FILE)) as f:
+                    size = int(f.read())
+                entries.append((os.path.getmtime(entry_dir), size, entry_dir))
+            except (IOError, OSError, ValueError):
+                # The entry is being evicted
+                continue
+        return entries
+
+    @staticmethod
+    def _use_entry(entry_dir):
+        """Mark the entry as used now, returning False if it does not exist."""
+        try:
+            os.utime(entry_dir, None)
+            return True
+        except OSError:
+            return False
+
+    def _get_staging_dir(self):
+        return os.path.join(self.cache_dir, _STAGING_DIR, uuid.uuid4().hex)
+
+    @staticmethod
+    def _get_size(path):
+        size = 0
+        for dirpath, _, filenames in os.walk(path):
+            size += sum(os.path.getsize(os.path.join(dirpath, f)) for f in filenames)
+        return size
+
+    @staticmethod
+    def _get_fingerprint(repo, artifact_path):
+        """
+        Return a fingerprint of the relative paths, sizes and versions of the files of the
+        artifact, or None if the artifact does not exist or the versions of its files are unknown.
+        """
+        versions = repo._list_file_versions(artifact_path)
+        if not versions or any(version is None for _, _, version in versions):
+            return None
+        return "\n".join("%s %s %s" % file_version for file_version in sorted(versions))
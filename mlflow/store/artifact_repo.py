@@ -1,12 +1,31 @@
 import os
 import posixpath
+import shutil
 import tempfile
+import threading
 from abc import abstractmethod, ABCMeta
+from multiprocessing.pool import ThreadPool
 
 from mlflow.utils.validation import path_not_unique, bad_path_message
 
+from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, RESOURCE_DOES_NOT_EXIST
+from mlflow.utils.env import get_env
+from mlflow.utils.file_utils import relative_path_to_artifact_path
+
+_DOWNLOAD_MAX_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_DOWNLOAD_MAX_WORKERS"
+_DEFAULT_DOWNLOAD_MAX_WORKERS = 8
+_UPLOAD_MAX_WORKERS_ENV_VAR = "MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS"
+_DEFAULT_UPLOAD_MAX_WORKERS = 8
+_UPLOAD_CHUNK_SIZE_ENV_VAR = "MLFLOW_ARTIFACT_UPLOAD_CHUNK_SIZE"
+_DEFAULT_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+_UPLOAD_CHUNK_CONCURRENCY_ENV_VAR = "MLFLOW_ARTIFACT_UPLOAD_CHUNK_CONCURRENCY"
+_DEFAULT_UPLOAD_CHUNK_CONCURRENCY = 4
+# Size of the chunks yielded by ``read_artifact`` when reading from local files or streams
+READ_CHUNK_SIZE = 1024 * 1024
+# Size of the ranges read by each request of ``read_artifact`` from storage read in ranges
+_RANGE_READ_SIZE = 8 * 1024 * 1024
 
 
 class ArtifactRepository:
@@ -17,6 +36,9 @@ class ArtifactRepository:
 
     __metaclass__ = ABCMeta
 
+    # Whether ``list_artifacts`` and ``_download_file`` can be called from several threads at once
+    _SUPPORTS_CONCURRENT_DOWNLOADS = True
+
     def __init__(self, artifact_uri):
         self.artifact_uri = artifact_uri
 
@@ -57,37 +79,38 @@ class ArtifactRepository:
         """
         pass
 
-    def download_artifacts(self, artifact_path, dst_path=None):
+    def download_artifacts(self, artifact_path, dst_path=None, max_workers=None,
+                           progress_callback=None):
         """
         Download an artifact file or directory to a local directory if applicable, and return a
         local path for it.
         The caller is responsible for managing the lifecycle of the downloaded artifacts.
 
+        The tree of artifacts under ``artifact_path`` is listed first, then its files are
+        downloaded concurrently. If downloading a file fails, no further downloads are started
+        and the error is raised once the downloads in progress have finished.
+
         :param artifact_path: Relative source path to the desired artifacts.
         :param dst_path: Absolute path of the local filesystem destination directory to which to
                          download the specified artifacts. This directory must already exist. If
                          unspecified, the artifacts will be downloaded to a new, uniquely-named
                          directory on the local filesystem.
+        :param max_workers: Maximum number of threads used to list directories and download files
+                            concurrently. Defaults to the value of the
+                            ``MLFLOW_ARTIFACT_DOWNLOAD_MAX_WORKERS`` environment variable, or 8 if
+                            it is unset. A value of 1 downloads files serially.
+        :param progress_callback: Function called with the number of downloaded files and the
+                                  total number of files to download, once before the first
+                                  download and after each completed download. It is called from
+                                  the calling thread.
 
         :return: Absolute path of the local filesystem location containing the downloaded artifacts.
         """
 
-        # TODO: Probably need to add a more efficient method to stream just a single artifact
-        # without downloading it, or to get a pre-signed URL for cloud storage.
-
-        def download_artifacts_into(artifact_path, dest_dir):
-            basename = posixpath.basename(artifact_path)
-            local_path = os.path.join(dest_dir, basename)
-            listing = self.list_artifacts(artifact_path)
-            if len(listing) > 0:
-                # Artifact_path is a directory, so make a directory for it and download everything
-                if not os.path.exists(local_path):
-                    os.mkdir(local_path)
-                for file_info in listing:
-                    download_artifacts_into(artifact_path=file_info.path, dest_dir=local_path)
-            else:
-                self._download_file(remote_file_path=artifact_path, local_path=local_path)
-            return local_path
+        max_workers = _get_positive_int(max_workers, _DOWNLOAD_MAX_WORKERS_ENV_VAR,
+                                        _DEFAULT_DOWNLOAD_MAX_WORKERS, "maximum number of workers")
+        if not self._SUPPORTS_CONCURRENT_DOWNLOADS:
+            max_workers = 1
 
         if dst_path is None:
             dst_path = tempfile.mkdtemp()
@@ -106,7 +129,176 @@ class ArtifactRepository:
                     " Destination path: {dst_path}".format(dst_path=dst_path)),
                 error_code=INVALID_PARAMETER_VALUE)
 
-        return download_artifacts_into(artifact_path, dst_path)
+        local_path = os.path.join(dst_path, posixpath.basename(artifact_path))
+        pool = ThreadPool(max_workers) if max_workers > 1 else None
+        try:
+            directories, downloads = self._list_artifact_tree(artifact_path, local_path, pool)
+            for local_dir in directories:
+                if not os.path.exists(local_dir):
+                    os.mkdir(local_dir)
+            self._download_files(downloads, pool, progress_callback)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+        return local_path
+
+    def list_artifacts_recursive(self, path=None):
+        """
+        Return all the artifacts for this run_id under path, including the contents of its
+        subdirectories. If path is a file, returns an empty list.
+
+        The default implementation lists the directories of the tree one by one with
+        :py:meth:`list_artifacts`. Repositories whose storage can enumerate a whole tree at once
+        override it to list the tree in a single (paginated) request.
+
+        :param path: Relative source path that contains desired artifacts
+
+        :return: List of artifacts as FileInfo under path, sorted by path, so that directories
+                 precede their contents.
+        """
+        return self._list_artifacts_recursive(path)
+
+    def _list_artifacts_recursive(self, path, pool=None):
+        """
+        Implementation of :py:meth:`list_artifacts_recursive`, which lists the tree level by
+        level, listing the directories of each level concurrently if a thread ``pool`` is given.
+        Repositories listing the tree in a single request override this method and ignore
+        ``pool``.
+        """
+        file_infos = []
+        directories = [path]
+        while directories:
+            if pool is None or len(directories) == 1:
+                listings = [self.list_artifacts(directory) for directory in directories]
+            else:
+                listings = pool.map(self.list_artifacts, directories)
+            directories = []
+            for listing in listings:
+                file_infos.extend(listing)
+                directories.extend(file_info.path for file_info in listing if file_info.is_dir)
+        return sorted(file_infos, key=lambda f: f.path)
+
+    def _list_file_versions(self, artifact_path):
+        """
+        Return a ``(path, size, version)`` tuple for each file of the artifact at
+        ``artifact_path``: the file itself if it is a file, or the files of its tree if it is a
+        directory. The version of a file, such as the ETag of an object, changes whenever the file
+        is overwritten, even with content of the same size.
+
+        :return: A list of tuples, which is empty if the artifact does not exist, or None if the
+                 repository cannot tell the versions of files.
+        """
+        return None
+
+    def _list_artifact_tree(self, artifact_path, local_path, pool=None):
+        """
+        List the tree of artifacts under ``artifact_path`` with
+        :py:meth:`_list_artifacts_recursive`. As in :py:meth:`list_artifacts`, a path whose
+        listing is empty is considered to be a file.
+
+        :return: A tuple of the list of local directories to create under ``local_path``, parents
+                 first, and the list of ``(remote_file_path, local_path)`` pairs of the files to
+                 download.
+        """
+        file_infos = self._list_artifacts_recursive(artifact_path, pool)
+        if len(file_infos) == 0:
+            return [], [(artifact_path, local_path)]
+        directories, downloads = [local_path], []
+        # Maps the remote paths of directories to their local paths. Directories are listed before
+        # their contents, whose parents are therefore always mapped, except at the top level.
+        local_dirs = {}
+        for file_info in file_infos:
+            parent_local_path = local_dirs.get(posixpath.dirname(file_info.path), local_path)
+            file_local_path = os.path.join(parent_local_path, posixpath.basename(file_info.path))
+            if file_info.is_dir:
+                local_dirs[file_info.path] = file_local_path
+                directories.append(file_local_path)
+            else:
+                downloads.append((file_info.path, file_local_path))
+        return directories, downloads
+
+    def _download_files(self, downloads, pool=None, progress_callback=None):
+        """
+        Download each ``(remote_file_path, local_path)`` pair of ``downloads``, concurrently if a
+        thread ``pool`` is given.
+        """
+        _apply_concurrently(
+            lambda download: self._download_file(remote_file_path=download[0],
+                                                 local_path=download[1]),
+            downloads, pool, progress_callback)
+
+    @staticmethod
+    def _upload_files(local_dir, dest_path, upload_file):
+        """
+        Upload the files under ``local_dir`` concurrently, by calling
+        ``upload_file(local_file, remote_path)`` with the path under ``dest_path`` that mirrors
+        the path of each file relative to ``local_dir``. Up to
+        ``MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS`` files (8 by default) are uploaded at once, so
+        ``upload_file`` must be thread-safe. The first error raised by an upload is raised after
+        the uploads in progress have finished, and prevents the remaining uploads from starting.
+        """
+        local_dir = os.path.abspath(local_dir)
+        uploads = []
+        for (root, _, filenames) in os.walk(local_dir):
+            upload_path = dest_path
+            if root != local_dir:
+                rel_path = os.path.relpath(root, local_dir)
+                rel_path = relative_path_to_artifact_path(rel_path)
+                upload_path = posixpath.join(dest_path, rel_path)
+            for f in filenames:
+                uploads.append((os.path.join(root, f), posixpath.join(upload_path, f)))
+        max_workers = min(_get_positive_int(None, _UPLOAD_MAX_WORKERS_ENV_VAR,
+                                            _DEFAULT_UPLOAD_MAX_WORKERS,
+                                            "maximum number of workers"),
+                          len(uploads))
+        pool = ThreadPool(max_workers) if max_workers > 1 else None
+        try:
+            _apply_concurrently(lambda upload: upload_file(*upload), uploads, pool)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+    def get_file_size(self, artifact_path):
+        """
+        Return the size in bytes of the file artifact at ``artifact_path``, or None if it is a
+        directory or does not exist.
+
+        The default implementation looks the file up in the listing of its parent directory.
+        """
+        parent = posixpath.dirname(artifact_path)
+        for file_info in self.list_artifacts(parent or None):
+            if posixpath.normpath(file_info.path) == posixpath.normpath(artifact_path):
+                return None if file_info.is_dir else file_info.file_size
+        return None
+
+    def read_artifact(self, artifact_path, start=0, end=None):
+        """
+        Read the bytes of the file artifact at ``artifact_path`` from offset ``start`` to offset
+        ``end`` (excluded, defaulting to the end of the file).
+
+        The default implementation downloads the file to a temporary directory, which is removed
+        once the returned iterator is exhausted or closed. Repositories whose storage supports
+        ranged reads override it to stream the bytes without temporary files.
+
+        :return: An iterator over chunks of bytes. If it has a ``close`` method, the method must
+                 be called to release its resources when it is not exhausted.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            local_path = os.path.join(tmp_dir, posixpath.basename(artifact_path))
+            self._download_file(remote_file_path=artifact_path, local_path=local_path)
+            f = open(local_path, "rb")
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+        def _close():
+            f.close()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        return ClosingIterator(_iter_file_range(f, start, end), _close)
 
     @abstractmethod
     def _download_file(self, remote_file_path, local_path):
@@ -121,6 +313,153 @@ class ArtifactRepository:
         pass
 
 
+def get_upload_chunk_size():
+    """
+    Return the size in bytes of the parts in which backends supporting multipart uploads upload
+    large files, set by the ``MLFLOW_ARTIFACT_UPLOAD_CHUNK_SIZE`` environment variable. Files
+    larger than a part are uploaded in several parts. Defaults to 8 MB.
+    """
+    return _get_positive_int(None, _UPLOAD_CHUNK_SIZE_ENV_VAR, _DEFAULT_UPLOAD_CHUNK_SIZE,
+                             "upload chunk size")
+
+
+def get_upload_chunk_concurrency():
+    """
+    Return the maximum number of parts of a file that backends supporting multipart uploads upload
+    at once, set by the ``MLFLOW_ARTIFACT_UPLOAD_CHUNK_CONCURRENCY`` environment variable. Defaults
+    to 4.
+    """
+    return _get_positive_int(None, _UPLOAD_CHUNK_CONCURRENCY_ENV_VAR,
+                             _DEFAULT_UPLOAD_CHUNK_CONCURRENCY, "upload chunk concurrency")
+
+
+def _add_parent_directories(path, file_infos):
+    """
+    Return the artifacts ``file_infos`` of a flat listing of the files under ``path``, as made by
+    storage without actual directories, along with the directories containing them under
+    ``path``, sorted by path.
+    """
+    base_path = posixpath.normpath(path or ".")
+    if base_path == ".":
+        base_path = ""
+    infos = list(file_infos)
+    directories = set()
+    for file_info in infos:
+        directory = posixpath.dirname(file_info.path)
+        while len(directory) > len(base_path) and directory not in directories:
+            directories.add(directory)
+            directory = posixpath.dirname(directory)
+    infos.extend(FileInfo(directory, True, None) for directory in directories)
+    return sorted(infos, key=lambda f: f.path)
+
+
+def _is_in_tree(key, path):
+    """Return whether the object ``key`` of flat storage is ``path`` or is under ``path``."""
+    return not path or key == path or key.startswith(path + "/")
+
+
+def _get_positive_int(value, env_var, default, description):
+    value = int(value or get_env(env_var) or default)
+    if value < 1:
+        raise MlflowException("Invalid %s %s. It must be at least 1." % (description, value),
+                              INVALID_PARAMETER_VALUE)
+    return value
+
+
+def _apply_concurrently(func, items, pool=None, progress_callback=None):
+    """
+    Call ``func`` on each of ``items``, concurrently if a thread ``pool`` is given. The first error
+    raised by ``func`` is raised after the calls in progress have finished, and prevents the
+    remaining calls from starting.
+
+    :param progress_callback: Function called from the calling thread with the number of completed
+                              calls and the number of items, once before the first call and after
+                              each completed call.
+    """
+    num_items = len(items)
+    if progress_callback is not None:
+        progress_callback(0, num_items)
+    if pool is None or num_items <= 1:
+        for num_completed, item in enumerate(items, 1):
+            func(item)
+            if progress_callback is not None:
+                progress_callback(num_completed, num_items)
+        return
+
+    failed = threading.Event()
+
+    def _apply(item):
+        if failed.is_set():
+            return False
+        try:
+            func(item)
+        except Exception:
+            failed.set()
+            raise
+        return True
+
+    num_completed = 0
+    try:
+        for completed in pool.imap_unordered(_apply, items):
+            if completed and progress_callback is not None:
+                num_completed += 1
+                progress_callback(num_completed, num_items)
+    except BaseException:
+        # Skip the calls that have not started yet, e.g. if the progress callback raised
+        failed.set()
+        raise
+
+
+class ClosingIterator(object):
+    """
+    Iterator over the items of ``iterator``, calling ``close`` once when it is exhausted or when
+    its ``close`` method is called. WSGI servers call the ``close`` method of response bodies, so
+    resources are released even if the client disconnects before the end of the response.
+    """
+
+    def __init__(self, iterator, close):
+        self._iterator = iter(iterator)
+        self._close = close
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            self.close()
+            raise
+
+    next = __next__
+
+    def close(self):
+        close, self._close = self._close, None
+        if close is not None:
+            close()
+
+
+def _iter_file_range(f, start=0, end=None):
+    """Yield the bytes of the file object ``f`` from ``start`` to ``end`` in chunks."""
+    f.seek(start)
+    remaining = None if end is None else end - start
+    while remaining is None or remaining > 0:
+        chunk = f.read(READ_CHUNK_SIZE if remaining is None else min(READ_CHUNK_SIZE, remaining))
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+        yield chunk
+
+
+def _iter_ranges(read_range, start, end, chunk_size=_RANGE_READ_SIZE):
+    """Yield the bytes from ``start`` to ``end`` by calling ``read_range(start, end)`` per chunk."""
+    while start < end:
+        chunk_end = min(start + chunk_size, end)
+        yield read_range(start, chunk_end)
+        start = chunk_end
+
+
 def verify_artifact_path(artifact_path):
     if artifact_path and path_not_unique(artifact_path):
         raise MlflowException("Invalid artifact path: '%s'. %s" % (artifact_path,
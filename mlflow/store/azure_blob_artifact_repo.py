@@ -6,7 +6,12 @@ from six.moves import urllib
 
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact_repo import ArtifactRepository
+from mlflow.store.artifact_repo import ArtifactRepository, get_upload_chunk_size, \
+    get_upload_chunk_concurrency, _add_parent_directories, _is_in_tree, _iter_ranges
+
+# Maximum size of a block of a block blob accepted by the Azure Blob Storage API version used by
+# the client
+_MAX_BLOCK_SIZE = 100 * 1024 * 1024
 
 
 class AzureBlobArtifactRepository(ArtifactRepository):
@@ -40,6 +45,10 @@ class AzureBlobArtifactRepository(ArtifactRepository):
         else:
             raise Exception("You need to set one of AZURE_STORAGE_CONNECTION_STRING or "
                             "AZURE_STORAGE_ACCESS_KEY to access Azure storage.")
+        # Upload files larger than the upload chunk size as blocks of that size
+        chunk_size = min(get_upload_chunk_size(), _MAX_BLOCK_SIZE)
+        self.client.MAX_BLOCK_SIZE = chunk_size
+        self.client.MAX_SINGLE_PUT_SIZE = chunk_size
 
     @staticmethod
     def parse_wasbs_uri(uri):
@@ -64,22 +73,18 @@ class AzureBlobArtifactRepository(ArtifactRepository):
             dest_path = posixpath.join(dest_path, artifact_path)
         dest_path = posixpath.join(
                 dest_path, os.path.basename(local_file))
-        self.client.create_blob_from_path(container, dest_path, local_file)
+        self.client.create_blob_from_path(container, dest_path, local_file,
+                                          max_connections=get_upload_chunk_concurrency())
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (container, _, dest_path) = self.parse_wasbs_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                path = posixpath.join(upload_path, f)
-                self.client.create_blob_from_path(
-                    container, path, os.path.join(root, f))
+        max_connections = get_upload_chunk_concurrency()
+        self._upload_files(
+            local_dir, dest_path,
+            lambda local_file, remote_path: self.client.create_blob_from_path(
+                container, remote_path, local_file, max_connections=max_connections))
 
     def list_artifacts(self, path=None):
         from azure.storage.blob.models import BlobPrefix
@@ -113,7 +118,75 @@ class AzureBlobArtifactRepository(ArtifactRepository):
                 break
         return sorted(infos, key=lambda f: f.path)
 
+    def _list_artifacts_recursive(self, path, pool=None):
+        (container, _, artifact_path) = self.parse_wasbs_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        infos = []
+        prefix = dest_path + "/"
+        marker = None  # Used to make next list request if this one exceeded the result limit
+        while True:
+            # Without a delimiter, all the blobs under the prefix are listed
+            results = self.client.list_blobs(container, prefix=prefix, marker=marker)
+            for r in results:
+                if not r.name.startswith(artifact_path):
+                    raise MlflowException(
+                        "The name of the listed Azure blob does not begin with the specified"
+                        " artifact path. Artifact path: {artifact_path}. Blob name:"
+                        " {blob_name}".format(artifact_path=artifact_path, blob_name=r.name))
+                if r.name.endswith("/"):
+                    # Placeholder blobs created by some tools to represent directories
+                    continue
+                file_name = posixpath.relpath(path=r.name, start=artifact_path)
+                infos.append(FileInfo(file_name, False, r.properties.content_length))
+            if results.next_marker:
+                marker = results.next_marker
+            else:
+                break
+        return _add_parent_directories(path, infos)
+
+    def _list_file_versions(self, artifact_path):
+        (container, _, root_path) = self.parse_wasbs_uri(self.artifact_uri)
+        dest_path = posixpath.join(root_path, artifact_path) if artifact_path else root_path
+        dest_path = dest_path.rstrip("/")
+        versions = []
+        marker = None
+        while True:
+            results = self.client.list_blobs(container, prefix=dest_path, marker=marker)
+            for r in results:
+                if r.name.endswith("/") or not _is_in_tree(r.name, dest_path):
+                    continue
+                versions.append((posixpath.relpath(path=r.name, start=root_path),
+                                 r.properties.content_length, r.properties.etag))
+            if results.next_marker:
+                marker = results.next_marker
+            else:
+                break
+        return versions
+
     def _download_file(self, remote_file_path, local_path):
         (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
         self.client.get_blob_to_path(container, remote_full_path, local_path)
+
+    def get_file_size(self, artifact_path):
+        from azure.common import AzureMissingResourceHttpError
+        (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
+        try:
+            blob = self.client.get_blob_properties(
+                container, posixpath.join(remote_root_path, artifact_path))
+        except AzureMissingResourceHttpError:
+            return None
+        return blob.properties.content_length
+
+    def read_artifact(self, artifact_path, start=0, end=None):
+        (container, _, remote_root_path) = self.parse_wasbs_uri(self.artifact_uri)
+        remote_full_path = posixpath.join(remote_root_path, artifact_path)
+        if end is None:
+            end = self.client.get_blob_properties(
+                container, remote_full_path).properties.content_length
+        # The end offset of ranged Azure downloads is inclusive
+        return _iter_ranges(lambda range_start, range_end: self.client.get_blob_to_bytes(
+            container, remote_full_path, start_range=range_start,
+            end_range=range_end - 1).content, start, end)
@@ -0,0 +1,149 @@
+"""
+Binary columnar storage format for metric histories recorded by
+:py:class:`mlflow.store.file_store.FileStore`.
+
+A binary metric file consists of the 8-byte ``BINARY_METRIC_HEADER`` followed by one fixed-width,
+little-endian record per logged point, laid out as ``METRIC_RECORD_DTYPE`` (int64 timestamp,
+float64 value, int64 step). Files can therefore be appended to without reading them and read back
+as a memory-mapped NumPy structured array. The header distinguishes binary files from metric files
+in the legacy text format, in which each point is stored as a ``"timestamp value step"`` line.
+"""
+import errno
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from mlflow.entities import Metric
+
+METRIC_FORMAT_TEXT = "text"
+METRIC_FORMAT_BINARY = "binary"
+METRIC_FORMATS = [METRIC_FORMAT_TEXT, METRIC_FORMAT_BINARY]
+
+BINARY_METRIC_HEADER = b"MLFMTR\x00\x01"
+
+METRIC_RECORD_DTYPE = np.dtype([("timestamp", "<i8"), ("value", "<f8"), ("step", "<i8")])
+
+_METRIC_RECORD_STRUCT = struct.Struct("<qdq")
+
+
+def is_binary_metric_file(path):
+    """
+    Return True if the metric file at ``path`` is stored in the binary format, False if it is
+    stored in the legacy text format.
+    """
+    with open(path, "rb") as f:
+        return f.read(len(BINARY_METRIC_HEADER)) == BINARY_METRIC_HEADER
+
+
+def _pack_record(metric):
+    return _METRIC_RECORD_STRUCT.pack(int(metric.timestamp), float(metric.value), int(metric.step))
+
+
+# Errors raised by ``os.link`` on file systems that do not support hard links
+_LINK_UNSUPPORTED_ERRNOS = frozenset(
+    getattr(errno, name) for name in ("EPERM", "EXDEV", "ENOTSUP", "EOPNOTSUPP", "ENOSYS")
+    if hasattr(errno, name))
+
+
+def create_binary_metric_file(path, metric, tmp_dir):
+    """
+    Create a binary metric file at ``path`` holding the single point ``metric``, unless a file
+    already exists there. The file is written in ``tmp_dir``, which must be on the same file system
+    as ``path``, and then linked into place, so that readers never observe a file without points.
+    On file systems without hard links, the file is instead created exclusively at ``path`` and
+    written with a single write.
+
+    :return: True if the file was created, False if a file already exists at ``path``.
+    """
+    data = BINARY_METRIC_HEADER + _pack_record(metric)
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, prefix=".new-metric-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            # Unlike renaming, linking fails rather than replace a file created concurrently
+            os.link(tmp_path, path)
+        except OSError as e:
+            if e.errno == errno.EEXIST:
+                return False
+            if e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+                raise
+            return _create_file_exclusively(path, data)
+        return True
+    finally:
+        os.remove(tmp_path)
+
+
+def _create_file_exclusively(path, data):
+    try:
+        fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0),
+                     0o666)
+    except OSError as e:
+        if e.errno != errno.EEXIST:
+            raise
+        return False
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return True
+
+
+def append_binary_metric(path, metric):
+    """
+    Append a point to the binary metric file at ``path``. The point is written with a single
+    append so that concurrent writers do not interleave partial records.
+    """
+    with open(path, "ab") as f:
+        f.write(_pack_record(metric))
+
+
+def write_binary_metric_file(path, metrics):
+    """
+    Write the given metrics to a new binary metric file at ``path``, replacing any existing file.
+    """
+    with open(path, "wb") as f:
+        f.write(BINARY_METRIC_HEADER)
+        for metric in metrics:
+            f.write(_pack_record(metric))
+
+
+def read_binary_metric_records(path):
+    """
+    Memory-map the points of the binary metric file at ``path``.
+
+    :return: A NumPy structured array with dtype ``METRIC_RECORD_DTYPE``. A trailing partial
+             record, e.g. from a write that is still in progress, is ignored.
+    """
+    data_size = os.path.getsize(path) - len(BINARY_METRIC_HEADER)
+    num_records = data_size // METRIC_RECORD_DTYPE.itemsize
+    if num_records <= 0:
+        return np.empty(0, dtype=METRIC_RECORD_DTYPE)
+    return np.memmap(path, dtype=METRIC_RECORD_DTYPE, mode="r", offset=len(BINARY_METRIC_HEADER),
+                     shape=(num_records,))
+
+
+def get_latest_record_index(records):
+    """
+    Return the index of the latest point among ``records``, i.e. the one with the largest
+    (step, timestamp, value), using vectorized comparisons rather than sorting.
+    """
+    steps = records["step"]
+    candidates = steps == steps.max()
+    timestamps = records["timestamp"]
+    candidates &= timestamps == timestamps[candidates].max()
+    indices = np.flatnonzero(candidates)
+    return indices[np.argmax(records["value"][indices])]
+
+
+def records_to_metrics(metric_key, records):
+    """
+    Convert a structured array of metric records to a list of
+    :py:class:`mlflow.entities.Metric`.
+    """
+    return [Metric(key=metric_key, value=value, timestamp=timestamp, step=step)
+            for timestamp, value, step in zip(records["timestamp"].tolist(),
+                                              records["value"].tolist(),
+                                              records["step"].tolist())]
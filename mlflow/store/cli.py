@@ -1,11 +1,14 @@
 import logging
+import os
 import sys
 
 import click
 
 from mlflow.store.artifact_repository_registry import get_artifact_repository
+from mlflow.store.binary_metrics import METRIC_FORMATS, METRIC_FORMAT_BINARY
 from mlflow.tracking import _get_store
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
+from mlflow.utils.file_utils import local_file_uri_to_path
 from mlflow.utils.proto_json_utils import message_to_json
 
 _logger = logging.getLogger(__name__)
@@ -118,3 +121,35 @@ def download_artifacts(run_id, artifact_path, artifact_uri):
     artifact_repo = get_artifact_repository(artifact_uri)
     artifact_location = artifact_repo.download_artifacts(artifact_path)
     print(artifact_location)
+
+
+@click.group("file-store")
+def file_store_commands():
+    """
+    Manage the local directories used by file-based backend stores.
+    """
+    pass
+
+
+@file_store_commands.command("migrate-metrics")
+@click.argument("backend_store_uri")
+@click.option("--format", "metric_format", type=click.Choice(METRIC_FORMATS),
+              default=METRIC_FORMAT_BINARY,
+              help="Format to convert metric files to (default: %s)." % METRIC_FORMAT_BINARY)
+def migrate_metrics(backend_store_uri, metric_format):
+    """
+    Convert the metric files of all runs in the file store at BACKEND_STORE_URI, a local path or
+    'file:' URI, to the specified format. Files already in that format are left unchanged.
+
+    Stop any processes logging to the store before running this command, since points logged to
+    a metric while its file is being converted may be lost. Metric files in the binary format can
+    only be read by MLflow versions that support it.
+    """
+    from mlflow.store.file_store import FileStore
+    if not os.path.isdir(local_file_uri_to_path(backend_store_uri)):
+        raise click.BadParameter("'%s' is not a directory." % backend_store_uri,
+                                 param_hint="BACKEND_STORE_URI")
+    store = FileStore(backend_store_uri)
+    num_converted = store.convert_metric_files(metric_format)
+    _logger.info("Converted %s metric files in %s to the %s format", num_converted,
+                 store.root_directory, metric_format)
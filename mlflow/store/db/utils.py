@@ -1,9 +1,16 @@
 import os
+import threading
 
 import logging
 
 from alembic.migration import MigrationContext  # pylint: disable=import-error
+from six.moves import urllib
 import sqlalchemy
+from sqlalchemy.pool import QueuePool
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.dbmodels.db_types import SQLITE
 
 
 _logger = logging.getLogger(__name__)
@@ -37,6 +44,188 @@ def _get_alembic_config(db_url, alembic_dir=None):
     return config
 
 
+def _parse_bool(value):
+    if value.lower() in ("true", "1"):
+        return True
+    if value.lower() in ("false", "0"):
+        return False
+    raise ValueError("expected 'true' or 'false'")
+
+
+# Connection pool options that may be specified in the query string of a database URI, mapped to
+# functions that parse their values. The options are passed to ``sqlalchemy.create_engine``.
+_POOL_OPTIONS = {
+    "pool_size": int,
+    "max_overflow": int,
+    "pool_timeout": int,
+    "pool_recycle": int,
+    "pool_pre_ping": _parse_bool,
+}
+
+# Pool options that are only supported by ``sqlalchemy.pool.QueuePool``.
+_QUEUE_POOL_OPTIONS = ["pool_size", "max_overflow", "pool_timeout"]
+
+
+def _with_query(db_uri, query):
+    return "%s?%s" % (db_uri, urllib.parse.urlencode(query)) if query else db_uri
+
+
+def _parse_pool_options(db_uri):
+    """
+    Extract the connection pool options listed in ``_POOL_OPTIONS`` from the query string of the
+    specified database URI.
+
+    :return: A tuple of the database URI with the pool options removed and a dictionary of the
+             parsed pool options.
+    """
+    # Split the query string off manually, since urlunparse would normalize URIs with an empty
+    # host like sqlite:////path/to/file.db
+    db_uri, _, query_string = db_uri.partition("?")
+    query = []
+    pool_options = {}
+    for key, value in urllib.parse.parse_qsl(query_string, keep_blank_values=True):
+        if key not in _POOL_OPTIONS:
+            query.append((key, value))
+            continue
+        try:
+            pool_options[key] = _POOL_OPTIONS[key](value)
+        except ValueError:
+            raise MlflowException(
+                "Invalid value '%s' for connection pool option '%s' in database URI."
+                % (value, key), INVALID_PARAMETER_VALUE)
+    return _with_query(db_uri, query), pool_options
+
+
+def _add_pool_options_to_db_uri(db_uri, pool_options):
+    """
+    Add the specified connection pool options to the query string of the database URI. Options
+    whose value is None are ignored; options already present in the URI are overridden.
+    """
+    db_uri, _, query_string = db_uri.partition("?")
+    query = [(key, value) for key, value in urllib.parse.parse_qsl(query_string,
+                                                                   keep_blank_values=True)
+             if pool_options.get(key) is None]
+    for key in sorted(pool_options):
+        value = pool_options[key]
+        if value is not None:
+            query.append((key, str(value).lower() if isinstance(value, bool) else str(value)))
+    return _with_query(db_uri, query)
+
+
+class _PoolMetrics(object):
+    """
+    Thread-safe counters describing the usage of the connection pool of a SQLAlchemy engine.
+    Wait time is the time spent acquiring a connection from the pool, including the time spent
+    opening a new database connection if none is available.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.connections_created = 0
+        self.connections_invalidated = 0
+        self.checked_out = 0
+        self.max_checked_out = 0
+        self.checkouts = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    def on_connect(self):
+        with self._lock:
+            self.connections_created += 1
+
+    def on_invalidate(self):
+        with self._lock:
+            self.connections_invalidated += 1
+
+    def on_checkout(self):
+        with self._lock:
+            self.checked_out += 1
+            self.max_checked_out = max(self.max_checked_out, self.checked_out)
+
+    def on_checkin(self):
+        with self._lock:
+            self.checked_out -= 1
+
+    def record_wait_time(self, wait_time):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def to_dict(self):
+        with self._lock:
+            mean_wait_time = self.total_wait_time / self.checkouts if self.checkouts else 0.0
+            return {
+                "connections_created": self.connections_created,
+                "connections_invalidated": self.connections_invalidated,
+                "checked_out": self.checked_out,
+                "max_checked_out": self.max_checked_out,
+                "checkouts": self.checkouts,
+                "total_wait_time": self.total_wait_time,
+                "mean_wait_time": mean_wait_time,
+                "max_wait_time": self.max_wait_time,
+            }
+
+
+def _register_pool_listeners(engine, pool_metrics):
+    """
+    Register pool event listeners that maintain ``pool_metrics`` and make the engine safe to use
+    after a fork (e.g. by gunicorn workers): a connection opened by another process is never
+    handed out, since sharing its socket would corrupt the connection for both processes. Instead,
+    the connection is discarded without being closed and the pool opens a new one.
+    See https://docs.sqlalchemy.org/en/13/core/pooling.html
+    #using-connection-pools-with-multiprocessing.
+    """
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def connect(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+        connection_record.info["pid"] = os.getpid()
+        pool_metrics.on_connect()
+
+    @sqlalchemy.event.listens_for(engine, "checkout")
+    def checkout(dbapi_connection, connection_record,  # pylint: disable=unused-argument
+                 connection_proxy):
+        pid = os.getpid()
+        if connection_record.info["pid"] != pid:
+            pool_metrics.on_invalidate()
+            connection_record.connection = connection_proxy.connection = None
+            raise sqlalchemy.exc.DisconnectionError(
+                "Connection record belongs to pid %s, attempting to check out in pid %s"
+                % (connection_record.info["pid"], pid))
+        pool_metrics.on_checkout()
+
+    @sqlalchemy.event.listens_for(engine, "checkin")
+    def checkin(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+        pool_metrics.on_checkin()
+
+
+def _is_in_memory_sqlite_uri(db_uri):
+    url = sqlalchemy.engine.url.make_url(db_uri)
+    return url.database in (None, "", ":memory:") or url.query.get("mode") == "memory"
+
+
+def _create_sqlalchemy_engine(db_uri, db_type):
+    """
+    Create a SQLAlchemy engine for the specified database URI, configuring its connection pool
+    with the options listed in ``_POOL_OPTIONS`` found in the URI's query string.
+
+    :return: A tuple of the engine and the :py:class:`_PoolMetrics` tracking its connection pool.
+    """
+    db_uri, pool_options = _parse_pool_options(db_uri)
+    if db_type == SQLITE and any(option in pool_options for option in _QUEUE_POOL_OPTIONS):
+        if _is_in_memory_sqlite_uri(db_uri):
+            # Each connection to an in-memory database opens a new, empty database
+            raise MlflowException(
+                "Connection pool options %s are not supported for in-memory SQLite databases."
+                % ", ".join(_QUEUE_POOL_OPTIONS), INVALID_PARAMETER_VALUE)
+        # SQLAlchemy uses a NullPool or SingletonThreadPool for SQLite databases, neither of which
+        # supports sizing options.
+        pool_options["poolclass"] = QueuePool
+    engine = sqlalchemy.create_engine(db_uri, **pool_options)
+    pool_metrics = _PoolMetrics()
+    _register_pool_listeners(engine, pool_metrics)
+    return engine, pool_metrics
+
+
 def _upgrade_db(url):
     """
     Upgrade the schema of an MLflow tracking database to the latest supported version.
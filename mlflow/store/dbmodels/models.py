@@ -2,7 +2,7 @@ import time
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy import (
     Column, String, Float, ForeignKey, Integer, CheckConstraint,
-    BigInteger, PrimaryKeyConstraint)
+    BigInteger, PrimaryKeyConstraint, Index)
 from sqlalchemy.ext.declarative import declarative_base
 from mlflow.entities import (
     Experiment, RunTag, Metric, Param, RunData, RunInfo,
@@ -138,6 +138,11 @@ class SqlRun(Base):
     """
     Experiment ID to which this run belongs to: *Foreign Key* into ``experiment`` table.
     """
+    version = Column(BigInteger, nullable=False, default=0, server_default='0')
+    """
+    Change counter of the run: `BigInteger`. Incremented by every write to the run, its metrics,
+    params or tags, so that readers can cheaply detect whether the run changed.
+    """
     experiment = relationship('SqlExperiment', backref=backref('runs', cascade='all'))
     """
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlExperiment`.
@@ -148,7 +153,11 @@ class SqlRun(Base):
         CheckConstraint(status.in_(RunStatusTypes), name='status'),
         CheckConstraint(lifecycle_stage.in_(LifecycleStage.view_type_to_stages(ViewType.ALL)),
                         name='runs_lifecycle_stage'),
-        PrimaryKeyConstraint('run_uuid', name='run_pk')
+        PrimaryKeyConstraint('run_uuid', name='run_pk'),
+        # Serves listing and searching the runs of experiments, which filters by experiment and
+        # lifecycle stage and orders by start time
+        Index('index_runs_experiment_id_lifecycle_stage_start_time',
+              'experiment_id', 'lifecycle_stage', 'start_time'),
     )
 
     def to_mlflow_entity(self):
@@ -168,19 +177,8 @@ class SqlRun(Base):
             lifecycle_stage=self.lifecycle_stage,
             artifact_uri=self.artifact_uri)
 
-        # only get latest recorded metrics per key
-        all_metrics = [m.to_mlflow_entity() for m in self.metrics]
-        metrics = {}
-        for m in all_metrics:
-            existing_metric = metrics.get(m.key)
-            if (existing_metric is None)\
-                or ((m.step, m.timestamp, m.value) >=
-                    (existing_metric.step, existing_metric.timestamp,
-                        existing_metric.value)):
-                metrics[m.key] = m
-
         run_data = RunData(
-            metrics=list(metrics.values()),
+            metrics=[m.to_mlflow_entity() for m in self.latest_metrics],
             params=[p.to_mlflow_entity() for p in self.params],
             tags=[t.to_mlflow_entity() for t in self.tags])
 
@@ -212,6 +210,7 @@ class SqlTag(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint('key', 'run_uuid', name='tag_pk'),
+        Index('index_tags_run_uuid', 'run_uuid'),
     )
 
     def __repr__(self):
@@ -260,6 +259,9 @@ class SqlMetric(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint('key', 'timestamp', 'step', 'run_uuid', 'value', name='metric_pk'),
+        # The primary key leads with the metric key, so cannot serve lookups of a run's metric
+        # history
+        Index('index_metrics_run_uuid_key', 'run_uuid', 'key'),
     )
 
     def __repr__(self):
@@ -278,6 +280,64 @@ class SqlMetric(Base):
             step=self.step)
 
 
+class SqlLatestMetric(Base):
+    """
+    DB model holding the latest value of each metric of a run, i.e. the value with the largest
+    (step, timestamp, value) among all values logged for the metric key. These are recorded in
+    the ``latest_metrics`` table and kept up to date whenever metrics are logged, so that runs can
+    be materialized and searched without scanning their full metric history.
+    """
+    __tablename__ = 'latest_metrics'
+
+    key = Column(String(250))
+    """
+    Metric key: `String` (limit 250 characters). Part of *Primary Key* for ``latest_metrics``
+                table.
+    """
+    value = Column(Float, nullable=False)
+    """
+    Metric value: `Float`. Defined as *Non-null* in schema.
+    """
+    timestamp = Column(BigInteger, default=lambda: int(time.time()))
+    """
+    Timestamp recorded for this metric entry: `BigInteger`.
+    """
+    step = Column(BigInteger, default=0, nullable=False)
+    """
+    Step recorded for this metric entry: `BigInteger`.
+    """
+    run_uuid = Column(String(32), ForeignKey('runs.run_uuid'))
+    """
+    Run UUID to which this metric belongs to: Part of *Primary Key* for ``latest_metrics`` table.
+                                              *Foreign Key* into ``runs`` table.
+    """
+    run = relationship('SqlRun', backref=backref('latest_metrics', cascade='all'))
+    """
+    SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
+    """
+
+    __table_args__ = (
+        PrimaryKeyConstraint('key', 'run_uuid', name='latest_metric_pk'),
+        Index('index_latest_metrics_run_uuid', 'run_uuid'),
+    )
+
+    def __repr__(self):
+        return '<SqlLatestMetric({}, {}, {}, {})>'.format(self.key, self.value, self.timestamp,
+                                                          self.step)
+
+    def to_mlflow_entity(self):
+        """
+        Convert DB model to corresponding MLflow entity.
+
+        :return: :py:class:`mlflow.entities.Metric`.
+        """
+        return Metric(
+            key=self.key,
+            value=self.value,
+            timestamp=self.timestamp,
+            step=self.step)
+
+
 class SqlParam(Base):
     __tablename__ = 'params'
 
@@ -301,6 +361,7 @@ class SqlParam(Base):
 
     __table_args__ = (
         PrimaryKeyConstraint('key', 'run_uuid', name='param_pk'),
+        Index('index_params_run_uuid', 'run_uuid'),
     )
 
     def __repr__(self):
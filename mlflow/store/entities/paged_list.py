@@ -0,0 +1,10 @@
+class PagedList(list):
+    """
+    Wrapper class around the base Python `List` type. Contains an additional ``token`` attribute
+    that can be passed to the API call that returned the list to fetch the next page of results,
+    or None if there are no further results.
+    """
+
+    def __init__(self, items, token):
+        super(PagedList, self).__init__(items)
+        self.token = token
@@ -1,9 +1,18 @@
+import errno
+import hashlib
+import heapq
+import itertools
+import json
 import logging
 import os
 import posixpath
 import sys
+import tempfile
+import time
+from multiprocessing.pool import ThreadPool
 
 import uuid
+import numpy as np
 import six
 
 from mlflow.entities import Experiment, Metric, Param, Run, RunData, RunInfo, RunStatus, RunTag, \
@@ -15,17 +24,29 @@ import mlflow.protos.databricks_pb2 as databricks_pb2
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR
 from mlflow.store import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH, SEARCH_MAX_RESULTS_THRESHOLD
 from mlflow.store.abstract_store import AbstractStore
+from mlflow.store.entities import PagedList
+from mlflow.store.binary_metrics import METRIC_FORMAT_TEXT, METRIC_FORMAT_BINARY, METRIC_FORMATS, \
+    is_binary_metric_file, create_binary_metric_file, append_binary_metric, \
+    write_binary_metric_file, read_binary_metric_records, get_latest_record_index, \
+    records_to_metrics, METRIC_RECORD_DTYPE
+from mlflow.store.metric_downsampling import validate_downsampling_params, select_step_range, \
+    downsample_records
 from mlflow.utils.validation import _validate_metric_name, _validate_param_name, _validate_run_id, \
     _validate_tag_name, _validate_experiment_id, \
     _validate_batch_log_limits, _validate_batch_log_data
 
 from mlflow.utils.env import get_env
+from mlflow.utils.search_utils import RunColumns, create_page_token, parse_page_token
 from mlflow.utils.file_utils import (is_directory, list_subdirs, mkdir, exists, write_yaml,
                                      read_yaml, find, read_file_lines, read_file,
                                      write_to, append_to, make_containing_dirs, mv, get_parent_dir,
-                                     list_all, local_file_uri_to_path, path_to_local_file_uri)
+                                     list_all, local_file_uri_to_path, path_to_local_file_uri,
+                                     exclusive_lock)
 
 _TRACKING_DIR_ENV_VAR = "MLFLOW_TRACKING_DIR"
+_METRIC_FORMAT_ENV_VAR = "MLFLOW_FILE_STORE_METRIC_FORMAT"
+_MAX_WORKERS_ENV_VAR = "MLFLOW_FILE_STORE_MAX_WORKERS"
+_DEFAULT_MAX_WORKERS = 8
 
 
 def _default_root_dir():
@@ -77,20 +98,106 @@ def _read_persisted_run_info_dict(run_info_dict):
     return RunInfo.from_dictionary(dict_copy)
 
 
+def _make_runs_summary_entry(run, mtimes):
+    # Latest metric values are kept apart from their timestamps and steps, so that the entries
+    # can serve as a RunColumns view for search filters
+    return {
+        "mtimes": mtimes,
+        "info": dict(run.info),
+        "metrics": {m.key: m.value for m in run.data._metric_objs},
+        "metric_steps": {m.key: [m.timestamp, m.step] for m in run.data._metric_objs},
+        "params": run.data.params,
+        "tags": run.data.tags,
+    }
+
+
+def _make_runs_summary_update(run_id, previous_mtimes, mtimes, info=None, metrics=(), params=(),
+                              tags=()):
+    # Values are recorded as they are read back from the run's files
+    update = {"run_id": run_id, "previous_mtimes": previous_mtimes, "mtimes": mtimes,
+              "metrics": [[m.key, float(m.value), int(m.timestamp), int(m.step)] for m in metrics],
+              "params": {p.key: FileStore._writeable_value(p.value).strip() for p in params},
+              "tags": {tag.key: FileStore._writeable_value(tag.value) for tag in tags}}
+    if info is not None:
+        update["info"] = info
+    return update
+
+
+def _apply_runs_summary_update(entry, update):
+    entry["mtimes"] = update["mtimes"]
+    if "info" in update:
+        entry["info"] = update["info"]
+    for key, value, timestamp, step in update["metrics"]:
+        # Keep the latest point, in the same order as ``FileStore._get_metric_from_file``
+        if key not in entry["metrics"] or (step, timestamp, value) > \
+                tuple(entry["metric_steps"][key][::-1]) + (entry["metrics"][key],):
+            entry["metrics"][key] = value
+            entry["metric_steps"][key] = [timestamp, step]
+    entry["params"].update(update["params"])
+    entry["tags"].update(update["tags"])
+
+
+def _run_from_summary_entry(entry):
+    metric_steps = entry["metric_steps"]
+    metrics = [Metric(key=key, value=value, timestamp=metric_steps[key][0],
+                      step=metric_steps[key][1])
+               for key, value in entry["metrics"].items()]
+    params = [Param(key, value) for key, value in entry["params"].items()]
+    tags = [RunTag(key, value) for key, value in entry["tags"].items()]
+    return Run(RunInfo.from_dictionary(entry["info"]), RunData(metrics, params, tags))
+
+
 class FileStore(AbstractStore):
     TRASH_FOLDER_NAME = ".trash"
+    # Holds one file per run, named after the run ID, which contains the path of the run's
+    # experiment directory relative to the root directory
+    RUN_INDEX_FOLDER_NAME = ".run_index"
     ARTIFACTS_FOLDER_NAME = "artifacts"
     METRICS_FOLDER_NAME = "metrics"
     PARAMS_FOLDER_NAME = "params"
     TAGS_FOLDER_NAME = "tags"
     META_DATA_FILE_NAME = "meta.yaml"
+    RUNS_SUMMARY_FILE_NAME = "runs_summary.json"
+    EXPERIMENT_NAME_INDEX_FILE_NAME = ".experiment_names.json"
+    _EXPERIMENT_NAME_INDEX_VERSION = 1
+    # Held while creating or renaming experiments, so that their names are unique across processes
+    _EXPERIMENTS_LOCK_FILE_NAME = ".experiments.lock"
+    _RUNS_SUMMARY_VERSION = 3
+    # Writes to runs stop being recorded in the runs summary file beyond this size, until the file
+    # is compacted by the next listing of the experiment's runs
+    _MAX_RUNS_SUMMARY_SIZE = 64 * 1024 * 1024
+    # Upper bound on the resolution of file modification times across file systems
+    _MTIME_RESOLUTION_SECONDS = 2
     DEFAULT_EXPERIMENT_ID = "0"
 
-    def __init__(self, root_directory=None, artifact_root_uri=None):
+    def __init__(self, root_directory=None, artifact_root_uri=None, metric_format=None,
+                 max_workers=None):
         """
         Create a new FileStore with the given root directory and a given default artifact root URI.
+
+        :param metric_format: Format in which to create new metric files, either ``"text"`` (one
+                              ``"timestamp value step"`` line per point) or ``"binary"`` (see
+                              :py:mod:`mlflow.store.binary_metrics`). Defaults to the value of the
+                              ``MLFLOW_FILE_STORE_METRIC_FORMAT`` environment variable, or
+                              ``"text"`` if it is unset. Metrics are always appended to existing
+                              files in the format of the file, so both formats can coexist.
+        :param max_workers: Maximum number of threads used to load runs concurrently when listing
+                            and searching runs, which hides the latency of the many small file
+                            reads involved on network file systems. Defaults to the value of the
+                            ``MLFLOW_FILE_STORE_MAX_WORKERS`` environment variable, or 8 if it is
+                            unset. A value of 1 loads runs serially.
         """
         super(FileStore, self).__init__()
+        self.metric_format = metric_format or get_env(_METRIC_FORMAT_ENV_VAR) or METRIC_FORMAT_TEXT
+        if self.metric_format not in METRIC_FORMATS:
+            raise MlflowException("Invalid metric format '%s'. Supported formats are %s."
+                                  % (self.metric_format, METRIC_FORMATS),
+                                  databricks_pb2.INVALID_PARAMETER_VALUE)
+        self.max_workers = int(max_workers or get_env(_MAX_WORKERS_ENV_VAR) or
+                               _DEFAULT_MAX_WORKERS)
+        if self.max_workers < 1:
+            raise MlflowException("Invalid maximum number of workers %s. It must be at least 1."
+                                  % self.max_workers, databricks_pb2.INVALID_PARAMETER_VALUE)
         self.root_directory = local_file_uri_to_path(root_directory or _default_root_dir())
         self.artifact_root_uri = artifact_root_uri or path_to_local_file_uri(self.root_directory)
         self.trash_folder = os.path.join(self.root_directory, FileStore.TRASH_FOLDER_NAME)
@@ -135,25 +242,20 @@ class FileStore(AbstractStore):
         return os.path.join(self._get_experiment_path(experiment_id, assert_exists=True),
                             run_uuid)
 
-    def _get_metric_path(self, experiment_id, run_uuid, metric_key):
-        _validate_run_id(run_uuid)
+    @staticmethod
+    def _get_metric_path(run_dir, metric_key):
         _validate_metric_name(metric_key)
-        return os.path.join(self._get_run_dir(experiment_id, run_uuid),
-                            FileStore.METRICS_FOLDER_NAME,
-                            metric_key)
+        return os.path.join(run_dir, FileStore.METRICS_FOLDER_NAME, metric_key)
 
-    def _get_param_path(self, experiment_id, run_uuid, param_name):
-        _validate_run_id(run_uuid)
+    @staticmethod
+    def _get_param_path(run_dir, param_name):
         _validate_param_name(param_name)
-        return os.path.join(self._get_run_dir(experiment_id, run_uuid),
-                            FileStore.PARAMS_FOLDER_NAME,
-                            param_name)
+        return os.path.join(run_dir, FileStore.PARAMS_FOLDER_NAME, param_name)
 
-    def _get_tag_path(self, experiment_id, run_uuid, tag_name):
-        _validate_run_id(run_uuid)
+    @staticmethod
+    def _get_tag_path(run_dir, tag_name):
         _validate_tag_name(tag_name)
-        return os.path.join(self._get_run_dir(experiment_id, run_uuid), FileStore.TAGS_FOLDER_NAME,
-                            tag_name)
+        return os.path.join(run_dir, FileStore.TAGS_FOLDER_NAME, tag_name)
 
     def _get_artifact_dir(self, experiment_id, run_uuid):
         _validate_run_id(run_uuid)
@@ -164,7 +266,9 @@ class FileStore(AbstractStore):
 
     def _get_active_experiments(self, full_path=False):
         exp_list = list_subdirs(self.root_directory, full_path)
-        return [exp for exp in exp_list if not exp.endswith(FileStore.TRASH_FOLDER_NAME)]
+        # Folders whose names start with a dot, like the trash and run index folders, are not
+        # experiments
+        return [exp for exp in exp_list if not os.path.basename(exp).startswith(".")]
 
     def _get_deleted_experiments(self, full_path=False):
         return list_subdirs(self.trash_folder, full_path)
@@ -196,6 +300,7 @@ class FileStore(AbstractStore):
             os.path.join(self.root_directory, str(experiment_id)))
         experiment = Experiment(experiment_id, name, artifact_uri, LifecycleStage.ACTIVE)
         write_yaml(meta_dir, FileStore.META_DATA_FILE_NAME, dict(experiment))
+        self._index_experiment_name(str(experiment_id), name)
         return experiment_id
 
     def create_experiment(self, name, artifact_location=None):
@@ -203,23 +308,154 @@ class FileStore(AbstractStore):
         if name is None or name == "":
             raise MlflowException("Invalid experiment name '%s'" % name,
                                   databricks_pb2.INVALID_PARAMETER_VALUE)
-        experiment = self.get_experiment_by_name(name)
-        if experiment is not None:
-            if experiment.lifecycle_stage == LifecycleStage.DELETED:
-                raise MlflowException(
-                    "Experiment '%s' already exists in deleted state. "
-                    "You can restore the experiment, or permanently delete the experiment "
-                    "from the .trash folder (under tracking server's root folder) before "
-                    "creating a new one with the same name." % experiment.name,
-                    databricks_pb2.RESOURCE_ALREADY_EXISTS)
+        with self._experiments_lock():
+            experiment = self.get_experiment_by_name(name)
+            if experiment is not None:
+                if experiment.lifecycle_stage == LifecycleStage.DELETED:
+                    raise MlflowException(
+                        "Experiment '%s' already exists in deleted state. "
+                        "You can restore the experiment, or permanently delete the experiment "
+                        "from the .trash folder (under tracking server's root folder) before "
+                        "creating a new one with the same name." % experiment.name,
+                        databricks_pb2.RESOURCE_ALREADY_EXISTS)
+                else:
+                    raise MlflowException("Experiment '%s' already exists." % experiment.name,
+                                          databricks_pb2.RESOURCE_ALREADY_EXISTS)
+            # Get all existing experiments and find the one with largest ID.
+            # len(list_all(..)) would not work when experiments are deleted.
+            experiments_ids = [int(e.experiment_id) for e in self.list_experiments(ViewType.ALL)]
+            experiment_id = max(experiments_ids) + 1 if experiments_ids else 0
+            return self._create_experiment_with_id(name, str(experiment_id), artifact_location)
+
+    def _experiments_lock(self):
+        """
+        Return a context manager holding a lock shared by all processes using this store's root
+        directory. Experiments are only created or renamed while holding it, so that checking
+        that their names are unique and writing them happen atomically.
+        """
+        return exclusive_lock(os.path.join(self.root_directory,
+                                           FileStore._EXPERIMENTS_LOCK_FILE_NAME))
+
+    @staticmethod
+    def _get_meta_stat(experiment_dir):
+        try:
+            stat = os.stat(os.path.join(experiment_dir, FileStore.META_DATA_FILE_NAME))
+        except OSError:
+            return None
+        return stat.st_mtime, stat.st_size
+
+    def _read_experiment_name_index(self):
+        """
+        Read the experiment name index file under the root directory. Return a tuple of a
+        dictionary mapping experiment names to IDs and a dictionary mapping each experiment ID to
+        a list of the modification time and size of the experiment's meta.yaml when it was read,
+        and the experiment's name. Both are empty if the file is missing or cannot be read.
+        """
+        index_path = os.path.join(self.root_directory, FileStore.EXPERIMENT_NAME_INDEX_FILE_NAME)
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}, {}
+        if not isinstance(index, dict) or \
+                index.get("version") != FileStore._EXPERIMENT_NAME_INDEX_VERSION:
+            return {}, {}
+        return index.get("names", {}), index.get("experiments", {})
+
+    def _write_experiment_name_index(self, names, experiments):
+        """
+        Atomically replace the experiment name index file. Failures are logged and otherwise
+        ignored, since the index only serves as a cache.
+        """
+        index_path = os.path.join(self.root_directory, FileStore.EXPERIMENT_NAME_INDEX_FILE_NAME)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.root_directory, prefix=".experiment-names-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"version": FileStore._EXPERIMENT_NAME_INDEX_VERSION,
+                               "names": names, "experiments": experiments}, f)
+                if sys.platform == "win32" and os.path.exists(index_path):
+                    os.remove(index_path)
+                os.rename(tmp_path, index_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except (IOError, OSError) as e:
+            logging.debug("Failed to write experiment name index file '%s': %s", index_path, e)
+
+    def _index_experiment_name(self, experiment_id, name):
+        """
+        Record the new name of an experiment in the experiment name index. The experiment's
+        meta.yaml has just been written, so it is read again by the next refresh of the index.
+        """
+        names, experiments = self._read_experiment_name_index()
+        names = {indexed_name: indexed_id for indexed_name, indexed_id in names.items()
+                 if indexed_id != experiment_id}
+        names[name] = experiment_id
+        experiments[experiment_id] = [None, None, name]
+        self._write_experiment_name_index(names, experiments)
+
+    def _refresh_experiment_name_index(self):
+        """
+        Bring the experiment name index file up to date with the experiments on disk, and return
+        the dictionary mapping experiment names to IDs. Only the meta.yaml files of experiments
+        that are new or were modified since they were last indexed are read. Active experiments
+        take precedence over deleted ones.
+        """
+        indexed_names, indexed_experiments = self._read_experiment_name_index()
+        names = {}
+        experiments = {}
+        # Don't trust the modification times of files modified too recently: a write that
+        # follows within the resolution of the file system's timestamps would not change them.
+        max_indexed_mtime = time.time() - FileStore._MTIME_RESOLUTION_SECONDS
+        all_experiments = self._get_active_experiments(True) + self._get_deleted_experiments(True)
+        for experiment_dir in all_experiments:
+            experiment_id = os.path.basename(os.path.abspath(experiment_dir))
+            if experiment_id in experiments:
+                continue
+            meta_stat = self._get_meta_stat(experiment_dir)
+            if meta_stat is None:
+                continue
+            indexed_mtime, indexed_size, name = \
+                indexed_experiments.get(experiment_id, [None, None, None])
+            if [indexed_mtime, indexed_size] != list(meta_stat):
+                try:
+                    meta = read_yaml(experiment_dir, FileStore.META_DATA_FILE_NAME) or {}
+                except MissingConfigException:
+                    continue
+                if str(meta.get("experiment_id")) != experiment_id:
+                    # Malformed experiments are ignored, as in ``list_experiments``
+                    continue
+                name = meta.get("name")
+            if meta_stat[0] <= max_indexed_mtime:
+                experiments[experiment_id] = [meta_stat[0], meta_stat[1], name]
             else:
-                raise MlflowException("Experiment '%s' already exists." % experiment.name,
-                                      databricks_pb2.RESOURCE_ALREADY_EXISTS)
-        # Get all existing experiments and find the one with largest ID.
-        # len(list_all(..)) would not work when experiments are deleted.
-        experiments_ids = [int(e.experiment_id) for e in self.list_experiments(ViewType.ALL)]
-        experiment_id = max(experiments_ids) + 1 if experiments_ids else 0
-        return self._create_experiment_with_id(name, str(experiment_id), artifact_location)
+                experiments[experiment_id] = [None, None, name]
+            names.setdefault(name, experiment_id)
+        if names != indexed_names or experiments != indexed_experiments:
+            self._write_experiment_name_index(names, experiments)
+        return names
+
+    def get_experiment_by_name(self, experiment_name):
+        """
+        Fetch an experiment by name. Lookups are served from the experiment name index file,
+        which is validated against the indexed experiment's meta.yaml and refreshed from disk if
+        the name is unknown or the indexed experiment no longer has that name.
+        """
+        self._check_root_dir()
+        names, _ = self._read_experiment_name_index()
+        experiment_id = names.get(experiment_name)
+        if experiment_id is not None:
+            try:
+                experiment = self._get_experiment(experiment_id)
+            except (MlflowException, MissingConfigException):
+                experiment = None
+            if experiment is not None and experiment.name == experiment_name:
+                return experiment
+        experiment_id = self._refresh_experiment_name_index().get(experiment_name)
+        if experiment_id is None:
+            return None
+        return self._get_experiment(experiment_id)
 
     def _has_experiment(self, experiment_id):
         return self._get_experiment_path(experiment_id) is not None
@@ -259,12 +495,46 @@ class FileStore(AbstractStore):
                                   databricks_pb2.RESOURCE_DOES_NOT_EXIST)
         return experiment
 
+    def get_experiment_version(self, experiment_id):
+        """
+        Derive the version of the experiment from its location, the modification time of its
+        metadata file and the IDs and modification times of its run directories, which are
+        updated by every write to the run (see ``_touch_run_dir``). This only lists the experiment
+        directory and stats its entries, without reading any run.
+        """
+        experiment_id = FileStore.DEFAULT_EXPERIMENT_ID if experiment_id is None else experiment_id
+        self._check_root_dir()
+        _validate_experiment_id(experiment_id)
+        experiment_dir = self._get_experiment_path(experiment_id)
+        if experiment_dir is None:
+            return None
+        paths = [os.path.join(experiment_dir, FileStore.META_DATA_FILE_NAME)] + \
+            list_all(experiment_dir, os.path.isdir, full_path=True)
+        return self._get_mtime_version(paths)
+
+    @staticmethod
+    def _get_mtime_version(paths):
+        """
+        Return a version string derived from the given paths and their modification times, or None
+        if any of them was modified too recently: a write that follows within the resolution of
+        the file system's timestamps would not change the version.
+        """
+        try:
+            mtimes = [(path, os.path.getmtime(path)) for path in paths]
+        except OSError:
+            return None
+        if any(mtime > time.time() - FileStore._MTIME_RESOLUTION_SECONDS for _, mtime in mtimes):
+            return None
+        return hashlib.sha1(repr(sorted(mtimes)).encode("utf-8")).hexdigest()
+
     def delete_experiment(self, experiment_id):
         experiment_dir = self._get_experiment_path(experiment_id, ViewType.ACTIVE_ONLY)
         if experiment_dir is None:
             raise MlflowException("Could not find experiment with ID %s" % experiment_id,
                                   databricks_pb2.RESOURCE_DOES_NOT_EXIST)
         mv(experiment_dir, self.trash_folder)
+        self._index_experiment_runs(
+            os.path.join(self.trash_folder, os.path.basename(experiment_dir)))
 
     def restore_experiment(self, experiment_id):
         experiment_dir = self._get_experiment_path(experiment_id, ViewType.DELETED_ONLY)
@@ -278,6 +548,8 @@ class FileStore(AbstractStore):
                 "An experiment with same ID already exists." % experiment_id,
                 databricks_pb2.RESOURCE_ALREADY_EXISTS)
         mv(experiment_dir, self.root_directory)
+        self._index_experiment_runs(
+            os.path.join(self.root_directory, os.path.basename(experiment_dir)))
 
     def rename_experiment(self, experiment_id, new_name):
         meta_dir = os.path.join(self.root_directory, experiment_id)
@@ -290,7 +562,14 @@ class FileStore(AbstractStore):
         if experiment.lifecycle_stage != LifecycleStage.ACTIVE:
             raise Exception("Cannot rename experiment in non-active lifecycle stage."
                             " Current stage: %s" % experiment.lifecycle_stage)
-        write_yaml(meta_dir, FileStore.META_DATA_FILE_NAME, dict(experiment), overwrite=True)
+        with self._experiments_lock():
+            conflict_experiment = self.get_experiment_by_name(new_name)
+            if conflict_experiment is not None and \
+                    conflict_experiment.experiment_id != experiment.experiment_id:
+                raise MlflowException("Experiment '%s' already exists." % new_name,
+                                      databricks_pb2.RESOURCE_ALREADY_EXISTS)
+            write_yaml(meta_dir, FileStore.META_DATA_FILE_NAME, dict(experiment), overwrite=True)
+            self._index_experiment_name(experiment.experiment_id, new_name)
 
     def delete_run(self, run_id):
         run_info = self._get_run_info(run_id)
@@ -319,21 +598,100 @@ class FileStore(AbstractStore):
             return get_parent_dir(parent)
         return parent
 
+    def _index_run(self, run_uuid, experiment_dir):
+        """
+        Record the experiment directory of a run in the run index folder. The file is replaced
+        atomically; failures are logged and otherwise ignored, since the index only serves as a
+        cache.
+        """
+        index_dir = os.path.join(self.root_directory, FileStore.RUN_INDEX_FOLDER_NAME)
+        try:
+            if not exists(index_dir):
+                try:
+                    os.makedirs(index_dir)
+                except OSError as e:
+                    if e.errno != errno.EEXIST:
+                        raise
+            fd, tmp_path = tempfile.mkstemp(dir=index_dir, prefix=".run-index-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(os.path.relpath(experiment_dir, self.root_directory))
+                index_path = os.path.join(index_dir, run_uuid)
+                if sys.platform == "win32" and os.path.exists(index_path):
+                    os.remove(index_path)
+                os.rename(tmp_path, index_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except (IOError, OSError) as e:
+            logging.debug("Failed to index run '%s': %s", run_uuid, e)
+
+    def _index_experiment_runs(self, experiment_dir):
+        """
+        Update the run index entries of all runs under the given experiment directory, e.g.
+        after the experiment has been moved to or from the trash folder.
+        """
+        for run_uuid in list_subdirs(experiment_dir, full_path=False):
+            self._index_run(run_uuid, experiment_dir)
+
+    def _read_run_index(self, run_uuid):
+        """
+        Return a tuple of (experiment ID, run directory) for the specified run as recorded in the
+        run index folder, or ``(None, None)`` if the run is not indexed.
+        """
+        try:
+            relative_experiment_dir = read_file(
+                os.path.join(self.root_directory, FileStore.RUN_INDEX_FOLDER_NAME), run_uuid)
+        except (IOError, OSError):
+            return None, None
+        experiment_dir = os.path.join(self.root_directory, relative_experiment_dir)
+        return os.path.basename(experiment_dir), os.path.join(experiment_dir, run_uuid)
+
     def _find_run_root(self, run_uuid):
-        _validate_run_id(run_uuid)
+        """
+        Return a tuple of (experiment ID, run directory) for the specified run, or
+        ``(None, None)`` if the run does not exist. Lookups are served from the run index folder
+        and validated by checking that the indexed run directory exists; runs that are not indexed
+        or have been moved (e.g. by another process) are looked up in every experiment and
+        indexed again.
+        """
+        return self._find_run_roots([run_uuid])[run_uuid]
+
+    def _find_run_roots(self, run_uuids):
+        """
+        Return a dictionary mapping each of the specified runs to a tuple of (experiment ID, run
+        directory), as returned by ``_find_run_root``. The experiments are listed at most once,
+        however many of the runs are not indexed or have been moved.
+        """
+        for run_uuid in run_uuids:
+            _validate_run_id(run_uuid)
         self._check_root_dir()
+        run_roots = {}
+        missing_run_uuids = []
+        for run_uuid in run_uuids:
+            experiment_id, run_dir = self._read_run_index(run_uuid)
+            if run_dir is not None and is_directory(run_dir):
+                run_roots[run_uuid] = (experiment_id, run_dir)
+            else:
+                missing_run_uuids.append(run_uuid)
+        if not missing_run_uuids:
+            return run_roots
+        # Active experiments take precedence over deleted ones
         all_experiments = self._get_active_experiments(True) + self._get_deleted_experiments(True)
-        for experiment_dir in all_experiments:
-            runs = find(experiment_dir, run_uuid, full_path=True)
-            if len(runs) == 0:
-                continue
-            return os.path.basename(os.path.abspath(experiment_dir)), runs[0]
-        return None, None
+        for run_uuid in missing_run_uuids:
+            run_roots[run_uuid] = (None, None)
+            for experiment_dir in all_experiments:
+                run_dir = os.path.join(experiment_dir, run_uuid)
+                if is_directory(run_dir):
+                    self._index_run(run_uuid, experiment_dir)
+                    run_roots[run_uuid] = (os.path.basename(os.path.abspath(experiment_dir)),
+                                           run_dir)
+                    break
+        return run_roots
 
     def update_run_info(self, run_id, run_status, end_time):
         _validate_run_id(run_id)
-        run_info = self.get_run(run_id).info
-        check_run_is_active(run_info)
+        run_info, _ = self._get_active_run(run_id)
         new_info = run_info._copy_with_overrides(run_status, end_time)
         self._overwrite_run_info(new_info)
         return new_info
@@ -364,13 +722,15 @@ class FileStore(AbstractStore):
         # Persist run metadata and create directories for logging metrics, parameters, artifacts
         run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
         mkdir(run_dir)
+        self._index_run(run_uuid, os.path.dirname(run_dir))
         run_info_dict = _make_persisted_run_info_dict(run_info)
         write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict)
         mkdir(run_dir, FileStore.METRICS_FOLDER_NAME)
         mkdir(run_dir, FileStore.PARAMS_FOLDER_NAME)
         mkdir(run_dir, FileStore.ARTIFACTS_FOLDER_NAME)
         for tag in tags:
-            self.set_tag(run_uuid, tag)
+            _validate_tag_name(tag.key)
+            self._set_run_tag(run_dir, tag)
         return Run(run_info=run_info, run_data=None)
 
     def get_run(self, run_id):
@@ -378,13 +738,59 @@ class FileStore(AbstractStore):
         Note: Will get both active and deleted runs.
         """
         _validate_run_id(run_id)
-        run_info = self._get_run_info(run_id)
+        exp_id, run_dir = self._find_run_root(run_id)
+        run_info = self._get_run_info_from_root(run_id, exp_id, run_dir)
+        return self._get_run_from_dir(run_info, run_dir)
+
+    def get_run_version(self, run_id):
+        _, run_dir = self._find_run_root(run_id)
+        if run_dir is None:
+            return None
+        return self._get_mtime_version([run_dir])
+
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs, locating all of them with a single pass over the run index and
+        loading them in parallel. Note: Will get both active and deleted runs.
+        """
+        run_roots = self._find_run_roots(run_ids)
+
+        def _load_run(run_id):
+            exp_id, run_dir = run_roots[run_id]
+            run_info = self._get_run_info_from_root(run_id, exp_id, run_dir)
+            return self._get_run_from_dir(run_info, run_dir)
+
+        unique_run_ids = list(run_roots)
+        runs_by_id = dict(zip(unique_run_ids, self._map_runs(_load_run, unique_run_ids)))
+        return [runs_by_id[run_id] for run_id in run_ids]
+
+    @staticmethod
+    def _get_run_info_from_root(run_id, exp_id, run_dir):
+        """
+        Read the metadata of a run located with ``_find_run_root``, raising an exception if the
+        run does not exist or its metadata is invalid.
+        """
+        if run_dir is None:
+            raise MlflowException("Run '%s' not found" % run_id,
+                                  databricks_pb2.RESOURCE_DOES_NOT_EXIST)
+        run_info = FileStore._get_run_info_from_dir(exp_id, run_dir)
         if run_info is None:
             raise MlflowException("Run '%s' metadata is in invalid state." % run_id,
                                   databricks_pb2.INVALID_STATE)
-        metrics = self.get_all_metrics(run_id)
-        params = self.get_all_params(run_id)
-        tags = self.get_all_tags(run_id)
+        return run_info
+
+    @staticmethod
+    def _get_run_from_dir(run_info, run_dir):
+        """
+        Load the metrics, params and tags of the run whose metadata ``run_info`` has already been
+        read from ``run_dir``, without reading the metadata file again.
+        """
+        metric_dir, metric_files = FileStore._get_resource_files(run_dir, "metric")
+        param_dir, param_files = FileStore._get_resource_files(run_dir, "param")
+        tag_dir, tag_files = FileStore._get_resource_files(run_dir, "tag")
+        metrics = [FileStore._get_metric_from_file(metric_dir, f) for f in metric_files]
+        params = [FileStore._get_param_from_file(param_dir, f) for f in param_files]
+        tags = [FileStore._get_tag_from_file(tag_dir, f) for f in tag_files]
         return Run(run_info, RunData(metrics, params, tags))
 
     def _get_run_info(self, run_uuid):
@@ -395,7 +801,10 @@ class FileStore(AbstractStore):
         if run_dir is None:
             raise MlflowException("Run '%s' not found" % run_uuid,
                                   databricks_pb2.RESOURCE_DOES_NOT_EXIST)
+        return self._get_run_info_from_dir(exp_id, run_dir)
 
+    @staticmethod
+    def _get_run_info_from_dir(exp_id, run_dir):
         meta = read_yaml(run_dir, FileStore.META_DATA_FILE_NAME)
         run_info = _read_persisted_run_info_dict(meta)
         if run_info.experiment_id != exp_id:
@@ -405,12 +814,35 @@ class FileStore(AbstractStore):
             return None
         return run_info
 
+    def _get_active_run(self, run_uuid):
+        """
+        Return a tuple of (RunInfo, run directory) for a run that is about to be written to,
+        raising an exception if the run is not active. Only the run's metadata file is read, so
+        the cost does not depend on how many metrics, params or tags the run already contains.
+        """
+        exp_id, run_dir = self._find_run_root(run_uuid)
+        if run_dir is None:
+            raise MlflowException("Run '%s' not found" % run_uuid,
+                                  databricks_pb2.RESOURCE_DOES_NOT_EXIST)
+        run_info = self._get_run_info_from_dir(exp_id, run_dir)
+        if run_info is None:
+            raise MlflowException("Run '%s' metadata is in invalid state." % run_uuid,
+                                  databricks_pb2.INVALID_STATE)
+        check_run_is_active(run_info)
+        return run_info, run_dir
+
     def _get_run_files(self, run_uuid, resource_type):
         _validate_run_id(run_uuid)
         run_info = self._get_run_info(run_uuid)
         if run_info is None:
             raise MlflowException("Run '%s' metadata is in invalid state." % run_uuid,
                                   databricks_pb2.INVALID_STATE)
+        _, run_dir = self._find_run_root(run_uuid)
+        # run_dir exists since run validity has been confirmed above.
+        return self._get_resource_files(run_dir, resource_type)
+
+    @staticmethod
+    def _get_resource_files(run_dir, resource_type):
         if resource_type == "metric":
             subfolder_name = FileStore.METRICS_FOLDER_NAME
         elif resource_type == "param":
@@ -419,8 +851,6 @@ class FileStore(AbstractStore):
             subfolder_name = FileStore.TAGS_FOLDER_NAME
         else:
             raise Exception("Looking for unknown resource under run.")
-        _, run_dir = self._find_run_root(run_uuid)
-        # run_dir exists since run validity has been confirmed above.
         source_dirs = find(run_dir, subfolder_name, full_path=True)
         if len(source_dirs) == 0:
             return run_dir, []
@@ -441,6 +871,15 @@ class FileStore(AbstractStore):
     @staticmethod
     def _get_metric_from_file(parent_path, metric_name):
         _validate_metric_name(metric_name)
+        metric_path = os.path.join(parent_path, metric_name)
+        if is_binary_metric_file(metric_path):
+            # Find the latest point with vectorized operations over the memory-mapped records,
+            # rather than converting every point to a Metric
+            records = read_binary_metric_records(metric_path)
+            if len(records) == 0:
+                raise ValueError("Metric '%s' is malformed. No data found." % metric_name)
+            latest_index = get_latest_record_index(records)
+            return records_to_metrics(metric_name, records[latest_index:latest_index + 1])[0]
         metric_objs = [FileStore._get_metric_from_line(metric_name, line)
                        for line in read_file_lines(parent_path, metric_name)]
         if len(metric_objs) == 0:
@@ -460,7 +899,11 @@ class FileStore(AbstractStore):
         return metrics
 
     @staticmethod
-    def _get_metric_from_line(metric_name, metric_line):
+    def _parse_metric_line(metric_name, metric_line):
+        """
+        Parse a line of a metric file in the text format into a ``(timestamp, value, step)``
+        tuple.
+        """
         metric_parts = metric_line.strip().split(" ")
         if len(metric_parts) != 2 and len(metric_parts) != 3:
             raise MlflowException("Metric '%s' is malformed; persisted metric data contained %s "
@@ -469,17 +912,74 @@ class FileStore(AbstractStore):
         ts = int(metric_parts[0])
         val = float(metric_parts[1])
         step = int(metric_parts[2]) if len(metric_parts) == 3 else 0
+        return ts, val, step
+
+    @staticmethod
+    def _get_metric_from_line(metric_name, metric_line):
+        ts, val, step = FileStore._parse_metric_line(metric_name, metric_line)
         return Metric(key=metric_name, value=val, timestamp=ts, step=step)
 
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(self, run_id, metric_key, max_points=None, min_step=None,
+                           max_step=None, aggregation=None):
         _validate_run_id(run_id)
         _validate_metric_name(metric_key)
+        aggregation = validate_downsampling_params(max_points, min_step, max_step, aggregation)
         parent_path, metric_files = self._get_run_files(run_id, "metric")
         if metric_key not in metric_files:
             raise MlflowException("Metric '%s' not found under run '%s'" % (metric_key, run_id),
                                   databricks_pb2.RESOURCE_DOES_NOT_EXIST)
-        return [FileStore._get_metric_from_line(metric_key, line)
-                for line in read_file_lines(parent_path, metric_key)]
+        if not max_points and min_step is None and max_step is None:
+            return FileStore._get_metric_history_from_file(parent_path, metric_key)
+        records = select_step_range(
+            FileStore._read_metric_records_from_file(parent_path, metric_key), min_step, max_step)
+        if max_points:
+            records = downsample_records(records, max_points, aggregation)
+        return records_to_metrics(metric_key, records)
+
+    def get_metric_histories(self, history_keys):
+        """
+        Return the histories of multiple metrics, locating their runs with a single pass over the
+        run index and reading the metric files in parallel.
+        """
+        history_keys = list(history_keys)
+        for _, metric_key in history_keys:
+            _validate_metric_name(metric_key)
+        run_roots = self._find_run_roots([run_id for run_id, _ in history_keys])
+        # Check that every run exists and has valid metadata, as get_metric_history does
+        self._map_runs(lambda run_root: self._get_run_info_from_root(run_root[0], *run_root[1]),
+                       list(run_roots.items()))
+
+        def _read_history(history_key):
+            run_id, metric_key = history_key
+            metric_dir = os.path.join(run_roots[run_id][1], FileStore.METRICS_FOLDER_NAME)
+            if not os.path.isfile(os.path.join(metric_dir, metric_key)):
+                raise MlflowException("Metric '%s' not found under run '%s'" % (metric_key, run_id),
+                                      databricks_pb2.RESOURCE_DOES_NOT_EXIST)
+            return FileStore._get_metric_history_from_file(metric_dir, metric_key)
+
+        return self._map_runs(_read_history, history_keys)
+
+    @staticmethod
+    def _read_metric_records_from_file(parent_path, metric_name):
+        """
+        Read the history of a metric as a structured array with dtype ``METRIC_RECORD_DTYPE``,
+        without creating a :py:class:`mlflow.entities.Metric` for each point. Binary metric files
+        are memory-mapped; text metric files are parsed line by line as they are read.
+        """
+        metric_path = os.path.join(parent_path, metric_name)
+        if is_binary_metric_file(metric_path):
+            return read_binary_metric_records(metric_path)
+        with open(metric_path) as f:
+            points = [FileStore._parse_metric_line(metric_name, line) for line in f]
+        return np.array(points, dtype=METRIC_RECORD_DTYPE)
+
+    @staticmethod
+    def _get_metric_history_from_file(parent_path, metric_name):
+        metric_path = os.path.join(parent_path, metric_name)
+        if is_binary_metric_file(metric_path):
+            return records_to_metrics(metric_name, read_binary_metric_records(metric_path))
+        return [FileStore._get_metric_from_line(metric_name, line)
+                for line in read_file_lines(parent_path, metric_name)]
 
     @staticmethod
     def _get_param_from_file(parent_path, param_name):
@@ -513,51 +1013,278 @@ class FileStore(AbstractStore):
             tags.append(self._get_tag_from_file(parent_path, tag_file))
         return tags
 
+    def list_run_infos(self, experiment_id, run_view_type):
+        """
+        Return the metadata of the experiment's runs in the same order as ``search_runs``. Runs
+        without a valid entry in the runs summary file only have their metadata file read.
+        """
+        return heapq.nsmallest(SEARCH_MAX_RESULTS_THRESHOLD,
+                               self._list_run_infos(experiment_id, run_view_type),
+                               key=lambda info: (-info.start_time, info.run_id))
+
     def _list_run_infos(self, experiment_id, view_type):
+        return [RunInfo.from_dictionary(entry["info"])
+                for entry in self._list_run_entries(experiment_id, view_type, info_only=True)]
+
+    def _list_run_entries(self, experiment_id, view_type, info_only=False):
         self._check_root_dir()
         if not self._has_experiment(experiment_id):
             return []
         experiment_dir = self._get_experiment_path(experiment_id, assert_exists=True)
+        entries = self._get_experiment_run_entries(experiment_id, experiment_dir, info_only)
+        return [entry for entry in entries
+                if LifecycleStage.matches_view_type(view_type, entry["info"]["lifecycle_stage"])]
+
+    def _get_experiment_run_entries(self, experiment_id, experiment_dir, info_only=False):
+        """
+        Return the runs summary entries (see ``_read_runs_summary``) of all runs of the
+        experiment, in directory listing order. Use ``_run_from_summary_entry`` to turn an entry
+        into a :py:class:`mlflow.entities.Run`.
+
+        An entry in the experiment's runs summary file is used only if the modification times of
+        the run directory and of its metrics, params and tags folders (see ``_get_run_mtimes``)
+        match the ones recorded in the entry. Other runs are loaded from their directories, after
+        which the summary file is rewritten.
+
+        :param info_only: If True, only the metadata of runs without a valid entry is loaded, and
+                          the returned entries of these runs only contain their ``"info"``. The
+                          summary file is left unchanged.
+        """
         run_uuids = list_all(experiment_dir, os.path.isdir, full_path=False)
-        run_infos = []
-        for r_id in run_uuids:
+        summary, num_updates = self._read_runs_summary(experiment_dir)
+        entries = {}
+        runs_to_load = []
+        for run_uuid in run_uuids:
+            run_dir = os.path.join(experiment_dir, run_uuid)
+            mtimes = self._get_run_mtimes(run_dir)
+            entry = summary.get(run_uuid)
+            if entry is not None and entry["mtimes"] == mtimes:
+                entries[run_uuid] = entry
+            else:
+                runs_to_load.append((run_uuid, run_dir, mtimes))
+
+        def _load_run(run_to_load):
+            run_uuid, run_dir, _ = run_to_load
             try:
                 # trap and warn known issues, will raise unexpected exceptions to caller
-                run_info = self._get_run_info(r_id)
-                if run_info is None:
-                    continue
-                if LifecycleStage.matches_view_type(view_type, run_info.lifecycle_stage):
-                    run_infos.append(run_info)
+                run_info = self._get_run_info_from_dir(experiment_id, run_dir)
+                if run_info is None or info_only:
+                    return run_info
+                return self._get_run_from_dir(run_info, run_dir)
             except MissingConfigException as rnfe:
                 # trap malformed run exception and log warning
-                logging.warning("Malformed run '%s'. Detailed error %s", r_id, str(rnfe),
+                logging.warning("Malformed run '%s'. Detailed error %s", run_uuid, str(rnfe),
                                 exc_info=True)
-        return run_infos
+                return None
+
+        loaded = self._map_runs(_load_run, runs_to_load)
+        if info_only:
+            for (run_uuid, _, _), run_info in zip(runs_to_load, loaded):
+                if run_info is not None:
+                    entries[run_uuid] = {"info": dict(run_info)}
+            return [entries[run_uuid] for run_uuid in run_uuids if run_uuid in entries]
+        for (run_uuid, _, mtimes), run in zip(runs_to_load, loaded):
+            if run is not None:
+                entries[run_uuid] = _make_runs_summary_entry(run, mtimes)
+        # Don't record runs modified too recently in the summary: a write that follows within the
+        # resolution of the file system's timestamps would not change their modification times.
+        max_summary_mtime = time.time() - FileStore._MTIME_RESOLUTION_SECONDS
+        new_summary = {run_uuid: entry for run_uuid, entry in entries.items()
+                       if max(mtime for mtime in entry["mtimes"] if mtime is not None) <=
+                       max_summary_mtime}
+        if num_updates > 0 or new_summary != summary:
+            self._write_runs_summary(experiment_dir, new_summary)
+        return [entries[run_uuid] for run_uuid in run_uuids if run_uuid in entries]
+
+    @staticmethod
+    def _get_run_mtimes(run_dir):
+        """
+        Return the modification times of a run directory and of its metrics, params and tags
+        folders, or None for missing folders. Every write to the run through this store updates
+        the first one (see ``_touch_run_dir``), while adding metric, param or tag files in any
+        other way updates one of the others.
+        """
+        mtimes = [os.path.getmtime(run_dir)]
+        for folder_name in [FileStore.METRICS_FOLDER_NAME, FileStore.PARAMS_FOLDER_NAME,
+                            FileStore.TAGS_FOLDER_NAME]:
+            try:
+                mtimes.append(os.path.getmtime(os.path.join(run_dir, folder_name)))
+            except OSError:
+                mtimes.append(None)
+        return mtimes
+
+    @staticmethod
+    def _read_runs_summary(experiment_dir):
+        """
+        Read the runs summary file of an experiment, which maps the ID of each of its runs to the
+        run's metadata, latest metrics, params and tags, as well as the modification times of the
+        run's directories when they were read.
+
+        The first line of the file holds the summary as of its last rewrite. Each following line
+        records a write to a run (see ``_touch_run_dir``), which is applied to the run's entry if
+        the entry was up to date before the write; otherwise the entry is discarded.
+
+        :return: A tuple of the summary, which is empty if the file is missing or cannot be read,
+                 and the number of writes recorded after its first line.
+        """
+        summary_path = os.path.join(experiment_dir, FileStore.RUNS_SUMMARY_FILE_NAME)
+        try:
+            with open(summary_path, "r") as f:
+                lines = f.read().splitlines()
+            summary = json.loads(lines[0])
+        except (IOError, OSError, IndexError, ValueError):
+            return {}, 0
+        if not isinstance(summary, dict) or \
+                summary.get("version") != FileStore._RUNS_SUMMARY_VERSION:
+            return {}, 0
+        runs = summary.get("runs", {})
+        for line in lines[1:]:
+            try:
+                update = json.loads(line)
+            except ValueError:
+                # Skipping a partially written update leaves the run's following updates
+                # inapplicable, so the run's entry is discarded
+                continue
+            entry = runs.get(update["run_id"])
+            if entry is None:
+                continue
+            if entry["mtimes"] == update["previous_mtimes"]:
+                _apply_runs_summary_update(entry, update)
+            else:
+                del runs[update["run_id"]]
+        return runs, len(lines) - 1
+
+    @staticmethod
+    def _write_runs_summary(experiment_dir, runs_summary):
+        """
+        Atomically replace the runs summary file of an experiment. Failures are logged and
+        otherwise ignored, since the summary only serves as a cache.
+        """
+        summary_path = os.path.join(experiment_dir, FileStore.RUNS_SUMMARY_FILE_NAME)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=experiment_dir, prefix=".runs-summary-")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"version": FileStore._RUNS_SUMMARY_VERSION, "runs": runs_summary},
+                              f)
+                    f.write("\n")
+                if sys.platform == "win32" and os.path.exists(summary_path):
+                    os.remove(summary_path)
+                os.rename(tmp_path, summary_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except (IOError, OSError) as e:
+            logging.debug("Failed to write runs summary file '%s': %s", summary_path, e)
+
+    @staticmethod
+    def _touch_run_dir(run_dir, previous_mtimes=None, **changes):
+        """
+        Update the modification time of a run directory after writing to the run, which
+        invalidates the run's entry in the runs summary file of its experiment.
+
+        If the modification times of the run's directories before the write (see
+        ``_get_run_mtimes``) are given, the write is also appended to the summary file, so that
+        the run's entry is updated rather than invalidated.
+
+        :param changes: The ``info`` of the run as a dictionary, and the ``metrics``, ``params``
+                        and ``tags`` written to the run.
+        """
+        os.utime(run_dir, None)
+        if previous_mtimes is None:
+            return
+        summary_path = os.path.join(os.path.dirname(run_dir), FileStore.RUNS_SUMMARY_FILE_NAME)
+        try:
+            update = _make_runs_summary_update(os.path.basename(run_dir), previous_mtimes,
+                                               FileStore._get_run_mtimes(run_dir), **changes)
+            line = (json.dumps(update) + "\n").encode("utf-8")
+            # Only append to an existing file, which starts with a summary. A single write in
+            # append mode keeps updates from concurrent writers whole.
+            fd = os.open(summary_path, os.O_WRONLY | os.O_APPEND)
+            try:
+                if os.fstat(fd).st_size + len(line) <= FileStore._MAX_RUNS_SUMMARY_SIZE:
+                    os.write(fd, line)
+            finally:
+                os.close(fd)
+        except (IOError, OSError) as e:
+            logging.debug("Failed to record write to run '%s' in runs summary file '%s': %s",
+                          run_dir, summary_path, e)
+
+    def _map_runs(self, func, items):
+        """
+        Apply ``func`` to each of ``items`` using up to ``self.max_workers`` threads.
+
+        :return: The list of results, in the same order as ``items``.
+        """
+        if self.max_workers == 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        pool = ThreadPool(min(self.max_workers, len(items)))
+        try:
+            return pool.map(func, items)
+        finally:
+            pool.close()
+            pool.join()
 
     def search_runs(self, experiment_ids, search_filter, run_view_type,
-                    max_results=SEARCH_MAX_RESULTS_THRESHOLD):
+                    max_results=SEARCH_MAX_RESULTS_THRESHOLD, page_token=None):
         if max_results > SEARCH_MAX_RESULTS_THRESHOLD:
             raise MlflowException("Invalid value for request parameter max_results. It must be at "
                                   "most {}, but got value {}".format(SEARCH_MAX_RESULTS_THRESHOLD,
                                                                      max_results),
                                   databricks_pb2.INVALID_PARAMETER_VALUE)
-        runs = []
+        page_start = parse_page_token(page_token)
+
+        def _sort_key(entry):
+            return -entry["info"]["start_time"], entry["info"]["run_id"]
+
+        entries = []
         for experiment_id in experiment_ids:
-            run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self.get_run(r.run_id) for r in run_infos)
-        filtered = [run for run in runs if not search_filter or search_filter.filter(run)]
-        return sorted(filtered, key=lambda r: (-r.info.start_time, r.info.run_id))[:max_results]
+            entries.extend(self._list_run_entries(experiment_id, run_view_type))
+        if page_start is not None:
+            start_key = -page_start[0], page_start[1]
+            entries = [entry for entry in entries if _sort_key(entry) > start_key]
+        if search_filter and search_filter.get_clauses():
+            # Filter the summary entries, so that Run objects are only created for the page
+            columns = RunColumns(metrics=[entry["metrics"] for entry in entries],
+                                 params=[entry["params"] for entry in entries],
+                                 tags=[entry["tags"] for entry in entries],
+                                 attributes=[entry["info"] for entry in entries])
+            entries = list(itertools.compress(entries,
+                                              search_filter.filter_columns(columns).tolist()))
+        # Select one run more than requested to find out whether there is a next page, without
+        # sorting all matching runs
+        selected = heapq.nsmallest(max_results + 1, entries, key=_sort_key)
+        page = [_run_from_summary_entry(entry) for entry in selected[:max_results]]
+        if page and len(selected) > max_results:
+            return PagedList(page, create_page_token(page[-1].info))
+        return PagedList(page, None)
 
     def log_metric(self, run_id, metric):
         _validate_run_id(run_id)
         _validate_metric_name(metric.key)
-        run = self.get_run(run_id)
-        check_run_is_active(run.info)
-        metric_path = self._get_metric_path(run.info.experiment_id, run_id, metric.key)
+        _, run_dir = self._get_active_run(run_id)
+        previous_mtimes = self._get_run_mtimes(run_dir)
+        self._log_run_metric(run_dir, metric)
+        self._touch_run_dir(run_dir, previous_mtimes, metrics=[metric])
+
+    def _log_run_metric(self, run_dir, metric):
+        metric_path = self._get_metric_path(run_dir, metric.key)
         make_containing_dirs(metric_path)
-        append_to(metric_path, "%s %s %s\n" % (metric.timestamp, metric.value, metric.step))
+        # The first point of a binary metric is written along with the header of the file, which
+        # is created outside of the metrics folder, like converted files, and then linked into
+        # place. Readers therefore never see binary metric files without points.
+        if self.metric_format == METRIC_FORMAT_BINARY and not exists(metric_path) and \
+                create_binary_metric_file(metric_path, metric, tmp_dir=run_dir):
+            return
+        # Append to existing metric files in their own format, which may differ from the format
+        # of this store
+        if exists(metric_path) and is_binary_metric_file(metric_path):
+            append_binary_metric(metric_path, metric)
+        else:
+            append_to(metric_path, "%s %s %s\n" % (metric.timestamp, metric.value, metric.step))
 
-    def _writeable_value(self, tag_value):
+    @staticmethod
+    def _writeable_value(tag_value):
         if tag_value is None:
             return ""
         elif isinstance(tag_value, six.string_types):
@@ -568,39 +1295,106 @@ class FileStore(AbstractStore):
     def log_param(self, run_id, param):
         _validate_run_id(run_id)
         _validate_param_name(param.key)
-        run = self.get_run(run_id)
-        check_run_is_active(run.info)
-        param_path = self._get_param_path(run.info.experiment_id, run_id, param.key)
+        _, run_dir = self._get_active_run(run_id)
+        previous_mtimes = self._get_run_mtimes(run_dir)
+        self._log_run_param(run_dir, param)
+        self._touch_run_dir(run_dir, previous_mtimes, params=[param])
+
+    def _log_run_param(self, run_dir, param):
+        param_path = self._get_param_path(run_dir, param.key)
         make_containing_dirs(param_path)
         write_to(param_path, self._writeable_value(param.value))
 
     def set_tag(self, run_id, tag):
         _validate_run_id(run_id)
         _validate_tag_name(tag.key)
-        run = self.get_run(run_id)
-        check_run_is_active(run.info)
-        tag_path = self._get_tag_path(run.info.experiment_id, run_id, tag.key)
+        _, run_dir = self._get_active_run(run_id)
+        previous_mtimes = self._get_run_mtimes(run_dir)
+        self._set_run_tag(run_dir, tag)
+        self._touch_run_dir(run_dir, previous_mtimes, tags=[tag])
+
+    def _set_run_tag(self, run_dir, tag):
+        tag_path = self._get_tag_path(run_dir, tag.key)
         make_containing_dirs(tag_path)
         # Don't add trailing newline
         write_to(tag_path, self._writeable_value(tag.value))
 
     def _overwrite_run_info(self, run_info):
-        run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
+        _, run_dir = self._find_run_root(run_info.run_id)
+        previous_mtimes = self._get_run_mtimes(run_dir)
         run_info_dict = _make_persisted_run_info_dict(run_info)
         write_yaml(run_dir, FileStore.META_DATA_FILE_NAME, run_info_dict, overwrite=True)
+        self._touch_run_dir(run_dir, previous_mtimes,
+                            info=dict(_read_persisted_run_info_dict(run_info_dict)))
 
     def log_batch(self, run_id, metrics, params, tags):
         _validate_run_id(run_id)
         _validate_batch_log_data(metrics, params, tags)
         _validate_batch_log_limits(metrics, params, tags)
-        run = self.get_run(run_id)
-        check_run_is_active(run.info)
+        _, run_dir = self._get_active_run(run_id)
+        previous_mtimes = self._get_run_mtimes(run_dir)
         try:
             for param in params:
-                self.log_param(run_id, param)
+                self._log_run_param(run_dir, param)
             for metric in metrics:
-                self.log_metric(run_id, metric)
+                self._log_run_metric(run_dir, metric)
             for tag in tags:
-                self.set_tag(run_id, tag)
+                self._set_run_tag(run_dir, tag)
         except Exception as e:
+            # The batch may have been partially written, which invalidates the run's summary entry
+            self._touch_run_dir(run_dir)
             raise MlflowException(e, INTERNAL_ERROR)
+        self._touch_run_dir(run_dir, previous_mtimes, metrics=metrics, params=params, tags=tags)
+
+    def convert_metric_files(self, metric_format):
+        """
+        Rewrite the metric files of all runs in this store, including runs of deleted
+        experiments, in the specified format. Files already in that format are left unchanged.
+        Each file is rewritten to a temporary file that then replaces it, so readers never observe
+        a partially converted file; however, points logged to a metric while its file is being
+        converted may be lost, so this should not be run while runs are being logged to.
+
+        :param metric_format: Either ``"text"`` or ``"binary"``.
+        :return: The number of converted metric files.
+        """
+        if metric_format not in METRIC_FORMATS:
+            raise MlflowException("Invalid metric format '%s'. Supported formats are %s."
+                                  % (metric_format, METRIC_FORMATS),
+                                  databricks_pb2.INVALID_PARAMETER_VALUE)
+        self._check_root_dir()
+        num_converted = 0
+        all_experiments = self._get_active_experiments(True) + self._get_deleted_experiments(True)
+        for experiment_dir in all_experiments:
+            for run_dir in list_subdirs(experiment_dir, full_path=True):
+                metrics_dir = os.path.join(run_dir, FileStore.METRICS_FOLDER_NAME)
+                for root, _, files in os.walk(metrics_dir):
+                    for name in files:
+                        metric_path = os.path.join(root, name)
+                        if is_binary_metric_file(metric_path) == \
+                                (metric_format == METRIC_FORMAT_BINARY):
+                            continue
+                        self._convert_metric_file(run_dir, metric_path, metric_format)
+                        num_converted += 1
+        return num_converted
+
+    @staticmethod
+    def _convert_metric_file(run_dir, metric_path, metric_format):
+        metric_name = os.path.basename(metric_path)
+        metrics = FileStore._get_metric_history_from_file(
+            os.path.dirname(metric_path), metric_name)
+        # Write the converted file outside of the metrics folder, so that it is never listed as a
+        # metric, but on the same file system, so that it can be renamed atomically
+        fd, tmp_path = tempfile.mkstemp(dir=run_dir, prefix=".convert-metric-")
+        os.close(fd)
+        try:
+            if metric_format == METRIC_FORMAT_BINARY:
+                write_binary_metric_file(tmp_path, metrics)
+            else:
+                write_to(tmp_path, "".join("%s %s %s\n" % (m.timestamp, m.value, m.step)
+                                           for m in metrics))
+            if sys.platform == "win32":
+                os.remove(metric_path)
+            os.rename(tmp_path, metric_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
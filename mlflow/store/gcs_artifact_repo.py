@@ -1,11 +1,15 @@
 import os
+import threading
 
 import posixpath
 from six.moves import urllib
 
 from mlflow.entities import FileInfo
-from mlflow.store.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.store.artifact_repo import ArtifactRepository, get_upload_chunk_size, \
+    _add_parent_directories, _is_in_tree, _iter_ranges
+
+# GCS requires the chunk size of resumable uploads to be a multiple of 256 KB
+_CHUNK_SIZE_MULTIPLE = 256 * 1024
 
 
 class GCSArtifactRepository(ArtifactRepository):
@@ -22,8 +26,30 @@ class GCSArtifactRepository(ArtifactRepository):
         else:
             from google.cloud import storage as gcs_storage
             self.gcs = gcs_storage
+        self._client = None
+        self._client_lock = threading.Lock()
         super(GCSArtifactRepository, self).__init__(artifact_uri)
 
+    def _get_bucket(self, bucket):
+        """
+        Return the bucket named ``bucket``, using a client that is created on first use and
+        reused by the subsequent calls.
+        """
+        with self._client_lock:
+            if self._client is None:
+                self._client = self.gcs.Client()
+        return self._client.get_bucket(bucket)
+
+    @staticmethod
+    def _get_chunk_size():
+        """
+        Return the size of the chunks in which files larger than the upload chunk size are
+        uploaded, rounded up to a multiple of 256 KB. GCS uploads the chunks of a file one after
+        the other, so the upload chunk concurrency does not apply.
+        """
+        chunk_size = get_upload_chunk_size()
+        return -(-chunk_size // _CHUNK_SIZE_MULTIPLE) * _CHUNK_SIZE_MULTIPLE
+
     @staticmethod
     def parse_gcs_uri(uri):
         """Parse an GCS URI, returning (bucket, path)"""
@@ -42,26 +68,20 @@ class GCSArtifactRepository(ArtifactRepository):
         dest_path = posixpath.join(
             dest_path, os.path.basename(local_file))
 
-        gcs_bucket = self.gcs.Client().get_bucket(bucket)
-        blob = gcs_bucket.blob(dest_path)
+        gcs_bucket = self._get_bucket(bucket)
+        blob = gcs_bucket.blob(dest_path, chunk_size=self._get_chunk_size())
         blob.upload_from_filename(local_file)
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (bucket, dest_path) = self.parse_gcs_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
-        gcs_bucket = self.gcs.Client().get_bucket(bucket)
-
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                path = posixpath.join(upload_path, f)
-                gcs_bucket.blob(path).upload_from_filename(os.path.join(root, f))
+        gcs_bucket = self._get_bucket(bucket)
+        chunk_size = self._get_chunk_size()
+        self._upload_files(
+            local_dir, dest_path,
+            lambda local_file, remote_path: gcs_bucket.blob(
+                remote_path, chunk_size=chunk_size).upload_from_filename(local_file))
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
@@ -70,7 +90,7 @@ class GCSArtifactRepository(ArtifactRepository):
             dest_path = posixpath.join(dest_path, path)
         prefix = dest_path + "/"
 
-        bkt = self.gcs.Client().get_bucket(bucket)
+        bkt = self._get_bucket(bucket)
 
         infos = self._list_folders(bkt, prefix, artifact_path)
 
@@ -81,6 +101,37 @@ class GCSArtifactRepository(ArtifactRepository):
 
         return sorted(infos, key=lambda f: f.path)
 
+    def _list_artifacts_recursive(self, path, pool=None):
+        (bucket, artifact_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        prefix = dest_path + "/"
+
+        infos = []
+        # Without a delimiter, all the blobs under the prefix are listed
+        for result in self._get_bucket(bucket).list_blobs(prefix=prefix):
+            if result.name.endswith("/"):
+                # Placeholder blobs created by some tools to represent directories
+                continue
+            blob_path = result.name[len(artifact_path) + 1:]
+            infos.append(FileInfo(blob_path, False, result.size))
+
+        return _add_parent_directories(path, infos)
+
+    def _list_file_versions(self, artifact_path):
+        (bucket, root_path) = self.parse_gcs_uri(self.artifact_uri)
+        dest_path = posixpath.join(root_path, artifact_path) if artifact_path else root_path
+        dest_path = dest_path.rstrip("/")
+        versions = []
+        for result in self._get_bucket(bucket).list_blobs(prefix=dest_path):
+            if result.name.endswith("/") or not _is_in_tree(result.name, dest_path):
+                continue
+            # Composite objects have no MD5 hash, but a new generation whenever overwritten
+            versions.append((result.name[len(root_path) + 1:], result.size,
+                             result.md5_hash or result.generation))
+        return versions
+
     def _list_folders(self, bkt, prefix, artifact_path):
         results = bkt.list_blobs(prefix=prefix, delimiter="/")
         dir_paths = set()
@@ -92,5 +143,21 @@ class GCSArtifactRepository(ArtifactRepository):
     def _download_file(self, remote_file_path, local_path):
         (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
         remote_full_path = posixpath.join(remote_root_path, remote_file_path)
-        gcs_bucket = self.gcs.Client().get_bucket(bucket)
+        gcs_bucket = self._get_bucket(bucket)
         gcs_bucket.get_blob(remote_full_path).download_to_filename(local_path)
+
+    def _get_blob(self, artifact_path):
+        (bucket, remote_root_path) = self.parse_gcs_uri(self.artifact_uri)
+        return self._get_bucket(bucket).get_blob(posixpath.join(remote_root_path, artifact_path))
+
+    def get_file_size(self, artifact_path):
+        blob = self._get_blob(artifact_path)
+        return None if blob is None else blob.size
+
+    def read_artifact(self, artifact_path, start=0, end=None):
+        blob = self._get_blob(artifact_path)
+        if blob is None:
+            raise IOError("Artifact %s does not exist." % artifact_path)
+        # The end offset of ranged GCS downloads is inclusive
+        return _iter_ranges(lambda range_start, range_end: blob.download_as_string(
+            start=range_start, end=range_end - 1), start, blob.size if end is None else end)
@@ -2,7 +2,8 @@ import distutils.dir_util as dir_util
 import os
 import shutil
 
-from mlflow.store.artifact_repo import ArtifactRepository, verify_artifact_path
+from mlflow.store.artifact_repo import ArtifactRepository, ClosingIterator, \
+    verify_artifact_path, _iter_file_range
 from mlflow.utils.file_utils import mkdir, list_all, get_file_info, local_file_uri_to_path, \
     relative_path_to_artifact_path
 
@@ -55,8 +56,45 @@ class LocalArtifactRepository(ArtifactRepository):
         else:
             return []
 
-    def _download_file(self, remote_file_path, local_path):
-        # NOTE: The remote_file_path is expected to be in posix format.
+    def _list_artifacts_recursive(self, path, pool=None):
+        if path:
+            path = os.path.normpath(path)
+        list_dir = os.path.join(self.artifact_dir, path) if path else self.artifact_dir
+        infos = []
+        for (root, dirnames, filenames) in os.walk(list_dir):
+            infos.extend(get_file_info(os.path.join(root, name),
+                                       relative_path_to_artifact_path(
+                                           os.path.relpath(os.path.join(root, name),
+                                                           self.artifact_dir)))
+                         for name in dirnames + filenames)
+        return sorted(infos, key=lambda f: f.path)
+
+    def _list_file_versions(self, artifact_path):
+        local_path = self._get_local_path(artifact_path) if artifact_path else self.artifact_dir
+        if os.path.isfile(local_path):
+            local_files = [local_path]
+        else:
+            local_files = [os.path.join(root, name)
+                           for (root, _, filenames) in os.walk(local_path) for name in filenames]
+        versions = []
+        for local_file in local_files:
+            stat = os.stat(local_file)
+            versions.append((relative_path_to_artifact_path(
+                os.path.relpath(local_file, self.artifact_dir)), stat.st_size, repr(stat.st_mtime)))
+        return versions
+
+    def _get_local_path(self, artifact_path):
+        # NOTE: The artifact_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
-        remote_file_path = os.path.join(self.artifact_dir, os.path.normpath(remote_file_path))
-        shutil.copyfile(remote_file_path, local_path)
+        return os.path.join(self.artifact_dir, os.path.normpath(artifact_path))
+
+    def _download_file(self, remote_file_path, local_path):
+        shutil.copyfile(self._get_local_path(remote_file_path), local_path)
+
+    def get_file_size(self, artifact_path):
+        local_path = self._get_local_path(artifact_path)
+        return os.path.getsize(local_path) if os.path.isfile(local_path) else None
+
+    def read_artifact(self, artifact_path, start=0, end=None):
+        f = open(self._get_local_path(artifact_path), "rb")
+        return ClosingIterator(_iter_file_range(f, start, end), f.close)
@@ -0,0 +1,156 @@
+"""
+Downsampling of metric histories returned by ``get_metric_history``.
+
+Metric histories are handled as NumPy structured arrays with dtype
+:py:data:`mlflow.store.binary_metrics.METRIC_RECORD_DTYPE`, so that stores can downsample
+millions of logged points without creating a :py:class:`mlflow.entities.Metric` for each of them.
+
+Two kinds of downsampling are supported:
+
+- ``lttb`` selects ``max_points`` of the logged points with the Largest-Triangle-Three-Buckets
+  algorithm, which keeps the visual shape of the history (peaks and dips) when plotted.
+- ``min``, ``max`` and ``mean`` split the range of logged steps into ``max_points`` buckets of
+  equal width and aggregate the values in each non-empty bucket. Each aggregated point is reported
+  at the smallest step and timestamp of its bucket. Bucket boundaries only depend on the steps of
+  the points, so that stores that aggregate in a database (see :py:func:`get_bucket_index`) return
+  the same points as stores that aggregate in memory.
+"""
+import numpy as np
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.binary_metrics import METRIC_RECORD_DTYPE
+
+AGGREGATION_LTTB = "lttb"
+AGGREGATION_MIN = "min"
+AGGREGATION_MAX = "max"
+AGGREGATION_MEAN = "mean"
+AGGREGATIONS = [AGGREGATION_LTTB, AGGREGATION_MIN, AGGREGATION_MAX, AGGREGATION_MEAN]
+DEFAULT_AGGREGATION = AGGREGATION_LTTB
+
+_BUCKET_REDUCERS = {
+    AGGREGATION_MIN: np.minimum,
+    AGGREGATION_MAX: np.maximum,
+    AGGREGATION_MEAN: np.add,
+}
+
+
+def validate_downsampling_params(max_points, min_step, max_step, aggregation):
+    """
+    Check the downsampling parameters passed to ``get_metric_history``.
+
+    :return: The aggregation to use, defaulting to ``DEFAULT_AGGREGATION``.
+    """
+    if max_points is not None and max_points < 0:
+        raise MlflowException("Invalid value %s for parameter 'max_points' supplied. It must be "
+                              "a non-negative integer." % max_points, INVALID_PARAMETER_VALUE)
+    if min_step is not None and max_step is not None and min_step > max_step:
+        raise MlflowException("Invalid step range: min_step %s is larger than max_step %s."
+                              % (min_step, max_step), INVALID_PARAMETER_VALUE)
+    if not aggregation:
+        return DEFAULT_AGGREGATION
+    if aggregation not in AGGREGATIONS:
+        raise MlflowException("Invalid aggregation '%s'. Supported aggregations are %s."
+                              % (aggregation, AGGREGATIONS), INVALID_PARAMETER_VALUE)
+    return aggregation
+
+
+def get_bucket_index(step, first_step, last_step, num_buckets):
+    """
+    Return the index of the bucket containing ``step`` when the steps from ``first_step`` to
+    ``last_step`` (inclusive) are split into ``num_buckets`` buckets of equal width. Only uses
+    integer arithmetic, so that it can be applied to NumPy arrays as well as to SQLAlchemy column
+    expressions, for which ``/`` is not integer division on every database.
+    """
+    offset = (step - first_step) * num_buckets
+    width = last_step - first_step + 1
+    return (offset - offset % width) / width
+
+
+def select_step_range(records, min_step=None, max_step=None):
+    """
+    Return the records logged at a step within ``[min_step, max_step]``, keeping their order.
+    """
+    if min_step is None and max_step is None:
+        return records
+    steps = records["step"]
+    selected = np.ones(len(records), dtype=bool)
+    if min_step is not None:
+        selected &= steps >= min_step
+    if max_step is not None:
+        selected &= steps <= max_step
+    return records[selected]
+
+
+def sort_records(records):
+    """
+    Return the records ordered by step, then by timestamp.
+    """
+    return records[np.lexsort((records["timestamp"], records["step"]))]
+
+
+def downsample_records(records, max_points, aggregation=DEFAULT_AGGREGATION):
+    """
+    Downsample metric records to at most ``max_points`` points.
+
+    :param records: Structured array with dtype ``METRIC_RECORD_DTYPE``.
+    :param max_points: Maximum number of points to return.
+    :param aggregation: One of ``AGGREGATIONS``.
+
+    :return: Structured array of at most ``max_points`` records, ordered by step, then by
+             timestamp. If there are no more than ``max_points`` records, all of them are returned.
+    """
+    records = sort_records(records)
+    if len(records) <= max_points:
+        return records
+    if aggregation == AGGREGATION_LTTB:
+        return records[_get_lttb_indices(records["step"].astype(np.float64), records["value"],
+                                         max_points)]
+    return _aggregate_buckets(records, max_points, aggregation)
+
+
+def _aggregate_buckets(records, num_buckets, aggregation):
+    steps = records["step"]
+    buckets = get_bucket_index(steps, steps[0], steps[-1], num_buckets)
+    # Records are sorted by step, so that each bucket is a contiguous slice starting at the first
+    # record whose bucket index differs from that of the previous record
+    starts = np.flatnonzero(np.concatenate([[True], buckets[1:] != buckets[:-1]]))
+    values = _BUCKET_REDUCERS[aggregation].reduceat(records["value"], starts)
+    if aggregation == AGGREGATION_MEAN:
+        values = values / np.diff(np.append(starts, len(records)))
+    result = np.empty(len(starts), dtype=METRIC_RECORD_DTYPE)
+    result["timestamp"] = np.minimum.reduceat(records["timestamp"], starts)
+    result["value"] = values
+    result["step"] = steps[starts]
+    return result
+
+
+def _get_lttb_indices(x, y, num_points):
+    """
+    Return the indices of the ``num_points`` points selected by the Largest-Triangle-Three-Buckets
+    algorithm (Steinarsson, 2013). The first and last points are always selected; the others are
+    split into ``num_points - 2`` buckets of (almost) equal size, and the point selected from each
+    bucket is the one forming the largest triangle with the point selected from the previous bucket
+    and the average of the points in the next bucket.
+    """
+    num_records = len(x)
+    if num_points < 3:
+        return np.unique(np.linspace(0, num_records - 1, num_points).round().astype(np.int64))
+    bounds = (np.arange(num_points - 1) * (float(num_records - 2) / (num_points - 2))).astype(
+        np.int64) + 1
+    bounds[-1] = num_records - 1
+    indices = np.empty(num_points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = num_records - 1
+    selected = 0
+    for i in range(num_points - 2):
+        start, end = bounds[i], bounds[i + 1]
+        next_end = bounds[i + 2] if i + 2 < len(bounds) else num_records
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+        selected_x, selected_y = x[selected], y[selected]
+        areas = np.abs((selected_x - next_x) * (y[start:end] - selected_y)
+                       - (selected_x - x[start:end]) * (next_y - selected_y))
+        selected = start + np.argmax(areas)
+        indices[i + 1] = selected
+    return indices
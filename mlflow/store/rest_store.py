@@ -1,17 +1,24 @@
 import json
 
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import Message
+
 from mlflow.store import SEARCH_MAX_RESULTS_THRESHOLD
 from mlflow.store.abstract_store import AbstractStore
+from mlflow.store.entities import PagedList
 
 from mlflow.entities import Experiment, Run, RunInfo, Metric, ViewType
 
-from mlflow.utils.proto_json_utils import message_to_json, parse_dict
-from mlflow.utils.rest_utils import http_request, verify_rest_response
+from mlflow.utils.env import get_env
+from mlflow.utils.proto_json_utils import parse_dict
+from mlflow.utils.validation import MAX_RUNS_PER_BATCH_GET, MAX_METRIC_HISTORIES_PER_BATCH_GET
+from mlflow.utils.rest_utils import http_request, verify_rest_response, gzip_compress, \
+    PROTOBUF_CONTENT_TYPE, JSON_CONTENT_TYPE, MIN_GZIP_BODY_SIZE
 
 from mlflow.protos.service_pb2 import CreateExperiment, MlflowService, GetExperiment, \
     GetRun, SearchRuns, ListExperiments, GetMetricHistory, LogMetric, LogParam, SetTag, \
     UpdateRun, CreateRun, DeleteRun, RestoreRun, DeleteExperiment, RestoreExperiment, \
-    UpdateExperiment, LogBatch
+    UpdateExperiment, LogBatch, GetRuns, GetMetricHistories
 
 from mlflow.protos import databricks_pb2
 
@@ -34,49 +41,112 @@ def _api_method_to_info():
 
 _METHOD_TO_INFO = _api_method_to_info()
 
+_USE_PROTOBUF_ENV_VAR = "MLFLOW_TRACKING_USE_PROTOBUF"
+_PROTOBUF_ACCEPT_HEADER = "%s, %s;q=0.5" % (PROTOBUF_CONTENT_TYPE, JSON_CONTENT_TYPE)
+
+
+def _get_response_header(response, name):
+    # Responses returned by custom ``_verify_rest_response`` implementations may lack headers
+    headers = getattr(response, 'headers', None)
+    return headers.get(name, '') if headers is not None else ''
+
+
+def _get_response_content_type(response):
+    return _get_response_header(response, 'Content-Type').split(';')[0].strip()
+
 
 class RestStore(AbstractStore):
     """
     Client for a remote tracking server accessed via REST API calls
 
+    Responses are requested in the binary protobuf format rather than JSON if ``use_protobuf``
+    is true, which reduces their size and the time spent parsing them. Servers that do not
+    support protobuf keep responding with JSON. Once a server has shown that it understands
+    protobuf or gzip-compressed request bodies, by responding in protobuf or advertising gzip
+    in the ``Accept-Encoding`` header of its responses, request bodies are sent in these formats
+    as well.
+
     :param get_host_creds: Method to be invoked prior to every REST request to get the
       :py:class:`mlflow.rest_utils.MlflowHostCreds` for the request. Note that this
       is a function so that we can obtain fresh credentials in the case of expiry.
+    :param use_protobuf: Whether to exchange messages with the server in the binary protobuf
+      format when it supports it. Defaults to true if the ``MLFLOW_TRACKING_USE_PROTOBUF``
+      environment variable is set to ``true``.
     """
 
-    def __init__(self, get_host_creds):
+    def __init__(self, get_host_creds, use_protobuf=None):
         super(RestStore, self).__init__()
         self.get_host_creds = get_host_creds
+        if use_protobuf is None:
+            use_protobuf = (get_env(_USE_PROTOBUF_ENV_VAR) or "").lower() == "true"
+        self.use_protobuf = use_protobuf
+        # Maps host -> (whether it accepts gzip request bodies, whether it speaks protobuf)
+        self._server_capabilities = {}
 
     def _verify_rest_response(self, response, endpoint):
         return verify_rest_response(response, endpoint)
 
+    def _record_server_capabilities(self, host, response):
+        accepts_gzip = 'gzip' in _get_response_header(response, 'Accept-Encoding')
+        speaks_protobuf = _get_response_content_type(response) == PROTOBUF_CONTENT_TYPE
+        self._server_capabilities[host] = (accepts_gzip, speaks_protobuf)
+
     def _call_endpoint(self, api, json_body):
+        """
+        Call the endpoint of the given API and return its response message.
+
+        :param api: Request message class of the API, e.g. ``GetRun``.
+        :param json_body: Request message, either as an instance of ``api`` or serialized as JSON.
+        """
         endpoint, method = _METHOD_TO_INFO[api]
         response_proto = api.Response()
-        # Convert json string to json dictionary, to pass to requests
-        if json_body:
-            json_body = json.loads(json_body)
         host_creds = self.get_host_creds()
+        accepts_gzip, speaks_protobuf = self._server_capabilities.get(host_creds.host,
+                                                                      (False, False))
+        headers = {}
+        kwargs = {}
+        if self.use_protobuf:
+            headers['Accept'] = _PROTOBUF_ACCEPT_HEADER
+        # Convert the request to a json dictionary or protobuf message, to pass to requests
+        if isinstance(json_body, Message):
+            request_message = json_body
+            json_body = MessageToDict(request_message, preserving_proto_field_name=True)
+        else:
+            json_body = json.loads(json_body) if json_body else json_body
+            request_message = None
 
         if method == 'GET':
-            response = http_request(
-                host_creds=host_creds, endpoint=endpoint, method=method, params=json_body)
+            kwargs['params'] = json_body
+        elif self.use_protobuf and speaks_protobuf and request_message is not None:
+            headers['Content-Type'] = PROTOBUF_CONTENT_TYPE
+            kwargs['data'] = request_message.SerializeToString()
+        elif accepts_gzip:
+            headers['Content-Type'] = JSON_CONTENT_TYPE
+            kwargs['data'] = json.dumps(json_body).encode('utf-8')
         else:
-            response = http_request(
-                host_creds=host_creds, endpoint=endpoint, method=method, json=json_body)
-
+            kwargs['json'] = json_body
+        if accepts_gzip and len(kwargs.get('data', b'')) >= MIN_GZIP_BODY_SIZE:
+            headers['Content-Encoding'] = 'gzip'
+            kwargs['data'] = gzip_compress(kwargs['data'])
+        if headers:
+            kwargs['headers'] = headers
+
+        response = http_request(host_creds=host_creds, endpoint=endpoint, method=method, **kwargs)
         response = self._verify_rest_response(response, endpoint)
+        self._record_server_capabilities(host_creds.host, response)
 
-        js_dict = json.loads(response.text)
-        parse_dict(js_dict=js_dict, message=response_proto)
+        if _get_response_content_type(response) == PROTOBUF_CONTENT_TYPE:
+            response_proto.ParseFromString(response.content)
+        else:
+            js_dict = json.loads(response.text)
+            parse_dict(js_dict=js_dict, message=response_proto)
         return response_proto
 
     def list_experiments(self, view_type=ViewType.ACTIVE_ONLY):
         """
         :return: a list of all known Experiment objects
         """
-        req_body = message_to_json(ListExperiments(view_type=view_type))
+        req_body = ListExperiments(view_type=view_type)
         response_proto = self._call_endpoint(ListExperiments, req_body)
         return [Experiment.from_proto(experiment_proto)
                 for experiment_proto in response_proto.experiments]
@@ -90,8 +160,8 @@ class RestStore(AbstractStore):
 
         :return: experiment_id (string) for the newly created experiment if successful, else None
         """
-        req_body = message_to_json(CreateExperiment(
-            name=name, artifact_location=artifact_location))
+        req_body = CreateExperiment(
+            name=name, artifact_location=artifact_location)
         response_proto = self._call_endpoint(CreateExperiment, req_body)
         return response_proto.experiment_id
 
@@ -104,21 +174,21 @@ class RestStore(AbstractStore):
         :return: A single :py:class:`mlflow.entities.Experiment` object if it exists,
         otherwise raises an Exception.
         """
-        req_body = message_to_json(GetExperiment(experiment_id=str(experiment_id)))
+        req_body = GetExperiment(experiment_id=str(experiment_id))
         response_proto = self._call_endpoint(GetExperiment, req_body)
         return Experiment.from_proto(response_proto.experiment)
 
     def delete_experiment(self, experiment_id):
-        req_body = message_to_json(DeleteExperiment(experiment_id=str(experiment_id)))
+        req_body = DeleteExperiment(experiment_id=str(experiment_id))
         self._call_endpoint(DeleteExperiment, req_body)
 
     def restore_experiment(self, experiment_id):
-        req_body = message_to_json(RestoreExperiment(experiment_id=str(experiment_id)))
+        req_body = RestoreExperiment(experiment_id=str(experiment_id))
         self._call_endpoint(RestoreExperiment, req_body)
 
     def rename_experiment(self, experiment_id, new_name):
-        req_body = message_to_json(UpdateExperiment(
-            experiment_id=str(experiment_id), new_name=new_name))
+        req_body = UpdateExperiment(
+            experiment_id=str(experiment_id), new_name=new_name)
         self._call_endpoint(UpdateExperiment, req_body)
 
     def get_run(self, run_id):
@@ -129,14 +199,29 @@ class RestStore(AbstractStore):
 
         :return: A single Run object if it exists, otherwise raises an Exception
         """
-        req_body = message_to_json(GetRun(run_uuid=run_id, run_id=run_id))
+        req_body = GetRun(run_uuid=run_id, run_id=run_id)
         response_proto = self._call_endpoint(GetRun, req_body)
         return Run.from_proto(response_proto.run)
 
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs, with one request per ``MAX_RUNS_PER_BATCH_GET`` runs.
+
+        :param run_ids: List of run IDs.
+
+        :return: A list of :py:class:`mlflow.entities.Run`, in the order of ``run_ids``.
+        """
+        runs = []
+        for i in range(0, len(run_ids), MAX_RUNS_PER_BATCH_GET):
+            req_body = GetRuns(run_ids=run_ids[i:i + MAX_RUNS_PER_BATCH_GET])
+            response_proto = self._call_endpoint(GetRuns, req_body)
+            runs.extend([Run.from_proto(run) for run in response_proto.runs])
+        return runs
+
     def update_run_info(self, run_id, run_status, end_time):
         """ Updates the metadata of the specified run. """
-        req_body = message_to_json(UpdateRun(run_uuid=run_id, run_id=run_id, status=run_status,
-                                             end_time=end_time))
+        req_body = UpdateRun(run_uuid=run_id, run_id=run_id, status=run_status,
+                             end_time=end_time)
         response_proto = self._call_endpoint(UpdateRun, req_body)
         return RunInfo.from_proto(response_proto.run_info)
 
@@ -152,9 +237,9 @@ class RestStore(AbstractStore):
         :return: The created Run object
         """
         tag_protos = [tag.to_proto() for tag in tags]
-        req_body = message_to_json(CreateRun(
+        req_body = CreateRun(
             experiment_id=str(experiment_id), user_id=user_id,
-            start_time=start_time, tags=tag_protos))
+            start_time=start_time, tags=tag_protos)
         response_proto = self._call_endpoint(CreateRun, req_body)
         run = Run.from_proto(response_proto.run)
         return run
@@ -166,10 +251,10 @@ class RestStore(AbstractStore):
         :param run_id: String id for the run
         :param metric: Metric instance to log
         """
-        req_body = message_to_json(LogMetric(
+        req_body = LogMetric(
             run_uuid=run_id, run_id=run_id,
             key=metric.key, value=metric.value, timestamp=metric.timestamp,
-            step=metric.step))
+            step=metric.step)
         self._call_endpoint(LogMetric, req_body)
 
     def log_param(self, run_id, param):
@@ -179,8 +264,8 @@ class RestStore(AbstractStore):
         :param run_id: String id for the run
         :param param: Param instance to log
         """
-        req_body = message_to_json(LogParam(
-            run_uuid=run_id, run_id=run_id, key=param.key, value=param.value))
+        req_body = LogParam(
+            run_uuid=run_id, run_id=run_id, key=param.key, value=param.value)
         self._call_endpoint(LogParam, req_body)
 
     def set_tag(self, run_id, tag):
@@ -190,26 +275,53 @@ class RestStore(AbstractStore):
         :param run_id: String id for the run
         :param tag: RunTag instance to log
         """
-        req_body = message_to_json(SetTag(
-            run_uuid=run_id, run_id=run_id, key=tag.key, value=tag.value))
+        req_body = SetTag(
+            run_uuid=run_id, run_id=run_id, key=tag.key, value=tag.value)
         self._call_endpoint(SetTag, req_body)
 
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(self, run_id, metric_key, max_points=None, min_step=None,
+                           max_step=None, aggregation=None):
         """
         Return all logged values for a given metric.
 
         :param run_id: Unique identifier for run
         :param metric_key: Metric name within the run
+        :param max_points: If specified, maximum number of values to return.
+        :param min_step: If specified, minimum step of the values to return.
+        :param max_step: If specified, maximum step of the values to return.
+        :param aggregation: How values are downsampled when there are more than ``max_points``.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
-        req_body = message_to_json(GetMetricHistory(
-            run_uuid=run_id, run_id=run_id, metric_key=metric_key))
+        req_body = GetMetricHistory(
+            run_uuid=run_id, run_id=run_id, metric_key=metric_key, max_points=max_points,
+            min_step=min_step, max_step=max_step, aggregation=aggregation)
         response_proto = self._call_endpoint(GetMetricHistory, req_body)
         return [Metric.from_proto(metric) for metric in response_proto.metrics]
 
+    def get_metric_histories(self, history_keys):
+        """
+        Return the histories of multiple metrics, with one request per
+        ``MAX_METRIC_HISTORIES_PER_BATCH_GET`` histories.
+
+        :param history_keys: List of ``(run_id, metric_key)`` tuples.
+
+        :return: A list containing, for each of ``history_keys``, the list of
+                 :py:class:`mlflow.entities.Metric` entities logged for the metric.
+        """
+        history_keys = list(history_keys)
+        histories = []
+        for i in range(0, len(history_keys), MAX_METRIC_HISTORIES_PER_BATCH_GET):
+            req_body = GetMetricHistories(history_keys=[
+                GetMetricHistories.HistoryKey(run_id=run_id, metric_key=metric_key)
+                for run_id, metric_key in history_keys[i:i + MAX_METRIC_HISTORIES_PER_BATCH_GET]])
+            response_proto = self._call_endpoint(GetMetricHistories, req_body)
+            histories.extend([[Metric.from_proto(metric) for metric in history.metrics]
+                              for history in response_proto.histories])
+        return histories
+
     def search_runs(self, experiment_ids, search_filter, run_view_type,
-                    max_results=SEARCH_MAX_RESULTS_THRESHOLD):
+                    max_results=SEARCH_MAX_RESULTS_THRESHOLD, page_token=None):
         """
         Return runs that match the given list of search expressions within the experiments.
         Given multiple search expressions, all these expressions are ANDed together for search.
@@ -219,30 +331,34 @@ class RestStore(AbstractStore):
             search expression or filter string.
         :param run_view_type: ACTIVE, DELETED, or ALL runs.
         :param max_results: Maximum number of runs desired.
+        :param page_token: Token specifying the next page of results.
 
-        :return: A list of Run objects that satisfy the search expressions
+        :return: A :py:class:`mlflow.store.entities.PagedList` of Run objects that satisfy the
+            search expressions, with the token for the next page, if any.
         """
         experiment_ids = [str(experiment_id) for experiment_id in experiment_ids]
         sr = SearchRuns(experiment_ids=experiment_ids,
                         filter=search_filter.filter_string if search_filter else None,
                         run_view_type=ViewType.to_proto(run_view_type),
-                        max_results=max_results)
-        req_body = message_to_json(sr)
-        response_proto = self._call_endpoint(SearchRuns, req_body)
-        return [Run.from_proto(proto_run) for proto_run in response_proto.runs]
+                        max_results=max_results,
+                        page_token=page_token)
+        response_proto = self._call_endpoint(SearchRuns, sr)
+        runs = [Run.from_proto(proto_run) for proto_run in response_proto.runs]
+        # Servers predating pagination never set the field, which reads as an empty string
+        return PagedList(runs, response_proto.next_page_token or None)
 
     def delete_run(self, run_id):
-        req_body = message_to_json(DeleteRun(run_id=run_id))
+        req_body = DeleteRun(run_id=run_id)
         self._call_endpoint(DeleteRun, req_body)
 
     def restore_run(self, run_id):
-        req_body = message_to_json(RestoreRun(run_id=run_id))
+        req_body = RestoreRun(run_id=run_id)
         self._call_endpoint(RestoreRun, req_body)
 
     def log_batch(self, run_id, metrics, params, tags):
         metric_protos = [metric.to_proto() for metric in metrics]
         param_protos = [param.to_proto() for param in params]
         tag_protos = [tag.to_proto() for tag in tags]
-        req_body = message_to_json(
-            LogBatch(metrics=metric_protos, params=param_protos, tags=tag_protos, run_id=run_id))
+        req_body = LogBatch(metrics=metric_protos, params=param_protos, tags=tag_protos,
+                            run_id=run_id)
         self._call_endpoint(LogBatch, req_body)
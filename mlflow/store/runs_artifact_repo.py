@@ -24,6 +24,10 @@ class RunsArtifactRepository(ArtifactRepository):
         super(RunsArtifactRepository, self).__init__(artifact_uri)
         self.repo = get_artifact_repository(uri)
 
+    @property
+    def _SUPPORTS_CONCURRENT_DOWNLOADS(self):  # pylint: disable=invalid-name
+        return self.repo._SUPPORTS_CONCURRENT_DOWNLOADS
+
     @staticmethod
     def parse_runs_uri(run_uri):
         parsed = urllib.parse.urlparse(run_uri)
@@ -86,6 +90,20 @@ class RunsArtifactRepository(ArtifactRepository):
         """
         return self.repo.list_artifacts(path)
 
+    def _list_artifacts_recursive(self, path, pool=None):
+        """
+        List the whole tree of artifacts under path with the underlying repository, which may
+        list it in a single request.
+        """
+        return self.repo._list_artifacts_recursive(path, pool)
+
+    def _list_file_versions(self, artifact_path):
+        """
+        List the versions of the files of the artifact with the underlying repository, so that
+        ``runs:/`` URIs are cached like the URIs of their artifacts.
+        """
+        return self.repo._list_file_versions(artifact_path)
+
     def _download_file(self, remote_file_path, local_path):
         """
         Download the file at the specified relative remote path and saves
@@ -1,4 +1,5 @@
 import os
+import threading
 
 import posixpath
 from six.moves import urllib
@@ -6,12 +7,42 @@ from six.moves import urllib
 from mlflow import data
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MlflowException
-from mlflow.store.artifact_repo import ArtifactRepository
-from mlflow.utils.file_utils import relative_path_to_artifact_path
+from mlflow.store.artifact_repo import ArtifactRepository, ClosingIterator, READ_CHUNK_SIZE, \
+    get_upload_chunk_size, get_upload_chunk_concurrency, _add_parent_directories, _is_in_tree, \
+    _get_positive_int, _DOWNLOAD_MAX_WORKERS_ENV_VAR, _DEFAULT_DOWNLOAD_MAX_WORKERS, \
+    _UPLOAD_MAX_WORKERS_ENV_VAR, _DEFAULT_UPLOAD_MAX_WORKERS
+
+# Creating clients from the default boto3 session is not thread-safe
+_client_creation_lock = threading.Lock()
+
+# S3 rejects multipart uploads with parts (other than the last one) smaller than 5 MB
+_MIN_MULTIPART_CHUNK_SIZE = 5 * 1024 * 1024
+
+# Number of requests sent at once by each ``download_file`` call (boto3's default)
+_DOWNLOAD_CONCURRENCY = 10
+
+
+def _get_max_pool_connections():
+    """
+    Return the number of connections to keep open to S3, so that every request of the concurrent
+    uploads (each sending up to ``MLFLOW_ARTIFACT_UPLOAD_CHUNK_CONCURRENCY`` parts at once) or
+    downloads can reuse a connection.
+    """
+    upload_workers = _get_positive_int(None, _UPLOAD_MAX_WORKERS_ENV_VAR,
+                                       _DEFAULT_UPLOAD_MAX_WORKERS, "maximum number of workers")
+    download_workers = _get_positive_int(None, _DOWNLOAD_MAX_WORKERS_ENV_VAR,
+                                         _DEFAULT_DOWNLOAD_MAX_WORKERS, "maximum number of workers")
+    return max(upload_workers * get_upload_chunk_concurrency(),
+               download_workers * _DOWNLOAD_CONCURRENCY)
 
 
 class S3ArtifactRepository(ArtifactRepository):
     """Stores artifacts on Amazon S3."""
+
+    def __init__(self, artifact_uri):
+        super(S3ArtifactRepository, self).__init__(artifact_uri)
+        self._s3_client = None
+
     @staticmethod
     def parse_s3_uri(uri):
         """Parse an S3 URI, returning (bucket, path)"""
@@ -24,9 +55,30 @@ class S3ArtifactRepository(ArtifactRepository):
         return parsed.netloc, path
 
     def _get_s3_client(self):
+        """
+        Return the client of the repository, which is created on first use and shared by the
+        threads uploading and downloading artifacts (boto3 clients are thread-safe).
+        """
         import boto3
-        s3_endpoint_url = os.environ.get('MLFLOW_S3_ENDPOINT_URL')
-        return boto3.client('s3', endpoint_url=s3_endpoint_url)
+        from botocore.config import Config
+        with _client_creation_lock:
+            if self._s3_client is None:
+                s3_endpoint_url = os.environ.get('MLFLOW_S3_ENDPOINT_URL')
+                config = Config(max_pool_connections=_get_max_pool_connections())
+                self._s3_client = boto3.client('s3', endpoint_url=s3_endpoint_url, config=config)
+            return self._s3_client
+
+    @staticmethod
+    def _get_transfer_config():
+        """
+        Return the configuration of multipart uploads: files larger than the upload chunk size
+        are uploaded in parts of that size, several at a time. Chunk sizes smaller than the
+        minimum part size of S3 are raised to it.
+        """
+        from boto3.s3.transfer import TransferConfig
+        chunk_size = max(get_upload_chunk_size(), _MIN_MULTIPART_CHUNK_SIZE)
+        return TransferConfig(multipart_threshold=chunk_size, multipart_chunksize=chunk_size,
+                              max_concurrency=get_upload_chunk_concurrency())
 
     def log_artifact(self, local_file, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
@@ -35,25 +87,18 @@ class S3ArtifactRepository(ArtifactRepository):
         dest_path = posixpath.join(
             dest_path, os.path.basename(local_file))
         s3_client = self._get_s3_client()
-        s3_client.upload_file(local_file, bucket, dest_path)
+        s3_client.upload_file(local_file, bucket, dest_path, Config=self._get_transfer_config())
 
     def log_artifacts(self, local_dir, artifact_path=None):
         (bucket, dest_path) = data.parse_s3_uri(self.artifact_uri)
         if artifact_path:
             dest_path = posixpath.join(dest_path, artifact_path)
         s3_client = self._get_s3_client()
-        local_dir = os.path.abspath(local_dir)
-        for (root, _, filenames) in os.walk(local_dir):
-            upload_path = dest_path
-            if root != local_dir:
-                rel_path = os.path.relpath(root, local_dir)
-                rel_path = relative_path_to_artifact_path(rel_path)
-                upload_path = posixpath.join(dest_path, rel_path)
-            for f in filenames:
-                s3_client.upload_file(
-                        os.path.join(root, f),
-                        bucket,
-                        posixpath.join(upload_path, f))
+        config = self._get_transfer_config()
+        self._upload_files(
+            local_dir, dest_path,
+            lambda local_file, remote_path: s3_client.upload_file(
+                local_file, bucket, remote_path, Config=config))
 
     def list_artifacts(self, path=None):
         (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
@@ -86,6 +131,44 @@ class S3ArtifactRepository(ArtifactRepository):
                 infos.append(FileInfo(file_rel_path, False, file_size))
         return sorted(infos, key=lambda f: f.path)
 
+    def _list_artifacts_recursive(self, path, pool=None):
+        (bucket, artifact_path) = data.parse_s3_uri(self.artifact_uri)
+        dest_path = artifact_path
+        if path:
+            dest_path = posixpath.join(dest_path, path)
+        infos = []
+        prefix = dest_path + "/"
+        s3_client = self._get_s3_client()
+        paginator = s3_client.get_paginator("list_objects_v2")
+        # Without a delimiter, all the objects under the prefix are listed
+        results = paginator.paginate(Bucket=bucket, Prefix=prefix)
+        for result in results:
+            for obj in result.get('Contents', []):
+                file_path = obj.get("Key")
+                self._verify_listed_object_contains_artifact_path_prefix(
+                    listed_object_path=file_path, artifact_path=artifact_path)
+                if file_path.endswith("/"):
+                    # Placeholder objects created by some tools to represent directories
+                    continue
+                file_rel_path = posixpath.relpath(path=file_path, start=artifact_path)
+                infos.append(FileInfo(file_rel_path, False, int(obj.get('Size'))))
+        return _add_parent_directories(path, infos)
+
+    def _list_file_versions(self, artifact_path):
+        (bucket, root_path) = data.parse_s3_uri(self.artifact_uri)
+        dest_path = posixpath.join(root_path, artifact_path) if artifact_path else root_path
+        dest_path = dest_path.rstrip("/")
+        versions = []
+        paginator = self._get_s3_client().get_paginator("list_objects_v2")
+        for result in paginator.paginate(Bucket=bucket, Prefix=dest_path):
+            for obj in result.get('Contents', []):
+                key = obj.get("Key")
+                if key.endswith("/") or not _is_in_tree(key, dest_path):
+                    continue
+                versions.append((posixpath.relpath(path=key, start=root_path),
+                                 int(obj.get('Size')), obj.get("ETag")))
+        return versions
+
     @staticmethod
     def _verify_listed_object_contains_artifact_path_prefix(listed_object_path, artifact_path):
         if not listed_object_path.startswith(artifact_path):
@@ -100,3 +183,25 @@ class S3ArtifactRepository(ArtifactRepository):
         s3_full_path = posixpath.join(s3_root_path, remote_file_path)
         s3_client = self._get_s3_client()
         s3_client.download_file(bucket, s3_full_path, local_path)
+
+    def get_file_size(self, artifact_path):
+        from botocore.exceptions import ClientError
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        try:
+            head = self._get_s3_client().head_object(
+                Bucket=bucket, Key=posixpath.join(s3_root_path, artifact_path))
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+        return head["ContentLength"]
+
+    def read_artifact(self, artifact_path, start=0, end=None):
+        (bucket, s3_root_path) = data.parse_s3_uri(self.artifact_uri)
+        kwargs = {"Bucket": bucket, "Key": posixpath.join(s3_root_path, artifact_path)}
+        if end is not None and end <= start:
+            return iter([])
+        if start > 0 or end is not None:
+            kwargs["Range"] = "bytes=%s-%s" % (start, "" if end is None else end - 1)
+        body = self._get_s3_client().get_object(**kwargs)["Body"]
+        return ClosingIterator(body.iter_chunks(READ_CHUNK_SIZE), body.close)
@@ -10,6 +10,9 @@ from mlflow.store.artifact_repo import ArtifactRepository
 class SFTPArtifactRepository(ArtifactRepository):
     """Stores artifacts as files in a remote directory, via sftp."""
 
+    # All operations go through a single SFTP connection, which is not thread-safe
+    _SUPPORTS_CONCURRENT_DOWNLOADS = False
+
     def __init__(self, artifact_uri, client=None):
         self.uri = artifact_uri
         parsed = urllib.parse.urlparse(artifact_uri)
@@ -1,12 +1,15 @@
 """
 Utilities for dealing with artifacts in the context of a Run.
 """
+import os
 import posixpath
+import shutil
 
 from six.moves import urllib
 
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.store.artifact_cache import get_artifact_cache
 from mlflow.store.artifact_repository_registry import get_artifact_repository
 from mlflow.tracking.utils import _get_store
 
@@ -52,6 +55,10 @@ def _download_artifact_from_uri(artifact_uri, output_path=None):
     :param artifact_uri: The *absolute* URI of the artifact to download.
     :param output_path: The local filesystem path to which to download the artifact. If unspecified,
                         a local output path will be created.
+
+    If the artifact cache is enabled (see :py:mod:`mlflow.store.artifact_cache`), remote artifacts
+    are downloaded into the cache, and the returned path is the cached copy if ``output_path`` is
+    unspecified. The cached copy must then not be modified.
     """
     parsed_uri = urllib.parse.urlparse(artifact_uri)
     prefix = ""
@@ -62,5 +69,29 @@ def _download_artifact_from_uri(artifact_uri, output_path=None):
     artifact_path = posixpath.basename(parsed_uri.path)
     parsed_uri = parsed_uri._replace(path=posixpath.dirname(parsed_uri.path))
     root_uri = prefix + urllib.parse.urlunparse(parsed_uri)
-    return get_artifact_repository(artifact_uri=root_uri).download_artifacts(
-        artifact_path=artifact_path, dst_path=output_path)
+    repo = get_artifact_repository(artifact_uri=root_uri)
+    cache = get_artifact_cache()
+    # Caching local artifacts would only copy them
+    if cache is not None and urllib.parse.urlparse(root_uri).scheme not in ("", "file"):
+        cached_path = cache.download_artifacts(artifact_uri, repo, artifact_path)
+        if cached_path is not None:
+            if output_path is None:
+                return cached_path
+            local_path = os.path.join(os.path.abspath(output_path), artifact_path)
+            if os.path.isdir(cached_path):
+                # Like downloads, copies are merged into existing directories, e.g. into
+                # ``output_path`` itself for the artifact root
+                _copy_tree_contents(cached_path, local_path)
+            else:
+                shutil.copyfile(cached_path, local_path)
+            return local_path
+    return repo.download_artifacts(artifact_path=artifact_path, dst_path=output_path)
+
+
+def _copy_tree_contents(src_dir, dst_dir):
+    for root, _, file_names in os.walk(src_dir):
+        dst_root = os.path.join(dst_dir, os.path.relpath(root, src_dir))
+        if not os.path.exists(dst_root):
+            os.makedirs(dst_root)
+        for file_name in file_names:
+            shutil.copyfile(os.path.join(root, file_name), os.path.join(dst_root, file_name))
@@ -0,0 +1,189 @@
+"""
+Internal module implementing asynchronous logging for the fluent API. Metrics, params and tags are
+buffered in memory and sent by a background thread as ``log_batch`` requests, so that logging
+calls return without waiting for the tracking server.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH, MAX_PARAMS_TAGS_PER_BATCH, \
+    MAX_ENTITIES_PER_BATCH
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5
+DEFAULT_FLUSH_SIZE = MAX_ENTITIES_PER_BATCH
+
+_logger = logging.getLogger(__name__)
+
+
+def _split_into_batches(metrics, params, tags):
+    """
+    Split the given metrics, params and tags into ``(metrics, params, tags)`` batches that
+    satisfy the limits checked by :py:func:`mlflow.utils.validation._validate_batch_log_limits`.
+    """
+    while metrics or params or tags:
+        batch_params = params[:MAX_PARAMS_TAGS_PER_BATCH]
+        batch_tags = tags[:MAX_PARAMS_TAGS_PER_BATCH]
+        num_metrics = min(MAX_METRICS_PER_BATCH,
+                          MAX_ENTITIES_PER_BATCH - len(batch_params) - len(batch_tags))
+        batch_metrics = metrics[:num_metrics]
+        yield batch_metrics, batch_params, batch_tags
+        metrics = metrics[len(batch_metrics):]
+        params = params[len(batch_params):]
+        tags = tags[len(batch_tags):]
+
+
+class _PendingRunData(object):
+    """
+    Metrics, params and tags buffered for a single run. Only the last value set for each tag is
+    kept, as it is the one that a sequence of ``set_tag`` calls would leave on the run. Params are
+    kept once per key, and changing the value of a buffered param raises an exception right away,
+    as a rejected param would otherwise fail the whole batch along with its metrics and tags.
+    """
+
+    def __init__(self, run_id):
+        self.run_id = run_id
+        self.metrics = []
+        self.params = OrderedDict()
+        self.tags = OrderedDict()
+
+    def add(self, metrics, params, tags):
+        new_params = OrderedDict()
+        for param in params:
+            pending_param = new_params.get(param.key, self.params.get(param.key))
+            if pending_param is not None and pending_param.value != param.value:
+                raise MlflowException(
+                    "Changing param value is not allowed. Param with key='{}' was already"
+                    " logged with value='{}' for run ID='{}'. Attempted logging new value"
+                    " '{}'.".format(param.key, pending_param.value, self.run_id, param.value),
+                    INVALID_PARAMETER_VALUE)
+            if pending_param is None:
+                new_params[param.key] = param
+        self.metrics.extend(metrics)
+        self.params.update(new_params)
+        for tag in tags:
+            self.tags.pop(tag.key, None)
+            self.tags[tag.key] = tag
+
+    def __len__(self):
+        return len(self.metrics) + len(self.params) + len(self.tags)
+
+
+class AsyncLoggingQueue(object):
+    """
+    Buffers metrics, params and tags and sends them with ``log_batch`` from a background thread.
+
+    Buffered data is sent once ``flush_size`` entities are pending or ``flush_interval_seconds``
+    have elapsed since the previous flush, whichever comes first, and whenever :py:meth:`flush`
+    is called. Data logged to the same run is coalesced into as few ``log_batch`` calls as the
+    batch limits allow; runs are flushed in the order in which they were first logged to. Errors
+    raised by ``log_batch`` do not interrupt the caller; they are collected and raised by the next
+    call to :py:meth:`flush`.
+    """
+
+    def __init__(self, log_batch, flush_interval_seconds=DEFAULT_FLUSH_INTERVAL_SECONDS,
+                 flush_size=DEFAULT_FLUSH_SIZE):
+        """
+        :param log_batch: Function called as ``log_batch(run_id, metrics, params, tags)`` to send
+                          a batch, e.g. :py:meth:`mlflow.tracking.MlflowClient.log_batch`.
+        :param flush_interval_seconds: Maximum time for which data is buffered before it is sent.
+        :param flush_size: Number of pending metrics, params and tags that triggers a flush.
+        """
+        self._log_batch = log_batch
+        self.flush_interval_seconds = flush_interval_seconds
+        self.flush_size = flush_size
+        self._pending = OrderedDict()
+        self._num_pending = 0
+        self._errors = []
+        # Guards the pending data and errors. Never held while sending, so that logging calls
+        # do not wait on the tracking server.
+        self._lock = threading.Lock()
+        self._pending_condition = threading.Condition(self._lock)
+        # Serializes sending, so that batches for a run are sent in the order they were logged.
+        self._send_lock = threading.Lock()
+        self._stopped = False
+        self._thread = None
+
+    def log(self, run_id, metrics=(), params=(), tags=()):
+        """
+        Buffer metrics, params and tags to log to the specified run. Returns immediately.
+
+        :raises MlflowException: if a param is logged with a different value than the one
+                                 already buffered for it, in which case nothing is buffered.
+        """
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                # Started lazily, which also restarts the thread in a child process after a fork
+                self._stopped = False
+                self._thread = threading.Thread(target=self._run, name="MlflowAsyncLogging")
+                self._thread.daemon = True
+                self._thread.start()
+            run_data = self._pending.get(run_id)
+            if run_data is None:
+                run_data = self._pending[run_id] = _PendingRunData(run_id)
+            num_before = len(run_data)
+            run_data.add(metrics, params, tags)
+            self._num_pending += len(run_data) - num_before
+            if self._num_pending >= self.flush_size:
+                self._pending_condition.notify()
+
+    def flush(self):
+        """
+        Send all buffered data, waiting for it to be logged.
+
+        :raises MlflowException: if any batch sent since the previous call to ``flush`` failed.
+        """
+        self._send_pending()
+        with self._lock:
+            errors, self._errors = self._errors, []
+        if errors:
+            raise MlflowException("Failed to log %d batch(es) asynchronously. First error: %s"
+                                  % (len(errors), errors[0]))
+
+    def stop(self):
+        """
+        Stop the background thread after sending all buffered data. Errors are not raised; call
+        :py:meth:`flush` first to check for them.
+        """
+        with self._lock:
+            self._stopped = True
+            self._pending_condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self):
+        last_flush_time = time.time()
+        while True:
+            with self._lock:
+                while not self._stopped and self._num_pending < self.flush_size:
+                    timeout = last_flush_time + self.flush_interval_seconds - time.time()
+                    if timeout <= 0:
+                        break
+                    self._pending_condition.wait(timeout)
+                stopped = self._stopped
+            self._send_pending()
+            last_flush_time = time.time()
+            if stopped:
+                return
+
+    def _send_pending(self):
+        with self._send_lock:
+            with self._lock:
+                pending, self._pending = self._pending, OrderedDict()
+                self._num_pending = 0
+            for run_id, run_data in pending.items():
+                batches = _split_into_batches(run_data.metrics, list(run_data.params.values()),
+                                              list(run_data.tags.values()))
+                for metrics, params, tags in batches:
+                    try:
+                        self._log_batch(run_id, metrics, params, tags)
+                    except Exception as e:  # pylint: disable=broad-except
+                        _logger.debug("Failed to log batch asynchronously to run %s", run_id,
+                                      exc_info=True)
+                        with self._lock:
+                            self._errors.append(e)
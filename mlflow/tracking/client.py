@@ -48,16 +48,60 @@ class MlflowClient(object):
         _validate_run_id(run_id)
         return self.store.get_run(run_id)
 
-    def get_metric_history(self, run_id, key):
+    def get_runs(self, run_ids):
+        """
+        Fetch multiple runs. This is equivalent to calling :py:meth:`get_run` for each run, but
+        shares work across the runs, e.g. by fetching them from a tracking server in a single
+        request.
+
+        :param run_ids: List of run IDs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the order of ``run_ids``.
+                 Raises an exception if any of the runs does not exist.
+        """
+        run_ids = list(run_ids)
+        for run_id in run_ids:
+            _validate_run_id(run_id)
+        return self.store.get_runs(run_ids)
+
+    def get_metric_history(self, run_id, key, max_points=None, min_step=None, max_step=None,
+                           aggregation=None):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param key: Metric name within the run
+        :param max_points: If specified, maximum number of values to return. For metrics with
+                           more values in the requested step range, the values are downsampled
+                           as specified by ``aggregation`` and returned ordered by step.
+        :param min_step: If specified, only values logged at a step greater than or equal to
+                         ``min_step`` are returned.
+        :param max_step: If specified, only values logged at a step less than or equal to
+                         ``max_step`` are returned.
+        :param aggregation: How values are downsampled when there are more than ``max_points``:
+                            ``"lttb"`` (the default) selects representative values with the
+                            Largest-Triangle-Three-Buckets algorithm, while ``"min"``, ``"max"``
+                            and ``"mean"`` aggregate the values of ``max_points`` buckets of
+                            equal step width.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
-        return self.store.get_metric_history(run_id=run_id, metric_key=key)
+        return self.store.get_metric_history(run_id=run_id, metric_key=key,
+                                             max_points=max_points, min_step=min_step,
+                                             max_step=max_step, aggregation=aggregation)
+
+    def get_metric_histories(self, history_keys):
+        """
+        Return the histories of multiple metrics, possibly logged under different runs. This is
+        equivalent to calling :py:meth:`get_metric_history` for each metric, but shares work
+        across the metrics, e.g. by fetching them from a tracking server in a single request.
+
+        :param history_keys: List of ``(run_id, key)`` tuples identifying the metrics.
+
+        :return: A list containing, for each of ``history_keys``, the list of
+                 :py:class:`mlflow.entities.Metric` entities logged for the metric.
+        """
+        return self.store.get_metric_histories([(run_id, key) for run_id, key in history_keys])
 
     def create_run(self, experiment_id, start_time=None, tags=None):
         """
@@ -220,18 +264,23 @@ class MlflowClient(object):
         artifact_repo = get_artifact_repository(run.info.artifact_uri)
         artifact_repo.log_artifacts(local_dir, artifact_path)
 
-    def list_artifacts(self, run_id, path=None):
+    def list_artifacts(self, run_id, path=None, recursive=False):
         """
         List the artifacts for a run.
 
         :param run_id: The run to list artifacts from.
         :param path: The run's relative artifact path to list from. By default it is set to None
                      or the root artifact path.
+        :param recursive: If True, list the whole tree of artifacts under ``path`` rather than
+                          only its direct children. Artifact stores that support it list the
+                          tree in a single request instead of one request per directory.
         :return: List of :py:class:`mlflow.entities.FileInfo`
         """
         run = self.get_run(run_id)
         artifact_root = run.info.artifact_uri
         artifact_repo = get_artifact_repository(artifact_root)
+        if recursive:
+            return artifact_repo.list_artifacts_recursive(path)
         return artifact_repo.list_artifacts(path)
 
     def download_artifacts(self, run_id, path):
@@ -273,7 +322,7 @@ class MlflowClient(object):
 
     def search_runs(self, experiment_ids, filter_string,
                     run_view_type=ViewType.ACTIVE_ONLY,
-                    max_results=SEARCH_MAX_RESULTS_DEFAULT):
+                    max_results=SEARCH_MAX_RESULTS_DEFAULT, page_token=None):
         """
         Search experiments that fit the search criteria.
 
@@ -282,11 +331,16 @@ class MlflowClient(object):
         :param run_view_type: one of enum values ACTIVE_ONLY, DELETED_ONLY, or ALL runs
                               defined in :py:class:`mlflow.entities.ViewType`.
         :param max_results: Maximum number of runs desired.
+        :param page_token: Token specifying the next page of results. It should be obtained from
+            a ``search_runs`` call with the same experiment IDs, filter string and view type.
 
         :return: A list of :py:class:`mlflow.entities.Run` objects that satisfy the search
-            expressions
+            expressions, ordered by descending start time. If there are more matching runs than
+            ``max_results``, the token for the next page is available through the ``token``
+            attribute of the returned list; otherwise ``token`` is None.
         """
         return self.store.search_runs(experiment_ids=experiment_ids,
                                       search_filter=SearchFilter(filter_string=filter_string),
                                       run_view_type=run_view_type,
-                                      max_results=max_results)
+                                      max_results=max_results,
+                                      page_token=page_token)
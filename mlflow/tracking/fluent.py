@@ -14,18 +14,24 @@ import logging
 from mlflow.entities import Run, RunStatus, Param, RunTag, Metric
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.exceptions import MlflowException
+from mlflow.tracking.async_logging import AsyncLoggingQueue, DEFAULT_FLUSH_INTERVAL_SECONDS, \
+    DEFAULT_FLUSH_SIZE
 from mlflow.tracking.client import MlflowClient
 from mlflow.tracking import artifact_utils, context
 from mlflow.utils import env
 from mlflow.utils.databricks_utils import is_in_databricks_notebook, get_notebook_id
 from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID, MLFLOW_RUN_NAME
-from mlflow.utils.validation import _validate_run_id
+from mlflow.utils.validation import _validate_run_id, _validate_metric, _validate_param_name, \
+    _validate_tag_name
 
 _EXPERIMENT_ID_ENV_VAR = "MLFLOW_EXPERIMENT_ID"
 _EXPERIMENT_NAME_ENV_VAR = "MLFLOW_EXPERIMENT_NAME"
 _RUN_ID_ENV_VAR = "MLFLOW_RUN_ID"
+_ASYNC_LOGGING_ENV_VAR = "MLFLOW_ENABLE_ASYNC_LOGGING"
 _active_run_stack = []
 _active_experiment_id = None
+_async_logging_enabled = None
+_async_logging_queue = None
 
 
 _logger = logging.getLogger(__name__)
@@ -136,13 +142,20 @@ def start_run(run_id=None, experiment_id=None, run_name=None, nested=False):
 
 
 def end_run(status=RunStatus.to_string(RunStatus.FINISHED)):
-    """End an active MLflow run (if there is one)."""
+    """
+    End an active MLflow run (if there is one). If asynchronous logging is enabled, data buffered
+    for the run is sent first, and errors raised while sending it are raised once the run has
+    been ended.
+    """
     global _active_run_stack
     if len(_active_run_stack) > 0:
-        MlflowClient().set_terminated(_active_run_stack[-1].info.run_id, status)
-        # Clear out the global existing run environment variable as well.
-        env.unset_variable(_RUN_ID_ENV_VAR)
-        _active_run_stack.pop()
+        try:
+            flush_async_logging()
+        finally:
+            MlflowClient().set_terminated(_active_run_stack[-1].info.run_id, status)
+            # Clear out the global existing run environment variable as well.
+            env.unset_variable(_RUN_ID_ENV_VAR)
+            _active_run_stack.pop()
 
 
 atexit.register(end_run)
@@ -153,6 +166,61 @@ def active_run():
     return _active_run_stack[-1] if len(_active_run_stack) > 0 else None
 
 
+def enable_async_logging(enable=True, flush_interval_seconds=DEFAULT_FLUSH_INTERVAL_SECONDS,
+                         flush_size=DEFAULT_FLUSH_SIZE):
+    """
+    Enable or disable asynchronous logging for ``log_metric``, ``log_param``, ``set_tag`` and
+    their batched variants. Asynchronous logging can also be enabled by setting the
+    ``MLFLOW_ENABLE_ASYNC_LOGGING`` environment variable to ``true``.
+
+    When enabled, these functions validate their arguments and return immediately. The logged
+    data is buffered in memory and sent by a background thread as batched requests, once
+    ``flush_size`` metrics, params and tags are pending or ``flush_interval_seconds`` have
+    elapsed, and whenever the run ends or :py:func:`flush_async_logging` is called. Errors
+    raised while sending data are reported when it is flushed.
+
+    Disabling asynchronous logging flushes any buffered data.
+
+    :param enable: Whether to log asynchronously.
+    :param flush_interval_seconds: Maximum time for which logged data is buffered.
+    :param flush_size: Number of pending metrics, params and tags that triggers a flush.
+    """
+    global _async_logging_enabled, _async_logging_queue
+    queue = _async_logging_queue
+    _async_logging_enabled = enable
+    _async_logging_queue = None
+    if enable:
+        _async_logging_queue = AsyncLoggingQueue(
+            log_batch=lambda run_id, metrics, params, tags: MlflowClient().log_batch(
+                run_id=run_id, metrics=metrics, params=params, tags=tags),
+            flush_interval_seconds=flush_interval_seconds, flush_size=flush_size)
+    if queue is not None:
+        try:
+            queue.flush()
+        finally:
+            queue.stop()
+
+
+def flush_async_logging():
+    """
+    Send all data buffered by asynchronous logging and wait for it to be logged. Does nothing
+    if asynchronous logging is disabled.
+
+    :raises MlflowException: if any data logged asynchronously since the previous flush could
+                             not be logged.
+    """
+    queue = _get_async_logging_queue()
+    if queue is not None:
+        queue.flush()
+
+
+def _get_async_logging_queue():
+    if _async_logging_enabled is None and \
+            (env.get_env(_ASYNC_LOGGING_ENV_VAR) or "").lower() in ("true", "1"):
+        enable_async_logging()
+    return _async_logging_queue
+
+
 def log_param(key, value):
     """
     Log a parameter under the current run, creating a run if necessary.
@@ -161,7 +229,12 @@ def log_param(key, value):
     :param value: Parameter value (string, but will be string-ified if not)
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_param(run_id, key, value)
+    queue = _get_async_logging_queue()
+    if queue is not None:
+        _validate_param_name(key)
+        queue.log(run_id, params=[Param(key, str(value))])
+    else:
+        MlflowClient().log_param(run_id, key, value)
 
 
 def set_tag(key, value):
@@ -172,7 +245,12 @@ def set_tag(key, value):
     :param value: Tag value (string, but will be string-ified if not)
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().set_tag(run_id, key, value)
+    queue = _get_async_logging_queue()
+    if queue is not None:
+        _validate_tag_name(key)
+        queue.log(run_id, tags=[RunTag(key, str(value))])
+    else:
+        MlflowClient().set_tag(run_id, key, value)
 
 
 def log_metric(key, value, step=None):
@@ -184,7 +262,13 @@ def log_metric(key, value, step=None):
     :param step: Metric step (int). Defaults to zero if unspecified.
     """
     run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_metric(run_id, key, value, int(time.time() * 1000), step or 0)
+    timestamp = int(time.time() * 1000)
+    queue = _get_async_logging_queue()
+    if queue is not None:
+        _validate_metric(key, value, timestamp, step or 0)
+        queue.log(run_id, metrics=[Metric(key, value, timestamp, step or 0)])
+    else:
+        MlflowClient().log_metric(run_id, key, value, timestamp, step or 0)
 
 
 def log_metrics(metrics, step=None):
@@ -199,7 +283,7 @@ def log_metrics(metrics, step=None):
     run_id = _get_or_start_run().info.run_id
     timestamp = int(time.time() * 1000)
     metrics_arr = [Metric(key, value, timestamp, step or 0) for key, value in metrics.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=metrics_arr, params=[], tags=[])
+    _log_batch(run_id=run_id, metrics=metrics_arr, params=[], tags=[])
 
 
 def log_params(params):
@@ -210,8 +294,8 @@ def log_params(params):
     :returns: None
     """
     run_id = _get_or_start_run().info.run_id
-    params_arr = [Param(key, value) for key, value in params.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=[], params=params_arr, tags=[])
+    params_arr = [Param(key, str(value)) for key, value in params.items()]
+    _log_batch(run_id=run_id, metrics=[], params=params_arr, tags=[])
 
 
 def set_tags(tags):
@@ -222,8 +306,22 @@ def set_tags(tags):
     :returns: None
     """
     run_id = _get_or_start_run().info.run_id
-    tags_arr = [RunTag(key, value) for key, value in tags.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=[], params=[], tags=tags_arr)
+    tags_arr = [RunTag(key, str(value)) for key, value in tags.items()]
+    _log_batch(run_id=run_id, metrics=[], params=[], tags=tags_arr)
+
+
+def _log_batch(run_id, metrics, params, tags):
+    queue = _get_async_logging_queue()
+    if queue is not None:
+        for metric in metrics:
+            _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
+        for param in params:
+            _validate_param_name(param.key)
+        for tag in tags:
+            _validate_tag_name(tag.key)
+        queue.log(run_id, metrics=metrics, params=params, tags=tags)
+    else:
+        MlflowClient().log_batch(run_id=run_id, metrics=metrics, params=params, tags=tags)
 
 
 def log_artifact(local_path, artifact_path=None):
@@ -5,12 +5,23 @@ import posixpath
 import shutil
 import tarfile
 import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
 from six.moves.urllib.request import pathname2url
 from six.moves.urllib.parse import unquote
 from six.moves import urllib
 
 import yaml
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
 
 from mlflow.entities import FileInfo
 from mlflow.exceptions import MissingConfigException
@@ -30,6 +41,31 @@ def exists(name):
     return os.path.exists(name)
 
 
+@contextmanager
+def exclusive_lock(path):
+    """Hold an exclusive lock on the file at ``path``, which is shared by all processes."""
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except IOError:
+                    # LK_LOCK gives up after 10 seconds
+                    pass
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
 def list_all(root, filter_func=lambda x: True, full_path=False):
     """
     List all entities directly under 'dir_name' that satisfy 'filter_func'
@@ -158,7 +194,7 @@ def read_yaml(root, file_name):
         raise MissingConfigException("Yaml file '%s' does not exist." % file_path)
     try:
         with codecs.open(file_path, mode='r', encoding=ENCODING) as yaml_file:
-            return yaml.safe_load(yaml_file)
+            return yaml.load(yaml_file, Loader=YamlSafeLoader)
     except Exception as e:
         raise e
 
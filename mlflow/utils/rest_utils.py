@@ -1,11 +1,17 @@
 import base64
+import os
+import random
+import threading
 import time
 import logging
 import json
+import zlib
 
 import requests
+from six.moves import urllib
 
 from mlflow import __version__
+from mlflow.utils.env import get_env
 from mlflow.utils.string_utils import strip_suffix
 from mlflow.exceptions import MlflowException, RestException
 
@@ -17,16 +23,73 @@ _DEFAULT_HEADERS = {
     'User-Agent': 'mlflow-python-client/%s' % __version__
 }
 
+PROTOBUF_CONTENT_TYPE = 'application/x-protobuf'
+JSON_CONTENT_TYPE = 'application/json'
+# Request and response bodies smaller than this are not worth compressing
+MIN_GZIP_BODY_SIZE = 1024
 
-def http_request(host_creds, endpoint, retries=3, retry_interval=3, **kwargs):
+_HTTP_POOL_MAXSIZE_ENV_VAR = "MLFLOW_HTTP_POOL_MAXSIZE"
+_DEFAULT_HTTP_POOL_MAXSIZE = 10
+_MAX_RETRY_INTERVAL = 60
+
+# Maps (process ID, host) -> requests.Session, see ``_get_request_session``
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _get_request_session(url):
+    """
+    Return the ``requests.Session`` used for requests to the host of the given URL, creating it if
+    necessary. Sessions keep connections to their host alive across requests, so that successive
+    requests do not each pay for a new TCP connection and TLS handshake. A session can be shared
+    by multiple threads, each of which uses its own pooled connection; the maximum number of
+    connections kept per host is given by the ``MLFLOW_HTTP_POOL_MAXSIZE`` environment variable
+    (10 by default). Sessions are not shared with forked child processes, which must not reuse the
+    parent's connections; a child drops the sessions inherited from its parent when it creates its
+    first session.
+    """
+    parsed_url = urllib.parse.urlparse(url)
+    pid = os.getpid()
+    key = (pid, parsed_url.scheme, parsed_url.netloc)
+    session = _sessions.get(key)
+    if session is not None:
+        return session
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            # The sessions of other processes are not closed, since closing their connections
+            # could affect the process that opened them
+            for other_key in [k for k in _sessions if k[0] != pid]:
+                del _sessions[other_key]
+            pool_maxsize = int(get_env(_HTTP_POOL_MAXSIZE_ENV_VAR) or _DEFAULT_HTTP_POOL_MAXSIZE)
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+            session = requests.Session()
+            session.mount("%s://" % parsed_url.scheme, adapter)
+            _sessions[key] = session
+    return session
+
+
+def _get_retry_interval(retry_interval, attempt):
+    """
+    Return the time to wait before retrying a request that failed ``attempt`` times (starting at
+    1), using exponential backoff with "full jitter": a random interval between zero and
+    ``retry_interval * 2 ** (attempt - 1)`` seconds, capped at ``_MAX_RETRY_INTERVAL``. The jitter
+    spreads out the retries of clients that failed at the same time, e.g. during a server restart.
+    """
+    return random.uniform(0, min(_MAX_RETRY_INTERVAL, retry_interval * 2 ** (attempt - 1)))
+
+
+def http_request(host_creds, endpoint, retries=3, retry_interval=3, headers=None, **kwargs):
     """
     Makes an HTTP request with the specified method to the specified hostname/endpoint. Retries
-    up to `retries` times if a request fails with a server error (e.g. error code 500), waiting
-    `retry_interval` seconds between successive retries. Parses the API response (assumed to be
-    JSON) into a Python object and returns it.
+    up to `retries` times if a request fails with a server error (e.g. error code 500), backing
+    off exponentially from `retry_interval` seconds with random jitter between successive retries
+    (see ``_get_retry_interval``). Requests to the same host reuse pooled connections. Parses the
+    API response (assumed to be JSON) into a Python object and returns it.
 
     :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
         hostname and optional authentication.
+    :param headers: Optional dictionary of additional headers to send with the request.
     :return: Parsed API response
     """
     hostname = host_creds.host
@@ -37,16 +100,19 @@ def http_request(host_creds, endpoint, retries=3, retry_interval=3, **kwargs):
     elif host_creds.token:
         auth_str = "Bearer %s" % host_creds.token
 
-    headers = dict(_DEFAULT_HEADERS)
+    request_headers = dict(_DEFAULT_HEADERS)
+    if headers:
+        request_headers.update(headers)
     if auth_str:
-        headers['Authorization'] = auth_str
+        request_headers['Authorization'] = auth_str
 
     verify = not host_creds.ignore_tls_verification
 
     cleaned_hostname = strip_suffix(hostname, '/')
     url = "%s%s" % (cleaned_hostname, endpoint)
+    session = _get_request_session(url)
     for i in range(retries):
-        response = requests.request(url=url, headers=headers, verify=verify, **kwargs)
+        response = session.request(url=url, headers=request_headers, verify=verify, **kwargs)
         if response.status_code >= 200 and response.status_code < 500:
             return response
         else:
@@ -54,11 +120,41 @@ def http_request(host_creds, endpoint, retries=3, retry_interval=3, **kwargs):
                 "API request to %s failed with code %s != 200, retrying up to %s more times. "
                 "API response body: %s",
                 url, response.status_code, retries - i - 1, response.text)
-            time.sleep(retry_interval)
+            if i < retries - 1:
+                time.sleep(_get_retry_interval(retry_interval, i + 1))
     raise MlflowException("API request to %s failed to return code 200 after %s tries" %
                           (url, retries))
 
 
+def gzip_compress(data):
+    """Compress the given bytes in the gzip format, as used by ``Content-Encoding: gzip``."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def gzip_decompress(data, max_size=None):
+    """
+    Decompress the given gzip-compressed bytes.
+
+    :param max_size: If set, the maximum size in bytes of the decompressed data. Data that would
+                     decompress to more bytes raises a ``ValueError`` as soon as the limit is
+                     exceeded, so that small bodies decompressing to huge ones (gzip bombs) are
+                     never decompressed in full.
+    """
+    if max_size is None:
+        return zlib.decompress(data, 16 + zlib.MAX_WBITS)
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    decompressed = decompressor.decompress(data, max_size + 1)
+    if len(decompressed) > max_size or decompressor.unconsumed_tail:
+        raise ValueError("Decompressed data exceeds the maximum size of %s bytes" % max_size)
+    # Decompress objects have no ``eof`` attribute on Python 2, so detect truncated data by
+    # feeding one more byte: only once the gzip stream is complete is it left in ``unused_data``.
+    decompressor.decompress(b"\0")
+    if not decompressor.unused_data:
+        raise zlib.error("Incomplete or truncated gzip data")
+    return decompressed
+
+
 def _can_parse_as_json(string):
     try:
         json.loads(string)
@@ -1,3 +1,10 @@
+import base64
+import itertools
+import json
+import operator
+
+import numpy as np
+import six
 import sqlparse
 from sqlparse.sql import Identifier, Token, Comparison, Statement
 from sqlparse.tokens import Token as TokenType
@@ -6,6 +13,15 @@ from mlflow.entities import RunInfo
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 
+_COMPARISON_OPERATORS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<=': operator.le,
+    '<': operator.lt,
+}
+
 
 class SearchFilter(object):
     VALID_METRIC_COMPARATORS = set(['>', '>=', '!=', '=', '<', '<='])
@@ -39,6 +55,7 @@ class SearchFilter(object):
 
         # lazy parsing
         self.parsed = None
+        self._compiled_clauses = None
 
     @property
     def filter_string(self):
@@ -252,36 +269,55 @@ class SearchFilter(object):
         else:
             return []
 
+    @classmethod
+    def _validate_comparator(cls, comparator, valid_comparators):
+        if comparator not in valid_comparators:
+            raise MlflowException("Invalid comparator '%s' "
+                                  "not one of '%s'" % (comparator, valid_comparators),
+                                  error_code=INVALID_PARAMETER_VALUE)
+
+    @classmethod
+    def is_metric(cls, key_type, comparator):
+        if key_type == cls._METRIC_IDENTIFIER:
+            cls._validate_comparator(comparator, cls.VALID_METRIC_COMPARATORS)
+            return True
+        return False
+
+    @classmethod
+    def is_param(cls, key_type, comparator):
+        if key_type == cls._PARAM_IDENTIFIER:
+            cls._validate_comparator(comparator, cls.VALID_PARAM_COMPARATORS)
+            return True
+        return False
+
+    @classmethod
+    def is_tag(cls, key_type, comparator):
+        if key_type == cls._TAG_IDENTIFIER:
+            cls._validate_comparator(comparator, cls.VALID_TAG_COMPARATORS)
+            return True
+        return False
+
+    @classmethod
+    def is_attribute(cls, key_type, comparator):
+        if key_type == cls._ATTRIBUTE_IDENTIFIER:
+            cls._validate_comparator(comparator, cls.VALID_STRING_ATTRIBUTE_COMPARATORS)
+            return True
+        return False
+
     @classmethod
     def does_run_match_clause(cls, run, sed):
         key_type = sed.get('type')
         key = sed.get('key')
         value = sed.get('value')
         comparator = sed.get('comparator')
-        if key_type == cls._METRIC_IDENTIFIER:
-            if comparator not in cls.VALID_METRIC_COMPARATORS:
-                raise MlflowException("Invalid comparator '%s' "
-                                      "not one of '%s" % (comparator,
-                                                          cls.VALID_METRIC_COMPARATORS),
-                                      error_code=INVALID_PARAMETER_VALUE)
+        if cls.is_metric(key_type, comparator):
             lhs = run.data.metrics.get(key, None)
             value = float(value)
-        elif key_type == cls._PARAM_IDENTIFIER:
-            if comparator not in cls.VALID_PARAM_COMPARATORS:
-                raise MlflowException("Invalid comparator '%s' "
-                                      "not one of '%s'" % (comparator, cls.VALID_PARAM_COMPARATORS),
-                                      error_code=INVALID_PARAMETER_VALUE)
+        elif cls.is_param(key_type, comparator):
             lhs = run.data.params.get(key, None)
-        elif key_type == cls._TAG_IDENTIFIER:
-            if comparator not in cls.VALID_TAG_COMPARATORS:
-                raise MlflowException("Invalid comparator '%s' "
-                                      "not one of '%s" % (comparator, cls.VALID_TAG_COMPARATORS))
+        elif cls.is_tag(key_type, comparator):
             lhs = run.data.tags.get(key, None)
-        elif key_type == cls._ATTRIBUTE_IDENTIFIER:
-            if comparator not in cls.VALID_STRING_ATTRIBUTE_COMPARATORS:
-                raise MlflowException("Invalid comparator '{}' not one of "
-                                      "'{}".format(comparator,
-                                                   cls.VALID_STRING_ATTRIBUTE_COMPARATORS))
+        elif cls.is_attribute(key_type, comparator):
             lhs = getattr(run.info, key)
         else:
             raise MlflowException("Invalid search expression type '%s'" % key_type,
@@ -303,7 +339,180 @@ class SearchFilter(object):
         else:
             return False
 
-    def filter(self, run):
+    def get_clauses(self):
+        """
+        Return the parsed search clauses as a list of dictionaries with ``type``, ``key``,
+        ``comparator`` and ``value`` entries. Parsing happens once, on first access.
+        """
         if not self.parsed:
             self.parsed = self._parse()
-        return all([self.does_run_match_clause(run, s) for s in self.parsed])
+        return self.parsed
+
+    @classmethod
+    def _compile_clause(cls, clause):
+        key_type = clause.get('type')
+        key = clause.get('key')
+        value = clause.get('value')
+        comparator = clause.get('comparator')
+        if cls.is_metric(key_type, comparator):
+            return _CompiledClause(RunColumns.METRICS, key, comparator, float(value))
+        elif cls.is_param(key_type, comparator):
+            return _CompiledClause(RunColumns.PARAMS, key, comparator, value)
+        elif cls.is_tag(key_type, comparator):
+            return _CompiledClause(RunColumns.TAGS, key, comparator, value)
+        elif cls.is_attribute(key_type, comparator):
+            return _CompiledClause(RunColumns.ATTRIBUTES, key, comparator, value)
+        else:
+            raise MlflowException("Invalid search expression type '%s'" % key_type,
+                                  error_code=INVALID_PARAMETER_VALUE)
+
+    def _get_compiled_clauses(self):
+        if self._compiled_clauses is None:
+            self._compiled_clauses = [self._compile_clause(c) for c in self.get_clauses()]
+        return self._compiled_clauses
+
+    def compile(self):
+        """
+        Compile the filter into a predicate that takes a :py:class:`mlflow.entities.Run` and
+        returns True if the run matches all search clauses. Clauses are parsed and validated
+        once, and evaluation stops at the first clause that the run does not match.
+        """
+        clauses = self._get_compiled_clauses()
+
+        def predicate(run):
+            for clause in clauses:
+                if not clause.matches(run):
+                    return False
+            return True
+        return predicate
+
+    def filter(self, run):
+        return self.compile()(run)
+
+    def filter_columns(self, columns):
+        """
+        Evaluate the filter over a :py:class:`RunColumns` table with vectorized NumPy comparisons.
+
+        :return: A boolean NumPy array that is True for the runs that match all search clauses.
+        """
+        mask = np.ones(len(columns), dtype=bool)
+        for clause in self._get_compiled_clauses():
+            # Only evaluate each clause for the runs that matched the previous ones
+            rows = np.flatnonzero(mask)
+            if len(rows) == 0:
+                break
+            mask[rows] = clause.matches_column(columns, None if len(rows) == len(mask) else mask)
+        return mask
+
+
+class RunColumns(object):
+    """
+    Columnar view of a list of runs for the batch evaluation of search filters by
+    :py:meth:`SearchFilter.filter_columns`. For each run, in the same order, it holds the
+    dictionaries of the run's latest metric values, params and tags, and a dictionary of the
+    searchable attributes of its :py:class:`mlflow.entities.RunInfo`.
+
+    Stores that keep runs in such dictionaries can build the view directly, and filter runs
+    without materializing :py:class:`mlflow.entities.Run` objects for those that do not match.
+    """
+    METRICS = "metrics"
+    PARAMS = "params"
+    TAGS = "tags"
+    ATTRIBUTES = "attributes"
+
+    def __init__(self, metrics, params, tags, attributes):
+        self.metrics = metrics
+        self.params = params
+        self.tags = tags
+        self.attributes = attributes
+
+    def __len__(self):
+        return len(self.attributes)
+
+    def get_column(self, source, key, rows=None):
+        """
+        Return the list of values of ``key`` in the dictionaries of ``source``, one of
+        ``METRICS``, ``PARAMS``, ``TAGS`` or ``ATTRIBUTES``, with None for runs without it.
+
+        :param rows: Optional boolean NumPy array selecting the runs to return values for.
+        """
+        dicts = getattr(self, source)
+        if rows is not None:
+            dicts = itertools.compress(dicts, rows.tolist())
+        return list(map(operator.methodcaller("get", key, None), dicts))
+
+
+class _CompiledClause(object):
+    """
+    Search clause compiled for evaluation against runs. Compares the value of ``key`` in the
+    ``source`` dictionary of a run (see :py:class:`RunColumns`) with ``value``. Runs that do not
+    have a value for ``key`` never match.
+    """
+
+    def __init__(self, source, key, comparator, value):
+        self.source = source
+        self.key = key
+        self.comparator = comparator
+        self.compare = _COMPARISON_OPERATORS[comparator]
+        self.value = value
+
+    def _get_run_value(self, run):
+        if self.source == RunColumns.METRICS:
+            return run.data.metrics.get(self.key, None)
+        elif self.source == RunColumns.PARAMS:
+            return run.data.params.get(self.key, None)
+        elif self.source == RunColumns.TAGS:
+            return run.data.tags.get(self.key, None)
+        return getattr(run.info, self.key)
+
+    def matches(self, run):
+        lhs = self._get_run_value(run)
+        return lhs is not None and self.compare(lhs, self.value)
+
+    def matches_column(self, columns, rows=None):
+        """
+        Evaluate the clause for the runs of a :py:class:`RunColumns` table selected by the
+        boolean NumPy array ``rows``, or for all runs if it is None, returning a boolean NumPy
+        array with one entry per evaluated run.
+        """
+        values = columns.get_column(self.source, self.key, rows)
+        if self.source == RunColumns.METRICS and self.comparator != '!=':
+            # Missing values become NaN, which never compares as greater, less or equal
+            return self.compare(np.array(values, dtype=np.float64), self.value)
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        mask = np.asarray(self.compare(column, self.value), dtype=bool)
+        return mask & np.not_equal(column, None)
+
+
+def create_page_token(run_info):
+    """
+    Create a page token for a page of search results that ends with the run with the given
+    :py:class:`mlflow.entities.RunInfo`. Runs are returned by ``search_runs`` in order of
+    descending start time, then ascending run ID, so the start time and ID of the last run of a
+    page identify where the next page starts regardless of runs created in the meantime.
+    """
+    token = json.dumps({"start_time": run_info.start_time, "run_id": run_info.run_id})
+    return base64.urlsafe_b64encode(token.encode("utf-8")).decode("utf-8")
+
+
+def parse_page_token(page_token):
+    """
+    Parse a page token created by :py:func:`create_page_token`.
+
+    :return: A ``(start_time, run_id)`` tuple for the last run of the previous page, or None if
+             ``page_token`` is empty.
+    """
+    if not page_token:
+        return None
+    try:
+        token = json.loads(base64.urlsafe_b64decode(page_token.encode("utf-8")).decode("utf-8"))
+        start_time, run_id = token["start_time"], token["run_id"]
+    except (TypeError, ValueError, KeyError):
+        raise MlflowException("Invalid page token '%s'" % page_token,
+                              error_code=INVALID_PARAMETER_VALUE)
+    if not isinstance(start_time, six.integer_types) or \
+            not isinstance(run_id, six.string_types):
+        raise MlflowException("Invalid page token '%s'" % page_token,
+                              error_code=INVALID_PARAMETER_VALUE)
+    return start_time, run_id
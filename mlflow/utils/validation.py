@@ -27,6 +27,8 @@ MAX_PARAMS_TAGS_PER_BATCH = 100
 MAX_METRICS_PER_BATCH = 1000
 MAX_ENTITIES_PER_BATCH = 1000
 MAX_BATCH_LOG_REQUEST_SIZE = int(1e6)
+MAX_RUNS_PER_BATCH_GET = 100
+MAX_METRIC_HISTORIES_PER_BATCH_GET = 100
 MAX_PARAM_VAL_LENGTH = 250
 MAX_TAG_VAL_LENGTH = 250
 MAX_ENTITY_KEY_LENGTH = 250
@@ -150,6 +152,14 @@ def _validate_batch_limit(entity_name, limit, length):
         raise MlflowException(error_msg, error_code=INVALID_PARAMETER_VALUE)
 
 
+def _validate_batch_get_limit(entity_name, limit, length):
+    if length > limit:
+        error_msg = ("A batch get request can contain at most {limit} {name}. Got {count} {name}. "
+                     "Please split up {name} across multiple requests and try "
+                     "again.").format(name=entity_name, count=length, limit=limit)
+        raise MlflowException(error_msg, error_code=INVALID_PARAMETER_VALUE)
+
+
 def _validate_batch_log_limits(metrics, params, tags):
     """Validate that the provided batched logging arguments are within expected limits."""
     _validate_batch_limit(entity_name="metrics", limit=MAX_METRICS_PER_BATCH, length=len(metrics))
@@ -175,11 +185,14 @@ def _validate_batch_log_data(metrics, params, tags):
         _validate_tag(tag.key, tag.value)
 
 
-def _validate_batch_log_api_req(json_req):
-    if len(json_req) > MAX_BATCH_LOG_REQUEST_SIZE:
+def _validate_batch_log_api_req(request_body):
+    """
+    Check the size in bytes of the (decompressed) body of a batched logging request.
+    """
+    if len(request_body) > MAX_BATCH_LOG_REQUEST_SIZE:
         error_msg = ("Batched logging API requests must be at most {limit} bytes, got a "
                      "request of size {size}.").format(
-            limit=MAX_BATCH_LOG_REQUEST_SIZE, size=len(json_req))
+            limit=MAX_BATCH_LOG_REQUEST_SIZE, size=len(request_body))
         raise MlflowException(error_msg, error_code=INVALID_PARAMETER_VALUE)
 
 
@@ -0,0 +1,104 @@
+"""
+Script that measures the time taken by ``S3ArtifactRepository.log_artifacts`` to upload a directory
+of many small files and a few large files, for several numbers of upload workers.
+
+usage: python tests/benchmarks/benchmark_artifact_upload.py [--num-files N] [--workers 1,8] ...
+
+By default, the benchmark uploads to a bucket of an in-process S3 stand-in provided by ``moto``,
+adding ``--latency-ms`` of simulated network latency to each request (moto answers requests
+without any latency, which would hide the benefit of concurrent uploads). Pass ``--endpoint-url``
+and ``--bucket`` to benchmark against an actual S3-compatible server instead, such as MinIO or
+``moto_server``; credentials are then read from the usual AWS environment variables.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+import boto3
+
+from mlflow.store.s3_artifact_repo import S3ArtifactRepository
+
+
+def _make_local_dir(root, num_files, file_size, num_large_files, large_file_size):
+    local_dir = os.path.join(root, "checkpoint")
+    os.makedirs(os.path.join(local_dir, "shards"))
+    for i in range(num_files):
+        with open(os.path.join(local_dir, "shards", "shard-%05d" % i), "wb") as f:
+            f.write(os.urandom(file_size))
+    for i in range(num_large_files):
+        with open(os.path.join(local_dir, "weights-%s.bin" % i), "wb") as f:
+            f.write(os.urandom(large_file_size))
+    return local_dir
+
+
+def _add_latency(s3_client, latency_seconds):
+    def _sleep(**kwargs):  # pylint: disable=unused-argument
+        time.sleep(latency_seconds)
+
+    # Registered first so that it runs before moto intercepts the request
+    s3_client.meta.events.register_first("before-send.s3", _sleep)
+
+
+def _time_upload(bucket, local_dir, num_workers, args):
+    os.environ["MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS"] = str(num_workers)
+    repo = S3ArtifactRepository("s3://%s/benchmark/%s" % (bucket, uuid.uuid4().hex))
+    if args.latency_ms and not args.endpoint_url:
+        _add_latency(repo._get_s3_client(), args.latency_ms / 1000.0)
+    start = time.time()
+    repo.log_artifacts(local_dir)
+    return time.time() - start
+
+
+def run_benchmark(bucket, local_dir, args):
+    num_files = args.num_files + args.num_large_files
+    num_bytes = args.num_files * args.file_size + args.num_large_files * args.large_file_size
+    print("Uploading %s files (%.1f MB) to bucket %s" % (num_files, num_bytes / 1e6, bucket))
+    for num_workers in [int(workers) for workers in args.workers.split(",")]:
+        elapsed = _time_upload(bucket, local_dir, num_workers, args)
+        print("  %3s workers: %.3fs (%.1f files/s, %.1f MB/s)"
+              % (num_workers, elapsed, num_files / elapsed, num_bytes / 1e6 / elapsed))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--endpoint-url", default=None,
+                        help="URL of the S3-compatible server to benchmark against. Defaults to "
+                             "an in-process moto stand-in.")
+    parser.add_argument("--bucket", default="mlflow-benchmark",
+                        help="Bucket to upload to, which must exist if --endpoint-url is passed.")
+    parser.add_argument("--latency-ms", type=float, default=20,
+                        help="Latency added to each request sent to the moto stand-in.")
+    parser.add_argument("--num-files", type=int, default=500,
+                        help="Number of small files to upload.")
+    parser.add_argument("--file-size", type=int, default=16 * 1024,
+                        help="Size of the small files, in bytes.")
+    parser.add_argument("--num-large-files", type=int, default=2,
+                        help="Number of large files to upload, in multiple parts.")
+    parser.add_argument("--large-file-size", type=int, default=32 * 1024 * 1024,
+                        help="Size of the large files, in bytes.")
+    parser.add_argument("--workers", default="1,4,16",
+                        help="Comma-separated numbers of upload workers to benchmark.")
+    args = parser.parse_args()
+    tmpdir = tempfile.mkdtemp()
+    try:
+        local_dir = _make_local_dir(tmpdir, args.num_files, args.file_size,
+                                    args.num_large_files, args.large_file_size)
+        if args.endpoint_url:
+            os.environ["MLFLOW_S3_ENDPOINT_URL"] = args.endpoint_url
+            run_benchmark(args.bucket, local_dir, args)
+        else:
+            import moto
+
+            for name, value in [("AWS_ACCESS_KEY_ID", "benchmark"),
+                                ("AWS_SECRET_ACCESS_KEY", "benchmark"),
+                                ("AWS_DEFAULT_REGION", "us-east-1")]:
+                os.environ.setdefault(name, value)
+            with moto.mock_s3():
+                boto3.client("s3").create_bucket(Bucket=args.bucket)
+                run_benchmark(args.bucket, local_dir, args)
+    finally:
+        shutil.rmtree(tmpdir)
@@ -0,0 +1,64 @@
+"""
+Script that compares serial and parallel run loading in ``FileStore.search_runs``.
+
+usage: python tests/benchmarks/benchmark_file_store_search.py [--root PATH] [--num-runs N] ...
+
+The script creates a synthetic store of ``num-runs`` runs (10,000 by default), each with a few
+metrics, params and tags, then times ``search_runs`` over all of them with each degree of
+parallelism given by ``--max-workers``. By default the store is created in a temporary directory
+on local disk; pass ``--root`` to create it on e.g. an NFS mount, where the speedup of parallel
+loading is largest. A store previously created with ``--root`` is reused if it already exists.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from mlflow.entities import Metric, Param, RunTag, ViewType
+from mlflow.store import SEARCH_MAX_RESULTS_THRESHOLD
+from mlflow.store.file_store import FileStore
+
+
+def populate_store(root, num_runs, num_experiments):
+    store = FileStore(root)
+    experiment_ids = [store.create_experiment("experiment-%s" % i)
+                      for i in range(num_experiments)]
+    for i in range(num_runs):
+        run_id = store.create_run(experiment_ids[i % num_experiments], user_id="benchmark",
+                                  start_time=i, tags=[]).info.run_id
+        store.log_batch(run_id,
+                        metrics=[Metric("metric-%s" % j, j, i, 0) for j in range(3)],
+                        params=[Param("param-%s" % j, str(j)) for j in range(3)],
+                        tags=[RunTag("tag-%s" % j, str(j)) for j in range(3)])
+    return experiment_ids
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--root", default=None,
+                        help="Directory in which to create the store. Defaults to a temporary "
+                             "directory that is deleted afterwards.")
+    parser.add_argument("--num-runs", type=int, default=10000)
+    parser.add_argument("--num-experiments", type=int, default=10)
+    parser.add_argument("--max-workers", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    args = parser.parse_args()
+    root = args.root or os.path.join(tempfile.mkdtemp(), "mlruns")
+    try:
+        if os.path.exists(root):
+            experiment_ids = [e.experiment_id for e in FileStore(root).list_experiments()]
+        else:
+            print("Creating %s runs in %s..." % (args.num_runs, root))
+            experiment_ids = populate_store(root, args.num_runs, args.num_experiments)
+        for max_workers in args.max_workers:
+            store = FileStore(root, max_workers=max_workers)
+            start = time.time()
+            runs = store.search_runs(experiment_ids, search_filter=None,
+                                     run_view_type=ViewType.ALL,
+                                     max_results=SEARCH_MAX_RESULTS_THRESHOLD)
+            print("max_workers=%-3s: loaded %s runs in %.2fs"
+                  % (max_workers, len(runs), time.time() - start))
+    finally:
+        if args.root is None:
+            shutil.rmtree(os.path.dirname(root))
@@ -0,0 +1,102 @@
+"""
+Script that measures the effect of the tracking schema's secondary indexes on the latency of
+``SqlAlchemyStore.get_metric_history`` and ``SqlAlchemyStore.search_runs``.
+
+usage: python tests/benchmarks/benchmark_indexes.py [--num-runs N] [--num-keys N] [--num-steps N]
+
+The script populates a temporary SQLite database with ``num-runs * num-keys * num-steps`` metric
+rows (one million by default), times both queries, then drops the indexes and times them again.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+import uuid
+
+from mlflow.entities import ViewType
+from mlflow.store.dbmodels.models import SqlRun, SqlMetric, SqlLatestMetric, SqlParam, SqlTag
+from mlflow.store.sqlalchemy_store import SqlAlchemyStore
+
+_INDEXES = [
+    "index_runs_experiment_id_lifecycle_stage_start_time",
+    "index_metrics_run_uuid_key",
+    "index_latest_metrics_run_uuid",
+    "index_params_run_uuid",
+    "index_tags_run_uuid",
+]
+
+_INSERT_CHUNK_SIZE = 50000
+
+
+def _insert(engine, model, rows):
+    for i in range(0, len(rows), _INSERT_CHUNK_SIZE):
+        engine.execute(model.__table__.insert(), rows[i:i + _INSERT_CHUNK_SIZE])
+
+
+def populate_db(store, num_experiments, num_runs, num_keys, num_steps):
+    experiment_ids = [int(store.create_experiment("experiment-%s" % i))
+                      for i in range(num_experiments)]
+    run_ids = [uuid.uuid4().hex for _ in range(num_runs)]
+    _insert(store.engine, SqlRun, [
+        dict(run_uuid=run_id, experiment_id=experiment_ids[i % num_experiments], start_time=i,
+             lifecycle_stage="active", source_type="LOCAL", status="FINISHED",
+             user_id="benchmark", artifact_uri=store.artifact_root_uri)
+        for i, run_id in enumerate(run_ids)])
+    keys = ["metric-%s" % i for i in range(num_keys)]
+    _insert(store.engine, SqlParam, [
+        dict(run_uuid=run_id, key="param", value="value") for run_id in run_ids])
+    _insert(store.engine, SqlTag, [
+        dict(run_uuid=run_id, key="tag", value="value") for run_id in run_ids])
+    _insert(store.engine, SqlLatestMetric, [
+        dict(run_uuid=run_id, key=key, value=1.0, timestamp=num_steps, step=num_steps - 1)
+        for run_id in run_ids for key in keys])
+    for run_id in run_ids:
+        _insert(store.engine, SqlMetric, [
+            dict(run_uuid=run_id, key=key, value=random.random(), timestamp=step, step=step)
+            for key in keys for step in range(num_steps)])
+    store.engine.execute("ANALYZE")
+    return [str(experiment_id) for experiment_id in experiment_ids], run_ids, keys
+
+
+def time_queries(store, experiment_ids, run_ids, keys, num_queries):
+    random.seed(0)
+    start = time.time()
+    for _ in range(num_queries):
+        store.get_metric_history(random.choice(run_ids), random.choice(keys))
+    metric_history_time = (time.time() - start) / num_queries
+    start = time.time()
+    for _ in range(num_queries):
+        store.search_runs([random.choice(experiment_ids)], search_filter=None,
+                          run_view_type=ViewType.ACTIVE_ONLY, max_results=100)
+    search_runs_time = (time.time() - start) / num_queries
+    print("  get_metric_history: %.2fms per query" % (metric_history_time * 1000))
+    print("  search_runs:        %.2fms per query" % (search_runs_time * 1000))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-experiments", type=int, default=10)
+    parser.add_argument("--num-runs", type=int, default=1000)
+    parser.add_argument("--num-keys", type=int, default=10)
+    parser.add_argument("--num-steps", type=int, default=100)
+    parser.add_argument("--num-queries", type=int, default=50)
+    args = parser.parse_args()
+    tmpdir = tempfile.mkdtemp()
+    try:
+        store = SqlAlchemyStore("sqlite:///%s" % os.path.join(tmpdir, "benchmark.db"), tmpdir)
+        print("Populating database with %s metric rows..."
+              % (args.num_runs * args.num_keys * args.num_steps))
+        experiment_ids, run_ids, keys = populate_db(
+            store, args.num_experiments, args.num_runs, args.num_keys, args.num_steps)
+        print("With indexes:")
+        time_queries(store, experiment_ids, run_ids, keys, args.num_queries)
+        for index in _INDEXES:
+            store.engine.execute("DROP INDEX %s" % index)
+        store.engine.execute("ANALYZE")
+        print("Without indexes:")
+        time_queries(store, experiment_ids, run_ids, keys, args.num_queries)
+    finally:
+        shutil.rmtree(tmpdir)
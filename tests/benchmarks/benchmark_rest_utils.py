@@ -0,0 +1,96 @@
+"""
+Script that compares the throughput of REST calls made through ``mlflow.utils.rest_utils``, which
+keeps connections alive in a pooled session per host, with that of calls that each open a new
+connection through ``requests.request``.
+
+usage: python tests/benchmarks/benchmark_rest_utils.py [--num-requests N] [--num-threads N]
+
+The script starts a local Flask server standing in for the tracking server, whose endpoint returns
+a small JSON response like ``GetExperiment``, and sends ``num-requests`` requests to it from each
+of ``num-threads`` threads. Connection setup is cheap on the loopback interface, so the gain
+against a remote server over TLS is larger than measured here.
+"""
+
+import argparse
+import json
+import logging
+import socket
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+import requests
+from flask import Flask
+from werkzeug.serving import make_server, WSGIRequestHandler
+
+from mlflow.utils.rest_utils import http_request, MlflowHostCreds
+
+_ENDPOINT = "/api/2.0/preview/mlflow/experiments/get"
+_RESPONSE = json.dumps({"experiment": {"experiment_id": "0", "name": "Default",
+                                       "artifact_location": "/tmp/mlruns/0",
+                                       "lifecycle_stage": "active"}})
+
+
+class _RequestHandler(WSGIRequestHandler):
+    # HTTP/1.1 lets the server keep connections alive between requests
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        WSGIRequestHandler.setup(self)
+        # The development server writes the headers and body of a response separately, which
+        # stalls kept-alive connections on delayed ACKs unless Nagle's algorithm is disabled
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def start_server():
+    app = Flask(__name__)
+
+    @app.route(_ENDPOINT)
+    def get_experiment():  # pylint: disable=unused-variable
+        return app.response_class(_RESPONSE, mimetype="application/json")
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    server = make_server("127.0.0.1", 0, app, threaded=True, request_handler=_RequestHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def _unpooled_request(host, num_requests):
+    for _ in range(num_requests):
+        requests.request(method="GET", url=host + _ENDPOINT, params={"experiment_id": "0"},
+                         headers={"Connection": "close"})
+
+
+def _pooled_request(host, num_requests):
+    host_creds = MlflowHostCreds(host)
+    for _ in range(num_requests):
+        http_request(host_creds, _ENDPOINT, method="GET", params={"experiment_id": "0"})
+
+
+def time_requests(request_fn, host, num_requests, num_threads):
+    pool = ThreadPool(num_threads)
+    start = time.time()
+    pool.map(lambda _: request_fn(host, num_requests), range(num_threads))
+    elapsed = time.time() - start
+    pool.close()
+    return num_requests * num_threads / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-requests", type=int, default=1000,
+                        help="Number of requests sent by each thread.")
+    parser.add_argument("--num-threads", type=int, default=4)
+    args = parser.parse_args()
+    server = start_server()
+    host = "http://127.0.0.1:%s" % server.server_port
+    try:
+        for name, request_fn in [("new connection per request", _unpooled_request),
+                                 ("pooled session", _pooled_request)]:
+            requests_per_second = time_requests(request_fn, host, args.num_requests,
+                                                args.num_threads)
+            print("%-26s: %.1f requests/s" % (name, requests_per_second))
+    finally:
+        server.shutdown()
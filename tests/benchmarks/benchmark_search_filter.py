@@ -0,0 +1,86 @@
+"""
+Script that compares ways of evaluating a ``SearchFilter`` over many runs: clause by clause with
+``SearchFilter.does_run_match_clause``, with the predicate returned by ``SearchFilter.compile``,
+and with ``SearchFilter.filter_columns`` over a ``RunColumns`` view of the runs, as used by
+``FileStore.search_runs``.
+
+usage: python tests/benchmarks/benchmark_search_filter.py [--num-runs N] [--filter FILTER]
+
+The script creates ``num-runs`` in-memory runs (100,000 by default) with a few metrics, params
+and tags each, and times each way of filtering them. The ``RunColumns`` view is built before
+timing, as stores build it from data they already hold.
+"""
+
+import argparse
+import itertools
+import random
+import time
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunStatus, RunTag, \
+    LifecycleStage
+from mlflow.utils.search_utils import SearchFilter, RunColumns
+
+
+def make_runs(num_runs):
+    random.seed(0)
+    runs = []
+    for i in range(num_runs):
+        run_id = "run-%s" % i
+        run_info = RunInfo(run_uuid=run_id, run_id=run_id, experiment_id="0", user_id="user",
+                           status=RunStatus.to_string(random.choice([RunStatus.FINISHED,
+                                                                     RunStatus.FAILED])),
+                           start_time=i, end_time=i + 1, lifecycle_stage=LifecycleStage.ACTIVE)
+        metrics = [Metric("metric_%s" % j, random.random(), i, 0) for j in range(5)]
+        params = [Param("param_%s" % j, random.choice(["a", "b", "c"])) for j in range(5)]
+        tags = [RunTag("tag_%s" % j, random.choice(["x", "y"])) for j in range(5)]
+        runs.append(Run(run_info, RunData(metrics, params, tags)))
+    return runs
+
+
+def make_run_columns(runs):
+    attribute_keys = RunInfo.get_searchable_attributes()
+    return RunColumns(metrics=[run.data.metrics for run in runs],
+                      params=[run.data.params for run in runs],
+                      tags=[run.data.tags for run in runs],
+                      attributes=[{key: getattr(run.info, key) for key in attribute_keys}
+                                  for run in runs])
+
+
+def filter_by_clause(search_filter, runs):
+    clauses = search_filter.get_clauses()
+    return [run for run in runs
+            if all([SearchFilter.does_run_match_clause(run, c) for c in clauses])]
+
+
+def filter_compiled(search_filter, runs):
+    predicate = search_filter.compile()
+    return [run for run in runs if predicate(run)]
+
+
+def filter_columns(search_filter, runs, columns):
+    mask = search_filter.filter_columns(columns)
+    return list(itertools.compress(runs, mask.tolist()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-runs", type=int, default=100000)
+    parser.add_argument("--filter", default="metrics.metric_0 > 0.5 and params.param_0 = 'a' "
+                                            "and tags.tag_0 != 'x' and "
+                                            "attributes.status = 'FINISHED'")
+    args = parser.parse_args()
+    runs = make_runs(args.num_runs)
+    columns = make_run_columns(runs)
+    expected = None
+    for name, filter_fn in [("does_run_match_clause", filter_by_clause),
+                            ("compiled predicate", filter_compiled),
+                            ("filter_columns", lambda sf, r: filter_columns(sf, r, columns))]:
+        search_filter = SearchFilter(filter_string=args.filter)
+        search_filter.get_clauses()
+        start = time.time()
+        matched = filter_fn(search_filter, runs)
+        elapsed = time.time() - start
+        assert expected is None or matched == expected
+        expected = matched
+        print("%-22s: matched %s of %s runs in %.1fms"
+              % (name, len(matched), len(runs), elapsed * 1000))
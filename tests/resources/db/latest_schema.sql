@@ -30,6 +30,7 @@ CREATE TABLE runs (
 	lifecycle_stage VARCHAR(20), 
 	artifact_uri VARCHAR(200), 
 	experiment_id INTEGER, 
+	version BIGINT DEFAULT '0' NOT NULL, 
 	CONSTRAINT run_pk PRIMARY KEY (run_uuid), 
 	FOREIGN KEY(experiment_id) REFERENCES experiments (experiment_id), 
 	CONSTRAINT status CHECK (status IN ('SCHEDULED', 'FAILED', 'FINISHED', 'RUNNING')), 
@@ -38,6 +39,17 @@ CREATE TABLE runs (
 )
 
 
+CREATE TABLE latest_metrics (
+	key VARCHAR(250) NOT NULL, 
+	value FLOAT NOT NULL, 
+	timestamp BIGINT, 
+	step BIGINT NOT NULL, 
+	run_uuid VARCHAR(32) NOT NULL, 
+	CONSTRAINT latest_metric_pk PRIMARY KEY (key, run_uuid), 
+	FOREIGN KEY(run_uuid) REFERENCES runs (run_uuid)
+)
+
+
 CREATE TABLE metrics (
 	key VARCHAR(250) NOT NULL, 
 	value FLOAT NOT NULL, 
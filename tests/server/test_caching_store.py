@@ -0,0 +1,193 @@
+import mock
+import pytest
+
+from mlflow.entities import Metric, RunTag, ViewType
+from mlflow.exceptions import MlflowException
+from mlflow.server import handlers, BACKEND_STORE_URI_ENV_VAR, CACHE_SIZE_ENV_VAR, \
+    CACHE_TTL_ENV_VAR
+from mlflow.server.caching_store import ReadCache, CachingStore
+from mlflow.store.file_store import FileStore
+
+
+@pytest.fixture()
+def mock_time():
+    with mock.patch("mlflow.server.caching_store.time.time", return_value=1000.0) as m:
+        yield m
+
+
+def test_read_cache_hits_and_misses():
+    cache = ReadCache(max_size=10)
+    load = mock.Mock(return_value="value")
+    assert cache.get("key", "name", load) == "value"
+    assert cache.get("key", "name", load) == "value"
+    assert load.call_count == 1
+    assert cache.get("key", "other", lambda: "other") == "other"
+    metrics = cache.get_metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["size"]) == (1, 2, 1)
+
+
+def test_read_cache_evicts_least_recently_used_entries():
+    cache = ReadCache(max_size=2)
+    cache.get("a", "name", lambda: 1)
+    cache.get("b", "name", lambda: 2)
+    cache.get("a", "name", lambda: 3)
+    cache.get("c", "name", lambda: 4)
+    assert cache.peek("a", "name") == 1
+    assert cache.peek("b", "name") is None
+    assert cache.peek("c", "name") == 4
+    assert cache.get_metrics()["evictions"] == 1
+
+
+def test_read_cache_expires_entries(mock_time):
+    cache = ReadCache(max_size=10, ttl_seconds=5)
+    cache.get("key", "name", lambda: 1)
+    mock_time.return_value += 4
+    assert cache.get("key", "name", lambda: 2) == 1
+    mock_time.return_value += 1
+    assert cache.peek("key", "name") is None
+    assert cache.get("key", "name", lambda: 3) == 3
+    assert cache.get_metrics()["expirations"] == 1
+
+
+def test_read_cache_does_not_store_values_loaded_before_invalidation():
+    cache = ReadCache(max_size=10)
+
+    def _load():
+        # A write invalidates the entry while the value is being loaded
+        cache.invalidate("key")
+        return "stale"
+
+    assert cache.get("key", "name", _load) == "stale"
+    assert cache.get("key", "name", lambda: "fresh") == "fresh"
+    assert cache.get_metrics()["invalidations"] == 1
+
+
+def test_read_cache_reset_entry_drops_other_values():
+    cache = ReadCache(max_size=10)
+    cache.get("key", "content", lambda: "old content")
+    assert cache.get("key", "version", lambda: 2, reset_entry=True) == 2
+    assert cache.peek("key", "content") is None
+    assert cache.get("key", "content", lambda: "new content") == "new content"
+    assert cache.get("key", "version", lambda: 3, reset_entry=True) == 2
+    assert cache.peek("key", "content") == "new content"
+
+
+@pytest.mark.parametrize("max_size,ttl_seconds", [(0, 5), (10, 0)])
+def test_read_cache_validates_limits(max_size, ttl_seconds):
+    with pytest.raises(MlflowException):
+        ReadCache(max_size, ttl_seconds)
+
+
+@pytest.fixture()
+def file_store(tmpdir):
+    return FileStore(tmpdir.join("mlruns").strpath)
+
+
+def test_caching_store_serves_reads_from_cache(file_store):
+    store = CachingStore(file_store, max_size=100)
+    run_id = store.create_run("0", "user", 0, []).info.run_id
+    with mock.patch.object(file_store, "get_run", wraps=file_store.get_run) as get_run_mock, \
+            mock.patch.object(file_store, "get_experiment",
+                              wraps=file_store.get_experiment) as get_experiment_mock:
+        for _ in range(3):
+            assert store.get_run(run_id).info.run_id == run_id
+            assert store.get_experiment("0").experiment_id == "0"
+        assert get_run_mock.call_count == 1
+        assert get_experiment_mock.call_count == 1
+    metrics = store.get_cache_metrics()
+    assert metrics["hits"] == 4
+    # Other methods are forwarded to the wrapped store
+    assert [r.info.run_id for r in store.search_runs(["0"], None, ViewType.ALL)] == [run_id]
+    assert store.root_directory == file_store.root_directory
+
+
+def test_caching_store_invalidates_runs_on_writes(file_store):
+    store = CachingStore(file_store, max_size=100)
+    run_id = store.create_run("0", "user", 0, []).info.run_id
+    assert [r.run_id for r in store.list_run_infos("0", ViewType.ACTIVE_ONLY)] == [run_id]
+    assert store.get_run(run_id).data.metrics == {}
+    store.log_metric(run_id, Metric("m", 1.0, 1, 0))
+    assert store.get_run(run_id).data.metrics == {"m": 1.0}
+    store.log_batch(run_id, [], [], [RunTag("t", "v")])
+    assert store.get_run(run_id).data.tags["t"] == "v"
+    store.delete_run(run_id)
+    assert store.list_run_infos("0", ViewType.ACTIVE_ONLY) == []
+    # The experiment of runs that were not read through the store is unknown, so writes to them
+    # invalidate all cached experiments
+    other_store = CachingStore(file_store, max_size=100)
+    other_store.list_run_infos("0", ViewType.ALL)
+    other_store.get_experiment("0")
+    other_store.restore_run(run_id)
+    assert other_store.cache.get_metrics()["size"] == 0
+
+
+def test_caching_store_experiments_of_runs_do_not_take_cache_entries(file_store):
+    store = CachingStore(file_store, max_size=2)
+    other_experiment_id = store.create_experiment("other")
+    run_ids = [store.create_run(experiment_id, "user", 0, []).info.run_id
+               for experiment_id in ["0", other_experiment_id]]
+    for run_id in run_ids:
+        store.get_run(run_id)
+    store.get_experiment(other_experiment_id)
+    assert store.cache.get_metrics()["evictions"] == 1
+    # Only the experiment of the run is invalidated, even though its run entry was evicted
+    with mock.patch.object(file_store, "get_experiment",
+                           wraps=file_store.get_experiment) as get_experiment_mock:
+        store.log_metric(run_ids[0], Metric("m", 1.0, 1, 0))
+        store.get_experiment(other_experiment_id)
+        assert get_experiment_mock.call_count == 0
+
+
+def test_caching_store_invalidates_experiments_on_writes(file_store):
+    store = CachingStore(file_store, max_size=100)
+    assert [e.name for e in store.list_experiments(ViewType.ALL)] == ["Default"]
+    experiment_id = store.create_experiment("exp")
+    assert [e.name for e in store.list_experiments(ViewType.ALL)] == ["Default", "exp"]
+    assert store.get_experiment(experiment_id).name == "exp"
+    store.rename_experiment(experiment_id, "renamed")
+    assert store.get_experiment(experiment_id).name == "renamed"
+    store.delete_experiment(experiment_id)
+    assert store.get_experiment(experiment_id).lifecycle_stage == "deleted"
+    assert [e.name for e in store.list_experiments(ViewType.ACTIVE_ONLY)] == ["Default"]
+    store.create_run(experiment_id="0", user_id="user", start_time=0, tags=[])
+    assert len(store.list_run_infos("0", ViewType.ALL)) == 1
+
+
+def test_caching_store_versions_are_not_newer_than_cached_content():
+    wrapped_store = mock.Mock()
+    store = CachingStore(wrapped_store, max_size=100)
+    wrapped_store.get_run.return_value = mock.Mock(name="old run")
+    old_run = store.get_run("r")
+    # A write through another worker changes the run, but the cached run is still served
+    wrapped_store.get_run.return_value = mock.Mock(name="new run")
+    wrapped_store.get_run_version.return_value = "2"
+    assert store.get_run_version("r") == "2"
+    # Serving the old run under the new version would let clients cache it indefinitely
+    new_run = store.get_run("r")
+    assert new_run is not old_run
+    assert new_run is wrapped_store.get_run.return_value
+    assert store.get_run_version("r") == "2"
+    assert store.get_run("r") is new_run
+
+
+def test_caching_store_does_not_cache_errors():
+    wrapped_store = mock.Mock()
+    wrapped_store.get_run.side_effect = [MlflowException("not found"), mock.Mock()]
+    store = CachingStore(wrapped_store, max_size=100)
+    with pytest.raises(MlflowException):
+        store.get_run("r")
+    store.get_run("r")
+    store.get_run("r")
+    assert wrapped_store.get_run.call_count == 2
+
+
+def test_get_store_wraps_backend_store_if_cache_is_enabled(tmpdir):
+    env = {BACKEND_STORE_URI_ENV_VAR: tmpdir.join("mlruns").strpath}
+    with mock.patch("mlflow.server.handlers._store", None), mock.patch.dict("os.environ", env):
+        assert isinstance(handlers._get_store(), FileStore)
+    env.update({CACHE_SIZE_ENV_VAR: "50", CACHE_TTL_ENV_VAR: "0.5"})
+    with mock.patch("mlflow.server.handlers._store", None), mock.patch.dict("os.environ", env):
+        store = handlers._get_store()
+        assert isinstance(store, CachingStore)
+        assert isinstance(store.store, FileStore)
+        assert (store.cache.max_size, store.cache.ttl_seconds) == (50, 0.5)
@@ -3,13 +3,21 @@ import json
 import mock
 import pytest
 
-from mlflow.entities import ViewType
+from mlflow.entities import Experiment, Metric, ViewType
 from mlflow.exceptions import MlflowException
-from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE, ErrorCode
+from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, INVALID_PARAMETER_VALUE, \
+    RESOURCE_DOES_NOT_EXIST, ErrorCode
 from mlflow.server.handlers import get_endpoints, _create_experiment, _get_request_message, \
-    _search_runs, _log_batch, catch_mlflow_exception
-from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
-from mlflow.utils.validation import MAX_BATCH_LOG_REQUEST_SIZE
+    _search_runs, _get_metric_history, _get_runs, _get_metric_histories, \
+    catch_mlflow_exception
+from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns, ListExperiments, \
+    GetMetricHistory, GetRuns, GetMetricHistories, ListArtifacts, LogBatch, Param, \
+    Run as ProtoRun
+from mlflow.store.entities import PagedList
+from mlflow.utils.proto_json_utils import message_to_json
+from mlflow.utils.rest_utils import gzip_compress, gzip_decompress
+from mlflow.utils.validation import MAX_BATCH_LOG_REQUEST_SIZE, MAX_RUNS_PER_BATCH_GET, \
+    MAX_METRIC_HISTORIES_PER_BATCH_GET
 
 
 @pytest.fixture()
@@ -18,12 +26,6 @@ def mock_get_request_message():
         yield m
 
 
-@pytest.fixture()
-def mock_get_request_json():
-    with mock.patch('mlflow.server.handlers._get_request_json') as m:
-        yield m
-
-
 @pytest.fixture()
 def mock_store():
     with mock.patch('mlflow.server.handlers._get_store') as m:
@@ -64,6 +66,15 @@ def test_can_parse_get_json_with_unknown_fields():
     assert msg.name == "hello"
 
 
+@pytest.mark.parametrize("value,expected", [("true", True), ("True", True), ("false", False)])
+def test_can_parse_get_bools(value, expected):
+    request = mock.MagicMock()
+    request.method = "GET"
+    request.query_string = ("run_id=1&recursive=%s" % value).encode("utf-8")
+    msg = _get_request_message(ListArtifacts(), flask_request=request)
+    assert msg.recursive is expected
+
+
 # Previous versions of the client sent a doubly string encoded JSON blob,
 # so this test ensures continued compliance with such clients.
 def test_can_parse_json_string():
@@ -80,19 +91,108 @@ def test_search_runs_default_view_type(mock_get_request_message, mock_store):
     Search Runs default view type is filled in as ViewType.ACTIVE_ONLY
     """
     mock_get_request_message.return_value = SearchRuns(experiment_ids=["0"])
+    mock_store.search_runs.return_value = PagedList([], None)
     _search_runs()
     args, _ = mock_store.search_runs.call_args
     assert args[2] == ViewType.ACTIVE_ONLY
 
 
-def test_log_batch_api_req(mock_get_request_json):
-    mock_get_request_json.return_value = "a" * (MAX_BATCH_LOG_REQUEST_SIZE + 1)
-    response = _log_batch()
+def test_search_runs_page_tokens(mock_get_request_message, mock_store):
+    mock_get_request_message.return_value = SearchRuns(experiment_ids=["0"], page_token="abc")
+    mock_store.search_runs.return_value = PagedList([], "def")
+    response = _search_runs()
+    args, _ = mock_store.search_runs.call_args
+    assert args[4] == "abc"
+    assert json.loads(response.get_data())["next_page_token"] == "def"
+
+
+def test_get_metric_history_downsampling_params(mock_get_request_message, mock_store):
+    mock_store.get_metric_history.return_value = []
+    mock_get_request_message.return_value = GetMetricHistory(run_id="r", metric_key="m")
+    _get_metric_history()
+    mock_store.get_metric_history.assert_called_with(
+        "r", "m", max_points=None, min_step=None, max_step=None, aggregation=None)
+    mock_get_request_message.return_value = GetMetricHistory(
+        run_id="r", metric_key="m", max_points=10, min_step=0, max_step=100, aggregation="mean")
+    _get_metric_history()
+    mock_store.get_metric_history.assert_called_with(
+        "r", "m", max_points=10, min_step=0, max_step=100, aggregation="mean")
+
+
+def test_get_runs_limits_batch_size(mock_get_request_message, mock_store):
+    mock_store.get_runs.return_value = []
+    mock_get_request_message.return_value = GetRuns(run_ids=["r1", "r2"])
+    _get_runs()
+    mock_store.get_runs.assert_called_once_with(["r1", "r2"])
+    mock_get_request_message.return_value = GetRuns(
+        run_ids=["r"] * (MAX_RUNS_PER_BATCH_GET + 1))
+    response = _get_runs()
+    assert json.loads(response.get_data())["error_code"] == \
+        ErrorCode.Name(INVALID_PARAMETER_VALUE)
+    assert mock_store.get_runs.call_count == 1
+
+
+def test_get_metric_histories(mock_get_request_message, mock_store):
+    mock_store.get_metric_histories.return_value = [[Metric("m", 1.5, 2, 3)], []]
+    mock_get_request_message.return_value = GetMetricHistories(history_keys=[
+        GetMetricHistories.HistoryKey(run_id="r1", metric_key="m"),
+        GetMetricHistories.HistoryKey(run_id="r2", metric_key="m")])
+    response = _get_metric_histories()
+    mock_store.get_metric_histories.assert_called_once_with([("r1", "m"), ("r2", "m")])
+    assert json.loads(response.get_data()) == {"histories": [
+        {"run_id": "r1", "metric_key": "m",
+         "metrics": [{"key": "m", "value": 1.5, "timestamp": "2", "step": "3"}]},
+        {"run_id": "r2", "metric_key": "m"}]}
+    mock_get_request_message.return_value = GetMetricHistories(history_keys=[
+        GetMetricHistories.HistoryKey(run_id="r", metric_key="m")
+        for _ in range(MAX_METRIC_HISTORIES_PER_BATCH_GET + 1)])
+    response = _get_metric_histories()
+    assert json.loads(response.get_data())["error_code"] == \
+        ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def _log_batch_path():
+    return "/api/2.0/preview/mlflow/runs/log-batch"
+
+
+@pytest.mark.parametrize("content_type,gzipped", [
+    ("application/json", False),
+    ("application/json", True),
+    ("application/x-protobuf", False),
+    ("application/x-protobuf", True),
+])
+def test_log_batch_api_req_size_is_checked_after_decompression(test_client, mock_store,
+                                                               content_type, gzipped):
+    request_message = LogBatch(run_id="r", params=[
+        Param(key="p-%s" % i, value="v" * 100) for i in range(MAX_BATCH_LOG_REQUEST_SIZE // 100)])
+    if content_type == "application/json":
+        body = message_to_json(request_message).encode("utf-8")
+    else:
+        body = request_message.SerializeToString()
+    headers = {"Content-Encoding": "gzip"} if gzipped else {}
+    response = test_client.post(_log_batch_path(), data=gzip_compress(body) if gzipped else body,
+                                content_type=content_type, headers=headers)
     assert response.status_code == 500
     json_response = json.loads(response.get_data())
     assert json_response["error_code"] == ErrorCode.Name(INVALID_PARAMETER_VALUE)
     assert ("Batched logging API requests must be at most %s bytes" % MAX_BATCH_LOG_REQUEST_SIZE
             in json_response["message"])
+    assert mock_store.log_batch.call_count == 0
+
+
+def test_log_batch_decompresses_gzip_requests_once(test_client, mock_store):
+    request_message = LogBatch(run_id="r", params=[Param(key="p", value="v")])
+    with mock.patch("mlflow.server.handlers.gzip_decompress",
+                    wraps=gzip_decompress) as gzip_decompress_mock:
+        response = test_client.post(
+            _log_batch_path(), data=gzip_compress(message_to_json(request_message).encode()),
+            content_type="application/json", headers={"Content-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert gzip_decompress_mock.call_count == 1
+    run_id = mock_store.log_batch.call_args[1]["run_id"]
+    params = mock_store.log_batch.call_args[1]["params"]
+    assert run_id == "r"
+    assert [(p.key, p.value) for p in params] == [("p", "v")]
 
 
 def test_catch_mlflow_exception():
@@ -106,3 +206,228 @@ def test_catch_mlflow_exception():
     assert response.status_code == 500
     assert json_response['error_code'] == ErrorCode.Name(INTERNAL_ERROR)
     assert json_response['message'] == 'test error'
+
+
+@pytest.fixture()
+def test_client():
+    from mlflow.server import app
+    return app.test_client()
+
+
+def _list_experiments_path():
+    return "/api/2.0/preview/mlflow/experiments/list"
+
+
+def _mock_experiments(mock_store, num_experiments):
+    mock_store.list_experiments.return_value = [
+        Experiment(str(i), "experiment-%s" % i, "/tmp/mlruns/%s" % i, "active")
+        for i in range(num_experiments)]
+
+
+def test_responses_are_json_by_default(test_client, mock_store):
+    _mock_experiments(mock_store, 1)
+    response = test_client.get(_list_experiments_path())
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert response.content_encoding is None
+    assert response.headers["Accept-Encoding"] == "gzip"
+    assert json.loads(response.get_data())["experiments"][0]["name"] == "experiment-0"
+
+
+def test_large_responses_are_gzipped(test_client, mock_store):
+    _mock_experiments(mock_store, 100)
+    response = test_client.get(_list_experiments_path(), headers={"Accept-Encoding": "gzip"})
+    assert response.content_encoding == "gzip"
+    assert "Accept-Encoding" in response.vary
+    experiments = json.loads(gzip_decompress(response.get_data()))["experiments"]
+    assert len(experiments) == 100
+    # Small responses are not compressed
+    _mock_experiments(mock_store, 1)
+    response = test_client.get(_list_experiments_path(), headers={"Accept-Encoding": "gzip"})
+    assert response.content_encoding is None
+
+
+def test_protobuf_responses(test_client, mock_store):
+    _mock_experiments(mock_store, 2)
+    response = test_client.get(_list_experiments_path(),
+                               headers={"Accept": "application/x-protobuf, application/json;q=0.5"})
+    assert response.mimetype == "application/x-protobuf"
+    response_message = ListExperiments.Response()
+    response_message.ParseFromString(response.get_data())
+    assert [e.name for e in response_message.experiments] == ["experiment-0", "experiment-1"]
+
+
+def test_protobuf_and_gzip_requests(test_client, mock_store):
+    mock_store.create_experiment.return_value = "1"
+    request_message = CreateExperiment(name="protobuf", artifact_location="/tmp")
+    response = test_client.post("/api/2.0/preview/mlflow/experiments/create",
+                                data=request_message.SerializeToString(),
+                                content_type="application/x-protobuf")
+    assert response.status_code == 200
+    mock_store.create_experiment.assert_called_with("protobuf", "/tmp")
+    response = test_client.post("/api/2.0/preview/mlflow/experiments/create",
+                                data=gzip_compress(message_to_json(request_message).encode()),
+                                content_type="application/json",
+                                headers={"Content-Encoding": "gzip"})
+    assert response.status_code == 200
+    mock_store.create_experiment.assert_called_with("protobuf", "/tmp")
+    response = test_client.post("/api/2.0/preview/mlflow/experiments/create",
+                                data=b"not gzip", content_type="application/json",
+                                headers={"Content-Encoding": "gzip"})
+    assert response.status_code == 500
+    assert json.loads(response.get_data())["error_code"] == \
+        ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def test_gzip_requests_decompressing_to_large_bodies_are_rejected(test_client, mock_store):
+    mock_store.create_experiment.return_value = "1"
+    body = json.dumps({"name": "bomb", "artifact_location": " " * 10000}).encode()
+    with mock.patch.dict("os.environ", {"MLFLOW_SERVER_MAX_DECOMPRESSED_REQUEST_SIZE": "1000"}), \
+            mock.patch("zlib.decompress") as decompress_mock:
+        response = test_client.post("/api/2.0/preview/mlflow/experiments/create",
+                                    data=gzip_compress(body), content_type="application/json",
+                                    headers={"Content-Encoding": "gzip"})
+        assert response.status_code == 500
+        assert json.loads(response.get_data())["error_code"] == \
+            ErrorCode.Name(INVALID_PARAMETER_VALUE)
+        assert mock_store.create_experiment.call_count == 0
+        # The body is never decompressed in full
+        assert decompress_mock.call_count == 0
+
+
+def test_get_run_conditional_requests(test_client, mock_store):
+    mock_store.get_run.return_value.to_proto.return_value = ProtoRun()
+    mock_store.get_run_version.return_value = "1"
+    path = "/api/2.0/preview/mlflow/runs/get?run_id=abc"
+    response = test_client.get(path)
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "no-cache"
+    mock_store.get_run_version.assert_called_with("abc")
+    response = test_client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.get_data() == b""
+    assert mock_store.get_run.call_count == 1
+    # Other runs, response formats and versions of the run have different entity tags
+    for other_path, headers in [
+            ("/api/2.0/preview/mlflow/runs/get?run_id=def", {}),
+            (path, {"Accept": "application/x-protobuf"})]:
+        response = test_client.get(other_path, headers=dict(headers, **{"If-None-Match": etag}))
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+    mock_store.get_run_version.return_value = "2"
+    response = test_client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    # Stores that do not track changes do not support conditional requests
+    mock_store.get_run_version.return_value = None
+    response = test_client.get(path, headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+
+def test_get_experiment_and_search_runs_conditional_requests(test_client, mock_store):
+    mock_store.get_experiment.return_value = Experiment("1", "exp", "/tmp", "active")
+    mock_store.list_run_infos.return_value = []
+    mock_store.search_runs.return_value = PagedList([], None)
+    versions = {"1": "a", "2": "b"}
+    mock_store.get_experiment_version.side_effect = versions.get
+    path = "/api/2.0/preview/mlflow/experiments/get?experiment_id=1"
+    etag = test_client.get(path).headers["ETag"]
+    assert test_client.get(path, headers={"If-None-Match": etag}).status_code == 304
+    versions["1"] = "c"
+    assert test_client.get(path, headers={"If-None-Match": etag}).status_code == 200
+
+    def _search(body, etag=None):
+        return test_client.post("/api/2.0/preview/mlflow/runs/search", data=json.dumps(body),
+                                content_type="application/json",
+                                headers={"If-None-Match": etag} if etag else {})
+
+    body = {"experiment_ids": ["1", "2"], "filter": "metrics.m > 1"}
+    etag = _search(body).headers["ETag"]
+    assert _search(body, etag).status_code == 304
+    assert mock_store.search_runs.call_count == 1
+    assert _search(dict(body, filter="metrics.m > 2"), etag).status_code == 200
+    versions["2"] = "d"
+    assert _search(body, etag).status_code == 200
+    versions["2"] = None
+    assert "ETag" not in _search(body).headers
+
+
+@pytest.fixture()
+def artifact_run(tmpdir, mock_store):
+    artifact_dir = tmpdir.mkdir("artifacts")
+    artifact_dir.mkdir("model").join("model.pkl").write_binary(bytes(bytearray(range(256))) * 40)
+    artifact_dir.join("notes.txt").write("<script>alert(1)</script>")
+    mock_store.get_run.return_value.info.artifact_uri = artifact_dir.strpath
+    return artifact_dir
+
+
+def _get_artifact(test_client, path, headers=None):
+    return test_client.get("/get-artifact?run_id=1&path=%s" % path, headers=headers or {})
+
+
+def test_list_artifacts_recursively(test_client, artifact_run):
+    path = "/ajax-api/2.0/preview/mlflow/artifacts/list?run_id=1"
+    response = json.loads(test_client.get(path).get_data())
+    assert [f["path"] for f in response["files"]] == ["model", "notes.txt"]
+    response = json.loads(test_client.get(path + "&recursive=true").get_data())
+    assert response["files"] == [
+        {"path": "model", "is_dir": True},
+        {"path": "model/model.pkl", "is_dir": False, "file_size": "10240"},
+        {"path": "notes.txt", "is_dir": False, "file_size": "25"},
+    ]
+    assert response["root_uri"] == artifact_run.strpath
+
+
+def test_get_artifact_streams_files_as_attachments(test_client, artifact_run):
+    response = _get_artifact(test_client, "model/model.pkl")
+    assert response.status_code == 200
+    assert response.get_data() == bytes(bytearray(range(256))) * 40
+    assert response.headers["Content-Length"] == "10240"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.headers["Content-Disposition"] == "attachment; filename=model.pkl"
+    response = _get_artifact(test_client, "notes.txt")
+    assert response.mimetype == "text/plain"
+    assert response.get_data() == b"<script>alert(1)</script>"
+    assert response.headers["Content-Disposition"] == "attachment; filename=notes.txt"
+
+
+def test_get_artifact_does_not_copy_artifacts(test_client, artifact_run):
+    with mock.patch("mlflow.store.local_artifact_repo.LocalArtifactRepository._download_file") \
+            as download_file_mock, mock.patch("tempfile.mkdtemp") as mkdtemp_mock:
+        assert _get_artifact(test_client, "notes.txt").status_code == 200
+    assert download_file_mock.call_count == 0
+    assert mkdtemp_mock.call_count == 0
+
+
+def test_get_artifact_range_requests(test_client, artifact_run):
+    content = bytes(bytearray(range(256))) * 40
+    response = _get_artifact(test_client, "model/model.pkl", {"Range": "bytes=100-299"})
+    assert response.status_code == 206
+    assert response.get_data() == content[100:300]
+    assert response.headers["Content-Range"] == "bytes 100-299/10240"
+    assert response.headers["Content-Length"] == "200"
+    response = _get_artifact(test_client, "model/model.pkl", {"Range": "bytes=-40"})
+    assert response.status_code == 206
+    assert response.get_data() == content[-40:]
+    response = _get_artifact(test_client, "model/model.pkl", {"Range": "bytes=10000-"})
+    assert response.get_data() == content[10000:]
+    response = _get_artifact(test_client, "model/model.pkl", {"Range": "bytes=20000-"})
+    assert response.status_code == 416
+    assert response.headers["Content-Range"] == "bytes */10240"
+    # Multiple and conditional ranges are answered with the whole file
+    for headers in [{"Range": "bytes=0-1,5-6"}, {"Range": "bytes=0-1", "If-Range": "etag"}]:
+        response = _get_artifact(test_client, "model/model.pkl", headers)
+        assert response.status_code == 200
+        assert response.get_data() == content
+
+
+@pytest.mark.parametrize("path", ["", "model", "missing.txt", "../artifacts/notes.txt",
+                                  "/etc/passwd"])
+def test_get_artifact_rejects_invalid_paths(test_client, artifact_run, path):
+    response = _get_artifact(test_client, path)
+    assert response.status_code == 500
+    assert json.loads(response.get_data())["error_code"] in \
+        [ErrorCode.Name(INVALID_PARAMETER_VALUE), ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)]
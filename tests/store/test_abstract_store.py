@@ -40,11 +40,12 @@ class AbstractStoreTestImpl(AbstractStore):
     def restore_run(self, run_id):
         raise NotImplementedError()
 
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(self, run_id, metric_key, max_points=None, min_step=None,
+                           max_step=None, aggregation=None):
         raise NotImplementedError()
 
     def search_runs(self, experiment_ids, search_filter, run_view_type,
-                    max_results=SEARCH_MAX_RESULTS_DEFAULT):
+                    max_results=SEARCH_MAX_RESULTS_DEFAULT, page_token=None):
         raise NotImplementedError()
 
     def log_batch(self, run_id, metrics, params, tags):
@@ -104,6 +105,20 @@ def test_set_tag():
         )
 
 
+def test_get_runs():
+    runs = {"a": mock.Mock(), "b": mock.Mock()}
+    with mock.patch.object(AbstractStoreTestImpl, "get_run", side_effect=runs.get):
+        store = AbstractStoreTestImpl()
+        assert store.get_runs(["b", "a", "b"]) == [runs["b"], runs["a"], runs["b"]]
+
+
+def test_get_metric_histories():
+    with mock.patch.object(AbstractStoreTestImpl, "get_metric_history",
+                           side_effect=lambda run_id, key: [run_id + key]):
+        store = AbstractStoreTestImpl()
+        assert store.get_metric_histories([("r1", "a"), ("r2", "b")]) == [["r1a"], ["r2b"]]
+
+
 def test_list_run_infos():
     experiment_id = mock.Mock()
     view_type = mock.Mock()
@@ -0,0 +1,159 @@
+import os
+import time
+from multiprocessing.pool import ThreadPool
+
+import mock
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store import artifact_cache
+from mlflow.store.artifact_cache import ArtifactCache, get_artifact_cache
+from mlflow.store.local_artifact_repo import LocalArtifactRepository
+
+
+@pytest.fixture
+def artifact_root(tmpdir):
+    root = tmpdir.mkdir("artifacts")
+    model = root.mkdir("model")
+    model.join("MLmodel").write("flavors")
+    model.mkdir("data").join("weights.bin").write("0" * 100)
+    root.join("metrics.json").write("{}")
+    return root
+
+
+@pytest.fixture
+def repo(artifact_root):
+    repo = LocalArtifactRepository(artifact_root.strpath)
+    with mock.patch.object(repo, "download_artifacts", wraps=repo.download_artifacts):
+        yield repo
+
+
+def _get_cache(tmpdir, max_size=artifact_cache.DEFAULT_CACHE_MAX_SIZE):
+    return ArtifactCache(tmpdir.join("cache").strpath, max_size)
+
+
+def test_download_artifacts_downloads_each_artifact_once(tmpdir, repo):
+    cache = _get_cache(tmpdir)
+    model_path = cache.download_artifacts("s3://bucket/model", repo, "model")
+    assert os.path.basename(model_path) == "model"
+    assert open(os.path.join(model_path, "data", "weights.bin")).read() == "0" * 100
+    assert cache.download_artifacts("s3://bucket/model", repo, "model") == model_path
+    file_path = cache.download_artifacts("s3://bucket/metrics.json", repo, "metrics.json")
+    assert open(file_path).read() == "{}"
+    assert cache.download_artifacts("s3://bucket/metrics.json", repo, "metrics.json") == file_path
+    assert repo.download_artifacts.call_count == 2
+    assert cache.get_size() == len("flavors") + 100 + len("{}")
+    # Another cache in the same directory shares the entries
+    assert _get_cache(tmpdir).download_artifacts("s3://bucket/model", repo, "model") == model_path
+    assert repo.download_artifacts.call_count == 2
+
+
+def test_download_artifacts_detects_changed_artifacts(tmpdir, repo, artifact_root):
+    cache = _get_cache(tmpdir)
+    model_path = cache.download_artifacts("s3://bucket/model", repo, "model")
+    artifact_root.join("model", "data", "weights.bin").write("1" * 200)
+    new_model_path = cache.download_artifacts("s3://bucket/model", repo, "model")
+    assert new_model_path != model_path
+    assert open(os.path.join(new_model_path, "data", "weights.bin")).read() == "1" * 200
+    # Other URIs of the same artifacts are cached separately
+    assert cache.download_artifacts("gs://bucket/model", repo, "model") != new_model_path
+    assert repo.download_artifacts.call_count == 3
+
+
+def test_download_artifacts_detects_overwritten_artifacts_of_same_size(
+        tmpdir, repo, artifact_root):
+    cache = _get_cache(tmpdir)
+    model_path = cache.download_artifacts("s3://bucket/model", repo, "model")
+    weights = artifact_root.join("model", "data", "weights.bin")
+    weights.write("1" * 100)
+    os.utime(weights.strpath, (0, 0))
+    new_model_path = cache.download_artifacts("s3://bucket/model", repo, "model")
+    assert new_model_path != model_path
+    assert open(os.path.join(new_model_path, "data", "weights.bin")).read() == "1" * 100
+
+
+def test_download_artifacts_does_not_cache_artifacts_without_versions(tmpdir, repo):
+    with mock.patch.object(repo, "_list_file_versions", return_value=None):
+        assert _get_cache(tmpdir).download_artifacts("s3://bucket/model", repo, "model") is None
+    assert repo.download_artifacts.call_count == 0
+
+
+def test_download_artifacts_caches_artifacts_named_like_entry_files(tmpdir, repo, artifact_root):
+    cache = _get_cache(tmpdir)
+    artifact_root.join("size").write("not a number")
+    artifact_root.mkdir("dir").mkdir("size").join("file.txt").write("nested")
+    file_path = cache.download_artifacts("s3://bucket/size", repo, "size")
+    assert open(file_path).read() == "not a number"
+    dir_path = cache.download_artifacts("s3://bucket/dir/size", repo, "dir/size")
+    assert open(os.path.join(dir_path, "file.txt")).read() == "nested"
+    assert cache.get_size() == len("not a number") + len("nested")
+
+
+def test_download_artifacts_returns_none_for_missing_artifacts(tmpdir, repo):
+    assert _get_cache(tmpdir).download_artifacts("s3://bucket/missing", repo, "missing") is None
+    assert repo.download_artifacts.call_count == 0
+
+
+def test_download_artifacts_cleans_up_failed_downloads(tmpdir, repo):
+    cache = _get_cache(tmpdir)
+    with mock.patch.object(repo, "_download_file", side_effect=IOError("connection reset")):
+        with pytest.raises(IOError):
+            cache.download_artifacts("s3://bucket/model", repo, "model")
+    assert os.listdir(tmpdir.join("cache", "staging").strpath) == []
+    assert cache.get_size() == 0
+    model_path = cache.download_artifacts("s3://bucket/model", repo, "model")
+    assert open(os.path.join(model_path, "MLmodel")).read() == "flavors"
+
+
+def test_concurrent_downloads_share_one_copy(tmpdir, repo):
+    download_artifacts = repo.download_artifacts
+
+    def slow_download_artifacts(*args, **kwargs):
+        time.sleep(0.1)
+        return download_artifacts(*args, **kwargs)
+
+    pool = ThreadPool(4)
+    try:
+        with mock.patch.object(repo, "download_artifacts",
+                               side_effect=slow_download_artifacts) as download_mock:
+            paths = pool.map(
+                lambda _: _get_cache(tmpdir).download_artifacts("s3://bucket/model", repo, "model"),
+                range(4))
+    finally:
+        pool.close()
+        pool.join()
+    assert len(set(paths)) == 1
+    assert download_mock.call_count == 1
+
+
+def test_evict_removes_least_recently_used_entries(tmpdir, repo, artifact_root):
+    cache = _get_cache(tmpdir, max_size=160)
+    with mock.patch.object(artifact_cache, "EVICTION_GRACE_PERIOD_SECONDS", -1):
+        model_path = cache.download_artifacts("s3://bucket/model", repo, "model")
+        metrics_path = cache.download_artifacts("s3://bucket/metrics.json", repo, "metrics.json")
+        # Using the model makes the metrics the least recently used entry
+        os.utime(os.path.dirname(os.path.dirname(metrics_path)), (0, 0))
+        assert cache.download_artifacts("s3://bucket/model", repo, "model") == model_path
+        artifact_root.join("other.txt").write("o" * 52)
+        cache.download_artifacts("s3://bucket/other.txt", repo, "other.txt")
+    assert not os.path.exists(metrics_path)
+    assert os.path.exists(model_path)
+    assert cache.get_size() == len("flavors") + 100 + 52
+
+
+def test_evict_spares_recently_used_entries(tmpdir, repo):
+    cache = _get_cache(tmpdir, max_size=1)
+    model_path = cache.download_artifacts("s3://bucket/model", repo, "model")
+    cache.evict()
+    assert os.path.exists(model_path)
+
+
+def test_get_artifact_cache_reads_environment(tmpdir):
+    with mock.patch.dict("os.environ", {}, clear=True):
+        assert get_artifact_cache() is None
+    env = {"MLFLOW_ARTIFACT_CACHE_DIR": tmpdir.strpath, "MLFLOW_ARTIFACT_CACHE_MAX_SIZE": "1000"}
+    with mock.patch.dict("os.environ", env):
+        cache = get_artifact_cache()
+        assert (cache.cache_dir, cache.max_size) == (tmpdir.strpath, 1000)
+    with pytest.raises(MlflowException):
+        ArtifactCache(tmpdir.strpath, max_size=0)
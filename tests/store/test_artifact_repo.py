@@ -0,0 +1,256 @@
+import os
+import threading
+import time
+
+import mock
+import pytest
+
+from mlflow.entities import FileInfo
+from mlflow.exceptions import MlflowException
+from mlflow.store.artifact_repo import ArtifactRepository, get_upload_chunk_size, \
+    get_upload_chunk_concurrency, _add_parent_directories
+
+
+class DictArtifactRepository(ArtifactRepository):
+    """Artifact repository serving the contents of a dictionary mapping file paths to contents."""
+
+    def __init__(self, files, download_delay=0):
+        super(DictArtifactRepository, self).__init__("dict:/")
+        self.files = files
+        self.download_delay = download_delay
+        self.downloaded = []
+        self.max_concurrent_downloads = 0
+        self._concurrent_downloads = 0
+        self._lock = threading.Lock()
+
+    def log_artifact(self, local_file, artifact_path=None):
+        raise NotImplementedError()
+
+    def log_artifacts(self, local_dir, artifact_path=None):
+        raise NotImplementedError()
+
+    def list_artifacts(self, path):
+        prefix = path.rstrip("/") + "/" if path else ""
+        children = set(p[len(prefix):].split("/")[0] for p in self.files if p.startswith(prefix))
+        return [FileInfo(prefix + child, prefix + child not in self.files, None)
+                for child in sorted(children)]
+
+    def _download_file(self, remote_file_path, local_path):
+        with self._lock:
+            self._concurrent_downloads += 1
+            self.max_concurrent_downloads = max(self.max_concurrent_downloads,
+                                                self._concurrent_downloads)
+        try:
+            time.sleep(self.download_delay)
+            content = self.files[remote_file_path]
+            if isinstance(content, Exception):
+                raise content
+            with open(local_path, "w") as f:
+                f.write(content)
+            with self._lock:
+                self.downloaded.append(remote_file_path)
+        finally:
+            with self._lock:
+                self._concurrent_downloads -= 1
+
+
+def _read_tree(root):
+    contents = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            with open(path) as f:
+                contents[os.path.relpath(path, root).replace(os.sep, "/")] = f.read()
+    return contents
+
+
+FILES = {
+    "model/MLmodel": "flavors",
+    "model/data/weights.bin": "weights",
+    "model/data/nested/vocab.txt": "vocab",
+    "metrics.json": "{}",
+}
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_download_artifacts_downloads_directory_tree(tmpdir, max_workers):
+    repo = DictArtifactRepository(FILES)
+    local_path = repo.download_artifacts("", tmpdir.strpath, max_workers=max_workers)
+    assert _read_tree(local_path) == FILES
+    local_path = repo.download_artifacts("model/data", tmpdir.mkdir("data").strpath,
+                                         max_workers=max_workers)
+    assert local_path == tmpdir.join("data", "data").strpath
+    assert _read_tree(local_path) == {"weights.bin": "weights", "nested/vocab.txt": "vocab"}
+    local_path = repo.download_artifacts("model/MLmodel", max_workers=max_workers)
+    assert os.path.basename(local_path) == "MLmodel"
+    assert open(local_path).read() == "flavors"
+
+
+def test_download_artifacts_downloads_files_concurrently(tmpdir):
+    files = dict(("file_%s" % i, str(i)) for i in range(12))
+    repo = DictArtifactRepository(files, download_delay=0.05)
+    repo.download_artifacts("", tmpdir.strpath, max_workers=4)
+    assert sorted(repo.downloaded) == sorted(files)
+    assert 1 < repo.max_concurrent_downloads <= 4
+
+    repo = DictArtifactRepository(files)
+    with mock.patch.dict("os.environ", {"MLFLOW_ARTIFACT_DOWNLOAD_MAX_WORKERS": "1"}):
+        repo.download_artifacts("", tmpdir.mkdir("serial").strpath)
+    assert repo.downloaded == sorted(files)
+    assert repo.max_concurrent_downloads == 1
+
+    with pytest.raises(MlflowException):
+        repo.download_artifacts("", tmpdir.strpath, max_workers=-1)
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_download_artifacts_reports_progress(tmpdir, max_workers):
+    repo = DictArtifactRepository(FILES)
+    callback = mock.Mock()
+    repo.download_artifacts("", tmpdir.strpath, max_workers=max_workers,
+                            progress_callback=callback)
+    assert callback.call_args_list == [mock.call(i, 4) for i in range(5)]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_download_artifacts_stops_and_raises_on_failure(tmpdir, max_workers):
+    files = dict(("file_%02d" % i, str(i)) for i in range(20))
+    files["file_01"] = IOError("connection reset")
+    repo = DictArtifactRepository(files, download_delay=0.01)
+    with pytest.raises(IOError) as exc:
+        repo.download_artifacts("", tmpdir.strpath, max_workers=max_workers)
+    assert "connection reset" in str(exc.value)
+    # Downloads that had not started when the failure occurred are skipped
+    assert len(repo.downloaded) < 19
+
+
+def _make_local_tree(tmpdir, num_files):
+    local_dir = tmpdir.mkdir("local")
+    for i in range(num_files):
+        local_dir.join("file_%02d.txt" % i).write(str(i))
+    local_dir.mkdir("nested").join("file.txt").write("nested")
+    return local_dir.strpath
+
+
+def test_upload_files_mirrors_local_directory_concurrently(tmpdir):
+    local_dir = _make_local_tree(tmpdir, num_files=9)
+    uploaded = {}
+    lock = threading.Lock()
+    threads = set()
+
+    def upload_file(local_file, remote_path):
+        time.sleep(0.02)
+        with lock:
+            threads.add(threading.current_thread().ident)
+            uploaded[remote_path] = open(local_file).read()
+
+    with mock.patch.dict("os.environ", {"MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS": "4"}):
+        ArtifactRepository._upload_files(local_dir, "root/path", upload_file)
+    expected = dict(("root/path/file_%02d.txt" % i, str(i)) for i in range(9))
+    expected["root/path/nested/file.txt"] = "nested"
+    assert uploaded == expected
+    assert 1 < len(threads) <= 4
+
+
+@pytest.mark.parametrize("max_workers", ["1", "3"])
+def test_upload_files_stops_and_raises_on_failure(tmpdir, max_workers):
+    local_dir = _make_local_tree(tmpdir, num_files=30)
+    uploaded = []
+
+    def upload_file(local_file, remote_path):
+        time.sleep(0.01)
+        if remote_path.endswith("file_00.txt"):
+            raise IOError("access denied")
+        uploaded.append(remote_path)
+
+    with mock.patch.dict("os.environ", {"MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS": max_workers}), \
+            pytest.raises(IOError) as exc:
+        ArtifactRepository._upload_files(local_dir, "", upload_file)
+    assert "access denied" in str(exc.value)
+    assert len(uploaded) < 30
+
+
+def test_upload_chunk_settings_are_read_from_environment():
+    assert get_upload_chunk_size() == 8 * 1024 * 1024
+    assert get_upload_chunk_concurrency() == 4
+    env = {"MLFLOW_ARTIFACT_UPLOAD_CHUNK_SIZE": "1048576",
+           "MLFLOW_ARTIFACT_UPLOAD_CHUNK_CONCURRENCY": "16"}
+    with mock.patch.dict("os.environ", env):
+        assert get_upload_chunk_size() == 1048576
+        assert get_upload_chunk_concurrency() == 16
+    with mock.patch.dict("os.environ", {"MLFLOW_ARTIFACT_UPLOAD_CHUNK_CONCURRENCY": "-2"}), \
+            pytest.raises(MlflowException):
+        get_upload_chunk_concurrency()
+
+
+def test_get_file_size_looks_up_files_in_parent_listing():
+    repo = DictArtifactRepository(FILES)
+    with mock.patch.object(repo, "list_artifacts",
+                           side_effect=lambda path: [FileInfo(path + "/weights.bin", False, 7),
+                                                     FileInfo(path + "/nested", True, None)]):
+        assert repo.get_file_size("model/data/weights.bin") == 7
+        assert repo.get_file_size("model/data/nested") is None
+        assert repo.get_file_size("model/data/missing") is None
+
+
+def test_read_artifact_removes_temporary_copy(tmpdir):
+    repo = DictArtifactRepository({"data.bin": "0123456789" * 10})
+    tmp_dir = tmpdir.join("tmp")
+    with mock.patch("tempfile.mkdtemp", side_effect=lambda: tmp_dir.mkdir().strpath):
+        assert b"".join(repo.read_artifact("data.bin")) == b"0123456789" * 10
+        assert not tmp_dir.exists()
+        chunks = repo.read_artifact("data.bin", 5, 15)
+        assert tmp_dir.exists()
+        assert b"".join(chunks) == b"5678901234"
+        assert not tmp_dir.exists()
+        # Closing an iterator that has not been consumed releases its resources
+        repo.read_artifact("data.bin").close()
+        assert not tmp_dir.exists()
+
+
+def test_list_artifacts_recursive_lists_directories_level_by_level():
+    repo = DictArtifactRepository(FILES)
+    with mock.patch.object(repo, "list_artifacts", wraps=repo.list_artifacts) as list_mock:
+        assert [(f.path, f.is_dir) for f in repo.list_artifacts_recursive()] == [
+            ("metrics.json", False),
+            ("model", True),
+            ("model/MLmodel", False),
+            ("model/data", True),
+            ("model/data/nested", True),
+            ("model/data/nested/vocab.txt", False),
+            ("model/data/weights.bin", False),
+        ]
+    # Files are not listed
+    assert sorted(c[0][0] for c in list_mock.call_args_list if c[0][0]) == \
+        ["model", "model/data", "model/data/nested"]
+    assert [f.path for f in repo.list_artifacts_recursive("model/data")] == \
+        ["model/data/nested", "model/data/nested/vocab.txt", "model/data/weights.bin"]
+    assert repo.list_artifacts_recursive("model/MLmodel") == []
+
+
+def test_download_artifacts_uses_recursive_listing(tmpdir):
+    repo = DictArtifactRepository({})
+    listing = [FileInfo("model", True, None),
+               FileInfo("model/empty", True, None),
+               FileInfo("model/MLmodel", False, 7)]
+    with mock.patch.object(repo, "_list_artifacts_recursive", return_value=listing), \
+            mock.patch.object(repo, "_download_file") as download_mock:
+        local_path = repo.download_artifacts("", tmpdir.strpath)
+    assert os.path.isdir(os.path.join(local_path, "model", "empty"))
+    download_mock.assert_called_once_with(
+        remote_file_path="model/MLmodel", local_path=os.path.join(local_path, "model", "MLmodel"))
+
+
+def test_add_parent_directories_lists_directories_under_path():
+    files = [FileInfo("a/b/c/d.txt", False, 1), FileInfo("a/b/e.txt", False, 2),
+             FileInfo("a/b/c/f/g.txt", False, 3)]
+    assert [(f.path, f.is_dir) for f in _add_parent_directories("a/b/", files)] == [
+        ("a/b/c", True),
+        ("a/b/c/d.txt", False),
+        ("a/b/c/f", True),
+        ("a/b/c/f/g.txt", False),
+        ("a/b/e.txt", False),
+    ]
+    for path in [None, "", "."]:
+        assert [f.path for f in _add_parent_directories(path, [FileInfo("x/y", False, 1)])] == \
+            ["x", "x/y"]
@@ -118,7 +118,7 @@ def test_log_artifact(mock_client, tmpdir):
 
     repo.log_artifact(fpath)
     mock_client.create_blob_from_path.assert_called_with(
-        "container", TEST_ROOT_PATH + "/test.txt", fpath)
+        "container", TEST_ROOT_PATH + "/test.txt", fpath, max_connections=4)
 
 
 def test_log_artifacts(mock_client, tmpdir):
@@ -134,11 +134,11 @@ def test_log_artifacts(mock_client, tmpdir):
 
     mock_client.create_blob_from_path.assert_has_calls([
         mock.call("container", TEST_ROOT_PATH + "/a.txt",
-                  os.path.normpath(parentd.strpath + "/a.txt")),
+                  os.path.normpath(parentd.strpath + "/a.txt"), max_connections=4),
         mock.call("container", TEST_ROOT_PATH + "/subdir/b.txt",
-                  os.path.normpath(subd.strpath + "/b.txt")),
+                  os.path.normpath(subd.strpath + "/b.txt"), max_connections=4),
         mock.call("container", TEST_ROOT_PATH + "/subdir/c.txt",
-                  os.path.normpath(subd.strpath + "/c.txt")),
+                  os.path.normpath(subd.strpath + "/c.txt"), max_connections=4),
     ], any_order=True)
 
 
@@ -230,17 +230,14 @@ def test_download_directory_artifact_succeeds_when_artifact_root_is_blob_contain
     def get_mock_listing(*args, **kwargs):
         """
         Produces a mock listing that only contains content if the specified prefix is the artifact
-        root or a relevant subdirectory. This allows us to mock `list_artifacts` during the
-        `_download_artifacts_into` subroutine without recursively listing the same artifacts at
-        every level of the directory traversal.
+        root: the subdirectory if the listing is delimited, or all the blobs otherwise.
         """
         # pylint: disable=unused-argument
-        if posixpath.abspath(kwargs["prefix"]) == "/":
-            return MockBlobList([dir_prefix])
-        if posixpath.abspath(kwargs["prefix"]) == posixpath.abspath(subdir_path):
-            return MockBlobList([blob_1, blob_2])
-        else:
+        if posixpath.abspath(kwargs["prefix"]) != "/":
             return MockBlobList([])
+        if kwargs.get("delimiter") == "/":
+            return MockBlobList([dir_prefix])
+        return MockBlobList([blob_1, blob_2])
 
     def create_file(container, cloud_path, local_path):
         # pylint: disable=unused-argument
@@ -290,3 +287,63 @@ def test_download_artifact_throws_value_error_when_listed_blobs_do_not_contain_a
         repo.download_artifacts("")
 
     assert "Azure blob does not begin with the specified artifact path" in str(exc)
+
+
+def test_read_artifact_downloads_ranges(mock_client):
+    from azure.common import AzureMissingResourceHttpError
+
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    content = os.urandom(20 * 1024 * 1024)
+    blob_props = BlobProperties()
+    blob_props.content_length = len(content)
+    mock_client.get_blob_properties.return_value = Blob(props=blob_props)
+    mock_client.get_blob_to_bytes.side_effect = \
+        lambda container, name, start_range, end_range: Blob(
+            content=content[start_range:end_range + 1])
+
+    assert repo.get_file_size("model/data.bin") == len(content)
+    mock_client.get_blob_properties.assert_called_with(
+        "container", TEST_ROOT_PATH + "/model/data.bin")
+    assert b"".join(repo.read_artifact("model/data.bin")) == content
+    assert mock_client.get_blob_to_bytes.call_count == 3
+    assert b"".join(repo.read_artifact("model/data.bin", 10, 100)) == content[10:100]
+    mock_client.get_blob_properties.side_effect = AzureMissingResourceHttpError("missing", 404)
+    assert repo.get_file_size("missing.bin") is None
+
+
+def test_list_artifacts_recursive(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    blobs = []
+    for name, size in [("dir/nested/file", 42), ("file", 7)]:
+        blob_props = BlobProperties()
+        blob_props.content_length = size
+        blobs.append(Blob(TEST_ROOT_PATH + "/" + name, props=blob_props))
+    mock_client.list_blobs.side_effect = [MockBlobList(blobs[:1], next_marker="marker"),
+                                          MockBlobList(blobs[1:])]
+
+    artifacts = repo.list_artifacts_recursive()
+    assert [(a.path, a.is_dir, a.file_size) for a in artifacts] == [
+        ("dir", True, None),
+        ("dir/nested", True, None),
+        ("dir/nested/file", False, 42),
+        ("file", False, 7),
+    ]
+    assert mock_client.list_blobs.call_args_list == [
+        mock.call("container", prefix=TEST_ROOT_PATH + "/", marker=None),
+        mock.call("container", prefix=TEST_ROOT_PATH + "/", marker="marker"),
+    ]
+
+
+def test_list_file_versions(mock_client):
+    repo = AzureBlobArtifactRepository(TEST_URI, mock_client)
+    blobs = []
+    for name, etag in [("model/MLmodel", "etag-1"), ("model2/MLmodel", "etag-2")]:
+        blob_props = BlobProperties()
+        blob_props.content_length = 5
+        blob_props.etag = etag
+        blobs.append(Blob(TEST_ROOT_PATH + "/" + name, props=blob_props))
+    mock_client.list_blobs.return_value = MockBlobList(blobs)
+
+    assert repo._list_file_versions("model/MLmodel") == [("model/MLmodel", 5, "etag-1")]
+    mock_client.list_blobs.assert_called_once_with(
+        "container", prefix=TEST_ROOT_PATH + "/model/MLmodel", marker=None)
@@ -6,8 +6,12 @@ from mock import mock
 
 import mlflow
 import mlflow.pyfunc
-from mlflow.entities import FileInfo
-from mlflow.store.cli import _file_infos_to_json
+from click.testing import CliRunner
+
+from mlflow.entities import FileInfo, Metric
+from mlflow.store.binary_metrics import is_binary_metric_file
+from mlflow.store.cli import _file_infos_to_json, migrate_metrics
+from mlflow.store.file_store import FileStore
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 from mlflow.utils.file_utils import TempDir
 from subprocess import Popen, STDOUT, PIPE
@@ -29,6 +33,24 @@ def test_file_info_to_json():
     }]
 
 
+def test_migrate_metrics(tmpdir):
+    root = tmpdir.join("mlruns")
+    store = FileStore(root.strpath)
+    run_id = store.create_run("0", user_id="user", start_time=0, tags=[]).info.run_id
+    store.log_metric(run_id, Metric("m", 1.0, 1, 0))
+    metric_path = root.join("0", run_id, "metrics", "m").strpath
+    res = CliRunner().invoke(migrate_metrics, [root.strpath])
+    assert res.exit_code == 0
+    assert is_binary_metric_file(metric_path)
+    res = CliRunner().invoke(migrate_metrics, ["--format", "text", root.strpath])
+    assert res.exit_code == 0
+    assert not is_binary_metric_file(metric_path)
+    assert store.get_metric_history(run_id, "m")[0].value == 1.0
+    res = CliRunner().invoke(migrate_metrics, [tmpdir.join("missing").strpath])
+    assert res.exit_code != 0
+    assert not os.path.exists(tmpdir.join("missing").strpath)
+
+
 def test_download_from_uri():
     class TestArtifactRepo:
         def __init__(self, scheme):
@@ -203,18 +203,14 @@ class TestDbfsArtifactRepository(object):
             list_mock.side_effect = [
                 Mock(text=json.dumps(LIST_ARTIFACTS_RESPONSE)),
                 Mock(text='{}'),  # this call is for listing `/dir`.
-                Mock(text='{}')   # this call is for listing `/dir/a.txt`.
             ]
-            dbfs_artifact_repo.download_artifacts('/')
-            assert list_mock.call_count == 3
-            assert download_mock.call_count == 2
-            chronological_download_calls = list(download_mock.call_args_list)
-            # Calls are in reverse chronological order by default
-            chronological_download_calls.reverse()
-            _, kwargs_call_1 = chronological_download_calls[0]
-            _, kwargs_call_2 = chronological_download_calls[1]
-            assert kwargs_call_1['endpoint'] == '/dbfs/test/dir'
-            assert kwargs_call_2['endpoint'] == '/dbfs/test/a.txt'
+            local_path = dbfs_artifact_repo.download_artifacts('/')
+            # Only directories are listed, and the empty directory `/dir` is created locally
+            assert list_mock.call_count == 2
+            assert download_mock.call_count == 1
+            _, kwargs_call = download_mock.call_args
+            assert kwargs_call['endpoint'] == '/dbfs/test/a.txt'
+            assert os.path.isdir(os.path.join(local_path, 'dir'))
 
 
 def test_get_host_creds_from_default_store_file_store():
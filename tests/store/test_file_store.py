@@ -1,23 +1,30 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import errno
+import json
 import os
 import random
 import shutil
 import six
 import tempfile
+import threading
 import time
 import unittest
 import uuid
 
 import mock
+import numpy as np
 import pytest
 
 from mlflow.entities import Metric, Param, RunTag, ViewType, LifecycleStage, RunStatus
 from mlflow.exceptions import MlflowException, MissingConfigException
 from mlflow.store import SEARCH_MAX_RESULTS_DEFAULT
-from mlflow.store.file_store import FileStore
+from mlflow.store.binary_metrics import is_binary_metric_file, METRIC_RECORD_DTYPE
+from mlflow.store.metric_downsampling import downsample_records, select_step_range, sort_records
+from mlflow.store.file_store import FileStore, _run_from_summary_entry
 from mlflow.utils.file_utils import write_yaml, read_yaml
-from mlflow.protos.databricks_pb2 import ErrorCode, RESOURCE_DOES_NOT_EXIST, INTERNAL_ERROR
+from mlflow.protos.databricks_pb2 import ErrorCode, RESOURCE_DOES_NOT_EXIST, INTERNAL_ERROR, \
+    RESOURCE_ALREADY_EXISTS, INVALID_PARAMETER_VALUE
 from mlflow.utils.search_utils import SearchFilter
 
 from tests.helper_functions import random_int, random_str, safe_edit_yaml
@@ -160,6 +167,84 @@ class TestFileStore(unittest.TestCase):
             exp = fs.get_experiment_by_name(exp_names)
             self.assertIsNone(exp)
 
+    def test_get_experiment_by_name_uses_name_index(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        name = self.exp_data[exp_id]["name"]
+        # Modification times of recently written files are not trusted
+        self._backdate(*[os.path.join(self.test_root, experiment_id, FileStore.META_DATA_FILE_NAME)
+                         for experiment_id in self.experiments + [FileStore.DEFAULT_EXPERIMENT_ID]])
+        assert fs.get_experiment_by_name(name).experiment_id == exp_id
+        assert os.path.exists(os.path.join(self.test_root,
+                                           FileStore.EXPERIMENT_NAME_INDEX_FILE_NAME))
+        # The index is shared by all stores with the same root directory
+        fs = FileStore(self.test_root)
+        with mock.patch("mlflow.store.file_store.read_yaml", wraps=read_yaml) as read_yaml_mock:
+            assert fs.get_experiment_by_name(name).experiment_id == exp_id
+            # Only the meta.yaml of the indexed experiment is read
+            assert read_yaml_mock.call_count == 1
+            assert fs.get_experiment_by_name(random_str(15)) is None
+            # Looking up an unknown name only stats unchanged experiments
+            assert read_yaml_mock.call_count == 1
+
+    def test_get_experiment_by_name_detects_changes_from_other_stores(self):
+        fs = FileStore(self.test_root)
+        other_fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        name = self.exp_data[exp_id]["name"]
+        assert fs.get_experiment_by_name(name).experiment_id == exp_id
+        other_fs.rename_experiment(exp_id, "renamed")
+        assert fs.get_experiment_by_name(name) is None
+        assert fs.get_experiment_by_name("renamed").experiment_id == exp_id
+        created_id = other_fs.create_experiment("created")
+        assert fs.get_experiment_by_name("created").experiment_id == created_id
+        with pytest.raises(MlflowException) as e:
+            fs.create_experiment("created")
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_ALREADY_EXISTS)
+
+    def test_experiment_names_are_unique_across_processes(self):
+        fs = FileStore(self.test_root)
+        other_fs = FileStore(self.test_root)
+        results = []
+        threads = []
+
+        def _create_concurrently():
+            try:
+                results.append(other_fs.create_experiment("concurrent"))
+            except MlflowException as e:
+                results.append(e)
+
+        list_experiments = FileStore.list_experiments
+
+        def _list_experiments(store, view_type=ViewType.ACTIVE_ONLY):
+            # Another process creates an experiment with the same name after this one has checked
+            # that the name is not taken
+            if not threads:
+                threads.append(threading.Thread(target=_create_concurrently))
+                threads[0].start()
+                threads[0].join(0.5)
+            return list_experiments(store, view_type)
+
+        with mock.patch.object(FileStore, "list_experiments", _list_experiments):
+            experiment_id = fs.create_experiment("concurrent")
+        threads[0].join()
+        assert isinstance(results[0], MlflowException)
+        assert results[0].error_code == ErrorCode.Name(RESOURCE_ALREADY_EXISTS)
+        assert [exp.experiment_id for exp in fs.list_experiments(ViewType.ALL)
+                if exp.name == "concurrent"] == [experiment_id]
+
+    def test_rename_experiment_to_existing_name_fails(self):
+        fs = FileStore(self.test_root)
+        exp_id, other_exp_id = self.experiments[:2]
+        other_name = self.exp_data[other_exp_id]["name"]
+        with pytest.raises(MlflowException) as e:
+            fs.rename_experiment(exp_id, other_name)
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_ALREADY_EXISTS)
+        assert fs.get_experiment(exp_id).name == self.exp_data[exp_id]["name"]
+        assert fs.get_experiment_by_name(other_name).experiment_id == other_exp_id
+        # Renaming an experiment to its current name is allowed
+        fs.rename_experiment(other_exp_id, other_name)
+
     def test_create_first_experiment(self):
         fs = FileStore(self.test_root)
         fs.list_experiments = mock.Mock(return_value=[])
@@ -262,6 +347,76 @@ class TestFileStore(unittest.TestCase):
         fs.restore_run(run_id)
         assert fs.get_run(run_id).info.lifecycle_stage == 'active'
 
+    def test_find_run_root_uses_run_index(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[random_int(0, len(self.experiments) - 1)]
+        run_id = self.exp_data[exp_id]['runs'][0]
+        run_dir = os.path.join(self.test_root, exp_id, run_id)
+        assert fs._find_run_root(run_id) == (exp_id, run_dir)
+        new_run = self._create_run(fs)
+        # Subsequent lookups, including those of other stores with the same root directory, are
+        # answered from the index without listing experiments
+        fs = FileStore(self.test_root)
+        with mock.patch.object(fs, "_get_active_experiments") as list_experiments_mock:
+            assert fs._find_run_root(run_id) == (exp_id, run_dir)
+            fs.log_param(new_run.info.run_id, Param("p", "v"))
+            list_experiments_mock.assert_not_called()
+        assert fs._find_run_root(uuid.uuid4().hex) == (None, None)
+        # The run index folder is not an experiment
+        assert FileStore.RUN_INDEX_FOLDER_NAME in os.listdir(self.test_root)
+        assert sorted(exp.experiment_id for exp in fs.list_experiments(ViewType.ALL)) == \
+            sorted(self.experiments)
+
+    def test_run_index_tracks_experiment_deletion_and_restoration(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[random_int(0, len(self.experiments) - 1)]
+        run_id = self.exp_data[exp_id]['runs'][0]
+        fs.get_run(run_id)
+        fs.delete_experiment(exp_id)
+        assert fs._read_run_index(run_id) == \
+            (exp_id, os.path.join(fs.trash_folder, exp_id, run_id))
+        assert fs.get_run(run_id).info.run_id == run_id
+        fs.restore_experiment(exp_id)
+        assert fs._read_run_index(run_id) == (exp_id, os.path.join(self.test_root, exp_id, run_id))
+        assert fs.get_run(run_id).info.run_id == run_id
+
+    def test_log_does_not_materialize_run(self):
+        fs = FileStore(self.test_root)
+        run_id = self._create_run(fs).info.run_id
+        with mock.patch.object(fs, "get_run") as get_run_mock, \
+                mock.patch.object(fs, "_get_run_files") as get_run_files_mock:
+            fs.log_metric(run_id, Metric("m", 1.0, 123, 0))
+            fs.log_param(run_id, Param("p", "v"))
+            fs.set_tag(run_id, RunTag("t", "v"))
+            fs.log_batch(run_id, [Metric("m", 2.0, 124, 1)], [], [RunTag("t", "w")])
+            get_run_mock.assert_not_called()
+            get_run_files_mock.assert_not_called()
+        self._verify_logged(fs, run_id,
+                            metrics=[Metric("m", 1.0, 123, 0), Metric("m", 2.0, 124, 1)],
+                            params=[Param("p", "v")], tags=[RunTag("t", "w")])
+
+    def test_log_to_deleted_run_fails(self):
+        fs = FileStore(self.test_root)
+        run_id = self._create_run(fs).info.run_id
+        fs.delete_run(run_id)
+        with pytest.raises(MlflowException):
+            fs.log_metric(run_id, Metric("m", 1.0, 123, 0))
+        with pytest.raises(MlflowException):
+            fs.log_param(run_id, Param("p", "v"))
+        with pytest.raises(MlflowException):
+            fs.set_tag(run_id, RunTag("t", "v"))
+
+    def test_run_index_is_rebuilt_when_run_moves_on_disk(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[random_int(0, len(self.experiments) - 1)]
+        run_id = self.exp_data[exp_id]['runs'][0]
+        fs.get_run(run_id)
+        # Move the experiment behind the store's back, as another process would
+        shutil.move(os.path.join(self.test_root, exp_id), fs.trash_folder)
+        run_root = (exp_id, os.path.join(fs.trash_folder, exp_id, run_id))
+        assert fs._find_run_root(run_id) == run_root
+        assert fs._read_run_index(run_id) == run_root
+
     def test_create_run_in_deleted_experiment(self):
         fs = FileStore(self.test_root)
         exp_id = self.experiments[random_int(0, len(self.experiments) - 1)]
@@ -291,6 +446,94 @@ class TestFileStore(unittest.TestCase):
             for run_id in runs:
                 self._verify_run(fs, run_id)
 
+    def test_get_runs(self):
+        fs = FileStore(self.test_root)
+        run_ids = [run_id for exp_id in self.experiments
+                   for run_id in self.exp_data[exp_id]["runs"]]
+        run_ids = run_ids[::-1] + run_ids[:1]
+        runs = fs.get_runs(run_ids)
+        assert [run.info.run_id for run in runs] == run_ids
+        for run in runs:
+            assert run.to_proto() == fs.get_run(run.info.run_id).to_proto()
+        assert fs.get_runs([]) == []
+        with pytest.raises(MlflowException) as e:
+            fs.get_runs(run_ids[:1] + ["f" * 32])
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    def test_get_metric_histories(self):
+        fs = FileStore(self.test_root)
+        history_keys = [(run_id, metric_key)
+                        for exp_id in self.experiments
+                        for run_id in self.exp_data[exp_id]["runs"]
+                        for metric_key in self.run_data[run_id]["metrics"]]
+        history_keys = history_keys[::-1] + history_keys[:1]
+        histories = fs.get_metric_histories(history_keys)
+        assert len(histories) == len(history_keys)
+        for (run_id, metric_key), history in zip(history_keys, histories):
+            assert [(m.key, m.value, m.timestamp, m.step) for m in history] == \
+                [(m.key, m.value, m.timestamp, m.step)
+                 for m in fs.get_metric_history(run_id, metric_key)]
+        with pytest.raises(MlflowException) as e:
+            fs.get_metric_histories(history_keys[:1] + [(history_keys[0][0], "missing")])
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
+    @staticmethod
+    def _backdate(*paths):
+        # Make sure that the next write changes the modification time of the paths
+        for path in paths:
+            os.utime(path, (time.time() - 10, time.time() - 10))
+
+    def test_get_run_version(self):
+        fs = FileStore(self.test_root)
+        run_id = self._create_run(fs).info.run_id
+        run_dir = fs._find_run_root(run_id)[1]
+        # Versions of recently modified runs are unknown
+        assert fs.get_run_version(run_id) is None
+        self._backdate(run_dir)
+        version = fs.get_run_version(run_id)
+        assert version is not None
+        assert fs.get_run_version(run_id) == version
+        with mock.patch.object(FileStore, "_MTIME_RESOLUTION_SECONDS", 0):
+            for write in [lambda: fs.log_metric(run_id, Metric("m", 1.0, 1, 0)),
+                          lambda: fs.log_param(run_id, Param("p", "1")),
+                          lambda: fs.set_tag(run_id, RunTag("t", "1")),
+                          lambda: fs.log_batch(run_id, [Metric("m", 2.0, 2, 0)], [], []),
+                          lambda: fs.update_run_info(run_id, RunStatus.FINISHED, 10),
+                          lambda: fs.delete_run(run_id)]:
+                self._backdate(run_dir)
+                version = fs.get_run_version(run_id)
+                write()
+                assert fs.get_run_version(run_id) not in (version, None)
+        assert fs.get_run_version("f" * 32) is None
+
+    def test_get_experiment_version(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        exp_dir = os.path.join(self.test_root, exp_id)
+
+        def _backdate_experiment():
+            self._backdate(os.path.join(exp_dir, FileStore.META_DATA_FILE_NAME),
+                           *[os.path.join(exp_dir, run_id) for run_id in os.listdir(exp_dir)])
+
+        _backdate_experiment()
+        version = fs.get_experiment_version(exp_id)
+        assert version is not None
+        assert fs.get_experiment_version(exp_id) == version
+        # Listing runs, which may rewrite the runs summary file, does not change the version
+        fs.search_runs([exp_id], None, ViewType.ALL)
+        assert fs.get_experiment_version(exp_id) == version
+        run_id = self.exp_data[exp_id]["runs"][0]
+        with mock.patch.object(FileStore, "_MTIME_RESOLUTION_SECONDS", 0):
+            for write in [lambda: fs.set_tag(run_id, RunTag("t", "1")),
+                          lambda: fs.create_run(exp_id, "user", 0, []),
+                          lambda: fs.rename_experiment(exp_id, "new name"),
+                          lambda: fs.delete_experiment(exp_id)]:
+                _backdate_experiment()
+                version = fs.get_experiment_version(exp_id)
+                write()
+                assert fs.get_experiment_version(exp_id) not in (version, None)
+        assert fs.get_experiment_version("12345") is None
+
     def test_get_run_int_experiment_id_backcompat(self):
         fs = FileStore(self.test_root)
         exp_id = FileStore.DEFAULT_EXPERIMENT_ID
@@ -346,6 +589,101 @@ class TestFileStore(unittest.TestCase):
         assert metric_obj.timestamp == 50
         assert metric_obj.value == 20
 
+    def test_log_metric_in_binary_format(self):
+        fs = FileStore(self.test_root, metric_format="binary")
+        run = self._create_run(fs)
+        tuples_to_log = [(0, 100, 1000.0), (3, 40, 100.0), (3, 50, 10.0), (3, 50, 20.0),
+                         (-3, 900, 900.0)]
+        for step, timestamp, value in tuples_to_log:
+            fs.log_metric(run.info.run_id, Metric("nested/metric", value, timestamp, step))
+        _, run_dir = fs._find_run_root(run.info.run_id)
+        assert is_binary_metric_file(os.path.join(run_dir, "metrics", "nested", "metric"))
+        metric_history = fs.get_metric_history(run.info.run_id, "nested/metric")
+        assert [(m.step, m.timestamp, m.value) for m in metric_history] == tuples_to_log
+        metric_obj = fs.get_run(run.info.run_id).data._metric_objs[0]
+        assert (metric_obj.key, metric_obj.step, metric_obj.timestamp, metric_obj.value) == \
+            ("nested/metric", 3, 50, 20.0)
+
+    def test_binary_metric_files_are_created_with_their_first_point(self):
+        fs = FileStore(self.test_root, metric_format="binary")
+        run_id = self._create_run(fs).info.run_id
+        _, run_dir = fs._find_run_root(run_id)
+        metric_path = os.path.join(run_dir, "metrics", "m")
+        original_link = os.link
+        observed_sizes = []
+
+        def link_after_concurrent_creation(src, dst):
+            # Another writer creates the file between the existence check and the link
+            observed_sizes.append(os.path.getsize(src))
+            if len(observed_sizes) == 1:
+                FileStore(self.test_root, metric_format="binary")._log_run_metric(
+                    run_dir, Metric("m", 1.0, 1, 0))
+            return original_link(src, dst)
+
+        with mock.patch("os.link", side_effect=link_after_concurrent_creation):
+            fs.log_metric(run_id, Metric("m", 2.0, 2, 1))
+        assert len(observed_sizes) == 2
+        assert all(size > 0 for size in observed_sizes)
+        assert is_binary_metric_file(metric_path)
+        assert [(m.value, m.step) for m in fs.get_metric_history(run_id, "m")] == \
+            [(1.0, 0), (2.0, 1)]
+        assert not [name for name in os.listdir(run_dir) if name.startswith(".new-metric")]
+
+    def test_binary_metric_files_are_created_without_hard_links(self):
+        fs = FileStore(self.test_root, metric_format="binary")
+        run_id = self._create_run(fs).info.run_id
+        _, run_dir = fs._find_run_root(run_id)
+        link_error = OSError(errno.EPERM, "Operation not permitted")
+        with mock.patch("os.link", side_effect=link_error) as link_mock:
+            fs.log_metric(run_id, Metric("m", 1.0, 1, 0))
+            fs.log_metric(run_id, Metric("m", 2.0, 2, 1))
+        assert link_mock.call_count == 1
+        assert is_binary_metric_file(os.path.join(run_dir, "metrics", "m"))
+        assert [(m.value, m.step) for m in fs.get_metric_history(run_id, "m")] == \
+            [(1.0, 0), (2.0, 1)]
+        assert not [name for name in os.listdir(run_dir) if name.startswith(".new-metric")]
+
+    def test_metric_formats_coexist(self):
+        text_fs = FileStore(self.test_root)
+        run_id = self._create_run(text_fs).info.run_id
+        text_fs.log_metric(run_id, Metric("text-metric", 1.0, 1, 0))
+        binary_fs = FileStore(self.test_root, metric_format="binary")
+        # Metrics are appended to existing files in the format of the file
+        binary_fs.log_metric(run_id, Metric("text-metric", 2.0, 2, 1))
+        binary_fs.log_metric(run_id, Metric("binary-metric", 3.0, 3, 0))
+        text_fs.log_metric(run_id, Metric("binary-metric", 4.0, 4, 1))
+        _, run_dir = text_fs._find_run_root(run_id)
+        assert not is_binary_metric_file(os.path.join(run_dir, "metrics", "text-metric"))
+        assert is_binary_metric_file(os.path.join(run_dir, "metrics", "binary-metric"))
+        for fs in [text_fs, binary_fs]:
+            assert fs.get_run(run_id).data.metrics == {"text-metric": 2.0, "binary-metric": 4.0}
+            assert [m.value for m in fs.get_metric_history(run_id, "binary-metric")] == [3.0, 4.0]
+
+    def test_convert_metric_files(self):
+        fs = FileStore(self.test_root)
+        run_id = self._create_run(fs).info.run_id
+        fs.log_metric(run_id, Metric("m", 1.5, 10, 0))
+        fs.log_metric(run_id, Metric("m", 2.5, 20, 1))
+        expected_metrics = {other_run_id: fs.get_run(other_run_id).data.metrics
+                            for other_run_id in self.run_data}
+        expected_metrics[run_id] = fs.get_run(run_id).data.metrics
+        expected_history = [(m.timestamp, m.value, m.step)
+                            for m in fs.get_metric_history(run_id, "m")]
+        num_metric_files = fs.convert_metric_files("binary")
+        assert num_metric_files > 1
+        assert fs.convert_metric_files("binary") == 0
+        for metric_format in ["binary", "text"]:
+            _, run_dir = fs._find_run_root(run_id)
+            assert is_binary_metric_file(os.path.join(run_dir, "metrics", "m")) == \
+                (metric_format == "binary")
+            assert not [name for name in os.listdir(run_dir) if name.startswith(".convert")]
+            for expected_run_id, metrics in expected_metrics.items():
+                assert fs.get_run(expected_run_id).data.metrics == metrics
+            assert [(m.timestamp, m.value, m.step)
+                    for m in fs.get_metric_history(run_id, "m")] == expected_history
+            if metric_format == "binary":
+                assert fs.convert_metric_files("text") == num_metric_files
+
     def test_get_all_metrics(self):
         fs = FileStore(self.test_root)
         for exp_id in self.experiments:
@@ -375,6 +713,36 @@ class TestFileStore(unittest.TestCase):
                         self.assertEqual(metric.key, metric_name)
                         self.assertEqual(metric.value, metric_value)
 
+    def test_get_metric_history_downsampling(self):
+        points = [(1000 + i, float((i * 7) % 23), (i * 13) % 200) for i in range(300)]
+        records = np.array(points, dtype=METRIC_RECORD_DTYPE)
+        for metric_format in ["text", "binary"]:
+            fs = FileStore(self.test_root, metric_format=metric_format)
+            run_id = self._create_run(fs).info.run_id
+            fs.log_batch(run_id, metrics=[Metric("m", value, timestamp, step)
+                                          for timestamp, value, step in points],
+                         params=[], tags=[])
+            # Without max_points, values in the step range are returned in logging order
+            history = fs.get_metric_history(run_id, "m", min_step=50, max_step=99)
+            assert [(m.timestamp, m.value, m.step) for m in history] == \
+                select_step_range(records, 50, 99).tolist()
+            history = fs.get_metric_history(run_id, "m", max_points=1000)
+            assert [(m.timestamp, m.value, m.step) for m in history] == \
+                sort_records(records).tolist()
+            for aggregation in ["lttb", "min", "max", "mean"]:
+                history = fs.get_metric_history(run_id, "m", max_points=20, min_step=10,
+                                                aggregation=aggregation)
+                expected = downsample_records(select_step_range(records, min_step=10), 20,
+                                              aggregation)
+                assert len(history) <= 20
+                assert [(m.key, m.timestamp, m.value, m.step) for m in history] == \
+                    [("m", ) + point for point in expected.tolist()]
+            assert [m.step for m in fs.get_metric_history(run_id, "m", max_points=5,
+                                                          aggregation="max")] == \
+                [0, 40, 80, 120, 160]
+            with pytest.raises(MlflowException):
+                fs.get_metric_history(run_id, "m", max_points=5, aggregation="median")
+
     def _search(self, fs, experiment_id, filter_str=None,
                 run_view_type=ViewType.ALL, max_results=SEARCH_MAX_RESULTS_DEFAULT):
         search_filter = SearchFilter(filter_string=filter_str) if filter_str else None
@@ -389,6 +757,171 @@ class TestFileStore(unittest.TestCase):
         assert len(self._search(fs, self.experiments[0])) == 2
         assert len(self._search(fs, self.experiments[0], run_view_type=ViewType.DELETED_ONLY)) == 0
 
+    def test_parallel_run_loading_preserves_order(self):
+        serial_fs = FileStore(self.test_root, max_workers=1)
+        parallel_fs = FileStore(self.test_root, max_workers=4)
+        exp = serial_fs.create_experiment("parallel_run_loading")
+        for i in range(20):
+            run_id = serial_fs.create_run(exp, 'user', i % 3, []).info.run_id
+            serial_fs.log_metric(run_id, Metric("m", i, 0, 0))
+        experiment_ids = self.experiments + [exp]
+        assert [r.run_id for r in parallel_fs._list_run_infos(exp, ViewType.ALL)] == \
+            [r.run_id for r in serial_fs._list_run_infos(exp, ViewType.ALL)]
+        serial_runs = serial_fs.search_runs(experiment_ids, None, ViewType.ALL)
+        parallel_runs = parallel_fs.search_runs(experiment_ids, None, ViewType.ALL)
+        assert len(parallel_runs) == len(self.run_data) + 20
+        assert [r.to_dictionary() for r in parallel_runs] == \
+            [r.to_dictionary() for r in serial_runs]
+        with mock.patch("mlflow.store.file_store.ThreadPool") as thread_pool_mock:
+            serial_fs.search_runs(experiment_ids, None, ViewType.ALL)
+            thread_pool_mock.assert_not_called()
+
+    def _age_run_dirs(self, fs, experiment_id, seconds=60):
+        # Make run directories and their metrics, params and tags folders look older than the
+        # minimum age for runs summary entries
+        experiment_dir = fs._get_experiment_path(experiment_id)
+        for run_uuid in os.listdir(experiment_dir):
+            run_dir = os.path.join(experiment_dir, run_uuid)
+            if os.path.isdir(run_dir):
+                for path in [os.path.join(run_dir, name) for name in ["metrics", "params", "tags"]
+                             if os.path.isdir(os.path.join(run_dir, name))] + [run_dir]:
+                    mtime = os.path.getmtime(path) - seconds
+                    os.utime(path, (mtime, mtime))
+        return experiment_dir
+
+    def test_search_runs_uses_runs_summary(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        experiment_dir = self._age_run_dirs(fs, exp_id)
+        runs = fs.search_runs([exp_id], None, ViewType.ALL)
+        assert os.path.exists(os.path.join(experiment_dir, FileStore.RUNS_SUMMARY_FILE_NAME))
+        with mock.patch("mlflow.store.file_store.FileStore._get_run_from_dir") as load_mock, \
+                mock.patch("mlflow.store.file_store.read_yaml") as read_yaml_mock:
+            cached_runs = fs.search_runs([exp_id], None, ViewType.ALL)
+            assert [info.run_id for info in fs.list_run_infos(exp_id, ViewType.ALL)] == \
+                [r.info.run_id for r in runs]
+            load_mock.assert_not_called()
+            read_yaml_mock.assert_not_called()
+        assert len(cached_runs) == 2
+        assert [r.to_dictionary() for r in cached_runs] == [r.to_dictionary() for r in runs]
+
+    def test_runs_summary_is_invalidated_by_writes(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_id = self.exp_data[exp_id]["runs"][0]
+        self._age_run_dirs(fs, exp_id)
+        fs.search_runs([exp_id], None, ViewType.ALL)
+        fs.log_metric(run_id, Metric("new-metric", 1.0, 0, 0))
+        fs.log_batch(run_id, metrics=[], params=[Param("new-param", "p")], tags=[])
+        fs.set_tag(run_id, RunTag("new-tag", "t"))
+        fs.update_run_info(run_id, RunStatus.FAILED, 123)
+        run = [r for r in fs.search_runs([exp_id], None, ViewType.ALL)
+               if r.info.run_id == run_id][0]
+        assert run.data.metrics["new-metric"] == 1.0
+        assert run.data.params["new-param"] == "p"
+        assert run.data.tags["new-tag"] == "t"
+        assert run.info.status == RunStatus.to_string(RunStatus.FAILED)
+        fs.delete_run(run_id)
+        assert run_id not in [r.run_id for r in fs.list_run_infos(exp_id, ViewType.ACTIVE_ONLY)]
+
+    def test_runs_summary_entries_are_updated_by_writes(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_id = self.exp_data[exp_id]["runs"][0]
+        self._age_run_dirs(fs, exp_id)
+        fs.search_runs([exp_id], None, ViewType.ALL)
+        fs.log_metric(run_id, Metric("new-metric", 2.0, 10, 1))
+        fs.log_metric(run_id, Metric("new-metric", 3.0, 20, 0))
+        fs.log_param(run_id, Param("new-param", 5))
+        fs.set_tag(run_id, RunTag("new-tag", "t"))
+        fs.log_batch(run_id, metrics=[Metric("batch-metric", 4.0, 0, 0)],
+                     params=[Param("batch-param", "p")], tags=[RunTag("new-tag", "u")])
+        fs.update_run_info(run_id, RunStatus.FAILED, 123)
+        expected_run = fs.get_run(run_id)
+        with mock.patch("mlflow.store.file_store.FileStore._get_run_from_dir") as load_mock, \
+                mock.patch("mlflow.store.file_store.read_yaml") as read_yaml_mock:
+            run = [r for r in fs.search_runs([exp_id], None, ViewType.ALL)
+                   if r.info.run_id == run_id][0]
+            load_mock.assert_not_called()
+            read_yaml_mock.assert_not_called()
+        assert run.to_dictionary() == expected_run.to_dictionary()
+        assert run.data.metrics["new-metric"] == 2.0
+        assert run.data.params["new-param"] == "5"
+        assert run.data.tags["new-tag"] == "u"
+        assert run.info.status == RunStatus.to_string(RunStatus.FAILED)
+        fs.delete_run(run_id)
+        assert run_id not in [r.run_id for r in fs.list_run_infos(exp_id, ViewType.ACTIVE_ONLY)]
+
+    def test_runs_summary_entries_are_invalidated_by_failed_batches(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_id = self.exp_data[exp_id]["runs"][0]
+        self._age_run_dirs(fs, exp_id)
+        fs.search_runs([exp_id], None, ViewType.ALL)
+        with mock.patch.object(FileStore, "_set_run_tag", side_effect=IOError("failed")), \
+                pytest.raises(MlflowException):
+            fs.log_batch(run_id, metrics=[], params=[Param("batch-param", "p")],
+                         tags=[RunTag("t", "v")])
+        run = [r for r in fs.search_runs([exp_id], None, ViewType.ALL)
+               if r.info.run_id == run_id][0]
+        assert run.data.params["batch-param"] == "p"
+
+    def test_runs_summary_is_invalidated_by_new_files(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_id = self.exp_data[exp_id]["runs"][0]
+        experiment_dir = self._age_run_dirs(fs, exp_id)
+        fs.search_runs([exp_id], None, ViewType.ALL)
+        # Files written by other means than this store do not update the run directory
+        run_dir = os.path.join(experiment_dir, run_id)
+        run_dir_mtime = os.path.getmtime(run_dir)
+        with open(os.path.join(run_dir, "params", "external-param"), "w") as f:
+            f.write("e")
+        os.utime(run_dir, (run_dir_mtime, run_dir_mtime))
+        run = [r for r in fs.search_runs([exp_id], None, ViewType.ALL)
+               if r.info.run_id == run_id][0]
+        assert run.data.params["external-param"] == "e"
+
+    def test_list_run_infos_only_reads_metadata_of_runs_missing_from_summary(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        expected_infos = fs.list_run_infos(exp_id, ViewType.ALL)
+        with mock.patch("mlflow.store.file_store.FileStore._get_run_from_dir") as load_mock:
+            infos = fs.list_run_infos(exp_id, ViewType.ALL)
+            load_mock.assert_not_called()
+        assert [dict(info) for info in infos] == [dict(info) for info in expected_infos]
+
+    def test_runs_summary_picks_up_new_and_removed_runs(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        experiment_dir = self._age_run_dirs(fs, exp_id)
+        fs.search_runs([exp_id], None, ViewType.ALL)
+        new_run_id = fs.create_run(experiment_id=exp_id, user_id='user', start_time=0,
+                                   tags=[]).info.run_id
+        removed_run_id = self.exp_data[exp_id]["runs"][0]
+        shutil.rmtree(os.path.join(experiment_dir, removed_run_id))
+        run_ids = [r.run_id for r in fs.list_run_infos(exp_id, ViewType.ALL)]
+        assert new_run_id in run_ids
+        assert removed_run_id not in run_ids
+
+    def test_corrupt_runs_summary_falls_back_to_scan(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        experiment_dir = self._age_run_dirs(fs, exp_id)
+        runs = fs.search_runs([exp_id], None, ViewType.ALL)
+        summary_path = os.path.join(experiment_dir, FileStore.RUNS_SUMMARY_FILE_NAME)
+        with open(summary_path, "w") as f:
+            f.write("{not json")
+        assert [r.to_dictionary() for r in fs.search_runs([exp_id], None, ViewType.ALL)] == \
+            [r.to_dictionary() for r in runs]
+        # The summary is rewritten
+        with open(summary_path) as f:
+            assert len(json.load(f)["runs"]) == 2
+
+    def test_invalid_max_workers(self):
+        with pytest.raises(MlflowException):
+            FileStore(self.test_root, max_workers=-1)
+
     def test_search_tags(self):
         fs = FileStore(self.test_root)
         experiment_id = self.experiments[0]
@@ -457,6 +990,46 @@ class TestFileStore(unittest.TestCase):
         for n in [0, 1, 2, 4, 8, 10, 20]:
             assert(runs[:min(10, n)] == self._search(fs, exp, max_results=n))
 
+    def test_search_with_page_token(self):
+        fs = FileStore(self.test_root)
+        exp = fs.create_experiment("test_search_with_page_token")
+        # Runs with equal start times are ordered by run ID across pages
+        runs = [fs.create_run(exp, 'user', r // 3, []).info for r in range(10)]
+        runs = [r.run_id for r in sorted(runs, key=lambda r: (-r.start_time, r.run_id))]
+        fs.log_param(runs[4], Param("p", "a"))
+        for page_size in [1, 3, 4, 10]:
+            page_token = None
+            found = []
+            while True:
+                page = fs.search_runs([exp], None, ViewType.ALL, page_size, page_token)
+                assert len(page) <= page_size
+                found.extend([r.info.run_id for r in page])
+                page_token = page.token
+                if page_token is None:
+                    break
+            assert found == runs
+        # No token is returned for the last page, even if it is full
+        assert fs.search_runs([exp], None, ViewType.ALL, 10).token is None
+        page = fs.search_runs([exp], SearchFilter(filter_string="params.p = 'a'"), ViewType.ALL, 1)
+        assert [r.info.run_id for r in page] == [runs[4]] and page.token is None
+
+        with self.assertRaises(MlflowException) as e:
+            fs.search_runs([exp], None, ViewType.ALL, 10, "not a token")
+        assert e.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+    def test_search_runs_only_creates_runs_of_page(self):
+        fs = FileStore(self.test_root)
+        exp = fs.create_experiment("test_search_runs_only_creates_runs_of_page")
+        run_ids = [fs.create_run(exp, 'user', r, []).info.run_id for r in range(10)]
+        for i, run_id in enumerate(run_ids):
+            fs.log_metric(run_id, Metric("m", i, 0, 0))
+        with mock.patch("mlflow.store.file_store._run_from_summary_entry",
+                        wraps=_run_from_summary_entry) as run_from_entry_mock:
+            runs = fs.search_runs([exp], SearchFilter(filter_string="metrics.m >= 4"),
+                                  ViewType.ALL, max_results=3)
+            assert [r.info.run_id for r in runs] == run_ids[9:6:-1]
+            assert run_from_entry_mock.call_count == 3
+
     def test_weird_param_names(self):
         WEIRD_PARAM_NAME = "this is/a weird/but valid param"
         fs = FileStore(self.test_root)
@@ -681,9 +1254,9 @@ class TestFileStore(unittest.TestCase):
 
         def _raise_exception_fn(*args, **kwargs):  # pylint: disable=unused-argument
             raise Exception("Some internal error")
-        with mock.patch("mlflow.store.file_store.FileStore.log_metric") as log_metric_mock, \
-                mock.patch("mlflow.store.file_store.FileStore.log_param") as log_param_mock, \
-                mock.patch("mlflow.store.file_store.FileStore.set_tag") as set_tag_mock:
+        with mock.patch("mlflow.store.file_store.FileStore._log_run_metric") as log_metric_mock, \
+                mock.patch("mlflow.store.file_store.FileStore._log_run_param") as log_param_mock, \
+                mock.patch("mlflow.store.file_store.FileStore._set_run_tag") as set_tag_mock:
             log_metric_mock.side_effect = _raise_exception_fn
             log_param_mock.side_effect = _raise_exception_fn
             set_tag_mock.side_effect = _raise_exception_fn
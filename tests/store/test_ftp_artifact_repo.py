@@ -192,23 +192,25 @@ def test_download_artifacts(ftp_mock):
         subfile_path_full: False,
     }
 
+    # Only directories are listed, so files are only checked in the listings of their parents
     is_dir_call_args = [
         dir_path, model_file_path_full, subdir_path_full,
-        model_file_path_full,
         subdir_path_full, subfile_path_full,
-        subfile_path_full
     ]
 
-    cwd_side_effect = [
-        None if is_dir_mapping[call_arg] else ftplib.error_perm for call_arg in is_dir_call_args
-    ]
+    def cwd_side_effect(path):
+        if not is_dir_mapping[path]:
+            raise ftplib.error_perm
+
+    # Directories are listed concurrently, so the mocks must not depend on the order of calls
+    nlst_mapping = {dir_path: [model_file_path_sub, subdir_name], subdir_path_full: [subfile_name]}
     ftp_mock.cwd = MagicMock(side_effect=cwd_side_effect)
-    ftp_mock.nlst = MagicMock(side_effect=[[model_file_path_sub, subdir_name], [subfile_name]])
+    ftp_mock.nlst = MagicMock(side_effect=lambda path: nlst_mapping[path])
 
     repo.download_artifacts("model")
 
     cwd_call_args = [arg_entry[0][0] for arg_entry in ftp_mock.cwd.call_args_list]
-    assert cwd_call_args == is_dir_call_args
+    assert sorted(cwd_call_args) == sorted(is_dir_call_args)
     assert ftp_mock.nlst.call_count == 2
-    assert ftp_mock.retrbinary.call_args_list[0][0][0] == 'RETR ' + model_file_path_full
-    assert ftp_mock.retrbinary.call_args_list[1][0][0] == 'RETR ' + subfile_path_full
+    assert sorted(arg_entry[0][0] for arg_entry in ftp_mock.retrbinary.call_args_list) == \
+        ['RETR ' + model_file_path_full, 'RETR ' + subfile_path_full]
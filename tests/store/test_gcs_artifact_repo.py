@@ -127,7 +127,7 @@ def test_log_artifact(gcs_mock, tmpdir):
 
     gcs_mock.Client().get_bucket.assert_called_with('test_bucket')
     gcs_mock.Client().get_bucket().blob\
-        .assert_called_with('some/path/test.txt')
+        .assert_called_with('some/path/test.txt', chunk_size=8 * 1024 * 1024)
     gcs_mock.Client().get_bucket().blob().upload_from_filename\
         .assert_called_with(fpath)
 
@@ -224,3 +224,62 @@ def test_download_artifacts_downloads_expected_content(gcs_mock, tmpdir):
     dir_contents = os.listdir(tmpdir.strpath)
     assert file_path_1 in dir_contents
     assert file_path_2 in dir_contents
+
+
+def test_read_artifact_downloads_ranges(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/some/path", gcs_mock)
+    content = os.urandom(20 * 1024 * 1024)
+    blob = gcs_mock.Client.return_value.get_bucket.return_value.get_blob.return_value
+    blob.size = len(content)
+    blob.download_as_string.side_effect = lambda start, end: content[start:end + 1]
+
+    assert repo.get_file_size("model/data.bin") == len(content)
+    gcs_mock.Client().get_bucket().get_blob.assert_called_with("some/path/model/data.bin")
+    assert b"".join(repo.read_artifact("model/data.bin")) == content
+    assert blob.download_as_string.call_count == 3
+    assert b"".join(repo.read_artifact("model/data.bin", 10, 100)) == content[10:100]
+    gcs_mock.Client().get_bucket().get_blob.return_value = None
+    assert repo.get_file_size("missing.bin") is None
+
+
+def test_list_artifacts_recursive(gcs_mock):
+    artifact_root_path = "experiment_id/run_id/"
+    repo = GCSArtifactRepository("gs://test_bucket/experiment_id/run_id", gcs_mock)
+    blobs = []
+    for name, size in [("model/", 0), ("model/data/weights.bin", 7), ("model/MLmodel", 3)]:
+        blob = mock.Mock()
+        blob.configure_mock(name=artifact_root_path + name, size=size)
+        blobs.append(blob)
+    list_blobs_mock = gcs_mock.Client.return_value.get_bucket.return_value.list_blobs
+    list_blobs_mock.return_value = blobs
+
+    artifacts = repo.list_artifacts_recursive("model")
+    assert [(a.path, a.is_dir, a.file_size) for a in artifacts] == [
+        ("model/MLmodel", False, 3),
+        ("model/data", True, None),
+        ("model/data/weights.bin", False, 7),
+    ]
+    list_blobs_mock.assert_called_once_with(prefix=artifact_root_path + "model/")
+
+
+def test_list_file_versions(gcs_mock):
+    repo = GCSArtifactRepository("gs://test_bucket/experiment_id/run_id", gcs_mock)
+    blobs = []
+    blob_specs = [
+        ("model/", None, 1),
+        ("model/MLmodel", "abc==", 2),
+        # Composite objects have no MD5 hash
+        ("model/data/weights.bin", None, 3),
+        ("model2/MLmodel", "def==", 4),
+    ]
+    for name, md5_hash, generation in blob_specs:
+        blob = mock.Mock()
+        blob.configure_mock(name="experiment_id/run_id/" + name, size=5, md5_hash=md5_hash,
+                            generation=generation)
+        blobs.append(blob)
+    list_blobs_mock = gcs_mock.Client.return_value.get_bucket.return_value.list_blobs
+    list_blobs_mock.return_value = blobs
+
+    assert repo._list_file_versions("model") == [("model/MLmodel", 5, "abc=="),
+                                                 ("model/data/weights.bin", 5, 3)]
+    list_blobs_mock.assert_called_once_with(prefix="experiment_id/run_id/model")
@@ -137,3 +137,42 @@ def test_hidden_files_are_logged_correctly(local_artifact_repo):
             f.write("42")
         local_artifact_repo.log_artifact(hidden_file)
         assert open(local_artifact_repo.download_artifacts(".mystery")).read() == "42"
+
+
+def test_get_file_size_and_read_artifact(local_artifact_repo, local_artifact_root):
+    content = os.urandom(3 * 1024 * 1024 + 5)
+    os.makedirs(os.path.join(local_artifact_root, "subdir"))
+    with open(os.path.join(local_artifact_root, "subdir", "data.bin"), "wb") as f:
+        f.write(content)
+    assert local_artifact_repo.get_file_size("subdir/data.bin") == len(content)
+    assert local_artifact_repo.get_file_size("subdir") is None
+    assert local_artifact_repo.get_file_size("missing") is None
+    chunks = list(local_artifact_repo.read_artifact("subdir/data.bin"))
+    assert len(chunks) == 4
+    assert b"".join(chunks) == content
+    assert b"".join(local_artifact_repo.read_artifact("subdir/data.bin", 10, 2000000)) == \
+        content[10:2000000]
+    assert b"".join(local_artifact_repo.read_artifact("subdir/data.bin", 3145725)) == \
+        content[3145725:]
+
+
+def test_list_artifacts_recursive(local_artifact_repo, local_artifact_root):
+    assert local_artifact_repo.list_artifacts_recursive() == []
+    os.makedirs(os.path.join(local_artifact_root, "model", "data"))
+    os.makedirs(os.path.join(local_artifact_root, "empty"))
+    with open(os.path.join(local_artifact_root, "model", "data", "weights.bin"), "w") as f:
+        f.write("weights")
+    with open(os.path.join(local_artifact_root, "notes.txt"), "w") as f:
+        f.write("notes")
+    artifacts = local_artifact_repo.list_artifacts_recursive()
+    assert [(a.path, a.is_dir, a.file_size) for a in artifacts] == [
+        ("empty", True, None),
+        ("model", True, None),
+        ("model/data", True, None),
+        ("model/data/weights.bin", False, 7),
+        ("notes.txt", False, 5),
+    ]
+    assert [a.path for a in local_artifact_repo.list_artifacts_recursive("model")] == \
+        ["model/data", "model/data/weights.bin"]
+    assert local_artifact_repo.list_artifacts_recursive("notes.txt") == []
+    assert local_artifact_repo.list_artifacts_recursive("missing") == []
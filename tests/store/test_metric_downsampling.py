@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.store.binary_metrics import METRIC_RECORD_DTYPE
+from mlflow.store.metric_downsampling import validate_downsampling_params, get_bucket_index, \
+    select_step_range, downsample_records, DEFAULT_AGGREGATION
+
+
+def _records(points):
+    return np.array(points, dtype=METRIC_RECORD_DTYPE)
+
+
+def _reference_buckets(points, num_buckets, aggregate):
+    points = sorted(points, key=lambda p: (p[2], p[0]))
+    first_step, last_step = points[0][2], points[-1][2]
+    buckets = {}
+    for point in points:
+        bucket = (point[2] - first_step) * num_buckets // (last_step - first_step + 1)
+        buckets.setdefault(bucket, []).append(point)
+    return [(min(p[0] for p in bucket_points), aggregate([p[1] for p in bucket_points]),
+             bucket_points[0][2])
+            for _, bucket_points in sorted(buckets.items())]
+
+
+def test_validate_downsampling_params():
+    assert validate_downsampling_params(None, None, None, None) == DEFAULT_AGGREGATION
+    assert validate_downsampling_params(10, -5, 5, "mean") == "mean"
+    for params in [(-1, None, None, None), (10, 5, 4, None), (10, None, None, "median")]:
+        with pytest.raises(MlflowException):
+            validate_downsampling_params(*params)
+
+
+def test_get_bucket_index_splits_steps_into_equal_buckets():
+    steps = np.arange(-3, 7)
+    assert get_bucket_index(steps, -3, 6, 5).tolist() == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
+    assert get_bucket_index(steps, -3, 6, 3).tolist() == [0, 0, 0, 0, 1, 1, 1, 2, 2, 2]
+    assert get_bucket_index(np.array([5, 5]), 5, 5, 3).tolist() == [0, 0]
+
+
+def test_select_step_range():
+    records = _records([(i, i * 0.5, step) for i, step in enumerate([3, 1, 4, 1, 5, 9, 2, 6])])
+    assert select_step_range(records) is records
+    assert select_step_range(records, min_step=3)["step"].tolist() == [3, 4, 5, 9, 6]
+    assert select_step_range(records, max_step=2)["step"].tolist() == [1, 1, 2]
+    assert select_step_range(records, 2, 4)["timestamp"].tolist() == [0, 2, 6]
+
+
+def test_downsample_records_returns_all_sorted_records_under_max_points():
+    records = _records([(2, 1.0, 5), (1, 2.0, 5), (3, 0.0, 1)])
+    for aggregation in ["lttb", "min", "max", "mean"]:
+        result = downsample_records(records, 3, aggregation)
+        assert result.tolist() == [(3, 0.0, 1), (1, 2.0, 5), (2, 1.0, 5)]
+
+
+@pytest.mark.parametrize("aggregation,aggregate", [
+    ("min", min),
+    ("max", max),
+    ("mean", lambda values: sum(values) / len(values)),
+])
+@pytest.mark.parametrize("num_buckets", [1, 3, 7, 50])
+def test_downsample_records_aggregates_buckets(aggregation, aggregate, num_buckets):
+    rng = np.random.RandomState(num_buckets)
+    steps = rng.randint(-20, 80, size=120).tolist()
+    points = [(int(rng.randint(0, 1000)), float(rng.normal()), step) for step in steps]
+    result = downsample_records(_records(points), num_buckets, aggregation)
+    expected = _reference_buckets(points, num_buckets, aggregate)
+    assert len(result) <= num_buckets
+    assert result[["timestamp", "step"]].tolist() == [(p[0], p[2]) for p in expected]
+    assert np.allclose(result["value"], [p[1] for p in expected])
+
+
+def test_downsample_records_lttb_keeps_endpoints_and_extremes():
+    values = np.sin(np.arange(1000) / 50.0)
+    values[321] = 10.0
+    values[654] = -10.0
+    records = _records([(step, value, step) for step, value in enumerate(values.tolist())])
+    result = downsample_records(records[::-1], 50, "lttb")
+    assert len(result) == 50
+    steps = result["step"].tolist()
+    assert steps == sorted(set(steps))
+    assert steps[0] == 0 and steps[-1] == 999
+    assert 321 in steps and 654 in steps
+    # Selected points are actual logged points
+    assert result["value"].tolist() == values[steps].tolist()
+
+
+def test_downsample_records_lttb_selects_points_across_whole_history():
+    records = _records([(step, float(step % 7), step) for step in range(150)])
+    result = downsample_records(records, 100, "lttb")
+    assert len(result) == 100
+    steps = result["step"]
+    assert steps[0] == 0 and steps[-1] == 149
+    # Each bucket holds one or two points, so selected points are never far apart
+    assert np.diff(steps).max() <= 3
+
+
+@pytest.mark.parametrize("max_points", [1, 2, 3])
+def test_downsample_records_lttb_with_few_points(max_points):
+    records = _records([(step, float(step), step) for step in range(10)])
+    result = downsample_records(records, max_points, "lttb")
+    assert len(result) == max_points
+    assert result["step"][0] == 0
+    if max_points > 1:
+        assert result["step"][-1] == 9
@@ -6,13 +6,13 @@ import six
 
 import mlflow
 from mlflow.exceptions import MlflowException
-from mlflow.entities import Param, Metric, RunTag, SourceType
+from mlflow.entities import Param, Metric, RunTag, SourceType, ViewType
 from mlflow.protos.service_pb2 import DeleteExperiment, RestoreExperiment, LogParam, LogMetric, \
-    SetTag, DeleteRun, RestoreRun, CreateRun, RunTag as ProtoRunTag, LogBatch
+    SetTag, DeleteRun, RestoreRun, CreateRun, RunTag as ProtoRunTag, LogBatch, GetExperiment
 from mlflow.store.rest_store import RestStore
 from mlflow.utils.proto_json_utils import message_to_json
 
-from mlflow.utils.rest_utils import MlflowHostCreds, _DEFAULT_HEADERS
+from mlflow.utils.rest_utils import MlflowHostCreds, _DEFAULT_HEADERS, gzip_decompress
 
 
 class MyCoolException(Exception):
@@ -26,7 +26,7 @@ class CustomErrorHandlingRestStore(RestStore):
 
 
 class TestRestStore(unittest.TestCase):
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_successful_http_request(self, request):
         def mock_request(**kwargs):
             # Filter out None arguments
@@ -49,7 +49,7 @@ class TestRestStore(unittest.TestCase):
         experiments = store.list_experiments()
         assert experiments[0].name == "Exp!"
 
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_failed_http_request(self, request):
         response = mock.MagicMock
         response.status_code = 404
@@ -61,7 +61,7 @@ class TestRestStore(unittest.TestCase):
             store.list_experiments()
         self.assertIn("RESOURCE_DOES_NOT_EXIST: No experiment", str(cm.exception))
 
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_failed_http_request_custom_handler(self, request):
         response = mock.MagicMock
         response.status_code = 404
@@ -72,7 +72,7 @@ class TestRestStore(unittest.TestCase):
         with self.assertRaises(MyCoolException):
             store.list_experiments()
 
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_response_with_unknown_fields(self, request):
         experiment_json = {
             "experiment_id": "1",
@@ -102,7 +102,7 @@ class TestRestStore(unittest.TestCase):
     def _verify_requests(self, http_request, host_creds, endpoint, method, json_body):
         http_request.assert_called_with(**(self._args(host_creds, endpoint, method, json_body)))
 
-    @mock.patch('requests.request')
+    @mock.patch('requests.Session.request')
     def test_requestor(self, request):
         response = mock.MagicMock
         response.status_code = 200
@@ -210,5 +210,116 @@ class TestRestStore(unittest.TestCase):
                                   message_to_json(RestoreExperiment(experiment_id="0")))
 
 
+def _mock_response(body, content_type="application/json", accept_encoding=None):
+    response = mock.MagicMock(status_code=200, text=body, content=body)
+    response.headers = {"Content-Type": content_type}
+    if accept_encoding:
+        response.headers["Accept-Encoding"] = accept_encoding
+    return response
+
+
+def test_protobuf_responses_are_requested_and_parsed():
+    store = RestStore(lambda: MlflowHostCreds('https://hello'), use_protobuf=True)
+    response_message = GetExperiment.Response()
+    response_message.experiment.name = "Exp!"
+    with mock.patch('mlflow.store.rest_store.http_request') as mock_http:
+        mock_http.return_value = _mock_response(response_message.SerializeToString(),
+                                                content_type="application/x-protobuf")
+        assert store.get_experiment("0").name == "Exp!"
+        assert mock_http.call_args[1]["headers"]["Accept"].startswith("application/x-protobuf")
+        # The server speaks protobuf, so POST requests are now sent in protobuf as well
+        store.delete_experiment("0")
+        kwargs = mock_http.call_args[1]
+        assert kwargs["headers"]["Content-Type"] == "application/x-protobuf"
+        assert DeleteExperiment.FromString(kwargs["data"]) == DeleteExperiment(experiment_id="0")
+
+
+def test_json_responses_are_parsed_when_protobuf_is_not_supported():
+    store = RestStore(lambda: MlflowHostCreds('https://hello'), use_protobuf=True)
+    with mock.patch('mlflow.store.rest_store.http_request') as mock_http:
+        mock_http.return_value = _mock_response('{"experiment": {"name": "Exp!"}}')
+        assert store.get_experiment("0").name == "Exp!"
+        store.delete_experiment("0")
+        assert mock_http.call_args[1]["json"] == {"experiment_id": "0"}
+
+
+def test_request_bodies_are_gzipped_once_server_accepts_gzip():
+    store = RestStore(lambda: MlflowHostCreds('https://hello'))
+    with mock.patch('mlflow.store.rest_store.http_request') as mock_http:
+        mock_http.return_value = _mock_response('{}')
+        store.set_tag("some_uuid", RunTag("t1", "abcd" * 1000))
+        assert "headers" not in mock_http.call_args[1]
+        mock_http.return_value = _mock_response('{}', accept_encoding="gzip")
+        store.set_tag("some_uuid", RunTag("t1", "abcd" * 1000))
+        assert "headers" not in mock_http.call_args[1]
+        store.set_tag("some_uuid", RunTag("t1", "abcd" * 1000))
+        kwargs = mock_http.call_args[1]
+        assert kwargs["headers"] == {"Content-Type": "application/json",
+                                     "Content-Encoding": "gzip"}
+        assert json.loads(gzip_decompress(kwargs["data"]).decode("utf-8"))["value"] == \
+            "abcd" * 1000
+        # Small request bodies are not compressed
+        store.delete_run("u25")
+        assert mock_http.call_args[1]["headers"] == {"Content-Type": "application/json"}
+
+
+def test_search_runs_passes_page_tokens():
+    store = RestStore(lambda: MlflowHostCreds('https://hello'))
+    with mock.patch('mlflow.store.rest_store.http_request') as mock_http:
+        mock_http.return_value = _mock_response('{"runs": [], "next_page_token": "def"}')
+        runs = store.search_runs(["0"], None, ViewType.ALL, max_results=10, page_token="abc")
+        assert runs == [] and runs.token == "def"
+        assert mock_http.call_args[1]["json"]["page_token"] == "abc"
+        # Responses without a next page token, e.g. from servers that do not support
+        # pagination, end the pagination
+        mock_http.return_value = _mock_response('{"runs": []}')
+        assert store.search_runs(["0"], None, ViewType.ALL).token is None
+        assert "page_token" not in mock_http.call_args[1]["json"]
+
+
+def test_get_metric_history_passes_downsampling_params():
+    store = RestStore(lambda: MlflowHostCreds('https://hello'))
+    with mock.patch('mlflow.store.rest_store.http_request') as mock_http:
+        mock_http.return_value = _mock_response(
+            '{"metrics": [{"key": "m", "value": 1.5, "timestamp": 2, "step": 3}]}')
+        metrics = store.get_metric_history("r", "m", max_points=10, min_step=0,
+                                           aggregation="max")
+        assert [(m.key, m.value, m.timestamp, m.step) for m in metrics] == [("m", 1.5, 2, 3)]
+        params = mock_http.call_args[1]["params"]
+        assert params["max_points"] == 10
+        assert params["min_step"] == "0"
+        assert params["aggregation"] == "max"
+        assert "max_step" not in params
+        store.get_metric_history("r", "m")
+        assert set(mock_http.call_args[1]["params"]) == {"run_id", "run_uuid", "metric_key"}
+
+
+def test_get_runs_and_metric_histories_are_sent_in_chunks():
+    store = RestStore(lambda: MlflowHostCreds('https://hello'))
+    run_ids = ["r%s" % i for i in range(5)]
+    with mock.patch('mlflow.store.rest_store.MAX_RUNS_PER_BATCH_GET', 2), \
+            mock.patch('mlflow.store.rest_store.MAX_METRIC_HISTORIES_PER_BATCH_GET', 2), \
+            mock.patch('mlflow.store.rest_store.http_request') as mock_http:
+        mock_http.side_effect = lambda **kwargs: _mock_response(json.dumps({"runs": [
+            {"info": {"run_id": run_id}} for run_id in kwargs["json"]["run_ids"]]}))
+        runs = store.get_runs(run_ids)
+        assert [run.info.run_id for run in runs] == run_ids
+        assert [call[1]["json"]["run_ids"] for call in mock_http.call_args_list] == \
+            [["r0", "r1"], ["r2", "r3"], ["r4"]]
+        assert mock_http.call_args[1]["endpoint"] == "/api/2.0/preview/mlflow/runs/get-batch"
+
+        mock_http.reset_mock()
+        mock_http.side_effect = lambda **kwargs: _mock_response(json.dumps({"histories": [
+            dict(key, metrics=[{"key": key["metric_key"], "value": 1.0, "timestamp": 2,
+                                "step": 3}])
+            for key in kwargs["json"]["history_keys"]]}))
+        histories = store.get_metric_histories([(run_id, "m") for run_id in run_ids])
+        assert [[(m.key, m.value, m.timestamp, m.step) for m in history]
+                for history in histories] == [[("m", 1.0, 2, 3)]] * 5
+        assert mock_http.call_count == 3
+        assert mock_http.call_args[1]["json"] == {
+            "history_keys": [{"run_id": "r4", "metric_key": "m"}]}
+
+
 if __name__ == '__main__':
     unittest.main()
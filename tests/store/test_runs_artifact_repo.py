@@ -1,3 +1,6 @@
+import os
+
+import mock
 import pytest
 
 import mlflow
@@ -45,3 +48,21 @@ def test_runs_artifact_repo_init():
     assert isinstance(runs_repo.repo, S3ArtifactRepository)
     expected_absolute_uri = "%s%s/artifacts/path/to/model" % (artifact_location, run_id)
     assert runs_repo.repo.artifact_uri == expected_absolute_uri
+
+
+@pytest.mark.usefixtures("tracking_uri_mock")
+def test_runs_artifact_repo_downloads_serially_if_wrapped_repo_is_not_thread_safe(tmpdir):
+    experiment_id = mlflow.create_experiment("expr_abc", tmpdir.join("artifacts").strpath)
+    with mlflow.start_run(experiment_id=experiment_id):
+        run_id = mlflow.active_run().info.run_id
+        for name in ["a.txt", "b.txt"]:
+            tmpdir.join(name).write(name)
+            mlflow.log_artifact(tmpdir.join(name).strpath, "model")
+    runs_repo = RunsArtifactRepository("runs:/%s/model" % run_id)
+    assert runs_repo._SUPPORTS_CONCURRENT_DOWNLOADS
+    runs_repo.repo._SUPPORTS_CONCURRENT_DOWNLOADS = False
+    assert not runs_repo._SUPPORTS_CONCURRENT_DOWNLOADS
+    with mock.patch("mlflow.store.artifact_repo.ThreadPool") as thread_pool_mock:
+        local_path = runs_repo.download_artifacts("", tmpdir.mkdir("dst").strpath)
+    thread_pool_mock.assert_not_called()
+    assert sorted(os.listdir(local_path)) == ["a.txt", "b.txt"]
@@ -1,8 +1,11 @@
 import os
 import posixpath
 
+import boto3
+import mock
 import pytest
 
+from mlflow import data
 from mlflow.store.artifact_repository_registry import get_artifact_repository
 
 from tests.helper_functions import set_boto_credentials  # pylint: disable=unused-import
@@ -127,3 +130,113 @@ def test_download_file_artifact_succeeds_when_artifact_root_is_s3_bucket_root(
     downloaded_file_path = repo.download_artifacts(file_a_name)
     with open(downloaded_file_path, "r") as f:
         assert f.read() == file_a_text
+
+
+def test_large_file_artifacts_are_uploaded_in_multiple_parts(s3_artifact_root, tmpdir):
+    chunk_size = 5 * 1024 * 1024
+    content = os.urandom(2 * chunk_size + 1)
+    subdir_path = str(tmpdir.mkdir("subdir"))
+    for name in ["large.bin", "other.bin"]:
+        with open(os.path.join(subdir_path, name), "wb") as f:
+            f.write(content)
+
+    env = {
+        "MLFLOW_ARTIFACT_UPLOAD_CHUNK_SIZE": str(chunk_size),
+        # Moto does not decode the aws-chunked parts that recent botocore versions send by default
+        "AWS_REQUEST_CHECKSUM_CALCULATION": "when_required",
+    }
+    with mock.patch.dict("os.environ", env):
+        repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+        repo.log_artifacts(subdir_path)
+
+    s3_client = boto3.client("s3")
+    bucket = s3_artifact_root[len("s3://"):]
+    for name in ["large.bin", "other.bin"]:
+        # Multipart uploads produce ETags suffixed with their number of parts
+        head = s3_client.head_object(Bucket=bucket, Key="some/path/" + name)
+        assert head["ETag"].strip('"').endswith("-3")
+        with open(repo.download_artifacts(name), "rb") as f:
+            assert f.read() == content
+
+
+def test_client_is_created_once_per_repository(s3_artifact_root, tmpdir):
+    subdir_path = str(tmpdir.mkdir("subdir"))
+    for i in range(10):
+        with open(os.path.join(subdir_path, "file_%s.txt" % i), "w") as f:
+            f.write(str(i))
+
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    with mock.patch("boto3.client", wraps=boto3.client) as client_mock:
+        repo.log_artifacts(subdir_path)
+        repo.download_artifacts("")
+    assert client_mock.call_count == 1
+
+
+def test_upload_chunk_size_is_raised_to_s3_minimum(s3_artifact_root, tmpdir):
+    file_path = os.path.join(str(tmpdir), "test.txt")
+    with open(file_path, "w") as f:
+        f.write("text")
+
+    repo = get_artifact_repository(s3_artifact_root)
+    with mock.patch.dict("os.environ", {"MLFLOW_ARTIFACT_UPLOAD_CHUNK_SIZE": "1024"}):
+        config = repo._get_transfer_config()
+        repo.log_artifact(file_path)
+    assert config.multipart_chunksize == 5 * 1024 * 1024
+    with open(repo.download_artifacts("test.txt")) as f:
+        assert f.read() == "text"
+
+
+def test_client_connection_pool_fits_concurrent_transfers(s3_artifact_root):
+    env = {
+        "MLFLOW_ARTIFACT_UPLOAD_MAX_WORKERS": "8",
+        "MLFLOW_ARTIFACT_UPLOAD_CHUNK_CONCURRENCY": "6",
+        "MLFLOW_ARTIFACT_DOWNLOAD_MAX_WORKERS": "2",
+    }
+    with mock.patch.dict("os.environ", env):
+        s3_client = get_artifact_repository(s3_artifact_root)._get_s3_client()
+    assert s3_client.meta.config.max_pool_connections == 48
+    s3_client = get_artifact_repository(s3_artifact_root)._get_s3_client()
+    assert s3_client.meta.config.max_pool_connections == 80
+
+
+def test_get_file_size_and_read_artifact(s3_artifact_root, tmpdir):
+    content = os.urandom(1000)
+    file_path = os.path.join(str(tmpdir), "data.bin")
+    with open(file_path, "wb") as f:
+        f.write(content)
+
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifact(file_path, "subdir")
+    assert repo.get_file_size("subdir/data.bin") == 1000
+    assert repo.get_file_size("subdir") is None
+    assert repo.get_file_size("missing.bin") is None
+    assert b"".join(repo.read_artifact("subdir/data.bin")) == content
+    assert b"".join(repo.read_artifact("subdir/data.bin", 10, 20)) == content[10:20]
+    assert b"".join(repo.read_artifact("subdir/data.bin", 990)) == content[990:]
+    assert b"".join(repo.read_artifact("subdir/data.bin", 5, 5)) == b""
+
+
+def test_list_artifacts_recursive_lists_tree_in_one_listing(s3_artifact_root, tmpdir):
+    subdir = tmpdir.mkdir("subdir")
+    subdir.join("a.txt").write("A")
+    subdir.mkdir("nested").mkdir("deeper").join("c.txt").write("CC")
+    repo = get_artifact_repository(posixpath.join(s3_artifact_root, "some/path"))
+    repo.log_artifacts(subdir.strpath)
+    # Placeholder objects of directories are ignored
+    s3_client = repo._get_s3_client()
+    (bucket, _) = data.parse_s3_uri(s3_artifact_root)
+    s3_client.put_object(Bucket=bucket, Key="some/path/nested/", Body=b"")
+
+    with mock.patch.object(s3_client, "get_paginator", wraps=s3_client.get_paginator) \
+            as get_paginator_mock:
+        listing = [(f.path, f.is_dir, f.file_size) for f in repo.list_artifacts_recursive()]
+    assert listing == [
+        ("a.txt", False, 1),
+        ("nested", True, None),
+        ("nested/deeper", True, None),
+        ("nested/deeper/c.txt", False, 2),
+    ]
+    assert get_paginator_mock.call_count == 1
+    assert [f.path for f in repo.list_artifacts_recursive("nested")] == \
+        ["nested/deeper", "nested/deeper/c.txt"]
+    assert repo.list_artifacts_recursive("a.txt") == []
@@ -79,6 +79,63 @@ def test_running_migrations_generates_expected_schema(tmpdir, expected_schema_fi
     _assert_schema_files_equal(generated_schema_file, expected_schema_file)
 
 
+def test_latest_metrics_migration_backfills_latest_values(db_url):
+    engine = sqlalchemy.create_engine(db_url)
+    InitialBase.metadata.create_all(engine)
+    config = _get_alembic_config(db_url)
+    command.upgrade(config, "451aebb31d03")
+    engine.execute("INSERT INTO experiments (experiment_id, name) VALUES (1, 'exp')")
+    for run_uuid in ["run1", "run2"]:
+        engine.execute("INSERT INTO runs (run_uuid, experiment_id) VALUES ('%s', 1)" % run_uuid)
+    metrics = [
+        ("run1", "m", 1.0, 5, 0),
+        ("run1", "m", 3.0, 4, 1),
+        ("run1", "m", 2.0, 9, 0),
+        ("run1", "n", 1.0, 1, 0),
+        ("run1", "n", 2.0, 1, 0),
+        ("run2", "m", 7.0, 1, 0),
+    ]
+    for run_uuid, key, value, timestamp, step in metrics:
+        engine.execute(
+            "INSERT INTO metrics (run_uuid, key, value, timestamp, step) "
+            "VALUES ('%s', '%s', %s, %s, %s)" % (run_uuid, key, value, timestamp, step))
+    invoke_cli_runner(mlflow.db.commands, ['upgrade', db_url])
+    latest_metrics = engine.execute(
+        "SELECT run_uuid, key, value, timestamp, step FROM latest_metrics").fetchall()
+    assert sorted(tuple(row) for row in latest_metrics) == [
+        ("run1", "m", 3.0, 4, 1),
+        ("run1", "n", 2.0, 1, 0),
+        ("run2", "m", 7.0, 1, 0),
+    ]
+
+
+def _get_indexes(engine):
+    inspector = sqlalchemy.inspect(engine)
+    return {
+        (table_name, index["name"], tuple(index["column_names"]))
+        for table_name in inspector.get_table_names()
+        for index in inspector.get_indexes(table_name)
+    }
+
+
+@pytest.mark.parametrize("migrate_existing_db", [False, True])
+def test_schema_has_indexes_for_run_and_metric_lookups(tmpdir, db_url, migrate_existing_db):
+    engine = sqlalchemy.create_engine(db_url)
+    if migrate_existing_db:
+        InitialBase.metadata.create_all(engine)
+        invoke_cli_runner(mlflow.db.commands, ['upgrade', db_url])
+    else:
+        SqlAlchemyStore(db_url, tmpdir.join("ARTIFACTS").strpath)
+    assert {
+        ("runs", "index_runs_experiment_id_lifecycle_stage_start_time",
+         ("experiment_id", "lifecycle_stage", "start_time")),
+        ("metrics", "index_metrics_run_uuid_key", ("run_uuid", "key")),
+        ("latest_metrics", "index_latest_metrics_run_uuid", ("run_uuid",)),
+        ("params", "index_params_run_uuid", ("run_uuid",)),
+        ("tags", "index_tags_run_uuid", ("run_uuid",)),
+    } <= _get_indexes(engine)
+
+
 def test_sqlalchemy_store_detects_schema_mismatch(
         tmpdir, db_url):  # pylint: disable=unused-argument
     def _assert_invalid_schema(engine):
@@ -21,6 +21,35 @@ def test_server_static_prefix_validation():
         run_server_mock.assert_not_called()
 
 
+def test_server_db_pool_options():
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        result = CliRunner().invoke(server, ["--backend-store-uri", "sqlite:///mlflow.db",
+                                             "--default-artifact-root", "./mlruns",
+                                             "--db-pool-size", "10", "--db-pool-pre-ping"])
+        assert result.exit_code == 0
+        run_server_mock.assert_called_once()
+        assert run_server_mock.call_args[0][0] == \
+            "sqlite:///mlflow.db?pool_pre_ping=true&pool_size=10"
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        result = CliRunner().invoke(server, ["--db-pool-size", "10"])
+        assert result.exit_code == 1
+        run_server_mock.assert_not_called()
+
+
+def test_server_cache_options():
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        result = CliRunner().invoke(server, ["--cache-size", "100", "--cache-ttl", "2.5"])
+        assert result.exit_code == 0
+        assert run_server_mock.call_args[1] == {"cache_size": 100, "cache_ttl": 2.5}
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        CliRunner().invoke(server)
+        assert run_server_mock.call_args[1] == {"cache_size": 0, "cache_ttl": None}
+    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+        result = CliRunner().invoke(server, ["--cache-size", "100", "--cache-ttl", "0"])
+        assert result.exit_code == 1
+        run_server_mock.assert_not_called()
+
+
 def test_mlflow_run():
     with mock.patch("mlflow.cli.projects") as mock_projects:
         result = CliRunner().invoke(run)
@@ -1,8 +1,15 @@
 import os
 
+import mock
+
 import mlflow
+from mlflow.store.artifact_repository_registry import get_artifact_repository
+from mlflow.store.s3_artifact_repo import S3ArtifactRepository
 from mlflow.tracking.artifact_utils import _download_artifact_from_uri
 
+from tests.helper_functions import set_boto_credentials  # pylint: disable=unused-import
+from tests.helper_functions import mock_s3_bucket  # pylint: disable=unused-import
+
 
 def test_artifact_can_be_downloaded_from_absolute_uri_successfully(tmpdir):
     artifact_file_name = "artifact.txt"
@@ -45,3 +52,48 @@ def test_download_artifact_from_absolute_uri_persists_data_to_specified_output_d
     with open(os.path.join(
             artifact_output_path, logged_artifact_subdir, artifact_file_name), "r") as f:
         assert f.read() == artifact_text
+
+
+def test_download_artifact_from_uri_uses_artifact_cache_if_enabled(mock_s3_bucket, tmpdir):
+    model_dir = tmpdir.mkdir("model")
+    model_dir.join("MLmodel").write("flavors")
+    artifact_uri = "s3://%s/some/path/model" % mock_s3_bucket
+    get_artifact_repository("s3://%s/some/path" % mock_s3_bucket).log_artifacts(
+        model_dir.strpath, "model")
+
+    env = {"MLFLOW_ARTIFACT_CACHE_DIR": tmpdir.join("cache").strpath}
+    with mock.patch.dict("os.environ", env), \
+            mock.patch.object(S3ArtifactRepository, "_download_file", autospec=True,
+                              side_effect=S3ArtifactRepository._download_file) \
+            as download_file_mock:
+        cached_path = _download_artifact_from_uri(artifact_uri)
+        assert cached_path.startswith(tmpdir.join("cache").strpath)
+        assert _download_artifact_from_uri(artifact_uri) == cached_path
+        output_path = tmpdir.mkdir("output").strpath
+        local_path = _download_artifact_from_uri(artifact_uri, output_path=output_path)
+        assert local_path == os.path.join(output_path, "model")
+        assert open(os.path.join(local_path, "MLmodel")).read() == "flavors"
+        assert download_file_mock.call_count == 1
+        # Re-logging the model with files of the same sizes changes their ETags
+        model_dir.join("MLmodel").write("FLAVORS")
+        get_artifact_repository("s3://%s/some/path" % mock_s3_bucket).log_artifacts(
+            model_dir.strpath, "model")
+        new_cached_path = _download_artifact_from_uri(artifact_uri)
+        assert new_cached_path != cached_path
+        assert open(os.path.join(new_cached_path, "MLmodel")).read() == "FLAVORS"
+    assert download_file_mock.call_count == 2
+
+
+def test_download_artifact_root_from_artifact_cache_to_output_path(mock_s3_bucket, tmpdir):
+    model_dir = tmpdir.mkdir("model")
+    model_dir.join("MLmodel").write("flavors")
+    get_artifact_repository("s3://%s/some/path" % mock_s3_bucket).log_artifacts(
+        model_dir.strpath, "model")
+
+    env = {"MLFLOW_ARTIFACT_CACHE_DIR": tmpdir.join("cache").strpath}
+    with mock.patch.dict("os.environ", env):
+        output_path = tmpdir.mkdir("output").strpath
+        local_path = _download_artifact_from_uri("s3://%s/some/path/" % mock_s3_bucket,
+                                                 output_path=output_path)
+    assert os.path.normpath(local_path) == output_path
+    assert open(os.path.join(output_path, "model", "MLmodel")).read() == "flavors"
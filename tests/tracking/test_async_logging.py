@@ -0,0 +1,133 @@
+import threading
+
+import mock
+import pytest
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.exceptions import MlflowException
+from mlflow.tracking.async_logging import AsyncLoggingQueue, _split_into_batches
+from mlflow.utils.validation import _validate_batch_log_limits
+
+
+def _metrics(num, key="m"):
+    return [Metric(key, i, i, i) for i in range(num)]
+
+
+def _params(num):
+    return [Param("p-%s" % i, str(i)) for i in range(num)]
+
+
+def _tags(num):
+    return [RunTag("t-%s" % i, str(i)) for i in range(num)]
+
+
+@pytest.mark.parametrize("num_metrics,num_params,num_tags,expected_num_batches", [
+    (0, 0, 0, 0),
+    (10, 10, 10, 1),
+    (1000, 0, 0, 1),
+    (1001, 0, 0, 2),
+    (0, 250, 0, 3),
+    (1000, 100, 100, 2),
+    (2500, 150, 30, 3),
+])
+def test_split_into_batches_respects_limits(num_metrics, num_params, num_tags,
+                                            expected_num_batches):
+    metrics, params, tags = _metrics(num_metrics), _params(num_params), _tags(num_tags)
+    batches = list(_split_into_batches(metrics, params, tags))
+    assert len(batches) == expected_num_batches
+    for batch_metrics, batch_params, batch_tags in batches:
+        _validate_batch_log_limits(batch_metrics, batch_params, batch_tags)
+    assert sum([b[0] for b in batches], []) == metrics
+    assert sum([b[1] for b in batches], []) == params
+    assert sum([b[2] for b in batches], []) == tags
+
+
+def test_flush_coalesces_logged_data_per_run():
+    log_batch = mock.Mock()
+    queue = AsyncLoggingQueue(log_batch, flush_interval_seconds=60)
+    metrics, params_1, params_2 = _metrics(2), _params(1), _params(1)
+    queue.log("run-1", metrics=metrics)
+    queue.log("run-2", params=params_2)
+    queue.log("run-1", params=params_1, tags=[RunTag("t", "a")])
+    queue.log("run-1", tags=[RunTag("t", "b")])
+    queue.flush()
+    assert log_batch.call_args_list == [
+        mock.call("run-1", metrics, params_1, [RunTag("t", "b")]),
+        mock.call("run-2", [], params_2, []),
+    ]
+    queue.flush()
+    assert log_batch.call_count == 2
+    queue.stop()
+
+
+def test_log_does_not_block_on_log_batch():
+    unblock = threading.Event()
+    log_batch = mock.Mock(side_effect=lambda *args: unblock.wait())
+    queue = AsyncLoggingQueue(log_batch, flush_interval_seconds=60, flush_size=10)
+    queue.log("run", metrics=_metrics(10))
+    # The background thread is now blocked sending the first batch
+    for _ in range(100):
+        queue.log("run", metrics=_metrics(1))
+    unblock.set()
+    queue.flush()
+    logged_metrics = sum([call[0][1] for call in log_batch.call_args_list], [])
+    assert len(logged_metrics) == 110
+    queue.stop()
+
+
+def test_flush_size_triggers_background_flush():
+    flushed = threading.Event()
+    log_batch = mock.Mock(side_effect=lambda *args: flushed.set())
+    queue = AsyncLoggingQueue(log_batch, flush_interval_seconds=60, flush_size=5)
+    queue.log("run", metrics=_metrics(4))
+    assert not flushed.wait(0.2)
+    queue.log("run", metrics=_metrics(1))
+    assert flushed.wait(5)
+    queue.stop()
+
+
+def test_flush_interval_triggers_background_flush():
+    flushed = threading.Event()
+    log_batch = mock.Mock(side_effect=lambda *args: flushed.set())
+    queue = AsyncLoggingQueue(log_batch, flush_interval_seconds=0.1)
+    queue.log("run", metrics=_metrics(1))
+    assert flushed.wait(5)
+    queue.stop()
+
+
+def test_log_raises_on_conflicting_param_values():
+    log_batch = mock.Mock()
+    queue = AsyncLoggingQueue(log_batch, flush_interval_seconds=60)
+    metrics, param = _metrics(2), Param("p", "a")
+    queue.log("run", metrics=metrics[:1], params=[param])
+    queue.log("run", params=[Param("p", "a")])
+    with pytest.raises(MlflowException) as e:
+        queue.log("run", metrics=metrics[1:], params=[Param("q", "b"), Param("p", "b")])
+    assert "Changing param value is not allowed" in e.value.message
+    # Nothing from the rejected call is buffered, and the other data is still sent
+    queue.flush()
+    log_batch.assert_called_once_with("run", metrics[:1], [param], [])
+    queue.stop()
+
+
+def test_errors_are_raised_at_flush_time():
+    log_batch = mock.Mock(side_effect=[MlflowException("boom"), None])
+    queue = AsyncLoggingQueue(log_batch, flush_interval_seconds=60)
+    queue.log("run-1", metrics=_metrics(1))
+    queue.log("run-2", metrics=_metrics(1))
+    with pytest.raises(MlflowException) as e:
+        queue.flush()
+    assert "boom" in e.value.message
+    # Data for other runs is still sent, and errors are only reported once
+    assert log_batch.call_count == 2
+    queue.flush()
+    queue.stop()
+
+
+def test_stop_sends_pending_data():
+    log_batch = mock.Mock()
+    queue = AsyncLoggingQueue(log_batch, flush_interval_seconds=60)
+    metrics = _metrics(3)
+    queue.log("run", metrics=metrics)
+    queue.stop()
+    log_batch.assert_called_once_with("run", metrics, [], [])
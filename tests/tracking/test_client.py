@@ -83,7 +83,8 @@ def test_client_search_runs(mock_store, mock_search_filter):
     mock_store.search_runs.assert_called_once_with(experiment_ids=experiment_ids,
                                                    search_filter=mock_search_filter,
                                                    run_view_type=ViewType.ACTIVE_ONLY,
-                                                   max_results=SEARCH_MAX_RESULTS_DEFAULT)
+                                                   max_results=SEARCH_MAX_RESULTS_DEFAULT,
+                                                   page_token=None)
 
     # Test alternate view type
     mock_store.reset_mock()
@@ -91,7 +92,8 @@ def test_client_search_runs(mock_store, mock_search_filter):
     mock_store.search_runs.assert_called_once_with(experiment_ids=experiment_ids,
                                                    search_filter=mock_search_filter,
                                                    run_view_type=ViewType.DELETED_ONLY,
-                                                   max_results=SEARCH_MAX_RESULTS_DEFAULT)
+                                                   max_results=SEARCH_MAX_RESULTS_DEFAULT,
+                                                   page_token=None)
 
     # Test with non-default max_results value
     mock_store.reset_mock()
@@ -99,4 +101,14 @@ def test_client_search_runs(mock_store, mock_search_filter):
     mock_store.search_runs.assert_called_once_with(experiment_ids=experiment_ids,
                                                    search_filter=mock_search_filter,
                                                    run_view_type=ViewType.ALL,
-                                                   max_results=2876)
+                                                   max_results=2876,
+                                                   page_token=None)
+
+    # Test with page token
+    mock_store.reset_mock()
+    MlflowClient().search_runs(experiment_ids, "dummy filter", ViewType.ALL, 10, "token")
+    mock_store.search_runs.assert_called_once_with(experiment_ids=experiment_ids,
+                                                   search_filter=mock_search_filter,
+                                                   run_view_type=ViewType.ALL,
+                                                   max_results=10,
+                                                   page_token="token")
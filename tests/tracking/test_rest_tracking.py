@@ -4,6 +4,7 @@ and ensures we can use the tracking API to communicate with it.
 """
 
 import mock
+import requests
 from subprocess import Popen
 import os
 import sys
@@ -16,11 +17,15 @@ import tempfile
 
 import mlflow.experiments
 from mlflow.entities import RunStatus, Metric, Param, RunTag, ViewType
+from mlflow.exceptions import MlflowException
 from mlflow.server import BACKEND_STORE_URI_ENV_VAR, ARTIFACT_ROOT_ENV_VAR
+from mlflow.store import rest_store
+from mlflow.store.rest_store import RestStore
 from mlflow.tracking import MlflowClient
 from mlflow.utils.mlflow_tags import MLFLOW_USER, MLFLOW_RUN_NAME, MLFLOW_PARENT_RUN_ID, \
     MLFLOW_SOURCE_TYPE, MLFLOW_SOURCE_NAME, MLFLOW_PROJECT_ENTRY_POINT, MLFLOW_GIT_COMMIT
 from mlflow.utils.file_utils import path_to_local_file_uri, local_file_uri_to_path
+from mlflow.utils.rest_utils import MlflowHostCreds
 from tests.integration.utils import invoke_cli_runner
 
 LOCALHOST = '127.0.0.1'
@@ -339,6 +344,106 @@ def test_log_batch(mlflow_client, backend_store_uri):
     assert metric.step == 3
 
 
+def test_get_metric_history_downsampling(mlflow_client):
+    experiment_id = mlflow_client.create_experiment('Downsampled history')
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+    mlflow_client.log_batch(run_id, metrics=[Metric("m", float(i % 10), 1000 + i, i - 100)
+                                             for i in range(1000)], params=[], tags=[])
+    history = mlflow_client.get_metric_history(run_id, "m", max_points=100)
+    assert len(history) == 100
+    assert history[0].step == -100 and history[-1].step == 899
+    history = mlflow_client.get_metric_history(run_id, "m", max_points=5, min_step=-50,
+                                               max_step=49, aggregation="mean")
+    assert [(m.step, m.value, m.timestamp) for m in history] == \
+        [(-50, 4.5, 1050), (-30, 4.5, 1070), (-10, 4.5, 1090), (10, 4.5, 1110), (30, 4.5, 1130)]
+    assert len(mlflow_client.get_metric_history(run_id, "m", max_step=-91)) == 10
+
+
+def test_get_runs_and_metric_histories(mlflow_client):
+    experiment_id = mlflow_client.create_experiment('Batch get')
+    run_ids = [mlflow_client.create_run(experiment_id).info.run_id for _ in range(3)]
+    for i, run_id in enumerate(run_ids):
+        mlflow_client.log_batch(run_id, metrics=[Metric("m", i + step, step, step)
+                                                 for step in range(4)],
+                                params=[Param("p", str(i))], tags=[])
+    runs = mlflow_client.get_runs(run_ids[::-1])
+    assert [run.info.run_id for run in runs] == run_ids[::-1]
+    assert [run.data.params["p"] for run in runs] == ["2", "1", "0"]
+    histories = mlflow_client.get_metric_histories([(run_id, "m") for run_id in run_ids])
+    assert [[m.value for m in history] for history in histories] == \
+        [[i + step for step in range(4)] for i in range(3)]
+    with pytest.raises(MlflowException):
+        mlflow_client.get_runs(run_ids + ["f" * 32])
+
+
+def test_conditional_get_run(backend_store_uri, tracking_server_uri, mlflow_client):
+    experiment_id = mlflow_client.create_experiment('Conditional requests')
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+
+    def _backdate_run():
+        if backend_store_uri.startswith("file:"):
+            # The file store only reports versions of runs not modified within the resolution
+            # of file modification times
+            run_dir = os.path.join(local_file_uri_to_path(backend_store_uri), experiment_id,
+                                   run_id)
+            os.utime(run_dir, (time.time() - 10, time.time() - 10))
+
+    def _get_run(etag=None):
+        return requests.get(tracking_server_uri + "/api/2.0/mlflow/runs/get",
+                            params={"run_id": run_id},
+                            headers={"If-None-Match": etag} if etag else {})
+
+    _backdate_run()
+    response = _get_run()
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert _get_run(etag).status_code == 304
+    mlflow_client.log_metric(run_id, "m", 1.0)
+    _backdate_run()
+    response = _get_run(etag)
+    assert response.status_code == 200
+    assert response.json()["run"]["data"]["metrics"][0]["value"] == 1.0
+    assert response.headers["ETag"] != etag
+
+
+def test_search_runs_pagination(mlflow_client):
+    experiment_id = mlflow_client.create_experiment('Paginated search')
+    runs = [mlflow_client.create_run(experiment_id, start_time=1 + i % 2).info for i in range(5)]
+    expected_run_ids = [r.run_id for r in sorted(runs, key=lambda r: (-r.start_time, r.run_id))]
+    run_ids = []
+    page_token = None
+    for _ in range(3):
+        page = mlflow_client.search_runs([experiment_id], "", max_results=2,
+                                         page_token=page_token)
+        run_ids.extend([r.info.run_id for r in page])
+        page_token = page.token
+    assert page_token is None
+    assert run_ids == expected_run_ids
+
+
+@pytest.mark.parametrize("use_protobuf", [False, True])
+def test_compressed_and_protobuf_transport(tracking_server_uri, use_protobuf):
+    store = RestStore(lambda: MlflowHostCreds(tracking_server_uri), use_protobuf=use_protobuf)
+    experiment_id = store.create_experiment('Transport %s' % use_protobuf)
+    run_id = store.create_run(experiment_id, user_id="user", start_time=0, tags=[]).info.run_id
+    metrics = [Metric("metric", i * 0.5, i, i) for i in range(500)]
+    params = [Param("param-%s" % i, "value") for i in range(50)]
+    with mock.patch("mlflow.store.rest_store.http_request",
+                    wraps=rest_store.http_request) as http_request_mock:
+        store.log_batch(run_id, metrics=metrics, params=params, tags=[RunTag("t", "v")])
+        headers = http_request_mock.call_args[1]["headers"]
+        assert headers["Content-Encoding"] == "gzip"
+        expected_content_type = "application/x-protobuf" if use_protobuf else "application/json"
+        assert headers["Content-Type"] == expected_content_type
+    run = store.get_run(run_id)
+    assert run.data.params == {p.key: p.value for p in params}
+    assert run.data.tags["t"] == "v"
+    assert run.data.metrics == {"metric": 249.5}
+    history = store.get_metric_history(run_id, "metric")
+    assert [(m.value, m.timestamp, m.step) for m in history] == \
+        [(m.value, m.timestamp, m.step) for m in metrics]
+
+
 def test_set_terminated_defaults(mlflow_client):
     experiment_id = mlflow_client.create_experiment('Terminator 1')
     created_run = mlflow_client.create_run(experiment_id)
@@ -378,6 +483,10 @@ def test_artifacts(mlflow_client):
     dir_artifacts_list = mlflow_client.list_artifacts(run_id, 'dir')
     assert set([a.path for a in dir_artifacts_list]) == {'dir/my.file'}
 
+    all_artifacts_list = mlflow_client.list_artifacts(run_id, recursive=True)
+    assert [(a.path, a.is_dir) for a in all_artifacts_list] == \
+        [('dir', True), ('dir/my.file', False), ('my.file', False)]
+
     all_artifacts = mlflow_client.download_artifacts(run_id, '.')
     assert open('%s/my.file' % all_artifacts, 'r').read() == 'Hello, World!'
     assert open('%s/dir/my.file' % all_artifacts, 'r').read() == 'Hello, World!'
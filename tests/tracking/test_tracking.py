@@ -586,3 +586,72 @@ def test_search_runs_multiple_experiments(tracking_uri_mock, reset_active_experi
     assert len(MlflowClient().search_runs(experiment_ids, "metrics.m_1 > 0", ViewType.ALL)) == 1
     assert len(MlflowClient().search_runs(experiment_ids, "metrics.m_2 = 2", ViewType.ALL)) == 1
     assert len(MlflowClient().search_runs(experiment_ids, "metrics.m_3 < 4", ViewType.ALL)) == 1
+
+
+@pytest.fixture
+def async_logging():
+    mlflow.enable_async_logging(flush_interval_seconds=60)
+    yield
+    mlflow.tracking.fluent.enable_async_logging(False)
+    mlflow.tracking.fluent._async_logging_enabled = None
+
+
+def test_async_logging_flushes_at_end_run(tracking_uri_mock, async_logging):
+    with mock.patch("mlflow.tracking.client.MlflowClient.log_batch",
+                    wraps=MlflowClient().log_batch) as log_batch_mock:
+        with start_run() as active_run:
+            run_id = active_run.info.run_id
+            for step in range(5):
+                mlflow.log_metric("loss", 1.0 / (step + 1), step=step)
+            mlflow.log_param("p", 1)
+            mlflow.log_params({"q": "2"})
+            mlflow.set_tag("t", "a")
+            mlflow.set_tags({"t": "b"})
+            assert log_batch_mock.call_count == 0
+        assert log_batch_mock.call_count == 1
+    run = MlflowClient().get_run(run_id)
+    assert run.info.status == RunStatus.to_string(RunStatus.FINISHED)
+    assert run.data.params == {"p": "1", "q": "2"}
+    assert run.data.tags["t"] == "b"
+    assert [m.step for m in MlflowClient().get_metric_history(run_id, "loss")] == list(range(5))
+
+
+def test_async_logging_validates_arguments_immediately(tracking_uri_mock, async_logging):
+    with start_run():
+        with pytest.raises(MlflowException):
+            mlflow.log_metric("bad/../name", 1)
+        with pytest.raises(MlflowException):
+            mlflow.log_params({"../": "value"})
+
+
+def test_async_logging_stringifies_batch_params(tracking_uri_mock, async_logging):
+    with start_run() as active_run:
+        mlflow.log_param("a", 1)
+        mlflow.log_params({"a": 1, "b": 2})
+    assert MlflowClient().get_run(active_run.info.run_id).data.params == {"a": "1", "b": "2"}
+
+
+def test_async_logging_reports_errors_at_end_run(tracking_uri_mock, async_logging):
+    active_run = start_run()
+    run_id = active_run.info.run_id
+    mlflow.log_param("p", "a")
+    with mock.patch("mlflow.store.file_store.FileStore.log_batch",
+                    side_effect=MlflowException("Failed to log batch")):
+        mlflow.log_metric("m", 1)
+        with pytest.raises(MlflowException) as e:
+            end_run()
+    assert "Failed to log batch" in e.value.message
+    assert mlflow.active_run() is None
+    run = MlflowClient().get_run(run_id)
+    assert run.info.status == RunStatus.to_string(RunStatus.FINISHED)
+
+
+def test_async_logging_enabled_by_environment_variable(tracking_uri_mock):
+    with mock.patch.dict(os.environ, {"MLFLOW_ENABLE_ASYNC_LOGGING": "true"}):
+        try:
+            with start_run():
+                mlflow.log_metric("m", 1)
+                assert mlflow.tracking.fluent._async_logging_queue is not None
+        finally:
+            mlflow.tracking.fluent.enable_async_logging(False)
+            mlflow.tracking.fluent._async_logging_enabled = None
@@ -1,16 +1,19 @@
 #!/usr/bin/env python
 
+import zlib
+
 import mock
 import numpy
 import pytest
 
+from mlflow.utils import rest_utils
 from mlflow.utils.rest_utils import http_request, http_request_safe,\
-    MlflowHostCreds, _DEFAULT_HEADERS
+    MlflowHostCreds, _DEFAULT_HEADERS, _get_request_session, _get_retry_interval
 from mlflow.pyfunc.scoring_server import NumpyEncoder
 from mlflow.exceptions import MlflowException, RestException
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_hostonly(request):
     host_only = MlflowHostCreds("http://my-host")
     response = mock.MagicMock()
@@ -24,7 +27,7 @@ def test_http_request_hostonly(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_cleans_hostname(request):
     # Add a trailing slash, should be removed.
     host_only = MlflowHostCreds("http://my-host/")
@@ -39,7 +42,7 @@ def test_http_request_cleans_hostname(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_with_basic_auth(request):
     host_only = MlflowHostCreds("http://my-host", username='user', password='pass')
     response = mock.MagicMock()
@@ -55,7 +58,7 @@ def test_http_request_with_basic_auth(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_with_token(request):
     host_only = MlflowHostCreds("http://my-host", token='my-token')
     response = mock.MagicMock()
@@ -71,7 +74,7 @@ def test_http_request_with_token(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_with_insecure(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -85,7 +88,7 @@ def test_http_request_with_insecure(request):
     )
 
 
-@mock.patch('requests.request')
+@mock.patch('requests.Session.request')
 def test_http_request_wrapper(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -109,6 +112,46 @@ def test_http_request_wrapper(request):
         http_request_safe(host_only, '/my/endpoint')
 
 
+def test_request_sessions_are_reused_per_host():
+    session = _get_request_session("http://my-host/my/endpoint")
+    assert _get_request_session("http://my-host/other/endpoint") is session
+    assert _get_request_session("http://other-host/my/endpoint") is not session
+    assert _get_request_session("https://my-host/my/endpoint") is not session
+    with mock.patch("os.getpid", return_value=-1):
+        # Forked processes do not share sessions with their parent
+        child_session = _get_request_session("http://my-host/my/endpoint")
+        assert child_session is not session
+        # The sessions inherited from the parent are dropped
+        assert all(key[0] == -1 for key in rest_utils._sessions)
+        assert _get_request_session("http://my-host/my/endpoint") is child_session
+
+
+def test_request_session_pool_size_is_configurable():
+    with mock.patch.dict("os.environ", {"MLFLOW_HTTP_POOL_MAXSIZE": "32"}):
+        session = _get_request_session("http://pool-size-host")
+    assert session.get_adapter("http://pool-size-host")._pool_maxsize == 32
+
+
+@mock.patch('requests.Session.request')
+def test_http_request_retries_with_exponential_backoff(request):
+    host_only = MlflowHostCreds("http://my-host")
+    request.return_value = mock.MagicMock(status_code=500, text="")
+    with mock.patch("time.sleep") as sleep_mock, \
+            mock.patch("random.uniform", side_effect=lambda a, b: b) as uniform_mock:
+        with pytest.raises(MlflowException, match="after 4 tries"):
+            http_request(host_only, '/my/endpoint', retries=4, retry_interval=2)
+    assert request.call_count == 4
+    assert [call[0] for call in uniform_mock.call_args_list] == [(0, 2), (0, 4), (0, 8)]
+    assert [call[0][0] for call in sleep_mock.call_args_list] == [2, 4, 8]
+
+
+def test_retry_interval_is_jittered_and_capped():
+    intervals = [_get_retry_interval(1, 3) for _ in range(100)]
+    assert all(0 <= interval <= 4 for interval in intervals)
+    assert len(set(intervals)) > 1
+    assert _get_retry_interval(1, 100) <= rest_utils._MAX_RETRY_INTERVAL
+
+
 def test_numpy_encoder():
     test_number = numpy.int64(42)
     ne = NumpyEncoder()
@@ -124,3 +167,40 @@ def test_numpy_encoder_fail():
     with pytest.raises(TypeError):
         ne = NumpyEncoder()
         ne.default(test_number)
+
+
+def test_gzip_decompress_limits_decompressed_size():
+    data = b"0123456789" * 100
+    assert rest_utils.gzip_decompress(rest_utils.gzip_compress(data)) == data
+    assert rest_utils.gzip_decompress(rest_utils.gzip_compress(data), max_size=1000) == data
+    with pytest.raises(ValueError):
+        rest_utils.gzip_decompress(rest_utils.gzip_compress(data), max_size=999)
+    with pytest.raises(zlib.error):
+        rest_utils.gzip_decompress(rest_utils.gzip_compress(data)[:-10], max_size=1000)
+    with pytest.raises(zlib.error):
+        rest_utils.gzip_decompress(rest_utils.gzip_compress(data)[:-1], max_size=1000)
+
+
+class _DecompressWithoutEof(object):
+    """Decompress object without the ``eof`` attribute, like ``zlib`` ones on Python 2."""
+
+    def __init__(self, decompressor):
+        self._decompressor = decompressor
+
+    def decompress(self, data, max_length=0):
+        return self._decompressor.decompress(data, max_length)
+
+    @property
+    def unconsumed_tail(self):
+        return self._decompressor.unconsumed_tail
+
+    @property
+    def unused_data(self):
+        return self._decompressor.unused_data
+
+
+def test_gzip_decompress_does_not_require_decompressor_eof():
+    decompressobj = zlib.decompressobj
+    with mock.patch("zlib.decompressobj",
+                    side_effect=lambda wbits: _DecompressWithoutEof(decompressobj(wbits))):
+        test_gzip_decompress_limits_decompressed_size()
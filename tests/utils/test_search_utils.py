@@ -1,8 +1,11 @@
+import mock
 import pytest
 
-from mlflow.entities import RunInfo, RunData, Run, LifecycleStage, RunStatus
+from mlflow.entities import RunInfo, RunData, Run, LifecycleStage, RunStatus, Metric, Param, \
+    RunTag
 from mlflow.exceptions import MlflowException
-from mlflow.utils.search_utils import SearchFilter
+from mlflow.utils.search_utils import SearchFilter, RunColumns, create_page_token, \
+    parse_page_token
 
 
 @pytest.mark.parametrize("filter_string, parsed_filter", [
@@ -182,3 +185,88 @@ def test_bad_comparators(entity_type, bad_comparators, key, entity_value):
         with pytest.raises(MlflowException) as e:
             sf.filter(run)
         assert "Invalid comparator" in str(e.value.message)
+
+
+def _make_run(run_id, status, metrics, params, tags):
+    run_info = RunInfo(run_uuid=run_id, run_id=run_id, experiment_id=0, user_id="user",
+                       status=RunStatus.to_string(status), start_time=0, end_time=1,
+                       lifecycle_stage=LifecycleStage.ACTIVE)
+    run_data = RunData(metrics=[Metric(k, v, 0, 0) for k, v in metrics.items()],
+                       params=[Param(k, v) for k, v in params.items()],
+                       tags=[RunTag(k, v) for k, v in tags.items()])
+    return Run(run_info=run_info, run_data=run_data)
+
+
+_FILTER_TEST_RUNS = [
+    _make_run("r0", RunStatus.FINISHED, {"acc": 0.9, "loss": 1.0}, {"model": "LR"}, {"t": "a"}),
+    _make_run("r1", RunStatus.FAILED, {"acc": 0.5}, {"model": "RF"}, {"t": "b"}),
+    _make_run("r2", RunStatus.FINISHED, {"acc": float("nan")}, {"model": "LR"}, {}),
+    _make_run("r3", RunStatus.RUNNING, {}, {}, {"t": "a"}),
+    _make_run("r4", RunStatus.FINISHED, {"acc": 0.7, "loss": 3.0}, {"other": "x"}, {"t": "c"}),
+]
+
+
+def _get_run_columns(runs):
+    attribute_keys = RunInfo.get_searchable_attributes()
+    return RunColumns(metrics=[run.data.metrics for run in runs],
+                      params=[run.data.params for run in runs],
+                      tags=[run.data.tags for run in runs],
+                      attributes=[{key: getattr(run.info, key) for key in attribute_keys}
+                                  for run in runs])
+
+
+@pytest.mark.parametrize("filter_string", [
+    "",
+    "metrics.acc > 0.6",
+    "metrics.acc >= 0.5",
+    "metrics.acc = 0.5",
+    "metrics.acc != 0.5",
+    "metrics.acc < 0.8",
+    "metrics.acc <= 0.7 and metrics.loss > 2",
+    "metrics.missing != 1",
+    "params.model = 'LR'",
+    "params.model != 'LR'",
+    "tags.t != 'a' and params.model != 'LR'",
+    "attribute.status = 'FINISHED' and metrics.acc > 0",
+    "attribute.status != 'FINISHED'",
+])
+def test_compiled_and_batch_filters_match_reference(filter_string):
+    sf = SearchFilter(filter_string=filter_string)
+    expected = [run for run in _FILTER_TEST_RUNS
+                if all([SearchFilter.does_run_match_clause(run, c) for c in sf.get_clauses()])]
+    predicate = sf.compile()
+    assert [run for run in _FILTER_TEST_RUNS if predicate(run)] == expected
+    assert [run for run in _FILTER_TEST_RUNS if sf.filter(run)] == expected
+    mask = sf.filter_columns(_get_run_columns(_FILTER_TEST_RUNS))
+    assert [run for run, match in zip(_FILTER_TEST_RUNS, mask) if match] == expected
+
+
+def test_compiled_filter_stops_at_first_failed_clause():
+    sf = SearchFilter(filter_string="metrics.acc > 0.6 and params.model = 'LR'")
+    run = _FILTER_TEST_RUNS[1]
+    with mock.patch.object(RunData, "params", new_callable=mock.PropertyMock) as params_mock:
+        assert not sf.filter(run)
+        params_mock.assert_not_called()
+
+
+def test_filters_are_validated_when_compiled():
+    with pytest.raises(MlflowException) as e:
+        SearchFilter(filter_string="params.model > 'LR'").compile()
+    assert "Invalid comparator" in e.value.message
+
+
+def test_page_token_round_trip():
+    run_info = RunInfo(run_uuid="r1", run_id="r1", experiment_id=0, user_id="user",
+                       status=RunStatus.FINISHED, start_time=1234, end_time=None,
+                       lifecycle_stage=LifecycleStage.ACTIVE)
+    assert parse_page_token(create_page_token(run_info)) == (1234, "r1")
+    assert parse_page_token(None) is None
+    assert parse_page_token("") is None
+
+
+@pytest.mark.parametrize("page_token", ["?", "bm90IGpzb24=", "e30=", "WzEsIDJd",
+                                        "eyJzdGFydF90aW1lIjogImEiLCAicnVuX2lkIjogMX0="])
+def test_invalid_page_tokens(page_token):
+    with pytest.raises(MlflowException) as e:
+        parse_page_token(page_token)
+    assert "Invalid page token" in e.value.message